@@ -6,10 +6,11 @@ from __future__ import annotations
 import ast
 import re
 from dataclasses import dataclass
-from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Sequence
 
+from adaad.core import ast_cache
+
 SEMVER_RE = re.compile(r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:-[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?(?:\+[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?$")
 DEFAULT_AGENT_SCOPES: Sequence[Path] = (Path("adaad/agents"),)
 DEFAULT_LEGACY_AGENT_BRIDGE_MODULES: Sequence[Path] = (
@@ -47,14 +48,8 @@ def discover_agent_modules(root: Path, scopes: Sequence[Path] = DEFAULT_AGENT_SC
     return modules
 
 
-@lru_cache(maxsize=256)
-def _parse_cached(path_str: str) -> ast.Module:
-    path = Path(path_str)
-    return ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-
-
 def _parse(path: Path) -> ast.Module:
-    return _parse_cached(str(path.resolve()))
+    return ast_cache.parse_file(path.resolve())
 
 
 def _collect_assignments_and_functions(path: Path) -> tuple[dict[str, ast.AST], dict[str, ast.FunctionDef]]:
@@ -0,0 +1,218 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Content-addressed LRU cache of parsed Python ASTs and facts derived from them.
+
+Preflight, constitutional validators, change classification and the contract
+validators all parse the same candidate sources. Entries are keyed by the
+SHA-256 of the source text, so each unique source is parsed once while it stays
+in the cache, regardless of which path or caller asked for it.
+
+Cached trees are shared between callers and must be treated as read-only;
+transformations (for example docstring stripping) operate on a copy.
+"""
+
+from __future__ import annotations
+
+import ast
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet
+
+DEFAULT_MAX_ENTRIES = 256
+
+
+@dataclass
+class _Entry:
+    tree: ast.Module | None
+    error: SyntaxError | None
+    facts: Dict[str, Any] = field(default_factory=dict)
+
+
+def _strip_docstrings(tree: ast.AST) -> ast.AST:
+    class StripDocstrings(ast.NodeTransformer):
+        def _strip(self, node: ast.AST) -> ast.AST:
+            body = getattr(node, "body", None)
+            if isinstance(body, list) and body:
+                head = body[0]
+                if isinstance(head, ast.Expr) and isinstance(getattr(head, "value", None), ast.Constant) and isinstance(head.value.value, str):
+                    node.body = body[1:]
+            return node
+
+        def visit_Module(self, node: ast.Module) -> ast.AST:
+            self.generic_visit(node)
+            return self._strip(node)
+
+        def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.AST:
+            self.generic_visit(node)
+            return self._strip(node)
+
+        def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> ast.AST:
+            self.generic_visit(node)
+            return self._strip(node)
+
+        def visit_ClassDef(self, node: ast.ClassDef) -> ast.AST:
+            self.generic_visit(node)
+            return self._strip(node)
+
+    return StripDocstrings().visit(ast.fix_missing_locations(copy.deepcopy(tree)))
+
+
+def _import_roots(tree: ast.AST) -> FrozenSet[str]:
+    roots = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                root = alias.name.split(".", 1)[0]
+                if root:
+                    roots.add(root)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level > 0 or not node.module:
+                continue
+            root = node.module.split(".", 1)[0]
+            if root:
+                roots.add(root)
+    return frozenset(roots)
+
+
+def _cyclomatic_complexity(tree: ast.AST) -> int:
+    complexity = 1
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.If, ast.For, ast.AsyncFor, ast.While, ast.ExceptHandler, ast.With, ast.AsyncWith, ast.IfExp)):
+            complexity += 1
+        elif isinstance(node, ast.BoolOp):
+            complexity += max(0, len(node.values) - 1)
+        elif isinstance(node, ast.comprehension):
+            complexity += 1
+        elif hasattr(ast, "Match") and isinstance(node, ast.Match):
+            complexity += max(1, len(getattr(node, "cases", [])))
+    return complexity
+
+
+def _stripped_dump(tree: ast.AST) -> str:
+    return ast.dump(_strip_docstrings(tree), include_attributes=False)
+
+
+class AstCache:
+    """Thread-safe LRU of ``source digest -> parsed tree + memoized facts``."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _entry(self, source: str, filename: str) -> _Entry:
+        digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None:
+                self._entries.move_to_end(digest)
+                self._hits += 1
+                return entry
+            self._misses += 1
+        try:
+            entry = _Entry(tree=ast.parse(source, filename=filename), error=None)
+        except SyntaxError as exc:
+            entry = _Entry(tree=None, error=exc)
+        with self._lock:
+            entry = self._entries.setdefault(digest, entry)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def _tree(self, source: str, filename: str) -> tuple[_Entry, ast.Module]:
+        entry = self._entry(source, filename)
+        if entry.tree is None:
+            assert entry.error is not None
+            if entry.error.filename != filename:
+                # Re-raise with the caller's filename so error text matches an uncached parse.
+                ast.parse(source, filename=filename)
+            raise entry.error.with_traceback(None)
+        return entry, entry.tree
+
+    def _fact(self, source: str, filename: str, name: str, compute: Callable[[ast.Module], Any]) -> Any:
+        entry, tree = self._tree(source, filename)
+        with self._lock:
+            if name in entry.facts:
+                return entry.facts[name]
+        value = compute(tree)
+        with self._lock:
+            return entry.facts.setdefault(name, value)
+
+    def parse(self, source: str, filename: str = "<unknown>") -> ast.Module:
+        """Return the shared (read-only) tree for ``source``; raises ``SyntaxError`` like ``ast.parse``."""
+        return self._tree(source, filename)[1]
+
+    def parse_file(self, path: Path) -> ast.Module:
+        return self.parse(path.read_text(encoding="utf-8"), filename=str(path))
+
+    def import_roots(self, source: str, filename: str = "<unknown>") -> FrozenSet[str]:
+        """Top-level module names imported by absolute ``import``/``from`` statements."""
+        return self._fact(source, filename, "import_roots", _import_roots)
+
+    def cyclomatic_complexity(self, source: str, filename: str = "<unknown>") -> int:
+        return self._fact(source, filename, "cyclomatic_complexity", _cyclomatic_complexity)
+
+    def stripped_dump(self, source: str, filename: str = "<unknown>") -> str:
+        """``ast.dump`` of the tree with module/class/function docstrings removed."""
+        return self._fact(source, filename, "stripped_dump", _stripped_dump)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self._hits, "misses": self._misses}
+
+
+_DEFAULT_CACHE = AstCache()
+
+
+def default_cache() -> AstCache:
+    return _DEFAULT_CACHE
+
+
+def parse_source(source: str, filename: str = "<unknown>") -> ast.Module:
+    return _DEFAULT_CACHE.parse(source, filename=filename)
+
+
+def parse_file(path: Path) -> ast.Module:
+    return _DEFAULT_CACHE.parse_file(path)
+
+
+def import_roots(source: str, filename: str = "<unknown>") -> FrozenSet[str]:
+    return _DEFAULT_CACHE.import_roots(source, filename=filename)
+
+
+def cyclomatic_complexity(source: str, filename: str = "<unknown>") -> int:
+    return _DEFAULT_CACHE.cyclomatic_complexity(source, filename=filename)
+
+
+def stripped_dump(source: str, filename: str = "<unknown>") -> str:
+    return _DEFAULT_CACHE.stripped_dump(source, filename=filename)
+
+
+def strip_docstrings(tree: ast.AST) -> ast.AST:
+    """Return a docstring-free copy of ``tree``; the input is left untouched."""
+    return _strip_docstrings(tree)
+
+
+__all__ = [
+    "AstCache",
+    "DEFAULT_MAX_ENTRIES",
+    "cyclomatic_complexity",
+    "default_cache",
+    "import_roots",
+    "parse_file",
+    "parse_source",
+    "strip_docstrings",
+    "stripped_dump",
+]
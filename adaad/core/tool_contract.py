@@ -11,6 +11,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence
 
+from adaad.core import ast_cache
+
 SEMVER_RE = re.compile(r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:-[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?(?:\+[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?$")
 DEFAULT_DISCOVERY_SCOPES: Sequence[Path] = (Path("tools"), Path("adaad/tools"))
 LEGACY_TOOL_MODULES: Sequence[Path] = (Path("tools/asset_generator.py"),)
@@ -60,7 +62,7 @@ def discover_tool_modules(root: Path, scopes: Sequence[Path] = DEFAULT_DISCOVERY
 
 
 def _load_ast(path: Path) -> ast.Module:
-    return ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    return ast_cache.parse_file(path)
 
 
 def _collect_symbols(path: Path) -> tuple[Dict[str, ast.AST], Dict[str, ast.FunctionDef]]:
@@ -29,6 +29,18 @@ def is_agent_dir(path: Path) -> bool:
 def iter_agent_dirs(agents_root: Path) -> Iterable[Path]:
     """
     Deterministically yield agent directories, skipping non-agent folders.
+
+    Served from the incremental inventory (:mod:`app.agents.inventory`), so
+    only directories whose mtime moved since the last call are re-listed.
+    """
+    from app.agents.inventory import inventory_for
+
+    yield from inventory_for(agents_root).agent_dirs()
+
+
+def scan_agent_dirs(agents_root: Path) -> Iterable[Path]:
+    """
+    Uncached walk with the same results as :func:`iter_agent_dirs`.
     """
     if not agents_root.exists():
         return
@@ -0,0 +1,142 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Stat-keyed cache of agent DNA and facts derived from it.
+
+Proposal generation touches every agent each cycle. A snapshot is keyed by
+``(st_mtime_ns, st_size, st_ino)`` of the agent's ``dna.json``, ``meta.json``
+and ``certificate.json`` together with a SHA-256 of their contents, so an
+unchanged agent costs three ``stat`` calls. A snapshot that is not yet settled
+(see ``runtime.governance.deterministic_filesystem.stamp_is_settled``, the same
+"racily clean" rule git applies to its index) is re-hashed on lookup and the
+parsed DNA is reused only if the content digest still matches.
+
+Cached DNA is shared between callers: use :func:`analyze_dna` in
+``app.agents.mutation_strategies`` for a private copy.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from app.agents.discovery import REQUIRED_FILES
+from runtime.governance.deterministic_filesystem import stamp_is_settled, stat_stamp
+
+DEFAULT_MAX_ENTRIES = 4096
+
+_Signature = Tuple[Tuple[int, int, int] | None, ...]
+
+
+@dataclass
+class DnaSnapshot:
+    signature: _Signature
+    content_hash: str
+    dna_hash: str
+    dna: Dict[str, Any]
+    taken_ns: int
+    facts: Dict[Hashable, Any] = field(default_factory=dict)
+
+
+def _signature(agent_dir: Path) -> _Signature:
+    stamps = []
+    for name in REQUIRED_FILES:
+        try:
+            stat = (agent_dir / name).stat()
+        except OSError:
+            stamps.append(None)
+            continue
+        stamps.append(stat_stamp(stat))
+    return tuple(stamps)
+
+
+def _read(agent_dir: Path) -> Tuple[str, bytes | None]:
+    digest = hashlib.sha256()
+    dna_bytes: bytes | None = None
+    for name in REQUIRED_FILES:
+        path = agent_dir / name
+        payload = path.read_bytes() if path.exists() else None
+        digest.update(name.encode("utf-8") + b"\0" + (payload or b"") + b"\0")
+        if name == "dna.json":
+            dna_bytes = payload
+    return digest.hexdigest(), dna_bytes
+
+
+class DnaCache:
+    """Thread-safe ``agent dir -> DnaSnapshot`` map revalidated by stat signature."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._entries: Dict[Path, DnaSnapshot] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def snapshot(self, agent_dir: Path) -> DnaSnapshot:
+        key = agent_dir.resolve()
+        signature = _signature(key)
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is not None and cached.signature == signature and not self._racy(cached):
+            with self._lock:
+                self._hits += 1
+            return cached
+        taken_ns = time.time_ns()
+        content_hash, dna_bytes = _read(key)
+        if cached is not None and cached.content_hash == content_hash:
+            # Stat moved (or was racy) but content did not: keep parsed DNA and memoized facts.
+            snapshot = DnaSnapshot(signature, content_hash, cached.dna_hash, cached.dna, taken_ns, cached.facts)
+        elif dna_bytes is None:
+            snapshot = DnaSnapshot(signature, content_hash, "", {}, taken_ns)
+        else:
+            dna = json.loads(dna_bytes.decode("utf-8"))
+            snapshot = DnaSnapshot(signature, content_hash, hashlib.sha256(dna_bytes).hexdigest(), dna, taken_ns)
+        with self._lock:
+            self._misses += 1
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = snapshot
+        return snapshot
+
+    @staticmethod
+    def _racy(snapshot: DnaSnapshot) -> bool:
+        newest = max((stamp[0] for stamp in snapshot.signature if stamp is not None), default=0)
+        return not stamp_is_settled(snapshot.taken_ns, newest)
+
+    def memo(self, snapshot: DnaSnapshot, name: Hashable, compute: Callable[[Dict[str, Any]], Any]) -> Any:
+        """Memoize ``compute(snapshot.dna)`` on the snapshot under ``name``."""
+        with self._lock:
+            if name in snapshot.facts:
+                return snapshot.facts[name]
+        value = compute(snapshot.dna)
+        with self._lock:
+            return snapshot.facts.setdefault(name, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self._hits, "misses": self._misses}
+
+
+_DEFAULT_CACHE = DnaCache()
+
+
+def default_cache() -> DnaCache:
+    return _DEFAULT_CACHE
+
+
+def snapshot(agent_dir: Path) -> DnaSnapshot:
+    return _DEFAULT_CACHE.snapshot(agent_dir)
+
+
+__all__ = ["DEFAULT_MAX_ENTRIES", "DnaCache", "DnaSnapshot", "default_cache", "snapshot"]
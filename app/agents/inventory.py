@@ -0,0 +1,286 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Persistent agent inventory refreshed incrementally from directory mtimes.
+
+Discovery, dream task selection and beast staging lookups all walk the same
+trees. The inventory remembers, per directory, its ``st_mtime_ns`` and what a
+scan of it produced (child entries, whether it is an agent dir), plus per-agent
+``meta.json`` digests and dream scope and per-candidate ``mutation.json``
+parents. A refresh stats each known directory and re-lists or re-reads only the
+ones whose stamp moved, so listing and parsing cost is O(changed agents).
+
+Adding or removing a file changes its directory's mtime, but an in-place write
+does not, so ``meta.json`` and ``mutation.json`` carry their own
+``(mtime_ns, size, inode)`` stamps. Anything whose stamp is not yet settled
+(``runtime.governance.deterministic_filesystem.stamp_is_settled``) is
+re-scanned on the next refresh rather than trusted. The standard library has
+no inotify binding, so change detection is stat-based everywhere.
+
+The index is persisted next to the lineage staging area
+(``<agents_root>/lineage/.agent_inventory.json``) when that directory exists,
+so a restarted process starts warm.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.agents.discovery import REQUIRED_FILES, _is_excluded
+from runtime.governance.deterministic_filesystem import stamp_is_settled, stat_stamp
+
+INDEX_VERSION = 1
+INDEX_FILENAME = ".agent_inventory.json"
+
+_Stamp = Optional[List[int]]
+
+
+@dataclass(frozen=True)
+class AgentRecord:
+    agent_id: str
+    path: Path
+    meta_digest: str
+    dream_scope: Any
+
+
+def _stamp(path: Path) -> _Stamp:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return list(stat_stamp(stat))
+
+
+def _dir_mtime(path: Path) -> Optional[int]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    if not os.path.isdir(path):
+        return None
+    return stat.st_mtime_ns
+
+
+def _list_dirs(path: Path) -> List[str]:
+    try:
+        entries = sorted(path.iterdir(), key=lambda p: p.name)
+    except OSError:
+        return []
+    return [entry.name for entry in entries if entry.is_dir() and not _is_excluded(entry)]
+
+
+def _read_json(path: Path) -> Tuple[str, Dict[str, Any] | None]:
+    try:
+        payload = path.read_bytes()
+    except OSError:
+        return "", None
+    try:
+        parsed = json.loads(payload.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        parsed = None
+    return hashlib.sha256(payload).hexdigest(), parsed if isinstance(parsed, dict) else None
+
+
+class AgentInventory:
+    """Incrementally maintained ``agent_id -> paths / meta / staging`` index for one agents root."""
+
+    def __init__(self, agents_root: Path, *, index_path: Path | None = None) -> None:
+        self.agents_root = agents_root
+        self.index_path = index_path or agents_root / "lineage" / INDEX_FILENAME
+        self._lock = threading.RLock()
+        self._index = self._load()
+        self._dirty = False
+
+    def _empty(self) -> Dict[str, Any]:
+        return {"version": INDEX_VERSION, "root": str(self.agents_root.resolve()), "dirs": {}, "meta": {}, "staging": {}}
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return self._empty()
+        if not isinstance(index, dict) or index.get("version") != INDEX_VERSION or index.get("root") != str(self.agents_root.resolve()):
+            return self._empty()
+        return index
+
+    def _persist(self) -> None:
+        if not self._dirty or not self.index_path.parent.is_dir():
+            return
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(self._index, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            return
+        self._dirty = False
+
+    @staticmethod
+    def _fresh(record: Dict[str, Any] | None, mtime_ns: int | None) -> bool:
+        if record is None or mtime_ns is None or record.get("mtime_ns") != mtime_ns:
+            return False
+        return stamp_is_settled(record.get("scanned_ns", 0), mtime_ns)
+
+    def _dir_record(self, rel: str, path: Path, now_ns: int, *, top_level: bool) -> Dict[str, Any] | None:
+        """Return ``{"is_agent", "children"}`` for ``path``, re-scanning only if its mtime moved."""
+        dirs = self._index["dirs"]
+        mtime_ns = _dir_mtime(path)
+        if mtime_ns is None:
+            if dirs.pop(rel, None) is not None:
+                self._dirty = True
+            return None
+        record = dirs.get(rel)
+        if self._fresh(record, mtime_ns):
+            return record
+        is_agent = all((path / name).exists() for name in REQUIRED_FILES)
+        children = _list_dirs(path) if top_level and not is_agent else []
+        record = {"mtime_ns": mtime_ns, "scanned_ns": now_ns, "is_agent": is_agent, "children": children}
+        dirs[rel] = record
+        self._dirty = True
+        return record
+
+    def _scan_agents(self, now_ns: int) -> List[str]:
+        root_record = self._dir_record("", self.agents_root, now_ns, top_level=True)
+        if root_record is None:
+            return []
+        found: List[str] = []
+        seen = {""}
+        for name in root_record["children"]:
+            record = self._dir_record(name, self.agents_root / name, now_ns, top_level=True)
+            seen.add(name)
+            if record is None:
+                continue
+            if record["is_agent"]:
+                found.append(name)
+                continue
+            for child in record["children"]:
+                rel = f"{name}/{child}"
+                seen.add(rel)
+                child_record = self._dir_record(rel, self.agents_root / name / child, now_ns, top_level=False)
+                if child_record is not None and child_record["is_agent"]:
+                    found.append(rel)
+        stale = set(self._index["dirs"]) - seen
+        for rel in stale:
+            del self._index["dirs"][rel]
+        self._dirty = self._dirty or bool(stale)
+        return found
+
+    def _refresh_meta(self, rel: str, now_ns: int) -> Dict[str, Any]:
+        meta_index = self._index["meta"]
+        meta_path = self.agents_root / rel / "meta.json"
+        stamp = _stamp(meta_path)
+        record = meta_index.get(rel)
+        if record is not None and record.get("stamp") == stamp and stamp is not None and stamp_is_settled(record.get("scanned_ns", 0), stamp[0]):
+            return record
+        digest, meta = _read_json(meta_path)
+        if record is not None and record.get("digest") == digest:
+            record.update({"stamp": stamp, "scanned_ns": now_ns})
+        else:
+            record = {"stamp": stamp, "scanned_ns": now_ns, "digest": digest, "dream_scope": (meta or {}).get("dream_scope")}
+            meta_index[rel] = record
+        self._dirty = True
+        return record
+
+    def refresh(self) -> List[AgentRecord]:
+        """Bring the index up to date and return agent records in discovery order."""
+        with self._lock:
+            now_ns = time.time_ns()
+            agents = self._scan_agents(now_ns)
+            records = []
+            for rel in agents:
+                meta = self._refresh_meta(rel, now_ns)
+                records.append(
+                    AgentRecord(
+                        agent_id=rel.replace("/", ":"),
+                        path=self.agents_root / rel,
+                        meta_digest=str(meta.get("digest") or ""),
+                        dream_scope=meta.get("dream_scope"),
+                    )
+                )
+            stale_meta = set(self._index["meta"]) - set(agents)
+            for rel in stale_meta:
+                del self._index["meta"][rel]
+            self._dirty = self._dirty or bool(stale_meta)
+            self._persist()
+            return records
+
+    def agent_dirs(self) -> List[Path]:
+        return [record.path for record in self.refresh()]
+
+    def get(self, agent_id: str) -> AgentRecord | None:
+        return next((record for record in self.refresh() if record.agent_id == agent_id), None)
+
+    def latest_staged(self, staging_root: Path, agent_id: str) -> Tuple[Optional[Path], Optional[Dict[str, Any]]]:
+        """Newest staged candidate under ``staging_root`` whose ``mutation.json`` names ``agent_id`` as parent."""
+        with self._lock:
+            now_ns = time.time_ns()
+            key = str(staging_root.resolve())
+            staging = self._index["staging"].setdefault(key, {"mtime_ns": None, "scanned_ns": 0, "entries": [], "candidates": {}})
+            mtime_ns = _dir_mtime(staging_root)
+            if mtime_ns is None:
+                if staging["entries"] or staging["candidates"]:
+                    self._index["staging"][key] = {"mtime_ns": None, "scanned_ns": 0, "entries": [], "candidates": {}}
+                    self._dirty = True
+                self._persist()
+                return None, None
+            if not self._fresh(staging, mtime_ns):
+                staging.update({"mtime_ns": mtime_ns, "scanned_ns": now_ns, "entries": _list_all_dirs(staging_root)})
+                self._dirty = True
+            candidates = staging["candidates"]
+            for name in set(candidates) - set(staging["entries"]):
+                del candidates[name]
+                self._dirty = True
+            ordered: List[Tuple[int, str]] = []
+            for name in staging["entries"]:
+                candidate_dir = staging_root / name
+                dir_mtime = _dir_mtime(candidate_dir)
+                if dir_mtime is None:
+                    continue
+                record = candidates.get(name)
+                stamp = _stamp(candidate_dir / "mutation.json")
+                if record is None or record.get("stamp") != stamp or (stamp is not None and not stamp_is_settled(record.get("scanned_ns", 0), stamp[0])):
+                    parent = None
+                    if stamp is not None:
+                        _, payload = _read_json(candidate_dir / "mutation.json")
+                        parent = payload.get("parent", "") if payload is not None else None
+                    record = {"stamp": stamp, "scanned_ns": now_ns, "parent": parent}
+                    candidates[name] = record
+                    self._dirty = True
+                if record["parent"] == agent_id:
+                    ordered.append((dir_mtime, name))
+            self._persist()
+        for _, name in sorted(ordered, key=lambda item: (-item[0], item[1])):
+            _, payload = _read_json(staging_root / name / "mutation.json")
+            if payload is not None and payload.get("parent", "") == agent_id:
+                return staging_root / name, payload
+        return None, None
+
+
+def _list_all_dirs(path: Path) -> List[str]:
+    try:
+        return sorted(entry.name for entry in path.iterdir() if entry.is_dir())
+    except OSError:
+        return []
+
+
+_INVENTORIES: Dict[Path, AgentInventory] = {}
+_INVENTORIES_LOCK = threading.Lock()
+
+
+def inventory_for(agents_root: Path) -> AgentInventory:
+    """Shared inventory for ``agents_root``; returned paths keep the caller's spelling of the root."""
+    with _INVENTORIES_LOCK:
+        inventory = _INVENTORIES.get(agents_root)
+        if inventory is None:
+            inventory = AgentInventory(agents_root)
+            _INVENTORIES[agents_root] = inventory
+        return inventory
+
+
+__all__ = ["AgentInventory", "AgentRecord", "INDEX_VERSION", "inventory_for"]
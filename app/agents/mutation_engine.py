@@ -20,6 +20,7 @@ from runtime.metrics_analysis import summarize_preflight_rejections, top_preflig
 EMA_ALPHA = float(os.getenv("ADAAD_MUTATION_EMA_ALPHA", "0.3"))
 LOW_IMPACT_THRESHOLD = float(os.getenv("ADAAD_MUTATION_LOW_IMPACT_THRESHOLD", "0.3"))
 SKILL_WEIGHT_COEF = float(os.getenv("ADAAD_MUTATION_SKILL_WEIGHT_COEF", "0.6"))
+METRICS_BATCH_SIZE = 5000
 
 
 class MutationEngine:
@@ -52,62 +53,46 @@ class MutationEngine:
         return entry
 
     def _update_state_from_metrics(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        if not self.metrics_path.exists():
+        if not self.metrics_path.exists() and not metrics.load_segment_manifest(self.metrics_path)["segments"]:
             return state
-        cursor = int(state.get("cursor", 0) or 0)
-        try:
-            size = self.metrics_path.stat().st_size
-        except OSError:
-            return state
-        if cursor > size:
-            cursor = 0
-        new_cursor = cursor
-        with self.metrics_path.open("rb") as handle:
-            handle.seek(cursor)
-            chunk = handle.read()
-            new_cursor = handle.tell()
-        if not chunk:
-            state["cursor"] = new_cursor
-            return state
-
-        for raw_line in chunk.splitlines():
-            try:
-                line = raw_line.decode("utf-8")
-            except UnicodeDecodeError:
-                continue
-            try:
-                record = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            payload = record.get("payload", {}) or {}
-            event = record.get("event")
-            sid = payload.get("strategy_id")
-            if not sid:
-                continue
-            entry = self._ensure_stats(state, sid)
-            if event == "mutation_score":
-                score = float(payload.get("score", 0.0))
-                entry["n"] += 1.0
-                entry["reward"] += score
-                if entry["ema"] is None:
-                    entry["ema"] = score
-                else:
-                    entry["ema"] = (EMA_ALPHA * score) + ((1 - EMA_ALPHA) * float(entry["ema"]))
-                if score < LOW_IMPACT_THRESHOLD:
-                    entry["low_impact"] += 1.0
-            if event == "mutation_failed":
-                entry["fail"] += 1.0
-            if event == "skill_feedback":
-                score = float(payload.get("score", 0.0))
-                if entry["skill_weight"] is None:
-                    entry["skill_weight"] = score
-                else:
-                    entry["skill_weight"] = (EMA_ALPHA * score) + (
-                        (1 - EMA_ALPHA) * float(entry["skill_weight"])
-                    )
-        state["cursor"] = new_cursor
+        cursor = state.get("cursor", 0)
+        while True:
+            records, cursor = metrics.read_since(cursor, path=self.metrics_path, limit=METRICS_BATCH_SIZE)
+            for record in records:
+                self._apply_metrics_record(state, record)
+            if len(records) < METRICS_BATCH_SIZE:
+                break
+        state["cursor"] = cursor
         return state
 
+    def _apply_metrics_record(self, state: Dict[str, Any], record: Dict[str, Any]) -> None:
+        payload = record.get("payload", {}) or {}
+        event = record.get("event")
+        sid = payload.get("strategy_id")
+        if not sid:
+            return
+        entry = self._ensure_stats(state, sid)
+        if event == "mutation_score":
+            score = float(payload.get("score", 0.0))
+            entry["n"] += 1.0
+            entry["reward"] += score
+            if entry["ema"] is None:
+                entry["ema"] = score
+            else:
+                entry["ema"] = (EMA_ALPHA * score) + ((1 - EMA_ALPHA) * float(entry["ema"]))
+            if score < LOW_IMPACT_THRESHOLD:
+                entry["low_impact"] += 1.0
+        if event == "mutation_failed":
+            entry["fail"] += 1.0
+        if event == "skill_feedback":
+            score = float(payload.get("score", 0.0))
+            if entry["skill_weight"] is None:
+                entry["skill_weight"] = score
+            else:
+                entry["skill_weight"] = (EMA_ALPHA * score) + (
+                    (1 - EMA_ALPHA) * float(entry["skill_weight"])
+                )
+
     def refresh_state_from_metrics(self) -> None:
         """
         Update persisted state from the metrics log.
@@ -242,18 +227,17 @@ class MutationEngine:
             "score_delta": score,
         }
 
-    def select(self, requests: List[MutationRequest]) -> Tuple[MutationRequest | None, Dict[str, float]]:
+    def rank(self, requests: List[MutationRequest]) -> Tuple[List[MutationRequest], Dict[str, float]]:
         """
-        Pick the best candidate request. Returns (request or None, scores).
+        Order candidate requests best-first (ties keep proposal order). Returns (ranked, scores).
         """
         if not requests:
-            return None, {}
+            return [], {}
         history = self._load_history()
         total = sum(v.get("n", 0.0) for v in history.values()) or 1.0
         scores: Dict[str, float] = {}
-        best: MutationRequest | None = None
-        best_score = -float("inf")
-        for req in requests:
+        scored: List[Tuple[float, int, MutationRequest]] = []
+        for index, req in enumerate(requests):
             sid = req.intent or "default"
             stats = history.get(sid, {"n": 0.0, "reward": 0.0, "fail": 0.0, "ema": None, "low_impact": 0.0})
             failures = stats.get("fail", 0.0)
@@ -274,10 +258,16 @@ class MutationEngine:
             s -= failure_rate * 0.5
             s, _ = self._apply_preflight_bias(req, s)
             scores[sid] = s
-            if s > best_score:
-                best_score = s
-                best = req
-        return best, scores
+            scored.append((s, index, req))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [req for _, _, req in scored], scores
+
+    def select(self, requests: List[MutationRequest]) -> Tuple[MutationRequest | None, Dict[str, float]]:
+        """
+        Pick the best candidate request. Returns (request or None, scores).
+        """
+        ranked, scores = self.rank(requests)
+        return (ranked[0] if ranked else None), scores
 
 
 __all__ = ["MutationEngine"]
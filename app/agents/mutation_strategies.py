@@ -6,12 +6,17 @@ Concrete mutation strategies that generate actionable ops.
 
 from __future__ import annotations
 
+import copy
 import json
 import os
+import threading
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple
 
+from app.agents import dna_cache
+from runtime.governance.deterministic_filesystem import stamp_is_settled, stat_stamp
 from runtime.intelligence.llm_provider import LLMProviderClient, load_provider_config
 from runtime.timeutils import now_iso
 
@@ -83,11 +88,8 @@ def adapt_generated_request_payload(raw_payload: Mapping[str, Any]) -> Dict[str,
 
 
 def analyze_dna(agent_dir: Path) -> Dict[str, Any]:
-    """Extract current state from agent DNA."""
-    dna_path = agent_dir / "dna.json"
-    if not dna_path.exists():
-        return {}
-    return json.loads(dna_path.read_text(encoding="utf-8"))
+    """Extract current state from agent DNA (a private copy of the cached snapshot)."""
+    return copy.deepcopy(dna_cache.snapshot(agent_dir).dna)
 
 
 def add_capability_strategy(agent_dir: Path) -> List[Dict[str, Any]]:
@@ -254,9 +256,11 @@ class StrategyRegistry:
         agent_dir: Path,
         skill_weights: Mapping[str, float] | None = None,
     ) -> Tuple[str, List[Dict[str, Any]]]:
-        dna = analyze_dna(agent_dir)
+        snapshot = dna_cache.snapshot(agent_dir)
+        registry_key = ("matching_strategies", tuple((name, id(strategy)) for name, strategy in self._strategies.items()))
+        matching = dna_cache.default_cache().memo(snapshot, registry_key, self.matching_strategies)
         candidates: List[Tuple[float, MutationStrategy]] = []
-        for strategy in self.matching_strategies(dna):
+        for strategy in matching:
             weight = strategy.skill_weight
             if skill_weights and strategy.name in skill_weights:
                 weight = skill_weights[strategy.name]
@@ -308,9 +312,12 @@ DEFAULT_REGISTRY = StrategyRegistry(
 )
 
 
-def load_skill_weights(state_path: Path) -> Dict[str, float]:
-    if not state_path.exists():
-        return {}
+# state path -> (stat stamp, stamped at ns, parsed weights)
+_SKILL_WEIGHTS_CACHE: Dict[Path, Tuple[Tuple[int, int, int], int, Dict[str, float]]] = {}
+_SKILL_WEIGHTS_LOCK = threading.Lock()
+
+
+def _parse_skill_weights(state_path: Path) -> Dict[str, float]:
     try:
         data = json.loads(state_path.read_text(encoding="utf-8"))
     except json.JSONDecodeError:
@@ -326,6 +333,21 @@ def load_skill_weights(state_path: Path) -> Dict[str, float]:
     return weights
 
 
+def load_skill_weights(state_path: Path) -> Dict[str, float]:
+    try:
+        stat = state_path.stat()
+    except OSError:
+        return {}
+    stamp = stat_stamp(stat)
+    with _SKILL_WEIGHTS_LOCK:
+        cached = _SKILL_WEIGHTS_CACHE.get(state_path)
+    if cached is None or cached[0] != stamp or not stamp_is_settled(cached[1], stat.st_mtime_ns):
+        cached = (stamp, time.time_ns(), _parse_skill_weights(state_path))
+        with _SKILL_WEIGHTS_LOCK:
+            _SKILL_WEIGHTS_CACHE[state_path] = cached
+    return dict(cached[2])
+
+
 def select_strategy(agent_dir: Path, skill_weights: Mapping[str, float] | None = None) -> Tuple[str, List[Dict[str, Any]]]:
     """Pick a mutation strategy and generate ops."""
     return DEFAULT_REGISTRY.select(agent_dir, skill_weights=skill_weights)
@@ -15,9 +15,12 @@
 Architect agent responsible for scanning the workspace.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
+from app.agents import dna_cache
 from app.agents.base_agent import validate_agents
 from app.agents.discovery import iter_agent_dirs, resolve_agent_id
 from app.agents.invariants import check_invariants
@@ -25,9 +28,19 @@ from app.agents.mutation_request import MutationRequest, MutationTarget
 from runtime import metrics
 from runtime import ROOT_DIR
 from runtime.timeutils import now_iso
-from runtime.tools.mutation_fs import file_hash
 
 ELEMENT_ID = "Wood"
+DEFAULT_ARCHITECT_WORKERS = 8
+
+
+def _architect_workers() -> int:
+    raw = os.getenv("ADAAD_ARCHITECT_WORKERS", "").strip()
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            return 1
+    return max(1, min(DEFAULT_ARCHITECT_WORKERS, os.cpu_count() or 1))
 
 
 class ArchitectAgent:
@@ -51,41 +64,51 @@ class ArchitectAgent:
     def propose_mutations(self) -> List[MutationRequest]:
         """
         Generate actionable mutation proposals using concrete strategies.
+
+        Agents are analysed on a thread pool (``ADAAD_ARCHITECT_WORKERS``);
+        proposals keep discovery order regardless of completion order.
         """
-        from app.agents.mutation_strategies import load_skill_weights, select_strategy
+        from app.agents.mutation_strategies import load_skill_weights
 
-        proposals: List[MutationRequest] = []
         skill_weights = load_skill_weights(ROOT_DIR / "data" / "mutation_engine_state.json")
-        for agent_dir in iter_agent_dirs(self.agents_root):
-            agent_id = resolve_agent_id(agent_dir, self.agents_root)
-            strategy_name, ops = select_strategy(agent_dir, skill_weights=skill_weights)
-            if not ops:
-                continue
-            dna_path = agent_dir / "dna.json"
-            targets = [
-                MutationTarget(
-                    agent_id=agent_id,
-                    path="dna.json",
-                    target_type="dna",
-                    ops=ops,
-                    hash_preimage=file_hash(dna_path),
-                )
-            ]
-            proposals.append(
-                MutationRequest(
-                    agent_id=agent_id,
-                    generation_ts=now_iso(),
-                    intent=strategy_name,
-                    ops=ops,
-                    targets=targets,
-                    signature="cryovant-dev-architect",
-                    nonce=f"arch-{agent_id}-{now_iso()}",
-                    authority_level="governor-review",
-                )
-            )
+        agent_dirs = list(iter_agent_dirs(self.agents_root))
+        workers = min(_architect_workers(), len(agent_dirs))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="architect") as pool:
+                results = list(pool.map(lambda agent_dir: self._propose_for(agent_dir, skill_weights), agent_dirs))
+        else:
+            results = [self._propose_for(agent_dir, skill_weights) for agent_dir in agent_dirs]
+        proposals = [proposal for proposal in results if proposal is not None]
         metrics.log(
             event_type="architect_proposals",
             payload={"count": len(proposals), "strategies": [p.intent for p in proposals]},
             level="INFO",
         )
         return proposals
+
+    def _propose_for(self, agent_dir: Path, skill_weights: Dict[str, float]) -> Optional[MutationRequest]:
+        from app.agents.mutation_strategies import select_strategy
+
+        agent_id = resolve_agent_id(agent_dir, self.agents_root)
+        strategy_name, ops = select_strategy(agent_dir, skill_weights=skill_weights)
+        if not ops:
+            return None
+        targets = [
+            MutationTarget(
+                agent_id=agent_id,
+                path="dna.json",
+                target_type="dna",
+                ops=ops,
+                hash_preimage=dna_cache.snapshot(agent_dir).dna_hash,
+            )
+        ]
+        return MutationRequest(
+            agent_id=agent_id,
+            generation_ts=now_iso(),
+            intent=strategy_name,
+            ops=ops,
+            targets=targets,
+            signature="cryovant-dev-architect",
+            nonce=f"arch-{agent_id}-{now_iso()}",
+            authority_level="governor-review",
+        )
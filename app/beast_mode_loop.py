@@ -29,6 +29,7 @@ import fcntl
 
 from app.agents.base_agent import promote_offspring
 from app.agents.discovery import agent_path_from_id, iter_agent_dirs, resolve_agent_id
+from app.agents.inventory import inventory_for
 from runtime.autonomy.mutation_scaffold import MutationCandidate, rank_mutation_candidates
 from runtime import fitness, metrics
 from runtime.capability_graph import get_capabilities, register_capability
@@ -317,22 +318,7 @@ class LegacyBeastModeCompatibilityAdapter:
         return True, "ok"
 
     def _latest_staged(self, agent_id: str) -> Tuple[Optional[Path], Optional[Dict[str, object]]]:
-        staging_root = self.lineage_dir / "_staging"
-        if not staging_root.exists():
-            return None, None
-        candidates = [item for item in staging_root.iterdir() if item.is_dir()]
-        candidates.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
-        for candidate in candidates:
-            mutation_file = candidate / "mutation.json"
-            if not mutation_file.exists():
-                continue
-            try:
-                payload = json.loads(mutation_file.read_text(encoding="utf-8"))
-            except json.JSONDecodeError:
-                continue
-            if safe_get(payload, "parent", default="") == agent_id:
-                return candidate, payload
-        return None, None
+        return inventory_for(self.agents_root).latest_staged(self.lineage_dir / "_staging", agent_id)
 
     @staticmethod
     def _validate_handoff_contract(contract: object) -> Tuple[bool, str, Optional[bool]]:
@@ -21,7 +21,8 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from app.agents.base_agent import stage_offspring
-from app.agents.discovery import agent_path_from_id, iter_agent_dirs, resolve_agent_id
+from app.agents.discovery import agent_path_from_id
+from app.agents.inventory import inventory_for
 from runtime import metrics
 from runtime.evolution.entropy_discipline import EntropyBudget, deterministic_context, deterministic_token_with_budget
 from runtime.evolution.fitness import FitnessEvaluator
@@ -97,10 +98,9 @@ class DreamMode:
         Discover mutation-ready agents.
         """
         tasks: List[str] = []
-        for agent_dir in iter_agent_dirs(self.agents_root):
-            agent_id = resolve_agent_id(agent_dir, self.agents_root)
-            meta = self._read_json(agent_dir / "meta.json")
-            if not self._extract_dream_scope(meta):
+        for record in inventory_for(self.agents_root).refresh():
+            agent_id = record.agent_id
+            if not self._extract_dream_scope({"dream_scope": record.dream_scope}):
                 metrics.log(
                     event_type="dream_scope_blocked",
                     payload={"agent": agent_id},
@@ -16,13 +16,15 @@ Deterministic orchestrator entrypoint.
 """
 
 import argparse
+import contextvars
 import json
 import logging
 import os
 import re
 import time
 import sys
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
 
 from app import APP_ROOT
 from app.architect_agent import ArchitectAgent
@@ -103,6 +105,51 @@ def _apply_governance_ci_mode_defaults() -> None:
     os.environ.setdefault("ADAAD_RESOURCE_WALL_SECONDS", "60")
 
 
+def _pipeline_top_k() -> int:
+    """Candidates per pipelined mutation cycle (``ADAAD_MUTATION_PIPELINE_TOP_K``; ``1`` keeps the serial cycle)."""
+    raw = os.getenv("ADAAD_MUTATION_PIPELINE_TOP_K", "").strip()
+    try:
+        return max(1, int(raw)) if raw else 1
+    except ValueError:
+        return 1
+
+
+def _run_pipeline_stage(
+    name: str,
+    tasks: List[Callable[[], Any]],
+    *,
+    workers: int,
+    stats: Dict[str, Dict[str, Any]],
+) -> List[Any]:
+    """Run one pipeline stage, returning results in task order and recording depth/latency in ``stats``."""
+    latencies: List[float] = [0.0] * len(tasks)
+
+    def _timed(index: int) -> Any:
+        started = time.monotonic()
+        try:
+            return tasks[index]()
+        finally:
+            latencies[index] = time.monotonic() - started
+
+    stage_start = time.monotonic()
+    workers = max(1, min(workers, len(tasks)))
+    if workers == 1:
+        results = [_timed(index) for index in range(len(tasks))]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"mutation-{name}") as pool:
+            # Each task gets its own context copy so envelope scopes stay per-candidate.
+            futures = [pool.submit(contextvars.copy_context().run, _timed, index) for index in range(len(tasks))]
+            results = [future.result() for future in futures]
+    stats[name] = {
+        "queue_depth": len(tasks),
+        "workers": workers,
+        "wall_seconds": round(time.monotonic() - stage_start, 6),
+        "max_latency_seconds": round(max(latencies, default=0.0), 6),
+        "mean_latency_seconds": round(sum(latencies) / len(latencies), 6) if latencies else 0.0,
+    }
+    return results
+
+
 class Orchestrator:
     """
     Coordinates boot order and health checks.
@@ -536,19 +583,34 @@ class Orchestrator:
             metrics.log(event_type="mutation_cycle_skipped", payload={"reason": "no proposals", "epoch_id": active_epoch_id}, level="INFO")
             return
         self.mutation_engine.refresh_state_from_metrics()
+        top_k = _pipeline_top_k()
+        if top_k > 1:
+            self._run_pipelined_cycle(proposals, top_k=top_k, epoch_meta=epoch_meta)
+            return
         selected, scores = self.mutation_engine.select(proposals)
         metrics.log(event_type="mutation_strategy_scores", payload={"scores": scores, **epoch_meta}, level="INFO")
         if not selected:
             metrics.log(event_type="mutation_cycle_skipped", payload={"reason": "no selection", "epoch_id": active_epoch_id}, level="INFO")
             return
+        tier = self._resolve_tier(selected)
+        constitutional_verdict = self._evaluate_constitution(selected, tier, active_epoch_id)
+        if not constitutional_verdict.get("passed"):
+            self._record_constitutional_rejection(selected, tier, constitutional_verdict, active_epoch_id)
+            return
+        self._commit_candidate(selected, tier, constitutional_verdict, epoch_meta)
+
+    def _resolve_tier(self, request: MutationRequest) -> Any:
         forced_tier = get_forced_tier()
-        tier = forced_tier or determine_tier(selected.agent_id)
+        tier = forced_tier or determine_tier(request.agent_id)
         if forced_tier is not None:
             metrics.log(
                 event_type="mutation_tier_override",
-                payload={"agent_id": selected.agent_id, "tier": tier.name},
+                payload={"agent_id": request.agent_id, "tier": tier.name},
                 level="INFO",
             )
+        return tier
+
+    def _evaluate_constitution(self, request: MutationRequest, tier: Any, active_epoch_id: Any) -> Dict[str, Any]:
         platform_snapshot = self.resource_monitor.snapshot()
         eval_wall_start = time.monotonic()
         eval_cpu_start = time.process_time()
@@ -571,62 +633,79 @@ class Orchestrator:
             },
         }
         with deterministic_envelope_scope(envelope_state):
-            constitutional_verdict = evaluate_mutation(selected, tier)
+            constitutional_verdict = evaluate_mutation(request, tier)
         eval_wall_elapsed = max(0.0, time.monotonic() - eval_wall_start)
         eval_cpu_elapsed = max(0.0, time.process_time() - eval_cpu_start)
         metrics.log(
             event_type="constitutional_evaluation_resource_measurements",
             payload={
                 "epoch_id": active_epoch_id,
-                "agent_id": selected.agent_id,
+                "agent_id": request.agent_id,
                 "wall_seconds": round(eval_wall_elapsed, 6),
                 "cpu_seconds": round(eval_cpu_elapsed, 6),
                 "peak_rss_mb": round(platform_snapshot.memory_mb, 4),
             },
             level="INFO",
         )
-        if not constitutional_verdict.get("passed"):
+        return constitutional_verdict
+
+    def _record_constitutional_rejection(
+        self,
+        selected: MutationRequest,
+        tier: Any,
+        constitutional_verdict: Dict[str, Any],
+        active_epoch_id: Any,
+    ) -> None:
+        metrics.log(
+            event_type="mutation_rejected_constitutional",
+            payload={**constitutional_verdict, "epoch_id": active_epoch_id, "decision": "rejected", "evidence": constitutional_verdict},
+            level="ERROR",
+        )
+        journal.write_entry(
+            agent_id=selected.agent_id,
+            action="mutation_rejected_constitutional",
+            payload={**constitutional_verdict, "epoch_id": active_epoch_id, "decision": "rejected", "evidence": constitutional_verdict},
+        )
+        if self.dry_run:
+            bias = self.mutation_engine.bias_details(selected)
             metrics.log(
-                event_type="mutation_rejected_constitutional",
-                payload={**constitutional_verdict, "epoch_id": active_epoch_id, "decision": "rejected", "evidence": constitutional_verdict},
-                level="ERROR",
+                event_type="mutation_dry_run",
+                payload={
+                    "agent_id": selected.agent_id,
+                    "strategy_id": selected.intent or "default",
+                    "tier": tier.name,
+                    "constitution_version": constitutional_verdict.get("constitution_version"),
+                    "constitutional_verdict": constitutional_verdict,
+                    "bias": bias,
+                    "fitness_score": None,
+                    "status": "rejected",
+                },
+                level="WARN",
             )
             journal.write_entry(
                 agent_id=selected.agent_id,
-                action="mutation_rejected_constitutional",
-                payload={**constitutional_verdict, "epoch_id": active_epoch_id, "decision": "rejected", "evidence": constitutional_verdict},
+                action="mutation_dry_run",
+                payload={
+                    "epoch_id": active_epoch_id,
+                    "strategy_id": selected.intent or "default",
+                    "tier": tier.name,
+                    "constitutional_verdict": constitutional_verdict,
+                    "bias": bias,
+                    "fitness_score": None,
+                    "status": "rejected",
+                    "ts": now_iso(),
+                },
             )
-            if self.dry_run:
-                bias = self.mutation_engine.bias_details(selected)
-                metrics.log(
-                    event_type="mutation_dry_run",
-                    payload={
-                        "agent_id": selected.agent_id,
-                        "strategy_id": selected.intent or "default",
-                        "tier": tier.name,
-                        "constitution_version": constitutional_verdict.get("constitution_version"),
-                        "constitutional_verdict": constitutional_verdict,
-                        "bias": bias,
-                        "fitness_score": None,
-                        "status": "rejected",
-                    },
-                    level="WARN",
-                )
-                journal.write_entry(
-                    agent_id=selected.agent_id,
-                    action="mutation_dry_run",
-                    payload={
-                        "epoch_id": active_epoch_id,
-                        "strategy_id": selected.intent or "default",
-                        "tier": tier.name,
-                        "constitutional_verdict": constitutional_verdict,
-                        "bias": bias,
-                        "fitness_score": None,
-                        "status": "rejected",
-                        "ts": now_iso(),
-                    },
-                )
-            return
+
+    def _commit_candidate(
+        self,
+        selected: MutationRequest,
+        tier: Any,
+        constitutional_verdict: Dict[str, Any],
+        epoch_meta: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Commit an approved candidate; returns the executor result, or ``{"status": "dry_run"}`` in dry-run mode."""
+        active_epoch_id = epoch_meta.get("epoch_id")
         metrics.log(
             event_type="mutation_approved_constitutional",
             payload={
@@ -670,7 +749,7 @@ class Orchestrator:
                     "ts": now_iso(),
                 },
             )
-            return
+            return {"status": "dry_run", "fitness_score": fitness_score}
 
         result = self.executor.execute(selected)
         journal.write_entry(
@@ -686,6 +765,80 @@ class Orchestrator:
                 "ts": now_iso(),
             },
         )
+        return result
+
+    def _run_pipelined_cycle(self, proposals: List[MutationRequest], *, top_k: int, epoch_meta: Dict[str, Any]) -> None:
+        """
+        Push the top-K ranked proposals through evaluate → commit.
+
+        Only constitutional evaluation runs concurrently per candidate; the
+        sandboxed test run happens inside ``MutationExecutor.execute`` against
+        the live tree, so commits stay serial. Rejections are journaled and
+        winners are committed one at a time in rank order, so governed state
+        changes stay deterministic. Only the best-ranked proposal per agent is
+        considered, and every winner after the first successful commit is
+        re-evaluated against the state that commit left behind, so
+        rate-sensitive rules such as ``max_mutation_rate`` see each commit.
+        Executions that do not land are reported under ``not_committed``.
+        """
+        active_epoch_id = epoch_meta.get("epoch_id")
+        ranked, scores = self.mutation_engine.rank(proposals)
+        metrics.log(event_type="mutation_strategy_scores", payload={"scores": scores, **epoch_meta}, level="INFO")
+        candidates: List[MutationRequest] = []
+        for candidate in ranked:
+            if len(candidates) < top_k and all(other.agent_id != candidate.agent_id for other in candidates):
+                candidates.append(candidate)
+        stages: Dict[str, Dict[str, Any]] = {}
+        tiers = [self._resolve_tier(candidate) for candidate in candidates]
+
+        verdicts = _run_pipeline_stage(
+            "constitution",
+            [lambda c=candidate, t=tier: self._evaluate_constitution(c, t, active_epoch_id) for candidate, tier in zip(candidates, tiers)],
+            workers=top_k,
+            stats=stages,
+        )
+        winners = []
+        for candidate, tier, verdict in zip(candidates, tiers, verdicts):
+            if verdict.get("passed"):
+                winners.append((candidate, tier, verdict))
+            else:
+                self._record_constitutional_rejection(candidate, tier, verdict, active_epoch_id)
+
+        committed: List[str] = []
+        not_committed: List[Dict[str, Any]] = []
+
+        def _commit(candidate: MutationRequest, tier: Any, verdict: Dict[str, Any]) -> None:
+            if committed:
+                verdict = self._evaluate_constitution(candidate, tier, active_epoch_id)
+                if not verdict.get("passed"):
+                    self._record_constitutional_rejection(candidate, tier, verdict, active_epoch_id)
+                    return
+            result = self._commit_candidate(candidate, tier, verdict, epoch_meta)
+            status = result.get("status")
+            # The executor's own lifecycle dry run also reports "dry_run" but is not a commit.
+            if status == "executed" or (self.dry_run and status == "dry_run"):
+                committed.append(candidate.agent_id)
+            else:
+                not_committed.append({"agent_id": candidate.agent_id, "status": status, "reason": result.get("reason") or result.get("error") or ""})
+
+        _run_pipeline_stage(
+            "commit",
+            [lambda c=candidate, t=tier, v=verdict: _commit(c, t, v) for candidate, tier, verdict in winners],
+            workers=1,
+            stats=stages,
+        )
+        metrics.log(
+            event_type="mutation_pipeline_cycle",
+            payload={
+                "epoch_id": active_epoch_id,
+                "top_k": top_k,
+                "candidates": len(candidates),
+                "committed": committed,
+                "not_committed": not_committed,
+                "stages": stages,
+            },
+            level="INFO",
+        )
 
     def _register_capabilities(self) -> None:
         registrations = [
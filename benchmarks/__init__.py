@@ -0,0 +1,6 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Offline benchmark suite for ledger, governance, replay and sandbox hot paths.
+
+    python -m benchmarks run --profile standard --output reports/bench.json
+    python -m benchmarks compare benchmarks/baseline.json reports/bench.json --threshold 0.25
+"""
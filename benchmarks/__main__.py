@@ -0,0 +1,113 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Command line for the benchmark suite: ``list``, ``run`` and ``compare``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from benchmarks import harness, suite
+
+DEFAULT_BASELINE_PATH = REPO_ROOT / "benchmarks" / "baseline.json"
+
+
+def _overrides(values: Sequence[str]) -> Dict[str, float]:
+    parsed: Dict[str, float] = {}
+    for value in values:
+        pattern, _, raw = value.rpartition("=")
+        if not pattern:
+            raise ValueError(f"expected PATTERN=THRESHOLD, got {value!r}")
+        parsed[pattern] = float(raw)
+    return parsed
+
+
+def _list(args: argparse.Namespace) -> int:
+    for case in harness.select(suite.cases(args.profile), args.filter):
+        print(case.case_id)
+    return 0
+
+
+def _run(args: argparse.Namespace) -> int:
+    selected = harness.select(suite.cases(args.profile), args.filter)
+    if not selected:
+        print("no benchmark matches the given filters", file=sys.stderr)
+        return 2
+    document = harness.run_cases(
+        selected,
+        profile=args.profile,
+        scratch=args.scratch,
+        progress=None if args.quiet else harness.print_result,
+    )
+    if args.output:
+        harness.write_results(document, args.output)
+    else:
+        print(json.dumps(document, indent=2, sort_keys=True))
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    try:
+        overrides = _overrides(args.threshold_for)
+        baseline = harness.load_results(args.baseline)
+        current = harness.load_results(args.current)
+    except (OSError, ValueError) as exc:
+        print(f"benchmark compare: {exc}", file=sys.stderr)
+        return 2
+    rows = harness.compare(baseline, current, threshold=args.threshold, overrides=overrides)
+    if args.format == "json":
+        print(json.dumps(harness.comparison_document(rows), indent=2, sort_keys=True))
+    else:
+        for row in rows:
+            ratio = f"{row.ratio:.2f}x" if row.ratio is not None else "-"
+            print(
+                f"{row.status:<9} {row.case_id}: {harness.format_seconds(row.baseline_s)} -> "
+                f"{harness.format_seconds(row.current_s)} ({ratio}, limit +{row.threshold:.0%})"
+            )
+    regressions = [row for row in rows if row.status == "regressed"]
+    if regressions:
+        print(f"benchmark compare failed: {len(regressions)} regression(s)", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for name, handler in (("list", _list), ("run", _run)):
+        command = commands.add_parser(name)
+        command.add_argument("--profile", choices=sorted(suite.PROFILES), default="standard")
+        command.add_argument("--filter", "-k", action="append", default=[], help="fnmatch pattern on case ids (repeatable)")
+        command.set_defaults(handler=handler)
+        if name == "run":
+            command.add_argument("--output", "-o", type=Path, default=None, help="results file (default: stdout)")
+            command.add_argument("--scratch", type=Path, default=None, help="parent directory for scratch ledgers")
+            command.add_argument("--quiet", "-q", action="store_true", help="no per-case progress on stderr")
+
+    compare = commands.add_parser("compare", help="fail when a benchmark regressed against the baseline")
+    compare.add_argument("baseline", type=Path, nargs="?", default=DEFAULT_BASELINE_PATH)
+    compare.add_argument("current", type=Path)
+    compare.add_argument("--threshold", type=float, default=harness.DEFAULT_THRESHOLD, help="allowed slowdown (0.25 = 25%%)")
+    compare.add_argument(
+        "--threshold-for",
+        action="append",
+        default=[],
+        metavar="PATTERN=THRESHOLD",
+        help="per-case threshold for case ids matching PATTERN (repeatable; last match wins)",
+    )
+    compare.add_argument("--format", choices=("text", "json"), default="text")
+    compare.set_defaults(handler=_compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Synthetic, fully chained ledgers for benchmarks.
+
+Files are written directly rather than through the append APIs so that a
+million-entry ledger takes seconds instead of an hour; the hash chains, bundle
+digests and epoch digests are computed exactly as the ledgers compute them, so
+``verify_integrity`` and replay accept the output.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import shutil
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+
+from runtime.evolution.lineage_v2 import GENESIS_HASH, LineageLedgerV2
+from security.ledger import journal
+
+DEFAULT_EPOCH_SIZE = 500
+SYNTHETIC_TS = "2026-01-01T00:00:00Z"
+_RISK_TIERS = ("low", "medium", "high")
+
+
+def epoch_id_for(position: int, epoch_size: int = DEFAULT_EPOCH_SIZE) -> str:
+    return f"bench-epoch-{position // epoch_size:06d}"
+
+
+def epoch_ids(count: int, epoch_size: int = DEFAULT_EPOCH_SIZE) -> List[str]:
+    return [epoch_id_for(start, epoch_size) for start in range(0, count, epoch_size)]
+
+
+def iter_lineage_events(count: int, *, epoch_size: int = DEFAULT_EPOCH_SIZE) -> Iterator[Dict[str, Any]]:
+    """Yield ``{"type", "payload"}`` events: each epoch is a start event, bundles, then an end event."""
+    epoch_size = max(3, epoch_size)
+    folder = LineageLedgerV2(Path("unused"))
+    epoch_digest = "sha256:0"
+    for position in range(count):
+        epoch_id = epoch_id_for(position, epoch_size)
+        slot = position % epoch_size
+        if slot == 0:
+            epoch_digest = "sha256:0"
+            yield {"type": "EpochStartEvent", "payload": {"epoch_id": epoch_id, "state": {"generation": position // epoch_size}}}
+        elif slot == epoch_size - 1:
+            yield {"type": "EpochEndEvent", "payload": {"epoch_id": epoch_id, "state": {"bundles": slot - 1}}}
+        else:
+            bundle_id = f"{epoch_id}-bundle-{slot:05d}"
+            payload: Dict[str, Any] = {
+                "epoch_id": epoch_id,
+                "bundle_id": bundle_id,
+                "impact": round((position % 100) / 100, 2),
+                "risk_tier": _RISK_TIERS[position % len(_RISK_TIERS)],
+                "strategy_set": ["safe"],
+                "certificate": {"bundle_id": bundle_id, "strategy_snapshot_hash": f"sha256:{position % 7}"},
+            }
+            payload["bundle_digest"] = folder.compute_bundle_digest(payload)
+            epoch_digest = "sha256:" + hashlib.sha256((epoch_digest + payload["bundle_digest"]).encode("utf-8")).hexdigest()
+            payload["epoch_digest"] = epoch_digest
+            yield {"type": "MutationBundleEvent", "payload": payload}
+
+
+def write_lineage_ledger(path: Path, count: int, *, epoch_size: int = DEFAULT_EPOCH_SIZE) -> List[str]:
+    """Write a valid lineage v2 ledger of ``count`` entries; return its epoch ids in ledger order."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    prev_hash = GENESIS_HASH
+    with path.open("w", encoding="utf-8") as handle:
+        for event in iter_lineage_events(count, epoch_size=epoch_size):
+            entry: Dict[str, Any] = {"type": event["type"], "payload": event["payload"], "prev_hash": prev_hash}
+            entry["hash"] = prev_hash = LineageLedgerV2._compute_hash(prev_hash, entry)
+            handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    return epoch_ids(count, max(3, epoch_size))
+
+
+def write_journal(path: Path, count: int) -> None:
+    """Write a valid Cryovant journal of ``count`` transactions."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    prev_hash = "0" * 64
+    with path.open("w", encoding="utf-8") as handle:
+        for position in range(count):
+            entry: Dict[str, Any] = {
+                "tx": f"TX-bench-{position:08d}",
+                "ts": SYNTHETIC_TS,
+                "type": "bench_tx",
+                "payload": {"sequence": position, "agent_id": f"agent-{position % 16}"},
+                "prev_hash": prev_hash,
+            }
+            entry["hash"] = prev_hash = journal._hash_line(prev_hash, entry)
+            handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def write_sandbox_evidence(path: Path, epochs: List[str]) -> None:
+    """Write one sandbox evidence row per epoch, in the shape the evidence bundle builder reads."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    prev_hash = "sha256:0"
+    with path.open("w", encoding="utf-8") as handle:
+        for epoch_id in epochs:
+            payload = {
+                "evidence_hash": f"sha256:{epoch_id}-evidence",
+                "manifest_hash": f"sha256:{epoch_id}-manifest",
+                "policy_hash": "sha256:bench-policy",
+                "manifest": {"epoch_id": epoch_id, "bundle_id": f"{epoch_id}-bundle-00001"},
+            }
+            entry_hash = "sha256:" + hashlib.sha256((prev_hash + json.dumps(payload, sort_keys=True)).encode("utf-8")).hexdigest()
+            handle.write(json.dumps({"payload": payload, "prev_hash": prev_hash, "hash": entry_hash}) + "\n")
+            prev_hash = entry_hash
+
+
+def cached_fixture(fixtures: Path, name: str, build: Callable[[Path], Any], target: Path) -> Path:
+    """Copy fixture ``name`` to ``target``, building it into ``fixtures`` on first use."""
+    source = fixtures / name
+    if not source.exists():
+        fixtures.mkdir(parents=True, exist_ok=True)
+        staging = fixtures / f".{name}.tmp"
+        build(staging)
+        staging.replace(source)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(source, target)
+    return target
+
+
+__all__ = [
+    "DEFAULT_EPOCH_SIZE",
+    "cached_fixture",
+    "epoch_id_for",
+    "epoch_ids",
+    "iter_lineage_events",
+    "write_journal",
+    "write_lineage_ledger",
+    "write_sandbox_evidence",
+]
@@ -0,0 +1,271 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Benchmark cases, the timing loop, result files and the baseline comparison.
+
+Each case gets its own scratch directory with the Cryovant journal, the
+lineage ledger and the metrics log redirected into it, so a run never touches
+the repository's ledgers. Timings are wall-clock seconds per operation; the
+comparison gates on the median, which is far less noisy than the mean on a
+shared machine.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Sequence
+
+from runtime import metrics
+from security.ledger import journal
+from tools.simulate_governance_harness import percentile
+
+RESULTS_SCHEMA_VERSION = "adaad.benchmark_results.v1"
+DEFAULT_THRESHOLD = 0.25
+
+
+@dataclass(frozen=True)
+class Workspace:
+    """Scratch directory for one case plus the run-wide fixture cache."""
+
+    workdir: Path
+    fixtures: Path
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    setup: Callable[[Workspace], Any]
+    operation: Callable[[Any], None]
+    params: Mapping[str, Any] = field(default_factory=dict)
+    repeat: int = 10
+    warmup: int = 1
+    # Operations performed by one ``operation`` call; samples are reported per operation.
+    ops_per_call: int = 1
+    teardown: Callable[[Any], None] | None = None
+
+    @property
+    def case_id(self) -> str:
+        inner = ",".join(f"{key}={value}" for key, value in sorted(self.params.items()))
+        return f"{self.name}[{inner}]" if inner else self.name
+
+
+@contextmanager
+def isolated_state(workdir: Path) -> Iterator[None]:
+    """Point the journal, lineage ledger and metrics log at ``workdir`` for the duration."""
+    targets = [
+        (journal, "LEDGER_FILE", workdir / "lineage.jsonl"),
+        (journal, "JOURNAL_PATH", workdir / "cryovant_journal.jsonl"),
+        (journal, "GENESIS_PATH", workdir / "cryovant_journal.genesis.jsonl"),
+        (journal, "TAIL_STATE_PATH", workdir / "cryovant_journal.tail.json"),
+        (journal, "LOCK_PATH", workdir / "cryovant_journal.lock"),
+        (metrics, "METRICS_PATH", workdir / "metrics.jsonl"),
+    ]
+    saved = [(module, attribute, getattr(module, attribute)) for module, attribute, _ in targets]
+    metrics.flush()
+    for module, attribute, value in targets:
+        setattr(module, attribute, value)
+    try:
+        yield
+    finally:
+        metrics.flush()
+        for module, attribute, value in saved:
+            setattr(module, attribute, value)
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    median = statistics.median(ordered)
+    return {
+        "min_s": ordered[0],
+        "median_s": median,
+        "mean_s": statistics.fmean(ordered),
+        "p95_s": percentile(ordered, 0.95),
+        "max_s": ordered[-1],
+        "stdev_s": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        "ops_per_sec": 1.0 / median if median > 0 else 0.0,
+    }
+
+
+def measure(case: Case, workspace: Workspace) -> Dict[str, Any]:
+    """Set up ``case``, discard ``warmup`` calls, then time ``repeat`` calls."""
+    workspace.workdir.mkdir(parents=True, exist_ok=True)
+    with isolated_state(workspace.workdir):
+        state = case.setup(workspace)
+        try:
+            for _ in range(case.warmup):
+                case.operation(state)
+            samples: List[float] = []
+            for _ in range(max(1, case.repeat)):
+                started = time.perf_counter()
+                case.operation(state)
+                samples.append((time.perf_counter() - started) / case.ops_per_call)
+        finally:
+            if case.teardown is not None:
+                case.teardown(state)
+    return {
+        "id": case.case_id,
+        "name": case.name,
+        "params": dict(case.params),
+        "samples": len(samples),
+        "ops_per_call": case.ops_per_call,
+        **summarize(samples),
+    }
+
+
+def environment() -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count() or 1,
+    }
+
+
+def select(cases: Sequence[Case], patterns: Sequence[str]) -> List[Case]:
+    if not patterns:
+        return list(cases)
+    return [case for case in cases if any(fnmatch.fnmatch(case.case_id, pattern) for pattern in patterns)]
+
+
+def run_cases(
+    cases: Sequence[Case],
+    *,
+    profile: str,
+    scratch: Path | None = None,
+    progress: Callable[[Dict[str, Any]], None] | None = None,
+) -> Dict[str, Any]:
+    """Measure every case and return the results document."""
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="adaad-bench-", dir=scratch) as root:
+        fixtures = Path(root) / "fixtures"
+        for index, case in enumerate(cases):
+            result = measure(case, Workspace(workdir=Path(root) / f"case-{index:03d}", fixtures=fixtures))
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    return {
+        "schema_version": RESULTS_SCHEMA_VERSION,
+        "profile": profile,
+        "environment": environment(),
+        "results": results,
+    }
+
+
+def write_results(document: Mapping[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    document = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(document, dict) or document.get("schema_version") != RESULTS_SCHEMA_VERSION:
+        raise ValueError(f"{path}: not a {RESULTS_SCHEMA_VERSION} results file")
+    return document
+
+
+@dataclass(frozen=True)
+class Comparison:
+    case_id: str
+    status: str  # ok | regressed | improved | missing | new
+    baseline_s: float | None
+    current_s: float | None
+    threshold: float
+
+    @property
+    def ratio(self) -> float | None:
+        if not self.baseline_s or self.current_s is None:
+            return None
+        return self.current_s / self.baseline_s
+
+
+def threshold_for(case_id: str, default: float, overrides: Mapping[str, float]) -> float:
+    """Last matching ``fnmatch`` override wins; otherwise ``default``."""
+    chosen = default
+    for pattern, value in overrides.items():
+        if fnmatch.fnmatch(case_id, pattern):
+            chosen = value
+    return chosen
+
+
+def compare(
+    baseline: Mapping[str, Any],
+    current: Mapping[str, Any],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    overrides: Mapping[str, float] | None = None,
+) -> List[Comparison]:
+    """Compare median seconds per op; a case regresses when it is slower than ``baseline * (1 + threshold)``."""
+    overrides = overrides or {}
+    before = {row["id"]: float(row["median_s"]) for row in baseline.get("results", [])}
+    after = {row["id"]: float(row["median_s"]) for row in current.get("results", [])}
+    rows: List[Comparison] = []
+    for case_id in sorted(before.keys() | after.keys()):
+        limit = threshold_for(case_id, threshold, overrides)
+        old, new = before.get(case_id), after.get(case_id)
+        if old is None:
+            status = "new"
+        elif new is None:
+            status = "missing"
+        elif new > old * (1.0 + limit):
+            status = "regressed"
+        elif new < old / (1.0 + limit):
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append(Comparison(case_id=case_id, status=status, baseline_s=old, current_s=new, threshold=limit))
+    return rows
+
+
+def comparison_document(rows: Sequence[Comparison]) -> Dict[str, Any]:
+    return {
+        "passed": not any(row.status == "regressed" for row in rows),
+        "regressions": [row.case_id for row in rows if row.status == "regressed"],
+        "comparisons": [{**asdict(row), "ratio": row.ratio} for row in rows],
+    }
+
+
+def format_seconds(value: float | None) -> str:
+    if value is None:
+        return "-"
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if value >= scale:
+            return f"{value / scale:.3f}{unit}"
+    return f"{value / 1e-9:.0f}ns"
+
+
+def print_result(result: Mapping[str, Any]) -> None:
+    print(
+        f"{result['id']}: median {format_seconds(result['median_s'])}  p95 {format_seconds(result['p95_s'])}  "
+        f"{result['ops_per_sec']:.1f} ops/s  ({result['samples']} samples)",
+        file=sys.stderr,
+    )
+
+
+__all__ = [
+    "Case",
+    "Comparison",
+    "DEFAULT_THRESHOLD",
+    "RESULTS_SCHEMA_VERSION",
+    "Workspace",
+    "compare",
+    "comparison_document",
+    "isolated_state",
+    "load_results",
+    "measure",
+    "run_cases",
+    "select",
+    "summarize",
+    "threshold_for",
+    "write_results",
+]
@@ -0,0 +1,250 @@
+# SPDX-License-Identifier: Apache-2.0
+"""The benchmark cases, per profile.
+
+``quick`` is a smoke run (seconds), ``standard`` measures the ledger paths at
+10k and 100k entries, and ``full`` adds 1M entries.
+"""
+
+from __future__ import annotations
+
+import itertools
+import subprocess
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Sequence
+
+from benchmarks import generators
+from benchmarks.harness import Case, Workspace
+from runtime import constitution, metrics
+from runtime.evolution.evidence_bundle import EvidenceBundleBuilder
+from runtime.evolution.lineage_v2 import LineageLedgerV2
+from runtime.evolution.replay import ReplayEngine
+from runtime.test_sandbox import TestSandbox
+from security.ledger import journal
+from tools.simulate_governance_harness import RequestMix, mixed_request
+
+PROFILES: Dict[str, Dict[str, Any]] = {
+    "quick": {"ledger_sizes": (1_000,), "append_repeat": 20, "scan_repeat": 2, "contention": (2,), "cold_sandbox": False},
+    "standard": {"ledger_sizes": (10_000, 100_000), "append_repeat": 200, "scan_repeat": 5, "contention": (1, 4), "cold_sandbox": True},
+    "full": {
+        "ledger_sizes": (10_000, 100_000, 1_000_000),
+        "append_repeat": 200,
+        "scan_repeat": 3,
+        "contention": (1, 4, 8),
+        "cold_sandbox": True,
+    },
+}
+METRICS_LINES_PER_WORKER = 200
+
+
+def _lineage(workspace: Workspace, entries: int) -> LineageLedgerV2:
+    """Copy the cached ``entries``-sized ledger into the case directory and warm its tail state and epoch index."""
+    path = generators.cached_fixture(
+        workspace.fixtures,
+        f"lineage_v2-{entries}.jsonl",
+        lambda target: generators.write_lineage_ledger(target, entries),
+        workspace.workdir / "lineage_v2.jsonl",
+    )
+    ledger = LineageLedgerV2(path)
+    ledger.get_epoch_summary(generators.epoch_id_for(0))
+    return ledger
+
+
+def _middle_epoch(entries: int) -> str:
+    epochs = generators.epoch_ids(entries)
+    return epochs[len(epochs) // 2]
+
+
+def _append_event(state: Dict[str, Any]) -> None:
+    state["ledger"].append_event("BenchmarkEvent", {"epoch_id": state["epoch_id"], "sequence": next(state["sequence"])})
+
+
+def _lineage_cases(sizes: Sequence[int], append_repeat: int, scan_repeat: int) -> List[Case]:
+    cases: List[Case] = []
+    for entries in sizes:
+        scans = max(1, scan_repeat if entries < 1_000_000 else scan_repeat // 2)
+        cases.append(
+            Case(
+                name="lineage.append_event",
+                params={"entries": entries},
+                setup=lambda ws, n=entries: {
+                    "ledger": _lineage(ws, n),
+                    "epoch_id": generators.epoch_ids(n)[-1],
+                    "sequence": itertools.count(),
+                },
+                operation=_append_event,
+                repeat=append_repeat,
+            )
+        )
+        cases.append(
+            Case(
+                name="lineage.verify_integrity",
+                params={"entries": entries},
+                setup=lambda ws, n=entries: _lineage(ws, n),
+                operation=lambda ledger: ledger.verify_integrity(),
+                repeat=scans,
+                warmup=0,
+            )
+        )
+        cases.append(
+            Case(
+                name="replay.replay_epoch",
+                params={"entries": entries},
+                setup=lambda ws, n=entries: (ReplayEngine(_lineage(ws, n)), _middle_epoch(n)),
+                operation=lambda state: state[0].replay_epoch(state[1]),
+                repeat=scans * 4,
+            )
+        )
+        cases.append(
+            Case(
+                name="evidence.build_bundle",
+                params={"entries": entries},
+                setup=lambda ws, n=entries: _evidence_builder(ws, n),
+                operation=lambda state: state[0].build_bundle(epoch_start=state[1], persist=False),
+                repeat=scans * 2,
+            )
+        )
+        cases.append(
+            Case(
+                name="evidence.export_bundle",
+                params={"entries": entries},
+                setup=lambda ws, n=entries: _evidence_builder(ws, n),
+                operation=lambda state: state[0].export_bundle(epoch_start=state[1]),
+                repeat=scans * 2,
+            )
+        )
+    return cases
+
+
+def _evidence_builder(workspace: Workspace, entries: int) -> tuple[EvidenceBundleBuilder, str]:
+    ledger = _lineage(workspace, entries)
+    sandbox_path = workspace.workdir / "sandbox_evidence.jsonl"
+    generators.write_sandbox_evidence(sandbox_path, generators.epoch_ids(entries))
+    builder = EvidenceBundleBuilder(
+        ledger=ledger,
+        sandbox_evidence_path=sandbox_path,
+        export_dir=workspace.workdir / "exports",
+    )
+    return builder, _middle_epoch(entries)
+
+
+def _journal_setup(workspace: Workspace, entries: int) -> None:
+    generators.cached_fixture(
+        workspace.fixtures,
+        f"cryovant_journal-{entries}.jsonl",
+        lambda target: generators.write_journal(target, entries),
+        journal.JOURNAL_PATH,
+    )
+
+
+def _journal_cases(sizes: Sequence[int], append_repeat: int) -> List[Case]:
+    sequence = itertools.count()
+    return [
+        Case(
+            name="journal.append_tx",
+            params={"entries": entries},
+            setup=lambda ws, n=entries: _journal_setup(ws, n),
+            operation=lambda _state: journal.append_tx("bench_tx", {"sequence": next(sequence)}),
+            repeat=append_repeat,
+        )
+        for entries in sizes
+    ]
+
+
+def _log_lines(count: int) -> None:
+    for sequence in range(count):
+        metrics.log(event_type="benchmark_metrics_line", payload={"sequence": sequence})
+    metrics.flush()
+
+
+def _init_metrics_worker(metrics_path: str) -> None:
+    metrics.METRICS_PATH = Path(metrics_path)
+
+
+def _fan_out(pool: Executor, workers: int) -> None:
+    for future in wait([pool.submit(_log_lines, METRICS_LINES_PER_WORKER) for _ in range(workers)]).done:
+        future.result()
+
+
+def _metrics_pool(kind: str, workers: int) -> Executor:
+    if kind == "threads":
+        return ThreadPoolExecutor(max_workers=workers)
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_metrics_worker, initargs=(str(metrics.METRICS_PATH),))
+    _fan_out(pool, workers)  # start every worker before the clock runs
+    return pool
+
+
+def _metrics_cases(contention: Sequence[int], repeat: int) -> List[Case]:
+    return [
+        Case(
+            name="metrics.log",
+            params={kind: workers},
+            setup=lambda _ws, k=kind, w=workers: _metrics_pool(k, w),
+            operation=lambda pool, w=workers: _fan_out(pool, w),
+            teardown=lambda pool: pool.shutdown(wait=True),
+            repeat=repeat,
+            ops_per_call=workers * METRICS_LINES_PER_WORKER,
+        )
+        for kind in ("threads", "processes")
+        for workers in contention
+    ]
+
+
+def _governance_cases(repeat: int) -> List[Case]:
+    cases: List[Case] = []
+    for tier in constitution.Tier:
+        mix = RequestMix(op_sizes=(1, 8, 32), tiers=(tier.name,))
+        requests = [mixed_request(index, mix, seed=0)[:2] for index in range(64)]
+        cases.append(
+            Case(
+                name="constitution.evaluate_mutation",
+                params={"tier": tier.name},
+                setup=lambda _ws, items=requests: itertools.cycle(items),
+                operation=lambda cycle: constitution.evaluate_mutation(*next(cycle)),
+                repeat=repeat,
+            )
+        )
+    return cases
+
+
+class _NoopRunner:
+    """Returns a passing pytest result at once, leaving only the sandbox's own overhead on the clock."""
+
+    def run(self, args: Sequence[str], *, cwd: Path, env: Mapping[str, str], timeout_s: int) -> subprocess.CompletedProcess[str]:
+        return subprocess.CompletedProcess([*args], 0, stdout="1 passed\n", stderr="")
+
+
+def _sandbox_setup(workspace: Workspace, cold: bool) -> TestSandbox:
+    project = workspace.workdir / "project"
+    project.mkdir(parents=True, exist_ok=True)
+    (project / "test_bench_trivial.py").write_text("def test_trivial():\n    assert True\n", encoding="utf-8")
+    return TestSandbox(root_dir=project, timeout_s=120, runner=None if cold else _NoopRunner())
+
+
+def _sandbox_cases(cold_sandbox: bool, repeat: int) -> List[Case]:
+    runners = ("noop", "cold") if cold_sandbox else ("noop",)
+    return [
+        Case(
+            name="sandbox.run_tests",
+            params={"runner": runner},
+            setup=lambda ws, cold=(runner == "cold"): _sandbox_setup(ws, cold),
+            operation=lambda sandbox: sandbox.run_tests(["-q", "-p", "no:cacheprovider"]),
+            repeat=max(1, repeat // 10) if runner == "cold" else repeat,
+        )
+        for runner in runners
+    ]
+
+
+def cases(profile: str = "standard") -> List[Case]:
+    config = PROFILES[profile]
+    sizes = config["ledger_sizes"]
+    return [
+        *_lineage_cases(sizes, config["append_repeat"], config["scan_repeat"]),
+        *_journal_cases(sizes, config["append_repeat"]),
+        *_metrics_cases(config["contention"], config["scan_repeat"] * 2),
+        *_governance_cases(config["append_repeat"] // 4),
+        *_sandbox_cases(config["cold_sandbox"], config["append_repeat"] // 4),
+    ]
+
+
+__all__ = ["METRICS_LINES_PER_WORKER", "PROFILES", "cases"]
@@ -8,26 +8,32 @@ Every mutation passes through constitutional evaluation before execution.
 
 from __future__ import annotations
 
-import ast
-import calendar
+import concurrent.futures
+import contextvars
+import copy
 import functools
 import fnmatch
 import inspect
 import hashlib
 import json
 import os
+import threading
 import time
+from collections import OrderedDict
 from contextlib import contextmanager
 from contextvars import ContextVar, Token
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Mapping
+from typing import Any, Callable, Dict, Iterator, List, Mapping
 
+from adaad.core import ast_cache
 from app.agents.mutation_request import MutationRequest
 from runtime import metrics
+from runtime.governance.deterministic_envelope import EntropyConsumption, adopt_envelope, capture_envelope
+from runtime.governance.deterministic_filesystem import stamp_is_settled, stat_stamp
 from runtime.governance.resource_accounting import coalesce_resource_usage_snapshot, normalize_resource_usage_snapshot
-from security.ledger import journal
+from security.ledger import journal, rate_index
 
 CONSTITUTION_VERSION = "0.2.0"
 ELEMENT_ID = "Earth"
@@ -54,6 +60,8 @@ VALIDATOR_VERSIONS: Dict[str, str] = {
 }
 _LINEAGE_VALIDATION_CACHE: Dict[str, Any] = {}
 _POLICY_DOCUMENT: Dict[str, Any] = {}
+_GOVERNANCE_FINGERPRINT_CACHE: Dict[str, Any] = {}
+_DOMAIN_CLASSIFICATION_CACHE: Dict[str, Any] = {}
 
 
 def _canonical_json(value: Any) -> str:
@@ -108,20 +116,53 @@ def _order_rules_with_dependencies(rules: List[tuple[Rule, Severity]]) -> List[t
     return ordered
 
 
+class _UnsettledFileStamp(Exception):
+    """A stamped file changed inside the racy window, so its stat stamp cannot key a cache."""
+
+
+def _file_stamp(path: Path) -> Dict[str, Any]:
+    """Return a stat stamp used to key file-derived caches.
+
+    Raises :class:`_UnsettledFileStamp` when the file was modified too recently
+    for the stamp to be trusted; callers then skip the cache.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return {"path": str(path), "exists": False}
+    if not stamp_is_settled(time.time_ns(), stat.st_mtime_ns):
+        raise _UnsettledFileStamp(str(path))
+    return {"path": str(path), "exists": True, "stamp": list(stat_stamp(stat))}
+
+
+def _settled_file_stamp_json(path: Path) -> str | None:
+    try:
+        return _canonical_json(_file_stamp(path))
+    except _UnsettledFileStamp:
+        return None
 
 
 def _governance_fingerprint_components() -> Dict[str, Any]:
+    stamp = _settled_file_stamp_json(RULE_APPLICABILITY_PATH)
+    cache_key = (stamp, POLICY_HASH, tuple((rule.name, rule.validator) for rule in RULES))
+    cached = _GOVERNANCE_FINGERPRINT_CACHE.get("entry")
+    if stamp is not None and cached is not None and cached[0] == cache_key:
+        return copy.deepcopy(cached[1])
     applicability_text = RULE_APPLICABILITY_PATH.read_text(encoding="utf-8") if RULE_APPLICABILITY_PATH.exists() else ""
     validator_hashes = {
         name: _validator_provenance(rule).get("validator_source_hash", "")
         for name, rule in sorted(((rule.name, rule) for rule in RULES), key=lambda item: item[0])
     }
-    return {
+    components = {
         "constitution_version": CONSTITUTION_VERSION,
         "policy_hash": POLICY_HASH,
         "applicability_hash": hashlib.sha256(applicability_text.encode("utf-8")).hexdigest(),
         "validator_hashes": validator_hashes,
     }
+    if stamp is not None:
+        # Single assignment so concurrent evaluations never observe a half-updated entry.
+        _GOVERNANCE_FINGERPRINT_CACHE["entry"] = (cache_key, copy.deepcopy(components))
+    return components
 
 
 def _current_governance_fingerprint() -> str:
@@ -460,20 +501,6 @@ def _validate_complexity(request: MutationRequest) -> Dict[str, Any]:
     """Compute deterministic cyclomatic complexity delta using AST traversal."""
     from runtime.preflight import _extract_source, _extract_targets
 
-    def _cyclomatic_complexity(source: str, filename: str) -> int:
-        tree = ast.parse(source, filename=filename)
-        complexity = 1
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.If, ast.For, ast.AsyncFor, ast.While, ast.ExceptHandler, ast.With, ast.AsyncWith, ast.IfExp)):
-                complexity += 1
-            elif isinstance(node, ast.BoolOp):
-                complexity += max(0, len(node.values) - 1)
-            elif isinstance(node, ast.comprehension):
-                complexity += 1
-            elif hasattr(ast, "Match") and isinstance(node, ast.Match):
-                complexity += max(1, len(getattr(node, "cases", [])))
-        return complexity
-
     raw_threshold = os.getenv("ADAAD_MAX_COMPLEXITY_DELTA", "5").strip()
     try:
         threshold = int(raw_threshold)
@@ -496,8 +523,8 @@ def _validate_complexity(request: MutationRequest) -> Dict[str, Any]:
             candidate_source = baseline_source
 
         try:
-            baseline_complexity = _cyclomatic_complexity(baseline_source, str(target)) if baseline_source else 0
-            candidate_complexity = _cyclomatic_complexity(candidate_source, str(target)) if candidate_source else 0
+            baseline_complexity = ast_cache.cyclomatic_complexity(baseline_source, str(target)) if baseline_source else 0
+            candidate_complexity = ast_cache.cyclomatic_complexity(candidate_source, str(target)) if candidate_source else 0
         except SyntaxError as exc:
             return {
                 "ok": False,
@@ -613,19 +640,6 @@ def _validate_coverage(_: MutationRequest) -> Dict[str, Any]:
     return {"ok": True, "reason": "coverage_maintained", "details": details}
 
 
-def _parse_iso_ts(value: str | None) -> float | None:
-    if not value:
-        return None
-    try:
-        if value.endswith("Z"):
-            parsed = time.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
-        else:
-            parsed = time.strptime(value, "%Y-%m-%dT%H:%M:%S")
-    except (TypeError, ValueError):
-        return None
-    return float(calendar.timegm(parsed))
-
-
 def _resolve_mutation_rate_limit() -> tuple[str, str, float]:
     """Resolve max mutation rate with deterministic env precedence."""
     new_name = "ADAAD_MAX_MUTATION_RATE"
@@ -640,67 +654,8 @@ def _resolve_mutation_rate_limit() -> tuple[str, str, float]:
 
 
 def _deterministic_mutation_count(window_sec: int, epoch_id: str) -> Dict[str, Any]:
-    """Count recent mutation actions from the immutable ledger stream."""
-    event_types = {
-        "mutation_approved_constitutional",
-        "mutation_rejected_constitutional",
-        "mutation_planned",
-        "mutation_executed",
-        "mutation_failed",
-        "mutation_noop",
-    }
-    lines = journal.ensure_ledger().read_text(encoding="utf-8").splitlines()
-    parsed_entries: List[Dict[str, Any]] = []
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            entry = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if not isinstance(entry, dict):
-            continue
-        parsed_entries.append(entry)
-
-    scoped_entries: List[Dict[str, Any]] = []
-    for entry in parsed_entries:
-        action = str(entry.get("action") or "")
-        if action not in event_types:
-            continue
-        payload = entry.get("payload") or {}
-        entry_epoch = str(payload.get("epoch_id") or "").strip()
-        if epoch_id and entry_epoch and entry_epoch != epoch_id:
-            continue
-        if epoch_id and not entry_epoch:
-            continue
-        scoped_entries.append(entry)
-
-    latest_event_ts = None
-    if scoped_entries:
-        latest_event_ts = max((_parse_iso_ts(str(item.get("timestamp") or "")) or 0.0) for item in scoped_entries)
-    window_end_ts = latest_event_ts if latest_event_ts and latest_event_ts > 0 else 0.0
-    window_start_ts = window_end_ts - window_sec
-
-    count = 0
-    for entry in scoped_entries:
-        ts = _parse_iso_ts(str(entry.get("timestamp") or ""))
-        if ts is None or ts < window_start_ts:
-            continue
-        count += 1
-
-    return {
-        "window_sec": window_sec,
-        "window_start_ts": window_start_ts,
-        "window_end_ts": window_end_ts,
-        "count": count,
-        "rate_per_hour": (count * 3600.0 / window_sec) if window_sec > 0 else float(count),
-        "event_types": sorted(event_types),
-        "entries_considered": len(parsed_entries),
-        "entries_scoped": len(scoped_entries),
-        "scope": {"epoch_id": epoch_id or "*"},
-        "source": "security.ledger.lineage",
-    }
+    """Count recent mutation actions from the immutable ledger stream via its sliding-window index."""
+    return rate_index.index_for(journal.ensure_ledger()).snapshot(window_sec=window_sec, epoch_id=epoch_id)
 
 
 def _validate_mutation_rate(request: MutationRequest) -> Dict[str, Any]:
@@ -914,6 +869,17 @@ def _load_rule_applicability(path: Path = RULE_APPLICABILITY_PATH) -> Dict[str,
 
 
 def _extract_domain_classification_config() -> Dict[str, Any]:
+    cache_key = _settled_file_stamp_json(RULE_APPLICABILITY_PATH)
+    cached = _DOMAIN_CLASSIFICATION_CACHE.get("entry")
+    if cache_key is not None and cached is not None and cached[0] == cache_key:
+        return copy.deepcopy(cached[1])
+    config = _load_domain_classification_config()
+    if cache_key is not None:
+        _DOMAIN_CLASSIFICATION_CACHE["entry"] = (cache_key, copy.deepcopy(config))
+    return config
+
+
+def _load_domain_classification_config() -> Dict[str, Any]:
     policy_doc = _load_policy_document(RULE_APPLICABILITY_PATH)[0]
     raw = policy_doc.get("domain_classification") if isinstance(policy_doc, dict) else {}
     if not isinstance(raw, dict):
@@ -1274,6 +1240,196 @@ VALIDATOR_REGISTRY: Dict[str, Callable[[MutationRequest], Dict[str, Any]]] = {
 }
 
 
+def _env_inputs(*names: str) -> Dict[str, str | None]:
+    return {name: os.getenv(name) for name in names}
+
+
+def _envelope_inputs(*keys: str) -> Dict[str, Any]:
+    state = get_deterministic_envelope_state()
+    return {key: state.get(key) for key in keys}
+
+
+def _target_inputs(request: MutationRequest) -> List[Dict[str, Any]]:
+    from runtime.preflight import _extract_targets
+
+    return [_file_stamp(target) for target in sorted(_extract_targets(request), key=str)]
+
+
+def _lineage_inputs(_: MutationRequest) -> Dict[str, Any]:
+    return {
+        "genesis": _file_stamp(journal.GENESIS_PATH),
+        "journal": _file_stamp(journal.JOURNAL_PATH),
+        "env": _env_inputs("ADAAD_ENV", "CRYOVANT_DEV_MODE"),
+    }
+
+
+def _coverage_inputs(_: MutationRequest) -> Dict[str, Any]:
+    state = _envelope_inputs(
+        "tier",
+        "fitness_coverage_baseline",
+        "fitness_coverage_post",
+        "fitness_coverage_baseline_path",
+        "fitness_coverage_post_path",
+    )
+    env = _env_inputs("ADAAD_FITNESS_COVERAGE_BASELINE_PATH", "ADAAD_FITNESS_COVERAGE_POST_PATH")
+    artifacts = [
+        _file_stamp(Path(value))
+        for value in (
+            state["fitness_coverage_baseline_path"] or env["ADAAD_FITNESS_COVERAGE_BASELINE_PATH"],
+            state["fitness_coverage_post_path"] or env["ADAAD_FITNESS_COVERAGE_POST_PATH"],
+        )
+        if isinstance(value, str) and value.strip()
+    ]
+    return {"envelope": state, "env": env, "artifacts": artifacts}
+
+
+def _mutation_rate_inputs(_: MutationRequest) -> Dict[str, Any]:
+    return {
+        "ledger": _file_stamp(journal.LEDGER_FILE),
+        "env": _env_inputs("ADAAD_MAX_MUTATION_RATE", "ADAAD_MAX_MUTATIONS_PER_HOUR", "ADAAD_MUTATION_RATE_WINDOW_SEC"),
+        "envelope": _envelope_inputs("tier", "domain_classification"),
+    }
+
+
+def _resource_inputs(_: MutationRequest) -> Dict[str, Any] | None:
+    if not _POLICY_DOCUMENT:
+        # The fallback path logs a policy-unavailable warning on every evaluation.
+        return None
+    return {
+        "env": _env_inputs("ADAAD_RESOURCE_MEMORY_MB", "ADAAD_RESOURCE_CPU_SECONDS", "ADAAD_RESOURCE_WALL_SECONDS"),
+        "envelope": _envelope_inputs("platform_telemetry", "resource_measurements"),
+    }
+
+
+def _entropy_inputs(_: MutationRequest) -> Dict[str, Any]:
+    return {
+        "env": _env_inputs("ADAAD_MAX_MUTATION_ENTROPY_BITS", "ADAAD_MAX_EPOCH_ENTROPY_BITS"),
+        "envelope": _envelope_inputs("tier", "domain_classification", "observed_entropy_bits", "epoch_entropy_bits"),
+    }
+
+
+# External inputs each validator reads beyond the request itself. A cached verdict is
+# reused only while these inputs (plus request, tier, policy and governance fingerprint)
+# are unchanged; validators without a declaration (or returning None, or stamping a
+# file still inside the racy window) are never cached.
+VALIDATOR_INPUTS: Dict[str, Callable[[MutationRequest], Any]] = {
+    "_validate_single_file": lambda _request: {},
+    "_validate_ast": _target_inputs,
+    "_validate_imports": _target_inputs,
+    "_validate_signature": lambda _request: _env_inputs("ADAAD_ENV", "CRYOVANT_DEV_MODE"),
+    "_validate_no_banned_tokens": _target_inputs,
+    "_validate_lineage": _lineage_inputs,
+    "_validate_complexity": lambda request: {
+        "env": _env_inputs("ADAAD_MAX_COMPLEXITY_DELTA"),
+        "targets": _target_inputs(request),
+    },
+    "_validate_coverage": _coverage_inputs,
+    "_validate_mutation_rate": _mutation_rate_inputs,
+    "_validate_resources": _resource_inputs,
+    "_validate_entropy_budget_limit": _entropy_inputs,
+}
+# Passing results that still emit audit events must re-run so the events are not lost.
+_UNCACHEABLE_REASONS = {"coverage_regressed_sandbox_warning"}
+VERDICT_CACHE_MAX_ENTRIES = 1024
+_VERDICT_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_VERDICT_CACHE_STATS: Dict[str, int] = {"hits": 0, "misses": 0}
+_VERDICT_CACHE_LOCK = threading.Lock()
+# Profiling side channel: wall-clock timings must never reach verdicts, whose provenance is hashed into the envelope.
+_RULE_TIMING_SINK: ContextVar[List[Dict[str, Any]] | None] = ContextVar("rule_timing_sink", default=None)
+
+
+def verdict_cache_enabled() -> bool:
+    return os.getenv("ADAAD_CONSTITUTION_VERDICT_CACHE", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def clear_verdict_cache() -> None:
+    """Drop all cached validator results and reset hit/miss counters."""
+    with _VERDICT_CACHE_LOCK:
+        _VERDICT_CACHE.clear()
+        _VERDICT_CACHE_STATS.update(hits=0, misses=0)
+
+
+def verdict_cache_stats() -> Dict[str, int]:
+    with _VERDICT_CACHE_LOCK:
+        return {**_VERDICT_CACHE_STATS, "entries": len(_VERDICT_CACHE)}
+
+
+@contextmanager
+def record_rule_timings() -> Iterator[List[Dict[str, Any]]]:
+    """
+    Collect ``{"rule", "elapsed_ns", "cached"}`` for every validator run in this context.
+
+    Validator worker threads inherit the sink through the copied context. Timings
+    are returned to the caller only; verdicts and envelope digests are unchanged.
+    """
+    sink: List[Dict[str, Any]] = []
+    token = _RULE_TIMING_SINK.set(sink)
+    try:
+        yield sink
+    finally:
+        _RULE_TIMING_SINK.reset(token)
+
+
+def _verdict_cache_key(
+    rule: Rule,
+    request: MutationRequest,
+    tier: Tier,
+    request_digest: str,
+    governance_fingerprint: str,
+) -> str | None:
+    declare_inputs = VALIDATOR_INPUTS.get(rule.validator.__name__)
+    if declare_inputs is None or rule.validator not in VALIDATOR_REGISTRY.values():
+        return None
+    try:
+        inputs = declare_inputs(request)
+    except Exception:
+        return None
+    if inputs is None:
+        return None
+    return _canonical_digest(
+        {
+            "rule": rule.name,
+            "request_digest": request_digest,
+            "tier": tier.name,
+            "policy_hash": POLICY_HASH,
+            "governance_fingerprint": governance_fingerprint,
+            "provenance": _validator_provenance(rule),
+            "inputs": inputs,
+        }
+    )
+
+
+def _invoke_validator(rule: Rule, request: MutationRequest, cache_key: str | None) -> tuple[Dict[str, Any], bool]:
+    if cache_key is not None:
+        with _VERDICT_CACHE_LOCK:
+            cached = _VERDICT_CACHE.get(cache_key)
+            if cached is not None:
+                _VERDICT_CACHE.move_to_end(cache_key)
+                _VERDICT_CACHE_STATS["hits"] += 1
+                return copy.deepcopy(cached), True
+            _VERDICT_CACHE_STATS["misses"] += 1
+    try:
+        result = rule.validator(request)
+    except Exception as exc:
+        return {"ok": False, "reason": f"validator_error:{exc}"}, False
+    if cache_key is not None and result.get("ok") is True and result.get("reason") not in _UNCACHEABLE_REASONS:
+        with _VERDICT_CACHE_LOCK:
+            _VERDICT_CACHE[cache_key] = copy.deepcopy(result)
+            while len(_VERDICT_CACHE) > VERDICT_CACHE_MAX_ENTRIES:
+                _VERDICT_CACHE.popitem(last=False)
+    return result, False
+
+
+def _run_validator(rule: Rule, request: MutationRequest, cache_key: str | None) -> Dict[str, Any]:
+    sink = _RULE_TIMING_SINK.get()
+    if sink is None:
+        return _invoke_validator(rule, request, cache_key)[0]
+    started = time.perf_counter_ns()
+    result, cached = _invoke_validator(rule, request, cache_key)
+    sink.append({"rule": rule.name, "elapsed_ns": time.perf_counter_ns() - started, "cached": cached})
+    return result
+
+
 def _policy_hash(policy_text: str) -> str:
     return hashlib.sha256(policy_text.encode("utf-8")).hexdigest()
 
@@ -1434,6 +1590,74 @@ def get_rules_for_tier(tier: Tier) -> List[tuple[Rule, Severity]]:
     return result
 
 
+def _resolve_validator_workers() -> int:
+    """Worker count for validator execution; ``ADAAD_CONSTITUTION_MAX_WORKERS`` > 1 enables the pool."""
+    raw = os.getenv("ADAAD_CONSTITUTION_MAX_WORKERS", "1").strip()
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        return 1
+
+
+def _run_validators(
+    rules: List[Rule],
+    evaluate: Callable[[Rule], Dict[str, Any]],
+    max_workers: int,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run ``evaluate`` for each rule, keyed by rule name.
+
+    With more than one worker the rules are scheduled as a DAG over
+    ``RULE_DEPENDENCY_GRAPH``: a rule is submitted once every dependency that
+    is also being evaluated has finished. Each task runs in a copy of the
+    caller's context, which carries the ContextVar envelope state, and adopts
+    the caller's thread-local entropy envelope so budget charges made by
+    validators count against the active ledger. Each task buffers its metrics
+    lines and entropy events; after the join they are emitted rule by rule in
+    ``rules`` order, so both match a sequential run.
+    """
+    if max_workers <= 1 or len(rules) <= 1:
+        return {rule.name: evaluate(rule) for rule in rules}
+
+    names = {rule.name for rule in rules}
+    pending = {
+        rule.name: (rule, {dep for dep in RULE_DEPENDENCY_GRAPH.get(rule.name, []) if dep in names}) for rule in rules
+    }
+    results: Dict[str, Dict[str, Any]] = {}
+    side_effects: Dict[str, tuple[List[bytes], List[EntropyConsumption]]] = {}
+    envelope = capture_envelope()
+
+    def _task(rule: Rule) -> Dict[str, Any]:
+        events: List[EntropyConsumption] = []
+        with metrics.deferred() as lines:
+            try:
+                with adopt_envelope(envelope, sink=events):
+                    return evaluate(rule)
+            finally:
+                side_effects[rule.name] = (lines, events)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(rules))) as pool:
+        running: Dict[concurrent.futures.Future[Dict[str, Any]], str] = {}
+        while pending or running:
+            ready = [name for name, (_rule, deps) in pending.items() if deps <= results.keys()]
+            if not ready and not running:
+                # Dependency cycle: fall back to the canonical order, as _order_rules_with_dependencies does.
+                ready = list(pending)
+            for name in ready:
+                rule, _deps = pending.pop(name)
+                running[pool.submit(contextvars.copy_context().run, _task, rule)] = name
+            done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.result()
+    ledger = envelope[0]
+    for rule in rules:
+        lines, events = side_effects.pop(rule.name, ([], []))
+        metrics.write_lines(lines)
+        if ledger is not None:
+            ledger.record(events)
+    return results
+
+
 def evaluate_mutation(request: MutationRequest, tier: Tier) -> Dict[str, Any]:
     """
     Apply all constitutional rules to a mutation request.
@@ -1448,6 +1672,9 @@ def evaluate_mutation(request: MutationRequest, tier: Tier) -> Dict[str, Any]:
 
     prior_state = get_deterministic_envelope_state()
     domain_classification = _classify_request_domains(request)
+    fingerprint_components = _governance_fingerprint_components()
+    drift_fingerprint = _canonical_digest(fingerprint_components)
+    request_digest = _canonical_digest(request.to_dict()) if verdict_cache_enabled() else ""
     evaluation_state = {
         **prior_state,
         "tier": tier.name,
@@ -1459,48 +1686,55 @@ def evaluate_mutation(request: MutationRequest, tier: Tier) -> Dict[str, Any]:
 
     with deterministic_envelope_scope(evaluation_state):
         applicability_matrix: List[Dict[str, Any]] = []
-        for rule, severity in rules:
+        applicable_rules: List[Rule] = []
+        for rule, _severity in rules:
             applicability_row = _evaluate_rule_applicability(rule, request, tier)
             applicability_matrix.append(applicability_row)
-            if not applicability_row["applicable"]:
-                verdicts.append(
-                    {
-                        "rule": rule.name,
-                        "severity": severity.value,
-                        "passed": True,
-                        "applicable": False,
-                        "provenance": _validator_provenance(rule),
-                        "details": {
-                            "ok": True,
-                            "reason": "rule_not_applicable",
-                            "applicability": applicability_row,
-                        },
-                    }
-                )
-                continue
-            try:
-                result = rule.validator(request)
-            except Exception as exc:
-                result = {"ok": False, "reason": f"validator_error:{exc}"}
-
-            verdict = {
-                "rule": rule.name,
-                "severity": severity.value,
-                "passed": result.get("ok", False),
-                "applicable": True,
-                "provenance": _validator_provenance(rule),
-                "details": result,
-            }
-            verdicts.append(verdict)
+            if applicability_row["applicable"]:
+                applicable_rules.append(rule)
+
+        def _evaluate(rule: Rule) -> Dict[str, Any]:
+            cache_key = (
+                _verdict_cache_key(rule, request, tier, request_digest, drift_fingerprint) if request_digest else None
+            )
+            return _run_validator(rule, request, cache_key)
 
-            if not verdict["passed"]:
-                if severity == Severity.BLOCKING:
-                    blocking_failures.append(rule.name)
-                elif severity == Severity.WARNING:
-                    warnings.append(rule.name)
+        results = _run_validators(applicable_rules, _evaluate, _resolve_validator_workers())
+
+    for (rule, severity), applicability_row in zip(rules, applicability_matrix):
+        if not applicability_row["applicable"]:
+            verdicts.append(
+                {
+                    "rule": rule.name,
+                    "severity": severity.value,
+                    "passed": True,
+                    "applicable": False,
+                    "provenance": _validator_provenance(rule),
+                    "details": {
+                        "ok": True,
+                        "reason": "rule_not_applicable",
+                        "applicability": applicability_row,
+                    },
+                }
+            )
+            continue
+        result = results[rule.name]
+        verdict = {
+            "rule": rule.name,
+            "severity": severity.value,
+            "passed": result.get("ok", False),
+            "applicable": True,
+            "provenance": _validator_provenance(rule),
+            "details": result,
+        }
+        verdicts.append(verdict)
+
+        if not verdict["passed"]:
+            if severity == Severity.BLOCKING:
+                blocking_failures.append(rule.name)
+            elif severity == Severity.WARNING:
+                warnings.append(rule.name)
 
-    fingerprint_components = _governance_fingerprint_components()
-    drift_fingerprint = _canonical_digest(fingerprint_components)
     drift_detected = drift_fingerprint != _BASE_GOVERNANCE_FINGERPRINT
     if drift_detected:
         drift_reason = "governance_drift_detected"
@@ -1718,4 +1952,9 @@ __all__ = [
     "reset_deterministic_envelope_state",
     "deterministic_envelope_scope",
     "get_deterministic_envelope_state",
+    "VALIDATOR_INPUTS",
+    "verdict_cache_enabled",
+    "verdict_cache_stats",
+    "clear_verdict_cache",
+    "record_rule_timings",
 ]
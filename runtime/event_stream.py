@@ -0,0 +1,444 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Module: event_stream
+Purpose: Tail the lineage ledger and metrics stream from byte cursors for server-sent event views.
+Author: ADAAD / InnovativeAI-adaad
+Integration points:
+  - Imports from: runtime.metrics (segment-aware ``read_since``), runtime.evolution.lineage_v2 (ledger path)
+  - Consumed by: ui.aponi_dashboard and server.py ``/stream`` endpoints
+  - Governance impact: low — read-only view; ledger hash-chain verification stays with the full readers
+
+An :class:`EventStreamHub` keeps one shared tail per source and a bounded
+buffer of the most recent records. Observers call :meth:`EventStreamHub.read`
+with their own :class:`StreamCursor`; the hub re-reads a file only when its
+stat moved and serves every observer positioned inside the buffer from memory,
+so attaching more observers does not multiply ledger reads. Observers resuming
+from before the buffer are read directly from their cursor.
+
+Streamed lineage records are not re-verified against the hash chain; consumers
+needing verified history use the epoch/timeline endpoints.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from runtime import metrics
+from runtime.evolution.lineage_v2 import LEDGER_V2_PATH
+
+SOURCES: Tuple[str, ...] = ("lineage", "metrics")
+DEFAULT_BUFFER_SIZE = 2048
+DEFAULT_BATCH_LIMIT = 500
+DEFAULT_POLL_INTERVAL_S = 0.5
+DEFAULT_HEARTBEAT_S = 15.0
+
+# (segment, byte offset); lineage has a single segment 0.
+Position = Tuple[int, int]
+
+
+class StreamCursorError(ValueError):
+    """Raised when a stream cursor token cannot be parsed."""
+
+
+@dataclass(frozen=True)
+class StreamCursor:
+    lineage: Position
+    metrics: Position
+
+    def token(self) -> str:
+        return f"{self.lineage[1]}.{self.metrics[0]}.{self.metrics[1]}"
+
+    @classmethod
+    def parse(cls, token: str) -> "StreamCursor":
+        try:
+            lineage_offset, metrics_segment, metrics_offset = (int(part) for part in token.strip().split("."))
+        except ValueError as exc:
+            raise StreamCursorError(f"invalid_stream_cursor:{token}") from exc
+        if min(lineage_offset, metrics_segment, metrics_offset) < 0:
+            raise StreamCursorError(f"invalid_stream_cursor:{token}")
+        return cls(lineage=(0, lineage_offset), metrics=(metrics_segment, metrics_offset))
+
+    def get(self, source: str) -> Position:
+        return self.lineage if source == "lineage" else self.metrics
+
+    def advanced(self, source: str, position: Position) -> "StreamCursor":
+        if source == "lineage":
+            return StreamCursor(lineage=position, metrics=self.metrics)
+        return StreamCursor(lineage=self.lineage, metrics=position)
+
+
+@dataclass(frozen=True)
+class StreamEvent:
+    source: str
+    record: Dict[str, Any]
+    cursor: StreamCursor
+
+
+def event_type(source: str, record: Dict[str, Any]) -> str:
+    return str(record.get("type" if source == "lineage" else "event") or "")
+
+
+def event_epoch(record: Dict[str, Any]) -> str:
+    payload = record.get("payload")
+    if isinstance(payload, dict) and payload.get("epoch_id"):
+        return str(payload["epoch_id"])
+    return str(record.get("epoch_id") or "")
+
+
+def _stamp(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+
+def _read_lineage(path: Path, position: Position, limit: int) -> List[Tuple[Dict[str, Any], Position]]:
+    records: List[Tuple[Dict[str, Any], Position]] = []
+    try:
+        handle = path.open("rb")
+    except OSError:
+        return records
+    with handle:
+        offset = position[1]
+        handle.seek(0, 2)
+        if offset > handle.tell():
+            offset = 0  # ledger was truncated or replaced
+        handle.seek(offset)
+        for line in handle:
+            if not line.endswith(b"\n"):
+                break
+            offset += len(line)
+            try:
+                record = json.loads(line.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                continue
+            if isinstance(record, dict):
+                records.append((record, (0, offset)))
+                if len(records) >= limit:
+                    break
+    return records
+
+
+def _lineage_end(path: Path) -> Position:
+    stamp = _stamp(path)
+    return (0, stamp[0] if stamp else 0)
+
+
+def _read_metrics(path: Path, position: Position, limit: int) -> List[Tuple[Dict[str, Any], Position]]:
+    records: List[Tuple[Dict[str, Any], Position]] = []
+    for record, cursor in metrics.iter_since({"segment": position[0], "offset": position[1]}, path=path):
+        records.append((record, (int(cursor["segment"]), int(cursor["offset"]))))
+        if len(records) >= limit:
+            break
+    return records
+
+
+def _metrics_end(path: Path) -> Position:
+    metrics.flush()
+    stamp = _stamp(path)
+    return (int(metrics.load_segment_manifest(path)["active_segment"]), stamp[0] if stamp else 0)
+
+
+class _SharedTail:
+    """One source's shared read position plus a bounded buffer of ``(before, after, record)``."""
+
+    def __init__(
+        self,
+        read: Callable[[Position, int], List[Tuple[Dict[str, Any], Position]]],
+        end: Callable[[], Position],
+        signature: Callable[[], Any],
+        buffer_size: int,
+    ) -> None:
+        self._read = read
+        self._end = end
+        self._signature = signature
+        self._buffer: Deque[Tuple[Position, Position, Dict[str, Any]]] = deque(maxlen=max(1, int(buffer_size)))
+        self._position: Position | None = None
+        self._seen_signature: Any = None
+        self.reads = 0
+
+    def end(self) -> Position:
+        self._poll()
+        assert self._position is not None
+        return self._position
+
+    def _poll(self) -> None:
+        signature = self._signature()
+        if self._position is not None and signature == self._seen_signature:
+            return
+        self._seen_signature = signature
+        if self._position is None:
+            self._position = self._end()
+            return
+        while True:
+            batch = self._read(self._position, DEFAULT_BATCH_LIMIT)
+            self.reads += 1
+            for record, after in batch:
+                before = self._position
+                if after < before:
+                    # Source was truncated or replaced and re-read from its start; buffered positions no longer apply.
+                    self._buffer.clear()
+                    before = (after[0], 0)
+                self._buffer.append((before, after, record))
+                self._position = after
+            if len(batch) < DEFAULT_BATCH_LIMIT:
+                return
+
+    def buffered_since(self, position: Position, limit: int) -> List[Tuple[Dict[str, Any], Position]] | None:
+        """Records after ``position`` from the shared buffer, or ``None`` if it starts before the buffer."""
+        self._poll()
+        if self._buffer and self._buffer[0][0] <= position:
+            return [(record, after) for _, after, record in self._buffer if after > position][:limit]
+        if self._position is not None and position == self._position:
+            return []
+        self.reads += 1
+        return None
+
+    def read_direct(self, position: Position, limit: int) -> List[Tuple[Dict[str, Any], Position]]:
+        return self._read(position, limit)
+
+
+class EventStreamHub:
+    """Shared, thread-safe tail of the lineage ledger and metrics stream."""
+
+    def __init__(
+        self,
+        lineage_path: Path | None = None,
+        metrics_path: Path | None = None,
+        *,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        self._lineage_path = lineage_path
+        self._metrics_path = metrics_path
+        self._lock = threading.Lock()
+        self._tails = {
+            "lineage": _SharedTail(
+                lambda position, limit: _read_lineage(self.lineage_path, position, limit),
+                lambda: _lineage_end(self.lineage_path),
+                lambda: _stamp(self.lineage_path),
+                buffer_size,
+            ),
+            "metrics": _SharedTail(
+                lambda position, limit: _read_metrics(self.metrics_path, position, limit),
+                lambda: _metrics_end(self.metrics_path),
+                self._metrics_signature,
+                buffer_size,
+            ),
+        }
+
+    @property
+    def lineage_path(self) -> Path:
+        return self._lineage_path or LEDGER_V2_PATH
+
+    @property
+    def metrics_path(self) -> Path:
+        # Resolve lazily so callers that repoint metrics.METRICS_PATH stay in sync.
+        return self._metrics_path or metrics.METRICS_PATH
+
+    def _metrics_signature(self) -> Any:
+        metrics.flush()
+        return (_stamp(self.metrics_path), _stamp(self.metrics_path.with_suffix(".segments.json")))
+
+    def head(self) -> StreamCursor:
+        """Cursor positioned after everything currently written."""
+        with self._lock:
+            return StreamCursor(lineage=self._tails["lineage"].end(), metrics=self._tails["metrics"].end())
+
+    def read(
+        self,
+        cursor: StreamCursor,
+        *,
+        sources: Iterable[str] = SOURCES,
+        event_types: Iterable[str] = (),
+        epoch_id: str = "",
+        limit: int = DEFAULT_BATCH_LIMIT,
+    ) -> Tuple[List[StreamEvent], StreamCursor]:
+        """Events after ``cursor`` matching the filters, and the cursor to resume from.
+
+        The returned cursor also moves past records that were filtered out, so a
+        resumed stream never re-scans them.
+        """
+        wanted = set(event_types)
+        selected = set(sources)
+        events: List[StreamEvent] = []
+        for source in SOURCES:
+            if source not in selected:
+                continue
+            tail = self._tails[source]
+            with self._lock:
+                batch = tail.buffered_since(cursor.get(source), limit)
+            if batch is None:
+                # Resuming from before the shared buffer: catch up outside the lock.
+                batch = tail.read_direct(cursor.get(source), limit)
+            for record, after in batch:
+                cursor = cursor.advanced(source, after)
+                if wanted and event_type(source, record) not in wanted:
+                    continue
+                if epoch_id and event_epoch(record) != epoch_id:
+                    continue
+                events.append(StreamEvent(source=source, record=record, cursor=cursor))
+        return events, cursor
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {f"{source}_reads": tail.reads for source, tail in self._tails.items()}
+
+
+def format_sse(event: StreamEvent) -> str:
+    data = json.dumps({"source": event.source, "record": event.record}, ensure_ascii=False, sort_keys=True)
+    return f"id: {event.cursor.token()}\nevent: {event.source}\ndata: {data}\n\n"
+
+
+def _sse_polls(
+    hub: EventStreamHub,
+    cursor: StreamCursor,
+    *,
+    sources: Iterable[str],
+    event_types: Iterable[str],
+    epoch_id: str,
+    heartbeat_s: float,
+    max_duration_s: float | None,
+    retry_ms: int | None,
+    transform: Callable[[str, Dict[str, Any]], Dict[str, Any]] | None,
+) -> Iterator[Tuple[List[str], bool]]:
+    """Polls shared by :func:`iter_sse` and :func:`aiter_sse`: one ``(frames, done)`` per hub read.
+
+    The caller sleeps a poll interval between polls unless ``done``. Each step
+    does the blocking file reads, so async callers run it off the event loop.
+    """
+    sources = tuple(sources)
+    event_types = tuple(event_types)
+    started = time.monotonic()
+    last_sent = started
+    frames: List[str] = [f"retry: {int(retry_ms)}\n\n"] if retry_ms is not None else []
+    while True:
+        events, cursor = hub.read(cursor, sources=sources, event_types=event_types, epoch_id=epoch_id)
+        for event in events:
+            if transform is not None:
+                event = StreamEvent(source=event.source, record=transform(event.source, event.record), cursor=event.cursor)
+            frames.append(format_sse(event))
+        now = time.monotonic()
+        if events:
+            last_sent = now
+        elif now - last_sent >= heartbeat_s:
+            # Comment frame carrying the cursor keeps proxies open and lets idle clients resume past filtered records.
+            frames.append(f": cursor {cursor.token()}\n\n")
+            last_sent = now
+        done = max_duration_s is not None and now - started >= max_duration_s
+        yield frames, done
+        if done:
+            return
+        frames = []
+
+
+def iter_sse(
+    hub: EventStreamHub,
+    cursor: StreamCursor,
+    *,
+    sources: Iterable[str] = SOURCES,
+    event_types: Iterable[str] = (),
+    epoch_id: str = "",
+    poll_interval_s: float = DEFAULT_POLL_INTERVAL_S,
+    heartbeat_s: float = DEFAULT_HEARTBEAT_S,
+    max_duration_s: float | None = None,
+    retry_ms: int | None = None,
+    transform: Callable[[str, Dict[str, Any]], Dict[str, Any]] | None = None,
+) -> Iterator[str]:
+    """Yield SSE frames for new events until ``max_duration_s`` elapses (forever when ``None``).
+
+    Every frame's ``id`` is a resumable cursor, so an ``EventSource`` reconnecting
+    with ``Last-Event-ID`` continues where it left off. ``transform(source, record)``,
+    when given, rewrites each record before it is framed (e.g. audit redaction).
+    """
+    for frames, done in _sse_polls(
+        hub,
+        cursor,
+        sources=sources,
+        event_types=event_types,
+        epoch_id=epoch_id,
+        heartbeat_s=heartbeat_s,
+        max_duration_s=max_duration_s,
+        retry_ms=retry_ms,
+        transform=transform,
+    ):
+        yield from frames
+        if not done:
+            time.sleep(poll_interval_s)
+
+
+async def aiter_sse(
+    hub: EventStreamHub,
+    cursor: StreamCursor,
+    *,
+    sources: Iterable[str] = SOURCES,
+    event_types: Iterable[str] = (),
+    epoch_id: str = "",
+    poll_interval_s: float = DEFAULT_POLL_INTERVAL_S,
+    heartbeat_s: float = DEFAULT_HEARTBEAT_S,
+    max_duration_s: float | None = None,
+    retry_ms: int | None = None,
+    transform: Callable[[str, Dict[str, Any]], Dict[str, Any]] | None = None,
+) -> AsyncIterator[str]:
+    """Async :func:`iter_sse` for ASGI servers.
+
+    Each poll's hub read runs in a worker thread via :func:`asyncio.to_thread`;
+    only the sleep between polls waits on the event loop, so idle streams hold
+    no thread and reads never block other requests.
+    """
+    polls = _sse_polls(
+        hub,
+        cursor,
+        sources=sources,
+        event_types=event_types,
+        epoch_id=epoch_id,
+        heartbeat_s=heartbeat_s,
+        max_duration_s=max_duration_s,
+        retry_ms=retry_ms,
+        transform=transform,
+    )
+    done = False
+    while not done:
+        frames, done = await asyncio.to_thread(next, polls)
+        for frame in frames:
+            yield frame
+        if not done:
+            await asyncio.sleep(poll_interval_s)
+
+
+_HUBS: Dict[Tuple[Optional[Path], Optional[Path]], EventStreamHub] = {}
+_HUBS_LOCK = threading.Lock()
+
+
+def hub_for(lineage_path: Path | None = None, metrics_path: Path | None = None) -> EventStreamHub:
+    """Process-wide hub for the given sources, shared by every observer."""
+    key = (lineage_path, metrics_path)
+    with _HUBS_LOCK:
+        hub = _HUBS.get(key)
+        if hub is None:
+            hub = EventStreamHub(lineage_path, metrics_path)
+            _HUBS[key] = hub
+        return hub
+
+
+__all__ = [
+    "DEFAULT_BUFFER_SIZE",
+    "EventStreamHub",
+    "SOURCES",
+    "StreamCursor",
+    "StreamCursorError",
+    "StreamEvent",
+    "aiter_sse",
+    "event_epoch",
+    "event_type",
+    "format_sse",
+    "hub_for",
+    "iter_sse",
+]
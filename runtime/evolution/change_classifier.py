@@ -11,6 +11,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 
+from adaad.core import ast_cache
 from runtime.timeutils import now_iso
 
 FUNCTIONAL_NODE_TYPES = (
@@ -46,38 +47,14 @@ class ChangeDecision:
 
 def _parse_ast(source: str) -> ast.AST | None:
     try:
-        return ast.parse(source)
+        return ast_cache.parse_source(source)
     except SyntaxError:
         return None
 
 
 def _without_docstrings(tree: ast.AST) -> ast.AST:
-    class StripDocstrings(ast.NodeTransformer):
-        def _strip(self, node: ast.AST) -> ast.AST:
-            body = getattr(node, "body", None)
-            if isinstance(body, list) and body:
-                head = body[0]
-                if isinstance(head, ast.Expr) and isinstance(getattr(head, "value", None), ast.Constant) and isinstance(head.value.value, str):
-                    node.body = body[1:]
-            return node
-
-        def visit_Module(self, node: ast.Module) -> ast.AST:
-            self.generic_visit(node)
-            return self._strip(node)
-
-        def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.AST:
-            self.generic_visit(node)
-            return self._strip(node)
-
-        def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> ast.AST:
-            self.generic_visit(node)
-            return self._strip(node)
-
-        def visit_ClassDef(self, node: ast.ClassDef) -> ast.AST:
-            self.generic_visit(node)
-            return self._strip(node)
-
-    return StripDocstrings().visit(ast.fix_missing_locations(tree))
+    # Returns a copy: parsed trees are shared through the AST cache.
+    return ast_cache.strip_docstrings(tree)
 
 
 def _imports(tree: ast.AST) -> set[str]:
@@ -131,12 +108,11 @@ def _token_kinds(source: str) -> list[int]:
 
 
 def is_doc_change(old_src: str, new_src: str) -> bool:
-    old_ast = _parse_ast(old_src)
-    new_ast = _parse_ast(new_src)
-    if old_ast is None or new_ast is None:
+    try:
+        old_dump = ast_cache.stripped_dump(old_src)
+        new_dump = ast_cache.stripped_dump(new_src)
+    except SyntaxError:
         return False
-    old_dump = ast.dump(_without_docstrings(old_ast), include_attributes=False)
-    new_dump = ast.dump(_without_docstrings(new_ast), include_attributes=False)
     if old_dump != new_dump:
         return False
     return _token_kinds(old_src) == _token_kinds(new_src)
@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from runtime.evolution.checkpoint_events import EpochCheckpointEvent
 from runtime.evolution.lineage_v2 import LineageLedgerV2
@@ -37,9 +37,15 @@ class CheckpointRegistry:
         self.entropy_policy_hash = entropy_policy_hash
         self.sandbox_policy_hash = sandbox_policy_hash
 
-    def _latest_checkpoint_hash(self, epoch_id: str) -> str:
+    def _latest_checkpoint_hash(self, epoch_id: str, epoch_events: List[Dict[str, Any]] | None = None) -> str:
+        if epoch_events is None:
+            summary_reader = getattr(self.ledger, "get_epoch_summary", None)
+            if callable(summary_reader):
+                summary = summary_reader(epoch_id) or {}
+                return str(summary.get("checkpoint_hash") or ZERO_HASH)
+            epoch_events = self.ledger.read_epoch(epoch_id)
         latest = ZERO_HASH
-        for entry in self.ledger.read_epoch(epoch_id):
+        for entry in epoch_events:
             if safe_get(entry, "type", default="") != "EpochCheckpointEvent":
                 continue
             candidate = safe_get(entry, "payload", "checkpoint_hash")
@@ -47,9 +53,21 @@ class CheckpointRegistry:
                 latest = candidate
         return latest
 
-    def create_checkpoint(self, epoch_id: str) -> Dict[str, Any]:
+    def create_checkpoint(
+        self,
+        epoch_id: str,
+        *,
+        epoch_events: List[Dict[str, Any]] | None = None,
+        baseline_digest: str | None = None,
+    ) -> Dict[str, Any]:
+        """Append the next checkpoint for ``epoch_id``.
+
+        Batch callers that already hold the verified epoch entries (and their
+        folded bundle digest) pass them in to skip re-reading the ledger.
+        """
         require_replay_safe_provider(self.provider, replay_mode=self.replay_mode, recovery_tier=self.recovery_tier)
-        epoch_events = self.ledger.read_epoch(epoch_id)
+        if epoch_events is None:
+            epoch_events = self.ledger.read_epoch(epoch_id)
         mutation_count = sum(1 for e in epoch_events if safe_get(e, "type", default="") == "MutationBundleEvent")
         promotion_count = sum(1 for e in epoch_events if safe_get(e, "type", default="") == "PromotionEvent")
         scoring_count = sum(1 for e in epoch_events if safe_get(e, "type", default="") == "ScoringEvent")
@@ -61,8 +79,9 @@ class CheckpointRegistry:
         evidence_hash = sha256_prefixed_digest(sorted(v for v in sandbox_evidence if isinstance(v, str)))
 
         epoch_digest = self.ledger.get_epoch_digest(epoch_id) or "sha256:0"
-        baseline_digest = self.ledger.compute_incremental_epoch_digest(epoch_id)
-        prev_checkpoint_hash = self._latest_checkpoint_hash(epoch_id)
+        if baseline_digest is None:
+            baseline_digest = self.ledger.compute_incremental_epoch_digest(epoch_id)
+        prev_checkpoint_hash = self._latest_checkpoint_hash(epoch_id, epoch_events)
         checkpoint_material = {
             "epoch_id": epoch_id,
             "epoch_digest": epoch_digest,
@@ -3,16 +3,22 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 
 from runtime.evolution.lineage_v2 import LineageLedgerV2
 from runtime.governance.foundation import ZERO_HASH, sha256_prefixed_digest
 
 
-def verify_checkpoint_chain(ledger: LineageLedgerV2, epoch_id: str) -> Dict[str, Any]:
+def verify_checkpoint_chain(
+    ledger: LineageLedgerV2,
+    epoch_id: str,
+    epoch_events: Iterable[Dict[str, Any]] | None = None,
+) -> Dict[str, Any]:
+    if epoch_events is None:
+        epoch_events = ledger.read_epoch(epoch_id)
     checkpoints: List[Dict[str, Any]] = [
         dict(entry.get("payload") or {})
-        for entry in ledger.read_epoch(epoch_id)
+        for entry in epoch_events
         if entry.get("type") == "EpochCheckpointEvent"
     ]
     previous = ZERO_HASH
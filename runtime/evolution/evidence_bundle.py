@@ -3,18 +3,23 @@
 
 from __future__ import annotations
 
+import filecmp
+import heapq
 import json
 import os
+import shutil
+import tempfile
 from hashlib import sha256
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
 
 from runtime import ROOT_DIR
 from runtime.evolution.lineage_v2 import LineageLedgerV2
 from runtime.evolution.replay import ReplayEngine
-from runtime.governance.deterministic_filesystem import read_file_deterministic
+from runtime.governance.deterministic_filesystem import iter_lines_deterministic, read_file_deterministic
 from runtime.governance.foundation import ZERO_HASH, canonical_json, sha256_prefixed_digest
 from runtime.governance.policy_artifact import DEFAULT_GOVERNANCE_POLICY_PATH, load_governance_policy
+from runtime.governance.schema_engine import EVIDENCE_BUNDLE, CompiledSchema, compile_schema, load_schema
 from runtime.sandbox.evidence import SANDBOX_EVIDENCE_PATH
 
 FORENSIC_EXPORT_DIR = ROOT_DIR / "reports" / "forensics"
@@ -22,6 +27,34 @@ EVIDENCE_BUNDLE_SCHEMA_VERSION = "1.0"
 DEFAULT_EXPORT_SIGNING_ALGORITHM = "hmac-sha256"
 DEFAULT_RETENTION_DAYS = 365
 DEFAULT_ACCESS_SCOPE = "governance_audit"
+# Rows a streaming export keeps in memory per section before spilling a sorted run to disk.
+STREAM_SPOOL_RUN_ROWS = 4096
+
+# Top-level keys in the order build_bundle inserts them, which is the order schema errors are reported in.
+_BUNDLE_KEY_ORDER = (
+    "schema_version",
+    "export_scope",
+    "replay_proofs",
+    "sandbox_evidence",
+    "policy_artifact_metadata",
+    "risk_summaries",
+    "lineage_anchors",
+    "bundle_index",
+    "bundle_id",
+    "export_metadata",
+)
+
+
+def _bundle_order(item: Dict[str, Any]) -> Tuple[str, ...]:
+    return (item["epoch_id"], item["bundle_id"], item["bundle_digest"])
+
+
+def _sandbox_order(item: Dict[str, Any]) -> Tuple[str, ...]:
+    return (item["epoch_id"], item["bundle_id"], item["entry_hash"])
+
+
+def _epoch_order(item: Dict[str, Any]) -> Tuple[str, ...]:
+    return (item["epoch_id"],)
 
 
 class EvidenceBundleError(RuntimeError):
@@ -42,11 +75,10 @@ def _signature_material(secret: str, signed_digest: str) -> str:
     return "sha256:" + sha256(f"{secret}:{signed_digest}".encode("utf-8")).hexdigest()
 
 
-def _read_jsonl(path: Path) -> List[Dict[str, Any]]:
+def _iter_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
     if not path.exists():
-        return []
-    entries: List[Dict[str, Any]] = []
-    for line_no, line in enumerate(read_file_deterministic(path).splitlines(), start=1):
+        return
+    for line_no, line in enumerate(iter_lines_deterministic(path), start=1):
         text = line.strip()
         if not text:
             continue
@@ -56,57 +88,56 @@ def _read_jsonl(path: Path) -> List[Dict[str, Any]]:
             raise EvidenceBundleError(f"invalid_jsonl:{path}:{line_no}:{exc.msg}") from exc
         if not isinstance(payload, dict):
             raise EvidenceBundleError(f"invalid_jsonl_entry:{path}:{line_no}:expected_object")
-        entries.append(payload)
-    return entries
-
-
-def _json_type_name(value: Any) -> str:
-    if value is None:
-        return "null"
-    if isinstance(value, bool):
-        return "boolean"
-    if isinstance(value, (int, float)):
-        return "number"
-    if isinstance(value, str):
-        return "string"
-    if isinstance(value, list):
-        return "array"
-    if isinstance(value, dict):
-        return "object"
-    return "unknown"
-
-
-def _validate_schema_subset(instance: Any, schema: Dict[str, Any], path: str = "$") -> List[str]:
-    errors: List[str] = []
-    expected_type = schema.get("type")
-    if isinstance(expected_type, str) and _json_type_name(instance) != expected_type:
-        return [f"{path}:expected_{expected_type}:got_{_json_type_name(instance)}"]
-
-    if expected_type == "object":
-        if not isinstance(instance, dict):
-            return [f"{path}:not_object"]
-        required = schema.get("required") or []
-        for key in required:
-            if key not in instance:
-                errors.append(f"{path}.{key}:missing_required")
-        properties = schema.get("properties") or {}
-        for key, value in instance.items():
-            if key in properties:
-                errors.extend(_validate_schema_subset(value, properties[key], f"{path}.{key}"))
-        if schema.get("additionalProperties") is False:
-            extra_keys = sorted(set(instance.keys()) - set(properties.keys()))
-            for key in extra_keys:
-                errors.append(f"{path}.{key}:additional_property")
-
-    if expected_type == "array":
-        if not isinstance(instance, list):
-            return [f"{path}:not_array"]
-        item_schema = schema.get("items")
-        if isinstance(item_schema, dict):
-            for idx, value in enumerate(instance):
-                errors.extend(_validate_schema_subset(value, item_schema, f"{path}[{idx}]"))
-
-    return errors
+        yield payload
+
+
+def _read_jsonl(path: Path) -> List[Dict[str, Any]]:
+    return list(_iter_jsonl(path))
+
+
+class _SortedSpool:
+    """Bounded-memory stable sort of canonical JSON rows.
+
+    Rows are buffered and spilled as sorted runs of ``run_rows``; iteration
+    merges the runs. Ties keep insertion order, so the output equals
+    ``sorted(rows, key=key)``. Yields each row's canonical JSON text.
+    """
+
+    def __init__(self, directory: Path, name: str, key: Callable[[Dict[str, Any]], Tuple[str, ...]], run_rows: int) -> None:
+        self.directory = directory
+        self.name = name
+        self.key = key
+        self.run_rows = max(1, run_rows)
+        self.count = 0
+        self._buffer: List[Tuple[Tuple[str, ...], str]] = []
+        self._runs: List[Path] = []
+
+    def add(self, row: Dict[str, Any]) -> None:
+        self._buffer.append((self.key(row), canonical_json(row)))
+        self.count += 1
+        if len(self._buffer) >= self.run_rows:
+            self._spill()
+
+    def _spill(self) -> None:
+        self._buffer.sort(key=lambda item: item[0])
+        run_path = self.directory / f"{self.name}.{len(self._runs):05d}.run"
+        with run_path.open("w", encoding="utf-8") as handle:
+            for key, text in self._buffer:
+                handle.write(json.dumps(list(key), ensure_ascii=False) + "\t" + text + "\n")
+        self._runs.append(run_path)
+        self._buffer = []
+
+    @staticmethod
+    def _read_run(path: Path) -> Iterator[Tuple[Tuple[str, ...], str]]:
+        for line in iter_lines_deterministic(path):
+            key, _, text = line.rstrip("\n").partition("\t")
+            yield tuple(json.loads(key)), text
+
+    def __iter__(self) -> Iterator[str]:
+        self._buffer.sort(key=lambda item: item[0])
+        runs = [self._read_run(path) for path in self._runs] + [iter(self._buffer)]
+        for _key, text in heapq.merge(*runs, key=lambda item: item[0]):
+            yield text
 
 
 class EvidenceBundleBuilder:
@@ -147,87 +178,84 @@ class EvidenceBundleBuilder:
         high = max(start_idx, end_idx)
         return sorted(known_epochs[low : high + 1])
 
+    @staticmethod
+    def _bundle_rows(epoch_id: str, entries: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for entry in entries:
+            if entry.get("type") != "MutationBundleEvent":
+                continue
+            payload = dict(entry.get("payload") or {})
+            yield {
+                "epoch_id": epoch_id,
+                "bundle_id": str(payload.get("bundle_id") or payload.get("certificate", {}).get("bundle_id") or ""),
+                "bundle_digest": str(payload.get("bundle_digest") or ""),
+                "epoch_digest": str(payload.get("epoch_digest") or ""),
+                "risk_tier": str(payload.get("risk_tier") or ""),
+                "certificate": dict(payload.get("certificate") or {}),
+            }
+
+    @staticmethod
+    def _sandbox_row(entry: Dict[str, Any]) -> Dict[str, Any]:
+        payload = dict(entry.get("payload") or {})
+        manifest = dict(payload.get("manifest") or {})
+        return {
+            "epoch_id": str(manifest.get("epoch_id") or payload.get("epoch_id") or ""),
+            "bundle_id": str(manifest.get("bundle_id") or payload.get("bundle_id") or ""),
+            "evidence_hash": str(payload.get("evidence_hash") or ""),
+            "manifest_hash": str(payload.get("manifest_hash") or ""),
+            "policy_hash": str(payload.get("policy_hash") or ""),
+            "entry_hash": str(entry.get("hash") or ""),
+            "prev_hash": str(entry.get("prev_hash") or ZERO_HASH),
+        }
+
+    @staticmethod
+    def _replay_proof(epoch_id: str, replay: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "epoch_id": epoch_id,
+            "digest": str(replay.get("digest") or ""),
+            "canonical_digest": str(replay.get("canonical_digest") or ""),
+            "event_count": int(replay.get("events") or 0),
+            "sandbox_replay": list(replay.get("sandbox_replay") or []),
+        }
+
+    def _lineage_anchor(self, epoch_id: str, incremental_digest: str, bundle_ids: Iterable[str]) -> Dict[str, Any]:
+        return {
+            "epoch_id": epoch_id,
+            "expected_epoch_digest": str(self.ledger.get_expected_epoch_digest(epoch_id) or ""),
+            "incremental_epoch_digest": str(incremental_digest),
+            "bundle_ids": sorted({bundle_id for bundle_id in bundle_ids if bundle_id}),
+        }
+
     def _collect_bundle_events(self, epoch_ids: List[str]) -> List[Dict[str, Any]]:
         bundles: List[Dict[str, Any]] = []
         for epoch_id in epoch_ids:
-            for entry in self.ledger.read_epoch(epoch_id):
-                if entry.get("type") != "MutationBundleEvent":
-                    continue
-                payload = dict(entry.get("payload") or {})
-                bundles.append(
-                    {
-                        "epoch_id": epoch_id,
-                        "bundle_id": str(payload.get("bundle_id") or payload.get("certificate", {}).get("bundle_id") or ""),
-                        "bundle_digest": str(payload.get("bundle_digest") or ""),
-                        "epoch_digest": str(payload.get("epoch_digest") or ""),
-                        "risk_tier": str(payload.get("risk_tier") or ""),
-                        "certificate": dict(payload.get("certificate") or {}),
-                    }
-                )
-        bundles.sort(key=lambda item: (item["epoch_id"], item["bundle_id"], item["bundle_digest"]))
+            bundles.extend(self._bundle_rows(epoch_id, self.ledger.read_epoch(epoch_id)))
+        bundles.sort(key=_bundle_order)
         return bundles
 
     def _collect_sandbox_evidence(self, epoch_ids: List[str]) -> List[Dict[str, Any]]:
         allowed = set(epoch_ids)
-        evidence: List[Dict[str, Any]] = []
-        for entry in _read_jsonl(self.sandbox_evidence_path):
-            payload = dict(entry.get("payload") or {})
-            manifest = dict(payload.get("manifest") or {})
-            epoch_id = str(manifest.get("epoch_id") or payload.get("epoch_id") or "")
-            if epoch_id not in allowed:
-                continue
-            evidence.append(
-                {
-                    "epoch_id": epoch_id,
-                    "bundle_id": str(manifest.get("bundle_id") or payload.get("bundle_id") or ""),
-                    "evidence_hash": str(payload.get("evidence_hash") or ""),
-                    "manifest_hash": str(payload.get("manifest_hash") or ""),
-                    "policy_hash": str(payload.get("policy_hash") or ""),
-                    "entry_hash": str(entry.get("hash") or ""),
-                    "prev_hash": str(entry.get("prev_hash") or ZERO_HASH),
-                }
-            )
-        evidence.sort(key=lambda item: (item["epoch_id"], item["bundle_id"], item["entry_hash"]))
+        evidence = [row for row in map(self._sandbox_row, _iter_jsonl(self.sandbox_evidence_path)) if row["epoch_id"] in allowed]
+        evidence.sort(key=_sandbox_order)
         return evidence
 
     def _collect_replay_proofs(self, epoch_ids: List[str]) -> List[Dict[str, Any]]:
-        proofs: List[Dict[str, Any]] = []
-        for epoch_id in epoch_ids:
-            replay = self.replay_engine.replay_epoch(epoch_id)
-            proofs.append(
-                {
-                    "epoch_id": epoch_id,
-                    "digest": str(replay.get("digest") or ""),
-                    "canonical_digest": str(replay.get("canonical_digest") or ""),
-                    "event_count": int(replay.get("events") or 0),
-                    "sandbox_replay": list(replay.get("sandbox_replay") or []),
-                }
-            )
-        proofs.sort(key=lambda item: item["epoch_id"])
+        proofs = [self._replay_proof(epoch_id, self.replay_engine.replay_epoch(epoch_id)) for epoch_id in epoch_ids]
+        proofs.sort(key=_epoch_order)
         return proofs
 
     def _collect_lineage_anchors(self, epoch_ids: List[str], bundles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        anchors: List[Dict[str, Any]] = []
-        for epoch_id in epoch_ids:
-            epoch_bundle_ids = sorted({entry["bundle_id"] for entry in bundles if entry["epoch_id"] == epoch_id and entry["bundle_id"]})
-            anchors.append(
-                {
-                    "epoch_id": epoch_id,
-                    "expected_epoch_digest": str(self.ledger.get_expected_epoch_digest(epoch_id) or ""),
-                    "incremental_epoch_digest": str(self.ledger.compute_incremental_epoch_digest(epoch_id)),
-                    "bundle_ids": epoch_bundle_ids,
-                }
+        return [
+            self._lineage_anchor(
+                epoch_id,
+                self.ledger.compute_incremental_epoch_digest(epoch_id),
+                (entry["bundle_id"] for entry in bundles if entry["epoch_id"] == epoch_id),
             )
-        return anchors
+            for epoch_id in epoch_ids
+        ]
 
-    def _build_core(self, epoch_start: str, epoch_end: str | None) -> Dict[str, Any]:
-        epoch_ids = self._resolve_epoch_ids(epoch_start=epoch_start, epoch_end=epoch_end)
-        bundles = self._collect_bundle_events(epoch_ids)
-        sandbox_evidence = self._collect_sandbox_evidence(epoch_ids)
-        replay_proofs = self._collect_replay_proofs(epoch_ids)
-        lineage_anchors = self._collect_lineage_anchors(epoch_ids, bundles)
+    def _policy_artifact_metadata(self) -> Dict[str, Any]:
         policy = load_governance_policy(self.policy_path)
-        policy_artifact_metadata = {
+        return {
             "path": str(self.policy_path),
             "schema_version": policy.schema_version,
             "fingerprint": policy.fingerprint,
@@ -237,6 +265,14 @@ class EvidenceBundleBuilder:
                 "determinism_warn": policy.thresholds.determinism_warn,
             },
         }
+
+    def _build_core(self, epoch_start: str, epoch_end: str | None) -> Dict[str, Any]:
+        epoch_ids = self._resolve_epoch_ids(epoch_start=epoch_start, epoch_end=epoch_end)
+        bundles = self._collect_bundle_events(epoch_ids)
+        sandbox_evidence = self._collect_sandbox_evidence(epoch_ids)
+        replay_proofs = self._collect_replay_proofs(epoch_ids)
+        lineage_anchors = self._collect_lineage_anchors(epoch_ids, bundles)
+        policy_artifact_metadata = self._policy_artifact_metadata()
         return {
             "schema_version": EVIDENCE_BUNDLE_SCHEMA_VERSION,
             "export_scope": {
@@ -301,14 +337,142 @@ class EvidenceBundleBuilder:
                 export_path.write_text(serialized, encoding="utf-8")
         return bundle
 
-    def validate_bundle(self, bundle: Dict[str, Any]) -> List[str]:
+    def export_bundle(self, *, epoch_start: str, epoch_end: str | None = None) -> Dict[str, Any]:
+        """Stream the bundle for an epoch range straight to its export file.
+
+        Writes the same bytes, digest and ``bundle_id`` as
+        ``build_bundle(persist=True)``, but reads the lineage span and the
+        sandbox evidence once each, replays every epoch from the entries
+        already read and hashes the canonical JSON as it is written. Memory is
+        bounded by the largest single epoch plus :data:`STREAM_SPOOL_RUN_ROWS`
+        rows per list section; longer lists are merge-sorted through scratch
+        files. Returns the bundle without its list sections.
+        """
+        epoch_ids = self._resolve_epoch_ids(epoch_start=epoch_start, epoch_end=epoch_end)
+        # Validate section by section against the bundle schema's property (or, for lists, item) schemas.
+        properties = self._compiled_schema().schema.get("properties") or {}
+        sections = {
+            key: compile_schema(schema.get("items", {}) if schema.get("type") == "array" else schema, EVIDENCE_BUNDLE)
+            for key, schema in properties.items()
+            if isinstance(schema, dict)
+        }
+        errors: Dict[str, List[str]] = {key: [] for key in _BUNDLE_KEY_ORDER}
+
+        def check(key: str, value: Any, path: str) -> None:
+            if key in sections:
+                errors[key].extend(sections[key].validate(value, path))
+
+        self.export_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(prefix=".evidence-stream-", dir=self.export_dir) as scratch:
+            scratch_dir = Path(scratch)
+            spools = {
+                name: _SortedSpool(scratch_dir, name, order, STREAM_SPOOL_RUN_ROWS)
+                for name, order in (
+                    ("bundle_index", _bundle_order),
+                    ("lineage_anchors", _epoch_order),
+                    ("replay_proofs", _epoch_order),
+                    ("sandbox_evidence", _sandbox_order),
+                )
+            }
+            high_risk_bundles = 0
+
+            def add_epoch(epoch_id: str, entries: List[Dict[str, Any]]) -> None:
+                nonlocal high_risk_bundles
+                bundle_ids = []
+                for row in self._bundle_rows(epoch_id, entries):
+                    spools["bundle_index"].add(row)
+                    bundle_ids.append(row["bundle_id"])
+                    high_risk_bundles += row["risk_tier"] in {"high", "critical"}
+                replay = self.replay_engine.replay_events(epoch_id, entries)
+                spools["replay_proofs"].add(self._replay_proof(epoch_id, replay))
+                spools["lineage_anchors"].add(self._lineage_anchor(epoch_id, str(replay.get("digest") or ""), bundle_ids))
+
+            pending = dict.fromkeys(epoch_ids)
+            for epoch_id, entries in self.ledger.iter_epochs(epoch_ids):
+                pending.pop(epoch_id, None)
+                add_epoch(epoch_id, entries)
+            for epoch_id in pending:
+                add_epoch(epoch_id, [])
+            allowed = set(epoch_ids)
+            for entry in _iter_jsonl(self.sandbox_evidence_path):
+                row = self._sandbox_row(entry)
+                if row["epoch_id"] in allowed:
+                    spools["sandbox_evidence"].add(row)
+
+            scalars: Dict[str, Any] = {
+                "schema_version": EVIDENCE_BUNDLE_SCHEMA_VERSION,
+                "export_scope": {"epoch_start": epoch_ids[0], "epoch_end": epoch_ids[-1], "epoch_ids": epoch_ids},
+                "policy_artifact_metadata": self._policy_artifact_metadata(),
+                "risk_summaries": {
+                    "bundle_count": spools["bundle_index"].count,
+                    "sandbox_evidence_count": spools["sandbox_evidence"].count,
+                    "replay_proof_count": spools["replay_proofs"].count,
+                    "high_risk_bundle_count": high_risk_bundles,
+                },
+            }
+            for key, value in scalars.items():
+                check(key, value, f"$.{key}")
+
+            # The digest covers the core only, so write it (sorted keys) while hashing and
+            # splice "bundle_id" and "export_metadata" into their sort positions afterwards.
+            core_path = scratch_dir / "core.json"
+            hasher = sha256()
+            with core_path.open("wb") as core:
+
+                def emit(text: str) -> None:
+                    data = text.encode("utf-8")
+                    hasher.update(data)
+                    core.write(data)
+
+                split = 0
+                for position, key in enumerate(sorted([*scalars, *spools])):
+                    emit(("," if position else "{") + canonical_json(key) + ":")
+                    if key not in spools:
+                        emit(canonical_json(scalars[key]))
+                        continue
+                    emit("[")
+                    for index, text in enumerate(spools[key]):
+                        emit(("," if index else "") + text)
+                        check(key, json.loads(text), f"$.{key}[{index}]")
+                    emit("]")
+                    if key == "bundle_index":
+                        split = core.tell()
+                emit("}")
+
+            digest = "sha256:" + hasher.hexdigest()
+            bundle_id = f"evidence-{digest.split(':', 1)[1][:16]}"
+            export_metadata = self._export_metadata(bundle_id=bundle_id, digest=digest)
+            check("bundle_id", bundle_id, "$.bundle_id")
+            check("export_metadata", export_metadata, "$.export_metadata")
+            validation_errors = [error for key in _BUNDLE_KEY_ORDER for error in errors[key]]
+            if validation_errors:
+                raise EvidenceBundleError("invalid_bundle:" + "|".join(validation_errors))
+
+            staged_path = scratch_dir / "bundle.json"
+            with core_path.open("rb") as core, staged_path.open("wb") as staged:
+                staged.write(("{" + canonical_json("bundle_id") + ":" + canonical_json(bundle_id) + ",").encode("utf-8"))
+                core.seek(1)
+                staged.write(core.read(split - 1))
+                staged.write(("," + canonical_json("export_metadata") + ":" + canonical_json(export_metadata)).encode("utf-8"))
+                shutil.copyfileobj(core, staged)
+            export_path = self.export_dir / f"{bundle_id}.json"
+            if export_path.exists():
+                if not filecmp.cmp(export_path, staged_path, shallow=False):
+                    raise EvidenceBundleError("immutable_export_mismatch")
+            else:
+                os.replace(staged_path, export_path)
+        return {**scalars, "bundle_id": bundle_id, "export_metadata": export_metadata}
+
+    def _compiled_schema(self) -> CompiledSchema:
         if not self.schema_path.exists():
             raise EvidenceBundleError(f"missing_schema:{self.schema_path}")
         try:
-            schema = json.loads(read_file_deterministic(self.schema_path))
+            return load_schema(self.schema_path, EVIDENCE_BUNDLE, deterministic=True)
         except json.JSONDecodeError as exc:
             raise EvidenceBundleError(f"invalid_schema_json:{self.schema_path}:{exc.msg}") from exc
-        return _validate_schema_subset(bundle, schema)
+
+    def validate_bundle(self, bundle: Dict[str, Any]) -> List[str]:
+        return self._compiled_schema().validate(bundle)
 
 
 __all__ = [
@@ -317,6 +481,7 @@ __all__ = [
     "DEFAULT_RETENTION_DAYS",
     "EVIDENCE_BUNDLE_SCHEMA_VERSION",
     "FORENSIC_EXPORT_DIR",
+    "STREAM_SPOOL_RUN_ROWS",
     "EvidenceBundleBuilder",
     "EvidenceBundleError",
 ]
@@ -5,14 +5,21 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import threading
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Protocol
 
-from runtime import ROOT_DIR
-from runtime.governance.deterministic_filesystem import read_file_deterministic
+from runtime import ROOT_DIR, metrics
+from runtime.governance.deterministic_envelope import EntropySource, charge_entropy
+from runtime.governance.deterministic_filesystem import iter_lines_deterministic
 
 LEDGER_V2_PATH = ROOT_DIR / "security" / "ledger" / "lineage_v2.jsonl"
+GENESIS_HASH = "0" * 64
+
+_THREAD_APPEND_LOCK = threading.Lock()
 
 
 def resolve_certified_ancestor_path(entry: Dict[str, Any]) -> Dict[str, Any]:
@@ -108,54 +115,222 @@ class LineageLedgerV2:
     def __init__(self, ledger_path: Path | None = None) -> None:
         self.ledger_path = ledger_path or LEDGER_V2_PATH
         self._epoch_digest_index: Dict[str, str] = {}
+        self._epoch_offset_index: Dict[str, Any] | None = None
 
     def _ensure(self) -> None:
         self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
         if not self.ledger_path.exists():
             self.ledger_path.touch()
 
+    @property
+    def tail_state_path(self) -> Path:
+        return self.ledger_path.with_suffix(".tail.json")
+
+    @property
+    def lock_path(self) -> Path:
+        return self.ledger_path.with_suffix(".lock")
+
+    @property
+    def epoch_index_path(self) -> Path:
+        return self.ledger_path.with_suffix(".epochs.json")
+
     def _last_hash(self) -> str:
-        self.verify_integrity()
-        lines = read_file_deterministic(self.ledger_path).splitlines()
-        if not lines:
-            return "0" * 64
-        return str(json.loads(lines[-1]).get("hash", "0" * 64))
+        last_hash, _ = self._validated_tail()
+        return last_hash
+
+    def _raise_integrity_error(
+        self,
+        message: str,
+        *,
+        recovery_hook: LineageRecoveryHook | None,
+        cause: Exception | None = None,
+    ) -> None:
+        error = LineageIntegrityError(message)
+        if recovery_hook is not None:
+            recovery_hook.on_lineage_integrity_failure(ledger_path=self.ledger_path, error=error)
+        if cause is not None:
+            raise error from cause
+        raise error
+
+    def _iter_chain(
+        self,
+        *,
+        recovery_hook: LineageRecoveryHook | None = None,
+        start_offset: int = 0,
+        expected_prev_hash: str = GENESIS_HASH,
+    ) -> Iterator[tuple[int, int, Dict[str, Any] | None]]:
+        """Yield ``(line_start, line_end, entry)`` per line, verifying the hash chain as it streams.
+
+        Blank lines are yielded with ``entry=None`` so callers can keep exact byte offsets.
+        """
+        self._ensure()
+        charge_entropy(EntropySource.FILESYSTEM, f"read:{self.ledger_path}")
+        prev_hash = expected_prev_hash
+        offset = start_offset
+        with self.ledger_path.open("rb") as handle:
+            if start_offset:
+                handle.seek(start_offset)
+            for line_no, line in enumerate(handle, start=1):
+                line_start = offset
+                offset += len(line)
+                entry_text = line.strip()
+                if not entry_text:
+                    yield line_start, offset, None
+                    continue
+                try:
+                    entry = json.loads(entry_text.decode("utf-8"))
+                except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+                    self._raise_integrity_error(
+                        f"lineage_invalid_json:line{line_no}:{exc}",
+                        recovery_hook=recovery_hook,
+                        cause=exc,
+                    )
+                if not isinstance(entry, dict):
+                    self._raise_integrity_error(f"lineage_malformed_entry:line{line_no}", recovery_hook=recovery_hook)
+                entry_prev_hash = str(entry.get("prev_hash") or "")
+                entry_hash = str(entry.get("hash") or "")
+                if entry_prev_hash != prev_hash:
+                    self._raise_integrity_error(f"lineage_prev_hash_mismatch:line{line_no}", recovery_hook=recovery_hook)
+                payload = {key: value for key, value in entry.items() if key != "hash"}
+                if entry_hash != self._compute_hash(prev_hash, payload):
+                    self._raise_integrity_error(f"lineage_hash_mismatch:line{line_no}", recovery_hook=recovery_hook)
+                prev_hash = entry_hash
+                yield line_start, offset, entry
+
+    def _scan_chain(
+        self,
+        *,
+        recovery_hook: LineageRecoveryHook | None = None,
+        start_offset: int = 0,
+        expected_prev_hash: str = GENESIS_HASH,
+        entry_offset: int = 0,
+    ) -> tuple[str, int, int]:
+        """Verify entries from ``start_offset`` and return ``(last_hash, end_offset, last_entry_offset)``."""
+        last_hash = expected_prev_hash
+        offset = start_offset
+        last_entry_offset = entry_offset
+        for line_start, offset, entry in self._iter_chain(
+            recovery_hook=recovery_hook,
+            start_offset=start_offset,
+            expected_prev_hash=expected_prev_hash,
+        ):
+            if entry is not None:
+                last_hash = str(entry["hash"])
+                last_entry_offset = line_start
+        return last_hash, offset, last_entry_offset
 
     def verify_integrity(self, recovery_hook: LineageRecoveryHook | None = None) -> None:
-        """Recompute chain from genesis and verify each stored hash."""
+        """Recompute chain from genesis and verify each stored hash.
+
+        This is the explicit full audit; appends only verify bytes written since
+        the last persisted tail state.
+        """
+        self._scan_chain(recovery_hook=recovery_hook)
+
+    def _read_tail_state(self) -> tuple[str, int, int] | None:
+        path = self.tail_state_path
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(data, dict):
+            return None
+        last_hash = str(data.get("last_hash") or "")
+        offset = data.get("offset")
+        entry_offset = data.get("entry_offset")
+        if len(last_hash) != 64 or not isinstance(offset, int) or not isinstance(entry_offset, int):
+            return None
+        if offset < 0 or entry_offset < 0 or entry_offset > offset:
+            return None
+        return last_hash, offset, entry_offset
+
+    def _write_tail_state(self, *, last_hash: str, offset: int, entry_offset: int) -> None:
+        payload = {"last_hash": last_hash, "offset": offset, "entry_offset": entry_offset}
+        temp_path = self.tail_state_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        temp_path.replace(self.tail_state_path)
+
+    def _tail_anchor_matches(self, *, last_hash: str, offset: int, entry_offset: int) -> bool:
+        """Check that the entry recorded as the tail still ends at ``offset`` and hashes to ``last_hash``."""
+        if offset == 0:
+            return last_hash == GENESIS_HASH
+        with self.ledger_path.open("rb") as handle:
+            handle.seek(entry_offset)
+            raw = handle.read(offset - entry_offset)
+        if not raw.endswith(b"\n"):
+            return False
+        try:
+            entry = json.loads(raw.strip().decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            return False
+        if not isinstance(entry, dict) or str(entry.get("hash") or "") != last_hash:
+            return False
+        payload = {key: value for key, value in entry.items() if key != "hash"}
+        return self._compute_hash(str(entry.get("prev_hash") or ""), payload) == last_hash
+
+    def _validated_tail(self, recovery_hook: LineageRecoveryHook | None = None) -> tuple[str, int]:
+        """Return ``(last_hash, offset)``, verifying only bytes appended after the persisted tail state."""
         self._ensure()
-        prev_hash = "0" * 64
-        for line_no, line in enumerate(read_file_deterministic(self.ledger_path).splitlines(), start=1):
-            entry_text = line.strip()
-            if not entry_text:
-                continue
+        tail_state = self._read_tail_state()
+        if tail_state is not None:
+            state_hash, state_offset, state_entry_offset = tail_state
             try:
-                entry = json.loads(entry_text)
-            except json.JSONDecodeError as exc:
-                error = LineageIntegrityError(f"lineage_invalid_json:line{line_no}:{exc}")
-                if recovery_hook is not None:
-                    recovery_hook.on_lineage_integrity_failure(ledger_path=self.ledger_path, error=error)
-                raise error from exc
-            if not isinstance(entry, dict):
-                error = LineageIntegrityError(f"lineage_malformed_entry:line{line_no}")
-                if recovery_hook is not None:
-                    recovery_hook.on_lineage_integrity_failure(ledger_path=self.ledger_path, error=error)
-                raise error
-            entry_prev_hash = str(entry.get("prev_hash") or "")
-            entry_hash = str(entry.get("hash") or "")
-            if entry_prev_hash != prev_hash:
-                error = LineageIntegrityError(f"lineage_prev_hash_mismatch:line{line_no}")
-                if recovery_hook is not None:
-                    recovery_hook.on_lineage_integrity_failure(ledger_path=self.ledger_path, error=error)
-                raise error
-            payload = {key: value for key, value in entry.items() if key != "hash"}
-            computed = self._compute_hash(prev_hash, payload)
-            if entry_hash != computed:
-                error = LineageIntegrityError(f"lineage_hash_mismatch:line{line_no}")
-                if recovery_hook is not None:
-                    recovery_hook.on_lineage_integrity_failure(ledger_path=self.ledger_path, error=error)
-                raise error
-            prev_hash = entry_hash
+                size = self.ledger_path.stat().st_size
+                if size >= state_offset and self._tail_anchor_matches(
+                    last_hash=state_hash,
+                    offset=state_offset,
+                    entry_offset=state_entry_offset,
+                ):
+                    if size == state_offset:
+                        return state_hash, state_offset
+                    last_hash, offset, entry_offset = self._scan_chain(
+                        start_offset=state_offset,
+                        expected_prev_hash=state_hash,
+                        entry_offset=state_entry_offset,
+                    )
+                    self._write_tail_state(last_hash=last_hash, offset=offset, entry_offset=entry_offset)
+                    return last_hash, offset
+            except (OSError, LineageIntegrityError):
+                pass
+            # Cached tail state is inconsistent with the current ledger; fall back
+            # to a full rescan from genesis below to rebuild a valid tail state.
+            metrics.log(
+                event_type="lineage_v2_tail_recovery_error",
+                payload={"ledger_path": str(self.ledger_path)},
+                level="WARNING",
+            )
+
+        last_hash, offset, entry_offset = self._scan_chain(recovery_hook=recovery_hook)
+        self._write_tail_state(last_hash=last_hash, offset=offset, entry_offset=entry_offset)
+        return last_hash, offset
+
+    @contextmanager
+    def _append_lock(self) -> Iterator[None]:
+        self._ensure()
+        with _THREAD_APPEND_LOCK:
+            with self.lock_path.open("a+", encoding="utf-8") as handle:
+                if os.name == "nt":
+                    import msvcrt
+
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+                else:
+                    import fcntl
+
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    if os.name == "nt":
+                        import msvcrt
+
+                        handle.seek(0)
+                        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+                    else:
+                        import fcntl
+
+                        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
 
     @staticmethod
     def _compute_hash(prev_hash: str, entry: Dict[str, Any]) -> str:
@@ -166,20 +341,148 @@ class LineageLedgerV2:
     def _hash_event(payload: Dict[str, Any]) -> str:
         return hashlib.sha256(json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
 
+    @staticmethod
+    def _empty_epoch_index() -> Dict[str, Any]:
+        return {"last_hash": GENESIS_HASH, "offset": 0, "entry_offset": 0, "epochs": {}}
+
+    @staticmethod
+    def _index_entry(index: Dict[str, Any], entry: Dict[str, Any], *, start: int, end: int) -> None:
+        """Fold one ledger line spanning ``[start, end)`` into the epoch offset index."""
+        payload = entry.get("payload")
+        epoch_id = payload.get("epoch_id") if isinstance(payload, dict) else None
+        if not isinstance(epoch_id, str) or not epoch_id:
+            return
+        record = index["epochs"].setdefault(
+            epoch_id,
+            {
+                "start": start,
+                "end": end,
+                # Chain anchors for span reads: the hash preceding ``start`` and the hash of the line ending at ``end``.
+                "start_prev_hash": str(index["last_hash"]),
+                "end_hash": "",
+                "event_count": 0,
+                "event_counts": {},
+                "epoch_digest": None,
+                "checkpoint_hash": None,
+            },
+        )
+        record["end"] = end
+        record["end_hash"] = str(entry.get("hash") or "")
+        record["event_count"] += 1
+        event_type = str(entry.get("type") or "")
+        record["event_counts"][event_type] = record["event_counts"].get(event_type, 0) + 1
+        if event_type in {"MutationBundleEvent", "EpochCheckpointEvent"} and payload.get("epoch_digest"):
+            record["epoch_digest"] = str(payload["epoch_digest"])
+        if event_type == "EpochCheckpointEvent":
+            checkpoint_hash = payload.get("checkpoint_hash")
+            if isinstance(checkpoint_hash, str) and checkpoint_hash:
+                record["checkpoint_hash"] = checkpoint_hash
+
+    def _load_epoch_index(self) -> Dict[str, Any] | None:
+        path = self.epoch_index_path
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(data, dict) or not isinstance(data.get("epochs"), dict):
+            return None
+        if not isinstance(data.get("offset"), int) or not isinstance(data.get("entry_offset"), int):
+            return None
+        if len(str(data.get("last_hash") or "")) != 64:
+            return None
+        if not all(isinstance(record, dict) and "start_prev_hash" in record for record in data["epochs"].values()):
+            return None  # written before span chain anchors were recorded
+        return data
+
+    def _write_epoch_index(self, index: Dict[str, Any]) -> None:
+        temp_path = self.epoch_index_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(index, ensure_ascii=False), encoding="utf-8")
+        temp_path.replace(self.epoch_index_path)
+        self._epoch_offset_index = index
+
+    def _matching_epoch_index(self, *, last_hash: str, offset: int) -> Dict[str, Any] | None:
+        """Return the cached or persisted index only if it covers exactly ``offset``/``last_hash``."""
+        for candidate in (self._epoch_offset_index, self._load_epoch_index()):
+            if candidate is not None and candidate["offset"] == offset and candidate["last_hash"] == last_hash:
+                self._epoch_offset_index = candidate
+                return candidate
+        if offset == 0 and last_hash == GENESIS_HASH:
+            return self._empty_epoch_index()
+        return None
+
+    def _refresh_epoch_index(self) -> Dict[str, Any]:
+        """Bring the epoch offset index up to the verified tail; caller must hold the append lock."""
+        last_hash, offset = self._validated_tail()
+        index = self._matching_epoch_index(last_hash=last_hash, offset=offset)
+        if index is not None:
+            return index
+
+        index = self._epoch_offset_index or self._load_epoch_index()
+        if index is None or index["offset"] > offset or not self._tail_anchor_matches(
+            last_hash=index["last_hash"],
+            offset=index["offset"],
+            entry_offset=index["entry_offset"],
+        ):
+            index = self._empty_epoch_index()
+
+        position = index["offset"]
+        with self.ledger_path.open("rb") as handle:
+            handle.seek(position)
+            for line in handle:
+                start = position
+                position += len(line)
+                if position > offset:
+                    break
+                if not line.strip():
+                    continue
+                entry = json.loads(line.strip().decode("utf-8"))
+                if not isinstance(entry, dict):
+                    continue
+                self._index_entry(index, entry, start=start, end=position)
+                index["entry_offset"] = start
+                index["last_hash"] = str(entry.get("hash") or "")
+        index["offset"] = offset
+        index["last_hash"] = last_hash
+        self._write_epoch_index(index)
+        return index
+
+    def _epoch_index(self) -> Dict[str, Any]:
+        with self._append_lock():
+            return self._refresh_epoch_index()
+
+    def get_epoch_summary(self, epoch_id: str) -> Dict[str, Any] | None:
+        """Return indexed byte span, event-type counts and latest digests for ``epoch_id``."""
+        record = self._epoch_index()["epochs"].get(epoch_id)
+        if record is None:
+            return None
+        summary = dict(record)
+        summary["event_counts"] = dict(record["event_counts"])
+        return summary
+
     def append(self, event: LineageEvent) -> Dict[str, Any]:
         return self.append_event(event.event_type, event.payload)
 
     def append_event(self, event_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        self.verify_integrity()
-        prev_hash = self._last_hash()
-        entry: Dict[str, Any] = {
-            "type": event_type,
-            "payload": payload,
-            "prev_hash": prev_hash,
-        }
-        entry["hash"] = self._compute_hash(prev_hash, entry)
-        with self.ledger_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        with self._append_lock():
+            prev_hash, offset = self._validated_tail()
+            entry: Dict[str, Any] = {
+                "type": event_type,
+                "payload": payload,
+                "prev_hash": prev_hash,
+            }
+            entry["hash"] = self._compute_hash(prev_hash, entry)
+            line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+            index = self._matching_epoch_index(last_hash=prev_hash, offset=offset)
+            with self.ledger_path.open("ab") as handle:
+                handle.write(line)
+            end = offset + len(line)
+            self._write_tail_state(last_hash=entry["hash"], offset=end, entry_offset=offset)
+            if index is not None:
+                self._index_entry(index, entry, start=offset, end=end)
+                index.update({"last_hash": entry["hash"], "offset": end, "entry_offset": offset})
+                self._write_epoch_index(index)
         if event_type == "MutationBundleEvent":
             epoch_id = str(payload.get("epoch_id") or "")
             digest = str(payload.get("epoch_digest") or "")
@@ -191,31 +494,158 @@ class LineageLedgerV2:
         event_type = event.__class__.__name__
         return self.append_event(event_type, asdict(event))
 
-    def _read_entries_unverified(self) -> List[Dict[str, Any]]:
+    def _iter_entries_unverified(self) -> Iterator[Dict[str, Any]]:
         self._ensure()
-        entries: List[Dict[str, Any]] = []
-        for line in read_file_deterministic(self.ledger_path).splitlines():
+        for line in iter_lines_deterministic(self.ledger_path):
             if not line.strip():
                 continue
             entry = json.loads(line)
             if isinstance(entry, dict):
-                entries.append(entry)
-        return entries
+                yield entry
+
+    def _read_entries_unverified(self) -> List[Dict[str, Any]]:
+        return list(self._iter_entries_unverified())
+
+    def iter_entries(self, recovery_hook: LineageRecoveryHook | None = None) -> Iterator[Dict[str, Any]]:
+        """Stream entries from genesis, verifying the hash chain line by line."""
+        for _, _, entry in self._iter_chain(recovery_hook=recovery_hook):
+            if entry is not None:
+                yield entry
 
     def read_all(self) -> List[Dict[str, Any]]:
-        self.verify_integrity()
-        return self._read_entries_unverified()
+        return list(self.iter_entries())
+
+    def iter_entries_reindexed(self, recovery_hook: LineageRecoveryHook | None = None) -> Iterator[Dict[str, Any]]:
+        """Stream verified entries like :meth:`iter_entries` while rebuilding the epoch index from them.
+
+        Verification paths use this instead of trusting the sidecar. Once the
+        stream is exhausted the persisted sidecar is compared with the rebuilt
+        index at the offset it claims to cover, the rebuilt index replaces it,
+        and any difference raises :class:`LineageIntegrityError`.
+        """
+        persisted = self._load_epoch_index()
+        index = self._empty_epoch_index()
+
+        def _snapshot() -> tuple[Any, ...]:
+            return (index["last_hash"], index["entry_offset"], json.loads(json.dumps(index["epochs"])))
+
+        snapshot = _snapshot() if persisted is not None and persisted["offset"] == 0 else None
+        offset = 0
+        for line_start, offset, entry in self._iter_chain(recovery_hook=recovery_hook):
+            if entry is not None:
+                self._index_entry(index, entry, start=line_start, end=offset)
+                index["entry_offset"] = line_start
+                index["last_hash"] = str(entry["hash"])
+            if persisted is not None and offset == persisted["offset"]:
+                snapshot = _snapshot()
+            if entry is not None:
+                yield entry
+        index["offset"] = offset
+        with self._append_lock():
+            # Skip the write if an append landed after the scan; that append maintained the index itself.
+            if self._validated_tail() == (index["last_hash"], offset):
+                self._write_epoch_index(index)
+        if persisted is not None and snapshot != (persisted["last_hash"], persisted["entry_offset"], persisted["epochs"]):
+            metrics.log(
+                event_type="lineage_v2_epoch_index_mismatch",
+                payload={"ledger_path": str(self.ledger_path), "index_offset": persisted["offset"]},
+                level="ERROR",
+            )
+            raise LineageIntegrityError("lineage_epoch_index_mismatch")
+
+    def _iter_span(self, *, start: int, end: int, prev_hash: str, end_hash: str) -> Iterator[tuple[int, Dict[str, Any]]]:
+        """Yield ``(line_start, entry)`` for every entry in ``[start, end)``, verifying the chain across the span.
+
+        Each line must link to the previous one and re-hash to its stored hash;
+        the span must start from ``prev_hash`` and finish on ``end_hash``. On a
+        mismatch the full audit runs first so errors carry line numbers.
+        Stops early if the caller stops consuming.
+        """
+        charge_entropy(EntropySource.FILESYSTEM, f"read:{self.ledger_path}")
+        position = start
+        with self.ledger_path.open("rb") as handle:
+            handle.seek(position)
+            for line in handle:
+                line_start = position
+                position += len(line)
+                if line.strip():
+                    entry = json.loads(line.strip().decode("utf-8"))
+                    if not isinstance(entry, dict) or str(entry.get("prev_hash") or "") != prev_hash:
+                        self.verify_integrity()
+                        raise LineageIntegrityError(f"lineage_prev_hash_mismatch:offset{line_start}")
+                    body = {key: value for key, value in entry.items() if key != "hash"}
+                    if entry.get("hash") != self._compute_hash(prev_hash, body):
+                        self.verify_integrity()
+                        raise LineageIntegrityError(f"lineage_hash_mismatch:offset{line_start}")
+                    prev_hash = str(entry["hash"])
+                    yield line_start, entry
+                if position >= end:
+                    break
+        if prev_hash != end_hash:
+            self.verify_integrity()
+            raise LineageIntegrityError(f"lineage_prev_hash_mismatch:offset{position}")
+
+    def iter_epoch(self, epoch_id: str) -> Iterator[Dict[str, Any]]:
+        """Stream one epoch by seeking to its indexed byte span.
+
+        The chain is verified up to the tail, and across the span every line is
+        re-hashed and linked to its predecessor, anchored on the hashes the index
+        recorded at the span's edges.
+        """
+        record = self._epoch_index()["epochs"].get(epoch_id)
+        if record is None:
+            return
+        for _, entry in self._iter_span(
+            start=int(record["start"]),
+            end=int(record["end"]),
+            prev_hash=str(record["start_prev_hash"]),
+            end_hash=str(record["end_hash"]),
+        ):
+            payload = entry.get("payload")
+            if isinstance(payload, dict) and payload.get("epoch_id") == epoch_id:
+                yield entry
 
     def read_epoch(self, epoch_id: str) -> List[Dict[str, Any]]:
-        return [entry for entry in self.read_all() if entry.get("payload", {}).get("epoch_id") == epoch_id]
+        return list(self.iter_epoch(epoch_id))
+
+    def iter_epochs(self, epoch_ids: Iterable[str]) -> Iterator[tuple[str, List[Dict[str, Any]]]]:
+        """Stream several epochs in one pass over their combined indexed byte span.
+
+        Each epoch is yielded as ``(epoch_id, entries)`` as soon as its last
+        indexed entry has been read, so only epochs still open are held in
+        memory. The chain is verified across the whole span exactly as in
+        :meth:`iter_epoch`; unknown ids are skipped.
+        """
+        epochs = self._epoch_index()["epochs"]
+        remaining = {epoch_id: int(epochs[epoch_id]["event_count"]) for epoch_id in dict.fromkeys(epoch_ids) if epoch_id in epochs}
+        if not remaining:
+            return
+        first = min(remaining, key=lambda epoch_id: int(epochs[epoch_id]["start"]))
+        last = max(remaining, key=lambda epoch_id: int(epochs[epoch_id]["end"]))
+        open_epochs: Dict[str, List[Dict[str, Any]]] = {}
+        for _, entry in self._iter_span(
+            start=int(epochs[first]["start"]),
+            end=int(epochs[last]["end"]),
+            prev_hash=str(epochs[first]["start_prev_hash"]),
+            end_hash=str(epochs[last]["end_hash"]),
+        ):
+            payload = entry.get("payload")
+            epoch_id = payload.get("epoch_id") if isinstance(payload, dict) else None
+            if isinstance(epoch_id, str) and epoch_id in remaining:
+                open_epochs.setdefault(epoch_id, []).append(entry)
+                remaining[epoch_id] -= 1
+                if not remaining[epoch_id]:
+                    del remaining[epoch_id]
+                    yield epoch_id, open_epochs.pop(epoch_id)
+        yield from open_epochs.items()
 
     def list_epoch_ids(self) -> List[str]:
-        seen: List[str] = []
-        for entry in self.read_all():
-            epoch_id = entry.get("payload", {}).get("epoch_id")
-            if isinstance(epoch_id, str) and epoch_id and epoch_id not in seen:
-                seen.append(epoch_id)
-        return seen
+        """Return epoch ids in first-seen ledger order, as recorded by the epoch index sidecar.
+
+        The sidecar is checked only against the tail anchor; verification paths
+        should derive ids from :meth:`iter_entries_reindexed` instead.
+        """
+        return list(self._epoch_index()["epochs"])
 
     def get_expected_epoch_digest(self, epoch_id: str) -> str | None:
         return self.get_epoch_digest(epoch_id)
@@ -251,13 +681,8 @@ class LineageLedgerV2:
     def get_epoch_digest(self, epoch_id: str) -> Optional[str]:
         if epoch_id in self._epoch_digest_index:
             return self._epoch_digest_index[epoch_id]
-        digest: Optional[str] = None
-        for entry in self.read_epoch(epoch_id):
-            payload = entry.get("payload", {})
-            if entry.get("type") == "MutationBundleEvent" and payload.get("epoch_digest"):
-                digest = str(payload["epoch_digest"])
-            if entry.get("type") == "EpochCheckpointEvent" and payload.get("epoch_digest"):
-                digest = str(payload["epoch_digest"])
+        summary = self.get_epoch_summary(epoch_id) or {}
+        digest: Optional[str] = summary.get("epoch_digest")
         if digest:
             self._epoch_digest_index[epoch_id] = digest
         return digest
@@ -268,11 +693,12 @@ class LineageLedgerV2:
     def compute_incremental_epoch_digest_unverified(self, epoch_id: str) -> str:
         """Recompute epoch digest from recorded bundle payloads without hash-chain integrity checks."""
 
+        entries = (entry for entry in self._iter_entries_unverified() if entry.get("payload", {}).get("epoch_id") == epoch_id)
+        return self._fold_bundle_digests(entries)
+
+    def _fold_bundle_digests(self, entries: Iterable[Dict[str, Any]]) -> str:
         digest = "sha256:0"
-        entries = self._read_entries_unverified()
         for entry in entries:
-            if entry.get("payload", {}).get("epoch_id") != epoch_id:
-                continue
             if entry.get("type") != "MutationBundleEvent":
                 continue
             payload = dict(entry.get("payload") or {})
@@ -281,10 +707,9 @@ class LineageLedgerV2:
         return digest
 
     def compute_incremental_epoch_digest(self, epoch_id: str) -> str:
-        """Recompute epoch digest after verifying append-only ledger chain integrity."""
+        """Recompute epoch digest from the verified, index-scoped epoch entries."""
 
-        self.verify_integrity()
-        return self.compute_incremental_epoch_digest_unverified(epoch_id)
+        return self._fold_bundle_digests(self.iter_epoch(epoch_id))
 
     def compute_cumulative_epoch_digest(self, epoch_id: str) -> str:
         return self.compute_incremental_epoch_digest(epoch_id)
@@ -314,6 +739,7 @@ __all__ = [
     "EpochEndEvent",
     "MutationBundleEvent",
     "LEDGER_V2_PATH",
+    "GENESIS_HASH",
     "LineageIntegrityError",
     "LineageRecoveryHook",
 ]
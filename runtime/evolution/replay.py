@@ -3,30 +3,77 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Sequence
 
 from runtime.evolution.lineage_v2 import LineageLedgerV2
 from runtime.governance.foundation.hashing import sha256_digest
 from runtime.sandbox.replay import replay_sandbox_execution
 
 
+# Below this many events per batch, process start-up costs more than it saves.
+REPLAY_PARALLEL_MIN_EVENTS = 2000
+DEFAULT_REPLAY_MAX_WORKERS = 4
+
+
+def replay_max_workers() -> int:
+    """Process count for batch replay (``ADAAD_REPLAY_MAX_WORKERS``; ``1`` keeps replay in-process)."""
+    raw = os.getenv("ADAAD_REPLAY_MAX_WORKERS", "").strip()
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            return 1
+    return max(1, min(DEFAULT_REPLAY_MAX_WORKERS, os.cpu_count() or 1))
+
+
+def _reconstruct(epoch_id: str, events: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    initial = [e for e in events if e.get("type") == "EpochStartEvent"]
+    final = [e for e in events if e.get("type") == "EpochEndEvent"]
+    bundles = [e for e in events if e.get("type") == "MutationBundleEvent"]
+    sandbox_events = [e for e in events if e.get("type") == "SandboxEvidenceEvent"]
+    return {
+        "epoch_id": epoch_id,
+        "initial_state": initial[0]["payload"] if initial else {},
+        "bundles": bundles,
+        "sandbox_events": sandbox_events,
+        "final_state": final[-1]["payload"] if final else {},
+    }
+
+
+def _replay_result(epoch_id: str, reconstructed: Dict[str, Any], replay_digest: str) -> Dict[str, Any]:
+    sandbox_events = reconstructed.get("sandbox_events", [])
+    sandbox_replay = [
+        replay_sandbox_execution((event.get("payload") or {}).get("manifest", {}), (event.get("payload") or {}))
+        for event in sandbox_events
+        if isinstance((event.get("payload") or {}).get("manifest"), dict)
+    ]
+    replay_material = {"reconstructed": reconstructed, "replay_digest": replay_digest, "sandbox_replay": sandbox_replay}
+    canonical_digest = sha256_digest(replay_material)
+    return {
+        "epoch_id": epoch_id,
+        "digest": replay_digest,
+        "canonical_digest": canonical_digest,
+        "events": len(reconstructed.get("bundles", [])),
+        "sandbox_replay": sandbox_replay,
+    }
+
+
+def _replay_partition(ledger_path: Path, epoch_id: str, events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Replay one epoch from already chain-verified events; runs in pool workers."""
+    replay_digest = LineageLedgerV2(ledger_path)._fold_bundle_digests(events)
+    return _replay_result(epoch_id, _reconstruct(epoch_id, events), replay_digest)
+
+
 class ReplayEngine:
     def __init__(self, ledger: LineageLedgerV2 | None = None) -> None:
         self.ledger = ledger or LineageLedgerV2()
 
     def reconstruct_epoch(self, epoch_id: str) -> Dict[str, Any]:
-        events = self.ledger.read_epoch(epoch_id)
-        initial = [e for e in events if e.get("type") == "EpochStartEvent"]
-        final = [e for e in events if e.get("type") == "EpochEndEvent"]
-        bundles = [e for e in events if e.get("type") == "MutationBundleEvent"]
-        sandbox_events = [e for e in events if e.get("type") == "SandboxEvidenceEvent"]
-        return {
-            "epoch_id": epoch_id,
-            "initial_state": initial[0]["payload"] if initial else {},
-            "bundles": bundles,
-            "sandbox_events": sandbox_events,
-            "final_state": final[-1]["payload"] if final else {},
-        }
+        return _reconstruct(epoch_id, self.ledger.read_epoch(epoch_id))
 
     def compute_incremental_digest_unverified(self, epoch_id: str) -> str:
         """Recompute digest from event payloads without hash-chain integrity checks.
@@ -46,21 +93,74 @@ class ReplayEngine:
     def replay_epoch(self, epoch_id: str) -> Dict[str, Any]:
         reconstructed = self.reconstruct_epoch(epoch_id)
         replay_digest = self.compute_incremental_digest(epoch_id)
-        sandbox_events = reconstructed.get("sandbox_events", [])
-        sandbox_replay = [
-            replay_sandbox_execution((event.get("payload") or {}).get("manifest", {}), (event.get("payload") or {}))
-            for event in sandbox_events
-            if isinstance((event.get("payload") or {}).get("manifest"), dict)
-        ]
-        replay_material = {"reconstructed": reconstructed, "replay_digest": replay_digest, "sandbox_replay": sandbox_replay}
-        canonical_digest = sha256_digest(replay_material)
-        return {
-            "epoch_id": epoch_id,
-            "digest": replay_digest,
-            "canonical_digest": canonical_digest,
-            "events": len(reconstructed.get("bundles", [])),
-            "sandbox_replay": sandbox_replay,
-        }
+        return _replay_result(epoch_id, reconstructed, replay_digest)
+
+    def replay_events(self, epoch_id: str, events: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+        """Replay one epoch from entries the caller already read; same result as :meth:`replay_epoch`.
+
+        The entries are not chain-verified here; pass them from a verifying
+        reader such as :meth:`LineageLedgerV2.iter_epochs`.
+        """
+        return _replay_result(epoch_id, _reconstruct(epoch_id, events), self.ledger._fold_bundle_digests(events))
+
+    def partition_epochs(self, epoch_ids: Iterable[str] | None = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Verify the chain once and bucket entries by epoch in a single pass.
+
+        Buckets follow ``epoch_ids`` order (default: first-seen ledger order,
+        taken from the verified chain rather than the epoch index sidecar);
+        raises :class:`LineageIntegrityError` like the per-epoch readers, and
+        also when the sidecar disagrees with the chain.
+        """
+
+        if epoch_ids is None:
+            discovered: Dict[str, List[Dict[str, Any]]] = {}
+            for entry in self.ledger.iter_entries_reindexed():
+                payload = entry.get("payload")
+                epoch_id = payload.get("epoch_id") if isinstance(payload, dict) else None
+                if isinstance(epoch_id, str) and epoch_id:
+                    discovered.setdefault(epoch_id, []).append(entry)
+            return discovered
+        partitions: Dict[str, List[Dict[str, Any]]] = {epoch_id: [] for epoch_id in epoch_ids}
+        for entry in self.ledger.iter_entries():
+            payload = entry.get("payload")
+            bucket = partitions.get(payload.get("epoch_id")) if isinstance(payload, dict) else None
+            if bucket is not None:
+                bucket.append(entry)
+        return partitions
+
+    def replay_partitions(
+        self,
+        partitions: Dict[str, List[Dict[str, Any]]],
+        *,
+        max_workers: int | None = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Replay pre-partitioned epochs, on a process pool when the batch is large enough.
+
+        Results are keyed in ``partitions`` order and equal :meth:`replay_epoch`.
+        """
+
+        workers = replay_max_workers() if max_workers is None else max(1, int(max_workers))
+        workers = min(workers, len(partitions))
+        total_events = sum(len(events) for events in partitions.values())
+        ledger_path = Path(self.ledger.ledger_path)
+        if workers <= 1 or total_events < REPLAY_PARALLEL_MIN_EVENTS:
+            return {
+                epoch_id: _replay_partition(ledger_path, epoch_id, events)
+                for epoch_id, events in partitions.items()
+            }
+        # Spawn keeps workers free of inherited locks and ledger handles.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = {
+                epoch_id: pool.submit(_replay_partition, ledger_path, epoch_id, events)
+                for epoch_id, events in partitions.items()
+            }
+            return {epoch_id: future.result() for epoch_id, future in futures.items()}
+
+    def replay_epochs(self, epoch_ids: Iterable[str] | None = None, *, max_workers: int | None = None) -> Dict[str, Dict[str, Any]]:
+        """Batch form of :meth:`replay_epoch` that reads and verifies the ledger once."""
+
+        return self.replay_partitions(self.partition_epochs(epoch_ids), max_workers=max_workers)
 
     def deterministic_replay(self, epoch_id: str) -> Dict[str, Any]:
         return self.replay_epoch(epoch_id)
@@ -70,4 +170,4 @@ class ReplayEngine:
         return replay["digest"] == expected_digest
 
 
-__all__ = ["ReplayEngine"]
+__all__ = ["REPLAY_PARALLEL_MIN_EVENTS", "ReplayEngine", "replay_max_workers"]
@@ -5,7 +5,6 @@ from __future__ import annotations
 
 import json
 import os
-import re
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping
@@ -16,6 +15,7 @@ from runtime.evolution.lineage_v2 import LineageLedgerV2
 from runtime.evolution.replay import ReplayEngine
 from runtime.governance.deterministic_filesystem import read_file_deterministic
 from runtime.governance.foundation import ZERO_HASH, canonical_json, sha256_digest, sha256_prefixed_digest
+from runtime.governance.schema_engine import REPLAY_ATTESTATION, load_schema
 from security import cryovant
 
 REPLAY_PROOFS_DIR = ROOT_DIR / "security" / "ledger" / "replay_proofs"
@@ -34,66 +34,6 @@ def _normalize_checkpoint_event(payload: Dict[str, Any]) -> Dict[str, str]:
     }
 
 
-def _json_type_name(value: Any) -> str:
-    if value is None:
-        return "null"
-    if isinstance(value, bool):
-        return "boolean"
-    if isinstance(value, (int, float)):
-        return "number"
-    if isinstance(value, str):
-        return "string"
-    if isinstance(value, list):
-        return "array"
-    if isinstance(value, dict):
-        return "object"
-    return "unknown"
-
-
-def _validate_schema_subset(instance: Any, schema: Dict[str, Any], path: str = "$") -> List[str]:
-    errors: List[str] = []
-    expected_type = schema.get("type")
-    if isinstance(expected_type, str) and _json_type_name(instance) != expected_type:
-        return [f"{path}:expected_{expected_type}:got_{_json_type_name(instance)}"]
-
-    if expected_type == "object":
-        if not isinstance(instance, dict):
-            return [f"{path}:not_object"]
-        required = schema.get("required") or []
-        for key in required:
-            if key not in instance:
-                errors.append(f"{path}.{key}:missing_required")
-        properties = schema.get("properties") or {}
-        for key, value in instance.items():
-            if key in properties:
-                errors.extend(_validate_schema_subset(value, properties[key], f"{path}.{key}"))
-        if schema.get("additionalProperties") is False:
-            extras = sorted(set(instance.keys()) - set(properties.keys()))
-            for key in extras:
-                errors.append(f"{path}.{key}:additional_property")
-
-    if expected_type == "array":
-        if not isinstance(instance, list):
-            return [f"{path}:not_array"]
-        item_schema = schema.get("items")
-        if isinstance(item_schema, dict):
-            for idx, value in enumerate(instance):
-                errors.extend(_validate_schema_subset(value, item_schema, f"{path}[{idx}]"))
-
-    if isinstance(instance, str):
-        const_value = schema.get("const")
-        if const_value is not None and instance != const_value:
-            errors.append(f"{path}:const_mismatch")
-        min_length = schema.get("minLength")
-        if isinstance(min_length, int) and len(instance) < min_length:
-            errors.append(f"{path}:min_length_violation")
-        pattern = schema.get("pattern")
-        if isinstance(pattern, str) and re.fullmatch(pattern, instance) is None:
-            errors.append(f"{path}:pattern_violation")
-
-    return errors
-
-
 def _parse_iso8601_utc(value: str) -> datetime | None:
     if not isinstance(value, str) or not value:
         return None
@@ -396,8 +336,7 @@ def load_replay_proof(path: Path) -> Dict[str, Any]:
 
 
 def validate_replay_proof_schema(bundle: Dict[str, Any]) -> List[str]:
-    schema = json.loads(read_file_deterministic(REPLAY_ATTESTATION_SCHEMA_PATH))
-    return _validate_schema_subset(bundle, schema)
+    return load_schema(REPLAY_ATTESTATION_SCHEMA_PATH, REPLAY_ATTESTATION, deterministic=True).validate(bundle)
 
 
 __all__ = [
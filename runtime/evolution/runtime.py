@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List
 
 from app.agents.mutation_request import MutationRequest
 from runtime.evolution.baseline import BaselineStore
@@ -200,33 +200,69 @@ class EvolutionRuntime:
         try:
             replay = self.replay_engine.replay_epoch(epoch_id)
         except LineageIntegrityError as exc:
-            self._enter_fail_closed_replay(epoch_id=epoch_id, reason="lineage_integrity_error")
-            return {
-                "epoch_id": epoch_id,
-                "baseline_epoch": epoch_id,
-                "baseline_source": "lineage_epoch_digest",
-                "baseline_id": self.baseline_id,
-                "baseline_hash": self.baseline_hash,
-                "baseline_match": False,
-                "expected_digest": expected or "sha256:0",
-                "actual_digest": "unavailable",
-                "passed": False,
-                "decision": "fail_closed",
-                "trusted": False,
-                "digest_match": False,
-                "digest": "unavailable",
-                "expected": expected or "sha256:0",
-                "replay_score": 0.0,
-                "cause_buckets": {
-                    "digest_mismatch": True,
-                    "baseline_mismatch": True,
-                    "time_input_variance": False,
-                    "external_dependency_variance": False,
-                },
-                "integrity_error": str(exc),
-                "checkpoint": None,
-                "checkpoint_verification": {"ok": False, "reason": "lineage_integrity_error"},
-            }
+            return self._integrity_failure(epoch_id, expected, exc)
+        return self._record_replay_verification(epoch_id, replay, expected)
+
+    def verify_epochs(self, epoch_ids: Iterable[str] | None = None) -> List[Dict[str, Any]]:
+        """Verify many epochs with one chain read and a process-parallel replay.
+
+        Replays run concurrently (see :meth:`ReplayEngine.replay_partitions`);
+        verification events and checkpoints are then appended one epoch at a
+        time in canonical order, so the ledger matches sequential
+        :meth:`verify_epoch` calls. With no ``epoch_ids`` the epochs are taken
+        from the verified chain, and a disagreeing epoch index fails closed.
+        """
+
+        requested = list(dict.fromkeys(epoch_ids)) if epoch_ids is not None else None
+        try:
+            partitions = self.replay_engine.partition_epochs(requested)
+            ordered = list(partitions)
+            replays = self.replay_engine.replay_partitions(partitions)
+        except LineageIntegrityError as exc:
+            failed = requested if requested is not None else [self.current_epoch_id or "unknown"]
+            return [self._integrity_failure(epoch_id, None, exc) for epoch_id in failed]
+        return [
+            self._record_replay_verification(epoch_id, replays[epoch_id], None, epoch_events=partitions[epoch_id])
+            for epoch_id in ordered
+        ]
+
+    def _integrity_failure(self, epoch_id: str, expected: str | None, exc: LineageIntegrityError) -> Dict[str, Any]:
+        self._enter_fail_closed_replay(epoch_id=epoch_id, reason="lineage_integrity_error")
+        return {
+            "epoch_id": epoch_id,
+            "baseline_epoch": epoch_id,
+            "baseline_source": "lineage_epoch_digest",
+            "baseline_id": self.baseline_id,
+            "baseline_hash": self.baseline_hash,
+            "baseline_match": False,
+            "expected_digest": expected or "sha256:0",
+            "actual_digest": "unavailable",
+            "passed": False,
+            "decision": "fail_closed",
+            "trusted": False,
+            "digest_match": False,
+            "digest": "unavailable",
+            "expected": expected or "sha256:0",
+            "replay_score": 0.0,
+            "cause_buckets": {
+                "digest_mismatch": True,
+                "baseline_mismatch": True,
+                "time_input_variance": False,
+                "external_dependency_variance": False,
+            },
+            "integrity_error": str(exc),
+            "checkpoint": None,
+            "checkpoint_verification": {"ok": False, "reason": "lineage_integrity_error"},
+        }
+
+    def _record_replay_verification(
+        self,
+        epoch_id: str,
+        replay: Dict[str, Any],
+        expected: str | None,
+        *,
+        epoch_events: List[Dict[str, Any]] | None = None,
+    ) -> Dict[str, Any]:
         actual_digest = replay["digest"]
         ledger_baseline = self.ledger.get_epoch_digest(epoch_id) or "sha256:0"
         expected_digest = expected or ledger_baseline
@@ -253,7 +289,7 @@ class EvolutionRuntime:
         )
         passed = verification["passed"]
         decision = verification["decision"]
-        self.ledger.append_event(
+        verification_entry = self.ledger.append_event(
             "ReplayVerificationEvent",
             {
                 "epoch_id": epoch_id,
@@ -270,8 +306,22 @@ class EvolutionRuntime:
                 "cause_buckets": verification["cause_buckets"],
             },
         )
-        checkpoint = self.checkpoint_registry.create_checkpoint(epoch_id)
-        checkpoint_verification = verify_checkpoint_chain(self.ledger, epoch_id)
+        if epoch_events is None:
+            checkpoint = self.checkpoint_registry.create_checkpoint(epoch_id)
+            checkpoint_verification = verify_checkpoint_chain(self.ledger, epoch_id)
+        else:
+            # Batch path: the verified partition plus our own appends is the whole epoch.
+            epoch_events = [*epoch_events, verification_entry]
+            checkpoint = self.checkpoint_registry.create_checkpoint(
+                epoch_id,
+                epoch_events=epoch_events,
+                baseline_digest=actual_digest,
+            )
+            checkpoint_verification = verify_checkpoint_chain(
+                self.ledger,
+                epoch_id,
+                [*epoch_events, {"type": "EpochCheckpointEvent", "payload": checkpoint}],
+            )
         return {
             "epoch_id": epoch_id,
             "baseline_epoch": epoch_id,
@@ -348,7 +398,7 @@ class EvolutionRuntime:
             results = [self.verify_epoch(epoch_id)]
             verify_target = "single_epoch"
         else:
-            results = [self.verify_epoch(each_epoch_id) for each_epoch_id in self.ledger.list_epoch_ids()]
+            results = self.verify_epochs()
             verify_target = "all_epochs"
 
         has_divergence = any(not result["passed"] for result in results)
@@ -369,10 +419,7 @@ class EvolutionRuntime:
         }
 
     def verify_all_epochs(self) -> bool:
-        ok = True
-        for epoch_id in self.ledger.list_epoch_ids():
-            result = self.verify_epoch(epoch_id)
-            ok = ok and result["passed"]
+        ok = all(result["passed"] for result in self.verify_epochs())
         if not ok:
             self.governor.enter_fail_closed("replay_divergence", self.current_epoch_id or "unknown")
         return ok
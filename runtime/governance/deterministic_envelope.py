@@ -61,24 +61,38 @@ class EntropyLedger:
     consumed: int = 0
     events: list[EntropyConsumption] = field(default_factory=list)
     overflow: bool = False
-
-    def charge(self, source: EntropySource, context: str, stack_trace: str) -> bool:
-        """Charge entropy budget for an operation."""
+    # Worker threads that adopt the envelope charge the same ledger.
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def charge(
+        self,
+        source: EntropySource,
+        context: str,
+        stack_trace: str,
+        sink: list[EntropyConsumption] | None = None,
+    ) -> bool:
+        """Charge entropy budget for an operation, recording the event in ``sink`` when given."""
         cost = _get_entropy_cost(source)
-        if self.consumed + cost > self.budget:
-            self.overflow = True
-            return False
-
-        event = EntropyConsumption(
-            source=source,
-            cost=cost,
-            context=context,
-            timestamp=now_iso(),
-            stack_trace=stack_trace,
-        )
-        self.events.append(event)
-        self.consumed += cost
-        return True
+        with self._lock:
+            if self.consumed + cost > self.budget:
+                self.overflow = True
+                return False
+
+            event = EntropyConsumption(
+                source=source,
+                cost=cost,
+                context=context,
+                timestamp=now_iso(),
+                stack_trace=stack_trace,
+            )
+            (self.events if sink is None else sink).append(event)
+            self.consumed += cost
+            return True
+
+    def record(self, events: list[EntropyConsumption]) -> None:
+        """Append events charged earlier into a sink; their cost is already counted."""
+        with self._lock:
+            self.events.extend(events)
 
     def remaining(self) -> int:
         return max(0, self.budget - self.consumed)
@@ -138,6 +152,41 @@ def deterministic_envelope(
         del _thread_local.provider
 
 
+def capture_envelope() -> tuple[EntropyLedger | None, RuntimeDeterminismProvider | None]:
+    """Return this thread's active ledger and provider, for handing to worker threads."""
+    return getattr(_thread_local, "envelope", None), getattr(_thread_local, "provider", None)
+
+
+@contextmanager
+def adopt_envelope(
+    captured: tuple[EntropyLedger | None, RuntimeDeterminismProvider | None],
+    sink: list[EntropyConsumption] | None = None,
+) -> Generator[EntropyLedger | None, None, None]:
+    """Install an envelope captured on another thread for the duration of a worker task.
+
+    Envelope state is thread-local, so ``contextvars.copy_context()`` does not
+    carry it into pool threads. Charges made while adopted count against the
+    shared budget; their events go to ``sink`` when given, so the owner can
+    :meth:`EntropyLedger.record` them in a deterministic order. Overflow is
+    still reported once, by the owning envelope.
+    """
+    ledger, provider = captured
+    if ledger is None:
+        yield None
+        return
+    if hasattr(_thread_local, "envelope"):
+        raise RuntimeError("nested_deterministic_envelope_not_supported")
+    _thread_local.envelope = ledger
+    _thread_local.provider = provider or default_provider()
+    _thread_local.sink = sink
+    try:
+        yield ledger
+    finally:
+        del _thread_local.envelope
+        del _thread_local.provider
+        del _thread_local.sink
+
+
 def _log_entropy_overflow(ledger: EntropyLedger) -> None:
     from runtime import metrics
 
@@ -170,7 +219,7 @@ def charge_entropy(source: EntropySource, context: str) -> bool:
         return True
 
     stack_trace = "".join(traceback.format_stack(limit=4)[:-1])
-    if not ledger.charge(source, context, stack_trace):
+    if not ledger.charge(source, context, stack_trace, sink=getattr(_thread_local, "sink", None)):
         raise EntropyBudgetExceeded(
             f"entropy_budget_exceeded:{ledger.epoch_id}:{ledger.consumed}/{ledger.budget}:{source.value}"
         )
@@ -183,6 +232,8 @@ __all__ = [
     "EntropyConsumption",
     "EntropyLedger",
     "EntropyBudgetExceeded",
+    "adopt_envelope",
+    "capture_envelope",
     "deterministic_envelope",
     "get_current_ledger",
     "charge_entropy",
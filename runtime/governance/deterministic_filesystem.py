@@ -11,6 +11,21 @@ from typing import Iterator
 
 from runtime.governance.deterministic_envelope import EntropySource, charge_entropy
 
+# File timestamps are only as fine as the kernel clock tick, so a write landing
+# in the same tick as a recorded stamp leaves the stamp unchanged. A stamp is
+# trusted only once it was recorded this long after the file's mtime.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def stat_stamp(stat: os.stat_result) -> tuple[int, int, int]:
+    """``(st_mtime_ns, st_size, st_ino)`` identity used by stat-stamp caches."""
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def stamp_is_settled(recorded_ns: int, mtime_ns: int) -> bool:
+    """True when a stamp recorded at ``recorded_ns`` lies outside the racy window of ``mtime_ns``."""
+    return recorded_ns - mtime_ns >= RACY_WINDOW_NS
+
 
 def listdir_deterministic(path: str | Path) -> list[str]:
     charge_entropy(EntropySource.FILESYSTEM, f"listdir:{path}")
@@ -40,6 +55,13 @@ def read_file_deterministic(path: str | Path, encoding: str = "utf-8") -> str:
         return handle.read()
 
 
+def iter_lines_deterministic(path: str | Path, encoding: str = "utf-8") -> Iterator[str]:
+    """Stream a text file line by line so callers stay constant-memory."""
+    charge_entropy(EntropySource.FILESYSTEM, f"read:{path}")
+    with open(path, "r", encoding=encoding, newline=None) as handle:
+        yield from handle
+
+
 def find_files_deterministic(
     root: str | Path,
     pattern: str = "*",
@@ -58,10 +80,14 @@ def find_files_deterministic(
 
 
 __all__ = [
+    "RACY_WINDOW_NS",
+    "stat_stamp",
+    "stamp_is_settled",
     "listdir_deterministic",
     "walk_deterministic",
     "glob_deterministic",
     "canonical_path",
     "read_file_deterministic",
+    "iter_lines_deterministic",
     "find_files_deterministic",
 ]
@@ -14,13 +14,11 @@ Expected invariants:
 from __future__ import annotations
 
 from dataclasses import asdict
-import json
-import re
 from typing import Any
 
 from runtime import ROOT_DIR
-from runtime.governance.deterministic_filesystem import read_file_deterministic
 from runtime.governance.federation.coordination import FederationDecision, FederationPolicyExchange, FederationVote
+from runtime.governance.schema_engine import FEDERATION, load_schema
 
 _PROTOCOL = "adaad.federation.handshake"
 _PROTOCOL_VERSION = "1.0"
@@ -34,79 +32,8 @@ class FederationProtocolValidationError(ValueError):
     """Raised when protocol envelope or payload validation fails."""
 
 
-def _schema(schema_name: str) -> dict[str, Any]:
-    path = ROOT_DIR / "schemas" / schema_name
-    return json.loads(read_file_deterministic(path))
-
-
-def _is_type(value: Any, expected: str) -> bool:
-    if expected == "object":
-        return isinstance(value, dict)
-    if expected == "array":
-        return isinstance(value, list)
-    if expected == "string":
-        return isinstance(value, str)
-    if expected == "integer":
-        return isinstance(value, int) and not isinstance(value, bool)
-    return True
-
-
-def _validate(schema: dict[str, Any], payload: Any, path: str = "$") -> list[str]:
-    errors: list[str] = []
-    expected_type = schema.get("type")
-    if isinstance(expected_type, str) and not _is_type(payload, expected_type):
-        return [f"{path}:expected_{expected_type}"]
-
-    if "const" in schema and payload != schema["const"]:
-        errors.append(f"{path}:const_mismatch")
-
-    enum = schema.get("enum")
-    if isinstance(enum, list) and payload not in enum:
-        errors.append(f"{path}:enum_mismatch")
-
-    if isinstance(payload, str):
-        minimum = schema.get("minLength")
-        if isinstance(minimum, int) and len(payload) < minimum:
-            errors.append(f"{path}:min_length")
-        pattern = schema.get("pattern")
-        if isinstance(pattern, str) and re.match(pattern, payload) is None:
-            errors.append(f"{path}:pattern_mismatch")
-
-    if isinstance(payload, int):
-        minimum = schema.get("minimum")
-        if isinstance(minimum, int) and payload < minimum:
-            errors.append(f"{path}:minimum")
-
-    if isinstance(payload, dict):
-        required = schema.get("required") if isinstance(schema.get("required"), list) else []
-        for key in required:
-            if isinstance(key, str) and key not in payload:
-                errors.append(f"{path}.{key}:missing_required")
-
-        properties = schema.get("properties") if isinstance(schema.get("properties"), dict) else {}
-        additional = schema.get("additionalProperties", True)
-        for key, value in payload.items():
-            if key in properties and isinstance(properties[key], dict):
-                errors.extend(_validate(properties[key], value, f"{path}.{key}"))
-            elif additional is False:
-                errors.append(f"{path}.{key}:additional_property")
-            elif isinstance(additional, dict):
-                errors.extend(_validate(additional, value, f"{path}.{key}"))
-
-    if isinstance(payload, list):
-        minimum_items = schema.get("minItems")
-        if isinstance(minimum_items, int) and len(payload) < minimum_items:
-            errors.append(f"{path}:min_items")
-        item_schema = schema.get("items") if isinstance(schema.get("items"), dict) else None
-        if item_schema is not None:
-            for idx, item in enumerate(payload):
-                errors.extend(_validate(item_schema, item, f"{path}[{idx}]"))
-
-    return errors
-
-
 def _validate_or_raise(schema_name: str, payload: dict[str, Any]) -> None:
-    errors = _validate(_schema(schema_name), payload)
+    errors = load_schema(ROOT_DIR / "schemas" / schema_name, FEDERATION, deterministic=True).validate(payload)
     if errors:
         raise FederationProtocolValidationError(";".join(sorted(errors)))
 
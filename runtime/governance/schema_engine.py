@@ -0,0 +1,378 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Module: schema_engine
+Purpose: Compile JSON schema documents once into validator closures shared by every governance surface.
+Author: ADAAD / InnovativeAI-adaad
+Integration points:
+  - Imports from: runtime.governance.deterministic_envelope
+  - Consumed by: response_schema_validator, federation.protocol, preflight, evidence_bundle, replay_attestation
+  - Governance impact: medium — fail-closed schema conformance with stable error strings
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+from runtime.governance.deterministic_envelope import EntropySource, charge_entropy
+from runtime.governance.deterministic_filesystem import stamp_is_settled, stat_stamp
+
+_Check = Callable[[Any, str, List[str]], None]
+
+
+@dataclass(frozen=True)
+class SchemaDialect:
+    """Keyword coverage and error spelling of one validation surface.
+
+    Each surface historically carried its own validator; the dialects keep
+    their exact behaviour and error strings so stored verdicts stay comparable.
+    ``type_names`` lists the ``type`` values checked leniently (anything else
+    passes); ``None`` selects strict JSON typing with ``expected_X:got_Y``
+    errors, where object and array keywords apply only under a matching
+    declared ``type`` and additional properties are reported sorted.
+    """
+
+    name: str
+    type_names: frozenset[str] | None
+    value_keywords: bool = False
+    string_keywords: bool = False
+    string_const: bool = False
+    extended_keywords: bool = False
+    min_length_error: str = "min_length"
+    pattern_error: str = "pattern_mismatch"
+    pattern_fullmatch: bool = False
+
+
+_ALL_TYPES = frozenset({"object", "array", "string", "number", "integer", "boolean"})
+
+RESPONSE = SchemaDialect("response", _ALL_TYPES, value_keywords=True)
+PREFLIGHT = SchemaDialect("preflight", _ALL_TYPES)
+FEDERATION = SchemaDialect(
+    "federation",
+    frozenset({"object", "array", "string", "integer"}),
+    value_keywords=True,
+    string_keywords=True,
+    extended_keywords=True,
+)
+EVIDENCE_BUNDLE = SchemaDialect("evidence_bundle", None)
+REPLAY_ATTESTATION = SchemaDialect(
+    "replay_attestation",
+    None,
+    string_keywords=True,
+    string_const=True,
+    min_length_error="min_length_violation",
+    pattern_error="pattern_violation",
+    pattern_fullmatch=True,
+)
+
+_LENIENT_TYPES: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+}
+
+
+def json_type_name(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    if isinstance(value, dict):
+        return "object"
+    return "unknown"
+
+
+def _run(checks: Tuple[_Check, ...]) -> _Check:
+    if len(checks) == 1:
+        return checks[0]
+
+    def node(value: Any, path: str, errors: List[str]) -> None:
+        for check in checks:
+            check(value, path, errors)
+
+    return node
+
+
+def _string_checks(schema: Mapping[str, Any], dialect: SchemaDialect) -> List[_Check]:
+    checks: List[_Check] = []
+    if dialect.string_const and schema.get("const") is not None:
+        const_value = schema["const"]
+
+        def check_const(value: Any, path: str, errors: List[str]) -> None:
+            if isinstance(value, str) and value != const_value:
+                errors.append(f"{path}:const_mismatch")
+
+        checks.append(check_const)
+    if not dialect.string_keywords:
+        return checks
+    min_length = schema.get("minLength")
+    if isinstance(min_length, int):
+        min_length_error = f":{dialect.min_length_error}"
+
+        def check_min_length(value: Any, path: str, errors: List[str]) -> None:
+            if isinstance(value, str) and len(value) < min_length:
+                errors.append(path + min_length_error)
+
+        checks.append(check_min_length)
+    pattern = schema.get("pattern")
+    if isinstance(pattern, str):
+        compiled = re.compile(pattern)
+        matcher = compiled.fullmatch if dialect.pattern_fullmatch else compiled.match
+        pattern_error = f":{dialect.pattern_error}"
+
+        def check_pattern(value: Any, path: str, errors: List[str]) -> None:
+            if isinstance(value, str) and matcher(value) is None:
+                errors.append(path + pattern_error)
+
+        checks.append(check_pattern)
+    return checks
+
+
+def _compile_lenient(schema: Mapping[str, Any], dialect: SchemaDialect) -> _Check:
+    checks: List[_Check] = []
+    if dialect.value_keywords and "const" in schema:
+        const_value = schema["const"]
+
+        def check_const(value: Any, path: str, errors: List[str]) -> None:
+            if value != const_value:
+                errors.append(f"{path}:const_mismatch")
+
+        checks.append(check_const)
+    enum = schema.get("enum")
+    if dialect.value_keywords and isinstance(enum, list):
+
+        def check_enum(value: Any, path: str, errors: List[str]) -> None:
+            if value not in enum:
+                errors.append(f"{path}:enum_mismatch")
+
+        checks.append(check_enum)
+    checks.extend(_string_checks(schema, dialect))
+    minimum = schema.get("minimum")
+    if dialect.extended_keywords and isinstance(minimum, int):
+
+        def check_minimum(value: Any, path: str, errors: List[str]) -> None:
+            if isinstance(value, int) and value < minimum:
+                errors.append(f"{path}:minimum")
+
+        checks.append(check_minimum)
+
+    required = tuple(key for key in (schema.get("required") if isinstance(schema.get("required"), list) else []) if isinstance(key, str))
+    raw_properties = schema.get("properties") if isinstance(schema.get("properties"), dict) else {}
+    properties = {key: _compile_lenient(sub, dialect) for key, sub in raw_properties.items() if isinstance(sub, dict)}
+    additional = schema.get("additionalProperties", True)
+    additional_check = _compile_lenient(additional, dialect) if dialect.extended_keywords and isinstance(additional, dict) else None
+    if required or properties or additional is False or additional_check is not None:
+
+        def check_object(value: Any, path: str, errors: List[str]) -> None:
+            if not isinstance(value, dict):
+                return
+            for key in required:
+                if key not in value:
+                    errors.append(f"{path}.{key}:missing_required")
+            for key, item in value.items():
+                child = properties.get(key)
+                if child is not None:
+                    child(item, f"{path}.{key}", errors)
+                elif additional is False:
+                    errors.append(f"{path}.{key}:additional_property")
+                elif additional_check is not None:
+                    additional_check(item, f"{path}.{key}", errors)
+
+        checks.append(check_object)
+
+    min_items = schema.get("minItems")
+    if dialect.extended_keywords and isinstance(min_items, int):
+
+        def check_min_items(value: Any, path: str, errors: List[str]) -> None:
+            if isinstance(value, list) and len(value) < min_items:
+                errors.append(f"{path}:min_items")
+
+        checks.append(check_min_items)
+    if isinstance(schema.get("items"), dict):
+        item_check = _compile_lenient(schema["items"], dialect)
+
+        def check_items(value: Any, path: str, errors: List[str]) -> None:
+            if isinstance(value, list):
+                for index, item in enumerate(value):
+                    item_check(item, f"{path}[{index}]", errors)
+
+        checks.append(check_items)
+
+    body = _run(tuple(checks)) if checks else None
+    expected_type = schema.get("type")
+    is_type = _LENIENT_TYPES.get(expected_type) if isinstance(expected_type, str) and expected_type in dialect.type_names else None
+    if is_type is None:
+        return body or (lambda value, path, errors: None)
+    type_error = f":expected_{expected_type}"
+
+    def node(value: Any, path: str, errors: List[str]) -> None:
+        if not is_type(value):
+            errors.append(path + type_error)
+            return
+        if body is not None:
+            body(value, path, errors)
+
+    return node
+
+
+def _compile_strict(schema: Mapping[str, Any], dialect: SchemaDialect) -> _Check:
+    checks: List[_Check] = []
+    expected_type = schema.get("type")
+    if expected_type == "object":
+        required = tuple(schema.get("required") or [])
+        raw_properties = schema.get("properties") or {}
+        properties = {key: _compile_strict(sub, dialect) for key, sub in raw_properties.items() if isinstance(sub, dict)}
+        known = frozenset(raw_properties)
+        closed = schema.get("additionalProperties") is False
+
+        def check_object(value: Any, path: str, errors: List[str]) -> None:
+            for key in required:
+                if key not in value:
+                    errors.append(f"{path}.{key}:missing_required")
+            for key, item in value.items():
+                child = properties.get(key)
+                if child is not None:
+                    child(item, f"{path}.{key}", errors)
+            if closed:
+                for key in sorted(set(value) - known):
+                    errors.append(f"{path}.{key}:additional_property")
+
+        checks.append(check_object)
+    if expected_type == "array" and isinstance(schema.get("items"), dict):
+        item_check = _compile_strict(schema["items"], dialect)
+
+        def check_items(value: Any, path: str, errors: List[str]) -> None:
+            for index, item in enumerate(value):
+                item_check(item, f"{path}[{index}]", errors)
+
+        checks.append(check_items)
+    checks.extend(_string_checks(schema, dialect))
+
+    body = _run(tuple(checks)) if checks else None
+    if not isinstance(expected_type, str):
+        return body or (lambda value, path, errors: None)
+    type_error = f":expected_{expected_type}:got_"
+
+    def node(value: Any, path: str, errors: List[str]) -> None:
+        actual = json_type_name(value)
+        if actual != expected_type:
+            errors.append(path + type_error + actual)
+            return
+        if body is not None:
+            body(value, path, errors)
+
+    return node
+
+
+class CompiledSchema:
+    """A schema document compiled for one dialect; :meth:`validate` returns the dialect's error strings."""
+
+    def __init__(self, schema: Mapping[str, Any], dialect: SchemaDialect, *, digest: str = "") -> None:
+        self.schema = schema
+        self.dialect = dialect
+        self.digest = digest
+        compile_node = _compile_strict if dialect.type_names is None else _compile_lenient
+        self._root = compile_node(schema, dialect)
+
+    def validate(self, payload: Any, path: str = "$") -> List[str]:
+        errors: List[str] = []
+        self._root(payload, path, errors)
+        return errors
+
+
+def compile_schema(schema: Mapping[str, Any], dialect: SchemaDialect = RESPONSE) -> CompiledSchema:
+    """Compile an in-memory schema (not cached: callers may mutate their dicts)."""
+    return CompiledSchema(schema, dialect)
+
+
+class SchemaCache:
+    """``path -> CompiledSchema`` cache revalidated by stat stamp, sharing compiled trees by file digest."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stamps: Dict[Tuple[Path, str], Tuple[Tuple[int, int, int], int, CompiledSchema]] = {}
+        self._by_digest: Dict[Tuple[str, str], CompiledSchema] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def load(self, path: Path, dialect: SchemaDialect = RESPONSE, *, deterministic: bool = False) -> CompiledSchema:
+        """Compiled schema for ``path``; raises ``OSError`` / ``json.JSONDecodeError`` like a direct read.
+
+        With ``deterministic=True`` every load charges filesystem entropy, hit
+        or miss, so envelope accounting matches an uncached read.
+        """
+        if deterministic:
+            charge_entropy(EntropySource.FILESYSTEM, f"read:{path}")
+        stat = path.stat()
+        stamp = stat_stamp(stat)
+        key = (path, dialect.name)
+        with self._lock:
+            cached = self._stamps.get(key)
+            if cached is not None and cached[0] == stamp and stamp_is_settled(cached[1], stat.st_mtime_ns):
+                self._hits += 1
+                return cached[2]
+        loaded_ns = time.time_ns()
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        with self._lock:
+            compiled = self._by_digest.get((digest, dialect.name))
+        if compiled is None:
+            compiled = CompiledSchema(json.loads(raw.decode("utf-8")), dialect, digest=digest)
+        with self._lock:
+            self._misses += 1
+            compiled = self._by_digest.setdefault((digest, dialect.name), compiled)
+            self._stamps[key] = (stamp, loaded_ns, compiled)
+        return compiled
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stamps.clear()
+            self._by_digest.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._by_digest), "hits": self._hits, "misses": self._misses}
+
+
+_DEFAULT_CACHE = SchemaCache()
+
+
+def default_cache() -> SchemaCache:
+    return _DEFAULT_CACHE
+
+
+def load_schema(path: Path, dialect: SchemaDialect = RESPONSE, *, deterministic: bool = False) -> CompiledSchema:
+    return _DEFAULT_CACHE.load(path, dialect, deterministic=deterministic)
+
+
+__all__ = [
+    "CompiledSchema",
+    "EVIDENCE_BUNDLE",
+    "FEDERATION",
+    "PREFLIGHT",
+    "REPLAY_ATTESTATION",
+    "RESPONSE",
+    "SchemaCache",
+    "SchemaDialect",
+    "compile_schema",
+    "default_cache",
+    "json_type_name",
+    "load_schema",
+]
@@ -13,15 +13,26 @@
 
 """
 Core invariant checks to enforce canonical tree and banned import policies.
+
+The source-level checks share one :class:`SourceScanner`: a single walk of
+``ROOT_DIR`` that prunes ``IGNORED_SCAN_DIRS`` as it descends and applies every
+line rule to a file in one pass. Per-file findings are cached by content hash
+behind a ``(st_mtime_ns, st_size, st_ino)`` stamp, so repeated ``verify_all``
+calls only re-read files whose stat moved (or whose stamp is within the racy
+window of the scan that recorded it).
 """
 
+import hashlib
 import json
 import os
 import re
+import threading
+import time
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 from runtime import ROOT_DIR, metrics
+from runtime.governance.deterministic_filesystem import stamp_is_settled, stat_stamp
 from runtime.founders_law import (
     RULE_INVARIANT_ABS_PATHS,
     RULE_INVARIANT_CAPABILITIES,
@@ -55,11 +66,100 @@ BANNED_ROOTS = {"core", "engines", "adad_core", "ADAAD22"}
 BANNED_ABSOLUTE_PATTERNS = ["/workspace/", "/home/", "/sdcard/", "/storage/"]
 IGNORED_SCAN_DIRS = {"archives", ".venv", "venv", "env", ".git", "__pycache__"}
 
+_IMPORT_PATTERN = re.compile(r"^(from|import) ([\\w\\.\\/]+)")
+
+# Per-file findings: rule name -> [(lineno, stripped line)].
+_Findings = Dict[str, List[Tuple[int, str]]]
+
+
+def _scan_lines(text: str) -> _Findings:
+    imports: List[Tuple[int, str]] = []
+    abs_paths: List[Tuple[int, str]] = []
+    for lineno, line in enumerate(text.splitlines(), start=1):
+        if line.startswith(("from ", "import ")):
+            match = _IMPORT_PATTERN.match(line)
+            if match:
+                root = match.group(2).split(".")[0]
+                if root in BANNED_ROOTS or root.startswith("/"):
+                    imports.append((lineno, line.strip()))
+        if any(pattern in line for pattern in BANNED_ABSOLUTE_PATTERNS):
+            abs_paths.append((lineno, line.strip()))
+    return {"imports": imports, "abs_paths": abs_paths}
+
+
+def _within(path: Path, root: Path) -> bool:
+    try:
+        path.relative_to(root.resolve())
+    except ValueError:
+        return False
+    return True
+
+
+class SourceScanner:
+    """Single-walk, content-hash cached line scanner for the Python sources under a root."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # resolved path -> (stamp, scanned_ns, content digest)
+        self._stamps: Dict[Path, Tuple[Tuple[int, int, int], int, str]] = {}
+        self._findings: Dict[str, _Findings] = {}
+        self._rescanned = 0
+
+    @staticmethod
+    def _walk(root: Path) -> List[Path]:
+        found: List[Path] = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [name for name in dirnames if name not in IGNORED_SCAN_DIRS]
+            found.extend(Path(dirpath) / name for name in filenames if name.endswith(".py"))
+        return sorted(found)
+
+    def scan(self, root: Path) -> List[Tuple[Path, _Findings]]:
+        """Return ``(path, findings)`` for every ``*.py`` under ``root``, re-reading only changed files."""
+        with self._lock:
+            now_ns = time.time_ns()
+            results: List[Tuple[Path, _Findings]] = []
+            live: Dict[Path, Tuple[Tuple[int, int, int], int, str]] = {}
+            rescanned = 0
+            for path in self._walk(root):
+                stat = path.stat()
+                stamp = stat_stamp(stat)
+                key = path.resolve()
+                cached = self._stamps.get(key)
+                if cached is not None and cached[0] == stamp and stamp_is_settled(cached[1], stat.st_mtime_ns) and cached[2] in self._findings:
+                    live[key] = cached
+                    results.append((path, self._findings[cached[2]]))
+                    continue
+                payload = path.read_bytes()
+                digest = hashlib.sha256(payload).hexdigest()
+                findings = self._findings.get(digest)
+                if findings is None:
+                    findings = _scan_lines(payload.decode("utf-8"))
+                    self._findings[digest] = findings
+                    rescanned += 1
+                live[key] = (stamp, now_ns, digest)
+                results.append((path, findings))
+            self._stamps = {**{k: v for k, v in self._stamps.items() if not _within(k, root)}, **live}
+            referenced = {entry[2] for entry in self._stamps.values()}
+            self._findings = {digest: findings for digest, findings in self._findings.items() if digest in referenced}
+            self._rescanned = rescanned
+            return results
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"files": len(self._stamps), "rescanned": self._rescanned}
 
+    def clear(self) -> None:
+        with self._lock:
+            self._stamps.clear()
+            self._findings.clear()
+            self._rescanned = 0
 
 
-def _should_scan_python_file(path: Path) -> bool:
-    return not any(part in IGNORED_SCAN_DIRS for part in path.parts)
+_SCANNER = SourceScanner()
+
+
+def source_scanner() -> SourceScanner:
+    return _SCANNER
 
 def verify_tree() -> Tuple[bool, List[str]]:
     missing = [name for name in REQUIRED_DIRS if not (ROOT_DIR / name).exists()]
@@ -70,20 +170,8 @@ def verify_tree() -> Tuple[bool, List[str]]:
     return True, []
 
 
-def scan_banned_imports() -> Tuple[bool, List[str]]:
-    failures: List[str] = []
-    for path in ROOT_DIR.rglob("*.py"):
-        if not _should_scan_python_file(path):
-            continue
-        content = path.read_text(encoding="utf-8").splitlines()
-        for lineno, line in enumerate(content, start=1):
-            if line.startswith(("from ", "import ")):
-                match = re.match(r"^(from|import) ([\\w\\.\\/]+)", line)
-                if not match:
-                    continue
-                root = match.group(2).split(".")[0]
-                if root in BANNED_ROOTS or root.startswith("/"):
-                    failures.append(f"{path}:{lineno}:{line.strip()}")
+def _banned_import_check(scanned: List[Tuple[Path, _Findings]]) -> Tuple[bool, List[str]]:
+    failures = [f"{path}:{lineno}:{line}" for path, findings in scanned for lineno, line in findings["imports"]]
     if failures:
         metrics.log(
             event_type="invariant_banned_imports",
@@ -96,6 +184,10 @@ def scan_banned_imports() -> Tuple[bool, List[str]]:
     return True, []
 
 
+def scan_banned_imports() -> Tuple[bool, List[str]]:
+    return _banned_import_check(_SCANNER.scan(ROOT_DIR))
+
+
 def verify_metrics_path() -> Tuple[bool, List[str]]:
     from runtime import metrics as metrics_module  # local import to avoid circular
 
@@ -148,17 +240,14 @@ def verify_capabilities_file() -> Tuple[bool, List[str]]:
         return False, [f"capabilities_invalid:{exc}"]
 
 
-def scan_absolute_paths() -> Tuple[bool, List[str]]:
-    failures: List[str] = []
-    for path in ROOT_DIR.rglob("*.py"):
-        if not _should_scan_python_file(path):
-            continue
-        if path.resolve() == Path(__file__).resolve():
-            continue
-        content = path.read_text(encoding="utf-8").splitlines()
-        for lineno, line in enumerate(content, start=1):
-            if any(pattern in line for pattern in BANNED_ABSOLUTE_PATTERNS):
-                failures.append(f"{path}:{lineno}:{line.strip()}")
+def _absolute_path_check(scanned: List[Tuple[Path, _Findings]]) -> Tuple[bool, List[str]]:
+    this_file = Path(__file__).resolve()
+    failures = [
+        f"{path}:{lineno}:{line}"
+        for path, findings in scanned
+        if findings["abs_paths"] and path.resolve() != this_file
+        for lineno, line in findings["abs_paths"]
+    ]
     if failures:
         metrics.log(event_type="invariant_abs_paths_failed", payload={"failures": failures}, level="ERROR", element_id=ELEMENT_ID)
         return False, failures
@@ -166,11 +255,16 @@ def scan_absolute_paths() -> Tuple[bool, List[str]]:
     return True, []
 
 
+def scan_absolute_paths() -> Tuple[bool, List[str]]:
+    return _absolute_path_check(_SCANNER.scan(ROOT_DIR))
+
+
 def verify_all() -> Tuple[bool, List[str]]:
+    scanned = _SCANNER.scan(ROOT_DIR)
     checks = [
         (RULE_INVARIANT_TREE, *verify_tree()),
-        (RULE_INVARIANT_IMPORTS, *scan_banned_imports()),
-        (RULE_INVARIANT_ABS_PATHS, *scan_absolute_paths()),
+        (RULE_INVARIANT_IMPORTS, *_banned_import_check(scanned)),
+        (RULE_INVARIANT_ABS_PATHS, *_absolute_path_check(scanned)),
         (RULE_INVARIANT_METRICS, *verify_metrics_path()),
         (RULE_INVARIANT_SECURITY, *verify_security_paths()),
         (RULE_INVARIANT_STAGING, *ensure_staging_dir()),
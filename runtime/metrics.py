@@ -22,14 +22,40 @@ Payload sensitivity rules:
 - All writes are serialized with a process lock and written as a single UTF-8
   encoded append operation to keep JSONL records line-atomic under
   thread/process concurrency.
+- Buffered mode (opt-in via ``ADAAD_METRICS_BUFFERED=1`` or
+  :func:`enable_buffered_writes`) queues encoded lines in memory and a
+  background flusher group-commits each batch with one locked ``os.write``.
+  Batches flush when they reach ``max_batch`` lines, after ``max_latency_s``
+  (``0`` flushes every line as soon as the flusher wakes), on
+  :func:`flush`/:func:`tail`, and at interpreter exit. Forked children write
+  through, since they may exit without running atexit. The queue holds at most
+  ``max_pending`` lines; a producer that finds it full flushes synchronously
+  before enqueueing. A failed write is logged, its lines are re-queued and the
+  flusher retries instead of exiting.
+- Segment rotation (opt-in via ``ADAAD_METRICS_SEGMENT_MAX_BYTES`` /
+  ``ADAAD_METRICS_SEGMENT_MAX_AGE_S`` or :func:`configure_rotation`) gzips the
+  active file into ``metrics.000123.jsonl.gz`` under the write lock and records
+  it in ``metrics.segments.json``. :func:`tail` and :func:`read_since` span
+  segments transparently; consumer cursors are ``{"segment", "offset"}`` so a
+  rotation never forces reprocessing.
+- Inside :func:`deferred` lines are held in a per-context list instead of
+  written; the caller hands them to :func:`write_lines` once it knows the
+  order they belong in (parallel validators use this to log in rule order).
 """
 
+import atexit
+import gzip
+import hashlib
 import json
+import logging
 import os
 import threading
 import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
 
 import fcntl
 
@@ -40,6 +66,25 @@ ELEMENT_ID = "Earth"
 METRICS_PATH = ROOT_DIR / "reports" / "metrics.jsonl"
 _THREAD_LOCK = threading.Lock()
 
+DEFAULT_MAX_BATCH = 256
+DEFAULT_MAX_LATENCY_S = 0.25
+DEFAULT_MAX_PENDING = 65536
+_FLUSH_RETRY_S = 1.0
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _env_int(name: str) -> int:
+    try:
+        return max(0, int(os.getenv(name, "0") or 0))
+    except ValueError:
+        return 0
+
+
+_SEGMENT_MAX_BYTES = _env_int("ADAAD_METRICS_SEGMENT_MAX_BYTES")
+_SEGMENT_MAX_AGE_S = _env_int("ADAAD_METRICS_SEGMENT_MAX_AGE_S")
+_SEGMENT_RETAIN = _env_int("ADAAD_METRICS_SEGMENT_RETAIN")
+
 
 class _FileLock:
     def __init__(self, lock_path: Path) -> None:
@@ -67,6 +112,334 @@ def _ensure_metrics_file() -> None:
         METRICS_PATH.touch()
 
 
+def configure_rotation(max_bytes: int = 0, max_age_s: int = 0, retain: int = 0) -> None:
+    """
+    Set segment rotation thresholds (0 disables a trigger; ``retain`` 0 keeps every segment).
+    """
+    global _SEGMENT_MAX_BYTES, _SEGMENT_MAX_AGE_S, _SEGMENT_RETAIN
+    _SEGMENT_MAX_BYTES = max(0, int(max_bytes))
+    _SEGMENT_MAX_AGE_S = max(0, int(max_age_s))
+    _SEGMENT_RETAIN = max(0, int(retain))
+
+
+def _manifest_path(path: Path) -> Path:
+    return path.with_suffix(".segments.json")
+
+
+def _segment_file_name(path: Path, segment: int) -> str:
+    return f"{path.stem}.{segment:06d}.jsonl.gz"
+
+
+def load_segment_manifest(path: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Return the rotation manifest: the active segment number plus archived segment ranges.
+    """
+    manifest_path = _manifest_path(path or METRICS_PATH)
+    default: Dict[str, Any] = {"active_segment": 1, "active_started_at": None, "segments": []}
+    if not manifest_path.exists():
+        return default
+    try:
+        data = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return default
+    if not isinstance(data, dict) or not isinstance(data.get("active_segment"), int) or not isinstance(data.get("segments"), list):
+        return default
+    return data
+
+
+def _write_segment_manifest(path: Path, manifest: Dict[str, Any]) -> None:
+    manifest_path = _manifest_path(path)
+    temp_path = manifest_path.with_suffix(".tmp")
+    temp_path.write_text(json.dumps(manifest, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+    temp_path.replace(manifest_path)
+
+
+def _line_timestamp(line: bytes) -> Optional[str]:
+    try:
+        value = json.loads(line.decode("utf-8")).get("timestamp")
+    except (UnicodeDecodeError, json.JSONDecodeError, AttributeError):
+        return None
+    return value if isinstance(value, str) else None
+
+
+def _rotate_locked(path: Path) -> Optional[Dict[str, Any]]:
+    """Archive the active file as a gzip segment; caller must hold the metrics locks."""
+    manifest = load_segment_manifest(path)
+    try:
+        if path.stat().st_size == 0:
+            return None
+    except FileNotFoundError:
+        return None
+    segment = int(manifest["active_segment"])
+    segment_path = path.with_name(_segment_file_name(path, segment))
+    temp_path = segment_path.with_suffix(".tmp")
+    digest = hashlib.sha256()
+    lines = 0
+    size = 0
+    first_line: Optional[bytes] = None
+    last_line: Optional[bytes] = None
+    with path.open("rb") as source, gzip.open(temp_path, "wb") as target:
+        for line in source:
+            target.write(line)
+            digest.update(line)
+            size += len(line)
+            lines += 1
+            first_line = line if first_line is None else first_line
+            last_line = line
+    os.replace(temp_path, segment_path)
+    entry = {
+        "segment": segment,
+        "file": segment_path.name,
+        "lines": lines,
+        "bytes": size,
+        "sha256": digest.hexdigest(),
+        "first_timestamp": _line_timestamp(first_line) if first_line else None,
+        "last_timestamp": _line_timestamp(last_line) if last_line else None,
+    }
+    segments = list(manifest["segments"]) + [entry]
+    if _SEGMENT_RETAIN and len(segments) > _SEGMENT_RETAIN:
+        dropped, segments = segments[: -_SEGMENT_RETAIN], segments[-_SEGMENT_RETAIN:]
+        for stale in dropped:
+            path.with_name(str(stale.get("file") or "")).unlink(missing_ok=True)
+    manifest.update(
+        {
+            "active_segment": segment + 1,
+            "active_started_at": time.time(),
+            "segments": segments,
+        }
+    )
+    # Manifest first, then unlink: readers that still hold the old active file
+    # open keep reading it as the archived segment.
+    _write_segment_manifest(path, manifest)
+    path.unlink()
+    return entry
+
+
+def _rotation_due(path: Path, size: int) -> bool:
+    if _SEGMENT_MAX_BYTES and size >= _SEGMENT_MAX_BYTES:
+        return True
+    if _SEGMENT_MAX_AGE_S and size:
+        manifest = load_segment_manifest(path)
+        started = manifest.get("active_started_at")
+        if not isinstance(started, (int, float)):
+            manifest["active_started_at"] = time.time()
+            _write_segment_manifest(path, manifest)
+            return False
+        return time.time() - started >= _SEGMENT_MAX_AGE_S
+    return False
+
+
+def _append_bytes(path: Path, data: bytes) -> None:
+    """Append pre-encoded JSONL bytes under the thread and cross-process locks."""
+    lock_path = path.with_suffix(path.suffix + ".lock")
+    with _THREAD_LOCK:
+        with _FileLock(lock_path):
+            fd = os.open(path, os.O_APPEND | os.O_CREAT | os.O_WRONLY, 0o644)
+            try:
+                view = memoryview(data)
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
+                size = os.fstat(fd).st_size
+            finally:
+                os.close(fd)
+            if (_SEGMENT_MAX_BYTES or _SEGMENT_MAX_AGE_S) and _rotation_due(path, size):
+                _rotate_locked(path)
+
+
+def rotate(path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """
+    Archive the active metrics file now; returns the new manifest segment entry, if any.
+    """
+    flush()
+    target = path or METRICS_PATH
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with _THREAD_LOCK:
+        with _FileLock(target.with_suffix(target.suffix + ".lock")):
+            return _rotate_locked(target)
+
+
+class _BufferedWriter:
+    """Group-commit writer draining queued metrics lines from a daemon thread."""
+
+    def __init__(
+        self,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_latency_s: float = DEFAULT_MAX_LATENCY_S,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        self.max_batch = max(1, int(max_batch))
+        self.max_latency_s = max(0.0, float(max_latency_s))
+        self.max_pending = max(self.max_batch, int(max_pending))
+        self._pending: List[Tuple[Path, bytes]] = []
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="metrics-flusher", daemon=True)
+        self._thread.start()
+
+    def submit(self, path: Path, line: bytes) -> None:
+        with self._condition:
+            overflow = len(self._pending) >= self.max_pending
+        if overflow:
+            # Backpressure: a full queue is drained on the caller's thread, so
+            # write errors surface to the caller exactly as in synchronous mode.
+            self.flush()
+        with self._condition:
+            self._pending.append((path, line))
+            if self.max_latency_s == 0 or len(self._pending) >= self.max_batch:
+                self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._closed:
+                    if not self._pending:
+                        self._condition.wait(timeout=self.max_latency_s or None)
+                    elif self.max_latency_s and len(self._pending) < self.max_batch:
+                        self._condition.wait(timeout=self.max_latency_s)
+                closed = self._closed
+            try:
+                self.flush()
+            except Exception:
+                # Unwritten lines are back on the queue; keep the flusher alive
+                # and retry, leaving the final attempt to close().
+                LOGGER.exception("metrics_flush_failed")
+                if closed:
+                    return
+                with self._condition:
+                    if not self._closed:
+                        self._condition.wait(timeout=_FLUSH_RETRY_S)
+                continue
+            if closed:
+                return
+
+    def flush(self) -> None:
+        # Holding the flush lock across take+write keeps batches in submit order.
+        with self._flush_lock:
+            with self._condition:
+                batch, self._pending = self._pending, []
+            grouped: Dict[Path, List[bytes]] = {}
+            for path, line in batch:
+                grouped.setdefault(path, []).append(line)
+            items = list(grouped.items())
+            for index, (path, lines) in enumerate(items):
+                try:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    _append_bytes(path, b"".join(lines))
+                except BaseException:
+                    unwritten = [(target, line) for target, group in items[index:] for line in group]
+                    with self._condition:
+                        self._pending[:0] = unwritten
+                    raise
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        self.flush()
+
+
+_WRITER_LOCK = threading.Lock()
+_BUFFERED_WRITER: Optional[_BufferedWriter] = None
+
+
+def _env_buffered_enabled() -> bool:
+    return os.getenv("ADAAD_METRICS_BUFFERED", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def enable_buffered_writes(
+    max_batch: int = DEFAULT_MAX_BATCH,
+    max_latency_s: float = DEFAULT_MAX_LATENCY_S,
+    max_pending: int = DEFAULT_MAX_PENDING,
+) -> None:
+    """
+    Switch :func:`log` to the group-commit writer (idempotent; reconfigures if already enabled).
+    """
+    global _BUFFERED_WRITER
+    writer = _BufferedWriter(max_batch=max_batch, max_latency_s=max_latency_s, max_pending=max_pending)
+    with _WRITER_LOCK:
+        previous, _BUFFERED_WRITER = _BUFFERED_WRITER, writer
+    if previous is not None:
+        previous.close()
+
+
+def disable_buffered_writes() -> None:
+    """
+    Flush any queued lines and return :func:`log` to synchronous writes.
+    """
+    global _BUFFERED_WRITER
+    with _WRITER_LOCK:
+        previous, _BUFFERED_WRITER = _BUFFERED_WRITER, None
+    if previous is not None:
+        previous.close()
+
+
+def buffered_writes_enabled() -> bool:
+    return _BUFFERED_WRITER is not None
+
+
+def flush() -> None:
+    """
+    Synchronously write every queued metrics line.
+    """
+    writer = _BUFFERED_WRITER
+    if writer is not None:
+        writer.flush()
+
+
+def _reset_writer_after_fork() -> None:
+    # The flusher thread does not survive fork, queued lines belong to the
+    # parent and the locks may have been held by a parent thread mid-write, so
+    # the child starts with fresh locks. Forked workers (multiprocessing among
+    # them) often leave through os._exit, which skips atexit, so the child
+    # writes through instead of buffering lines it might never flush.
+    global _BUFFERED_WRITER, _THREAD_LOCK, _WRITER_LOCK
+    _THREAD_LOCK = threading.Lock()
+    _WRITER_LOCK = threading.Lock()
+    _BUFFERED_WRITER = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_writer_after_fork)
+atexit.register(disable_buffered_writes)
+if _env_buffered_enabled():
+    enable_buffered_writes()
+
+
+_DEFERRED_LINES: ContextVar[Optional[List[bytes]]] = ContextVar("metrics_deferred_lines", default=None)
+
+
+@contextmanager
+def deferred() -> Iterator[List[bytes]]:
+    """
+    Hold lines logged in the current context in the yielded list instead of writing them.
+    """
+    lines: List[bytes] = []
+    token = _DEFERRED_LINES.set(lines)
+    try:
+        yield lines
+    finally:
+        _DEFERRED_LINES.reset(token)
+
+
+def write_lines(lines: List[bytes]) -> None:
+    """
+    Write encoded lines collected by :func:`deferred`, in the given order.
+    """
+    if not lines:
+        return
+    writer = _BUFFERED_WRITER
+    if writer is not None:
+        for line in lines:
+            writer.submit(METRICS_PATH, line)
+        return
+    _ensure_metrics_file()
+    _append_bytes(METRICS_PATH, b"".join(lines))
+
+
 def log(
     event_type: str,
     payload: Optional[Dict[str, Any]] = None,
@@ -76,7 +449,6 @@ def log(
     """
     Append a structured JSON line to the metrics file.
     """
-    _ensure_metrics_file()
     record = {
         "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         "event": event_type,
@@ -85,22 +457,33 @@ def log(
         "payload": payload or {},
     }
     line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
-    lock_path = METRICS_PATH.with_suffix(METRICS_PATH.suffix + ".lock")
-    with _THREAD_LOCK:
-        with _FileLock(lock_path):
-            fd = os.open(METRICS_PATH, os.O_APPEND | os.O_CREAT | os.O_WRONLY, 0o644)
-            try:
-                os.write(fd, line)
-            finally:
-                os.close(fd)
+    held = _DEFERRED_LINES.get()
+    if held is not None:
+        held.append(line)
+        return
+    writer = _BUFFERED_WRITER
+    if writer is not None:
+        writer.submit(METRICS_PATH, line)
+        return
+    _ensure_metrics_file()
+    _append_bytes(METRICS_PATH, line)
 
 
 def tail(limit: int = 100) -> List[Dict[str, Any]]:
     """
-    Return the most recent entries from the metrics log.
+    Return the most recent entries from the metrics log, spanning rotated segments.
     """
+    flush()
     _ensure_metrics_file()
     raw_lines, _ = _read_last_lines(METRICS_PATH, limit)
+    if len(raw_lines) < limit:
+        manifest = load_segment_manifest(METRICS_PATH)
+        for entry in reversed(manifest["segments"]):
+            needed = limit - len(raw_lines)
+            if needed <= 0:
+                break
+            older = _read_segment_tail(METRICS_PATH.with_name(str(entry.get("file") or "")), needed)
+            raw_lines = older + raw_lines
     entries: List[Dict[str, Any]] = []
     for line in raw_lines:
         try:
@@ -110,6 +493,131 @@ def tail(limit: int = 100) -> List[Dict[str, Any]]:
     return entries
 
 
+def _read_segment_tail(segment_path: Path, limit: int) -> List[str]:
+    if not segment_path.exists():
+        return []
+    with gzip.open(segment_path, "rb") as handle:
+        window = deque(handle, maxlen=limit)
+    return [line.decode("utf-8", errors="ignore").rstrip("\n") for line in window]
+
+
+def _normalize_cursor(cursor: Any, manifest: Dict[str, Any]) -> Tuple[int, int]:
+    active = int(manifest["active_segment"])
+    archived = [int(entry["segment"]) for entry in manifest["segments"]]
+    oldest = archived[0] if archived else active
+    if cursor is None or cursor == 0:
+        return oldest, 0
+    if isinstance(cursor, int):
+        # Legacy byte cursors predate rotation and always point into the active file.
+        return active, max(0, cursor)
+    segment = int(cursor.get("segment", oldest))
+    offset = max(0, int(cursor.get("offset", 0)))
+    if segment < oldest:
+        return oldest, 0
+    if segment > active:
+        return active, 0
+    return segment, offset
+
+
+def _open_segment(path: Path, manifest: Dict[str, Any], segment: int) -> Optional[BinaryIO]:
+    if segment == int(manifest["active_segment"]):
+        return path.open("rb") if path.exists() else None
+    for entry in manifest["segments"]:
+        if int(entry["segment"]) == segment:
+            segment_path = path.with_name(str(entry.get("file") or ""))
+            return gzip.open(segment_path, "rb") if segment_path.exists() else None
+    return None
+
+
+def _iter_lines_since(cursor: Any, path: Path) -> Iterator[Tuple[Optional[Dict[str, Any]], Dict[str, int]]]:
+    """Yield ``(record, cursor_after_line)`` for each complete line; unparseable lines yield ``None``."""
+    for _ in range(3):
+        manifest = load_segment_manifest(path)
+        segment, offset = _normalize_cursor(cursor, manifest)
+        active = int(manifest["active_segment"])
+        order = [int(entry["segment"]) for entry in manifest["segments"] if int(entry["segment"]) >= segment]
+        order.append(active)
+        for current in order:
+            start = offset if current == segment else 0
+            handle = _open_segment(path, manifest, current)
+            if handle is None:
+                if current == active:
+                    return
+                continue
+            with handle:
+                if current == active:
+                    if load_segment_manifest(path)["active_segment"] != active:
+                        break  # rotated between manifest read and open; retry from cursor
+                    if start > os.fstat(handle.fileno()).st_size:
+                        start = 0  # active file was truncated or replaced
+                position = start
+                handle.seek(start)
+                for line in handle:
+                    if not line.endswith(b"\n"):
+                        break
+                    position += len(line)
+                    cursor = {"segment": current, "offset": position}
+                    try:
+                        record = json.loads(line.decode("utf-8"))
+                    except (UnicodeDecodeError, json.JSONDecodeError):
+                        record = None
+                    yield (record if isinstance(record, dict) else None), cursor
+            if current == active:
+                return
+            cursor = {"segment": current + 1, "offset": 0}
+    return
+
+
+def iter_since(cursor: Any = None, *, path: Optional[Path] = None) -> Iterator[Tuple[Dict[str, Any], Dict[str, int]]]:
+    """
+    Stream ``(record, cursor_after_record)`` pairs written after ``cursor``.
+
+    ``cursor`` is ``{"segment": n, "offset": bytes}`` (``None`` starts at the
+    oldest retained segment; a legacy ``int`` is an offset into the active file).
+    Only complete lines are consumed.
+    """
+    flush()
+    for record, next_cursor in _iter_lines_since(cursor, path or METRICS_PATH):
+        if record is not None:
+            yield record, next_cursor
+
+
+def read_since(
+    cursor: Any = None,
+    *,
+    path: Optional[Path] = None,
+    limit: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """
+    Return up to ``limit`` records written after ``cursor`` and the cursor to resume from.
+    """
+    flush()
+    target = path or METRICS_PATH
+    manifest = load_segment_manifest(target)
+    segment, offset = _normalize_cursor(cursor, manifest)
+    resume = {"segment": segment, "offset": offset}
+    records: List[Dict[str, Any]] = []
+    for record, next_cursor in _iter_lines_since(cursor, target):
+        resume = next_cursor
+        if record is not None:
+            records.append(record)
+            if limit is not None and len(records) >= limit:
+                break
+    return records, resume
+
+
+def iter_records(cursor: Any = None, *, path: Optional[Path] = None, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+    """
+    Stream every record after ``cursor`` across archived segments and the active file.
+    """
+    while True:
+        records, next_cursor = read_since(cursor, path=path, limit=batch_size)
+        yield from records
+        if len(records) < batch_size:
+            return
+        cursor = next_cursor
+
+
 def _read_last_lines(path: Path, limit: int, chunk_size: int = 4096) -> Tuple[List[str], int]:
     """
     Read only the last `limit` lines from a UTF-8 file without loading it fully
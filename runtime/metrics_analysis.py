@@ -13,14 +13,10 @@ from pathlib import Path
 from typing import Any, Dict, Iterable, List, Tuple
 
 from runtime import metrics
-MUTATION_EVENT_TYPES = {
-    "mutation_approved_constitutional",
-    "mutation_rejected_constitutional",
-    "mutation_planned",
-    "mutation_executed",
-    "mutation_failed",
-    "mutation_noop",
-}
+from runtime.metrics_index import MetricsIndex, index_enabled
+from security.ledger import journal, rate_index
+
+MUTATION_EVENT_TYPES = set(rate_index.MUTATION_RATE_ACTIONS)
 
 
 def _parse_timestamp(value: str | None) -> float | None:
@@ -35,27 +31,51 @@ def _parse_timestamp(value: str | None) -> float | None:
 
 def mutation_rate_snapshot(
     window_sec: int,
-    max_entries: int = 1000,
+    max_entries: int | None = None,
     event_types: Iterable[str] | None = None,
     now: float | None = None,
+    *,
+    epoch_id: str = "",
+    source: str = "ledger",
 ) -> Dict[str, Any]:
     """
     Compute the recent mutation rate over a sliding time window.
+
+    The default ``source="ledger"`` reads the lineage ledger's rate index, the
+    same counters the ``max_mutation_rate`` constitutional rule checks: the
+    window ends at the newest scoped ledger entry, so passing ``max_entries``
+    or ``now`` raises ``ValueError``. ``source="metrics"`` counts metrics
+    events in the window ending at ``now`` among the last ``max_entries``
+    (default 1000); with ``ADAAD_METRICS_INDEX`` enabled that count is exact
+    for the whole window and ``max_entries`` is ignored.
     """
+    if source == "ledger":
+        if max_entries is not None or now is not None:
+            raise ValueError("max_entries and now apply only to source='metrics'")
+        return rate_index.index_for(journal.ensure_ledger()).snapshot(window_sec, epoch_id=epoch_id, event_types=event_types)
+    if source != "metrics":
+        raise ValueError(f"unknown mutation rate source: {source}")
+    if max_entries is None:
+        max_entries = 1000
     if window_sec <= 0:
         window_sec = 1
     event_filter = set(event_types) if event_types is not None else set(MUTATION_EVENT_TYPES)
     now_ts = now if now is not None else time.time()
     cutoff = now_ts - window_sec
-    entries = metrics.tail(max_entries)
-    count = 0
-    for entry in entries:
-        if entry.get("event") not in event_filter:
-            continue
-        entry_ts = _parse_timestamp(entry.get("timestamp"))
-        if entry_ts is None or entry_ts < cutoff:
-            continue
-        count += 1
+    if index_enabled():
+        count = MetricsIndex().count(event_filter, since=cutoff)
+        entries_considered = count
+    else:
+        entries = metrics.tail(max_entries)
+        entries_considered = len(entries)
+        count = 0
+        for entry in entries:
+            if entry.get("event") not in event_filter:
+                continue
+            entry_ts = _parse_timestamp(entry.get("timestamp"))
+            if entry_ts is None or entry_ts < cutoff:
+                continue
+            count += 1
     rate_per_hour = count * 3600.0 / window_sec
     return {
         "window_sec": window_sec,
@@ -64,15 +84,21 @@ def mutation_rate_snapshot(
         "count": count,
         "rate_per_hour": rate_per_hour,
         "event_types": sorted(event_filter),
-        "entries_considered": len(entries),
+        "entries_considered": entries_considered,
     }
 
 
 def summarize_preflight_rejections(limit: int = 500) -> Dict[str, Any]:
     """
     Summarize preflight rejection reasons over the most recent metrics entries.
+
+    With ``ADAAD_METRICS_INDEX`` enabled the window is the last ``limit``
+    rejection events rather than the last ``limit`` metrics entries.
     """
-    entries = metrics.tail(limit)
+    if index_enabled():
+        entries = MetricsIndex().latest(["mutation_rejected_preflight"], limit=limit)
+    else:
+        entries = metrics.tail(limit)
     counts: Counter[str] = Counter()
     for entry in entries:
         if entry.get("event") != "mutation_rejected_preflight":
@@ -116,7 +142,8 @@ def rolling_determinism_score(window: int = 200) -> Dict[str, Any]:
     if window <= 0:
         window = 1
     replay_entries: List[Dict[str, Any]] = []
-    for entry in metrics.tail(window):
+    recent = MetricsIndex().latest(["ReplayVerificationEvent"], limit=window) if index_enabled() else metrics.tail(window)
+    for entry in recent:
         if entry.get("event") == "ReplayVerificationEvent":
             replay_entries.append(entry)
 
@@ -0,0 +1,255 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Module: metrics_index
+Purpose: Maintain an optional SQLite secondary index over the metrics JSONL stream.
+Author: ADAAD / InnovativeAI-adaad
+Integration points:
+  - Imports from: runtime.metrics (source JSONL path + buffered flush)
+  - Consumed by: runtime.metrics_analysis and ui.aponi_dashboard when ADAAD_METRICS_INDEX is enabled
+  - Governance impact: low — read-side acceleration only; metrics.jsonl stays the source of truth
+
+The index tails the metrics stream from a persisted ``(segment, offset)``
+cursor via :func:`runtime.metrics.read_since`, so everything written through
+:func:`runtime.metrics.log` feeds it without extra hooks and segment rotation
+never forces a re-ingest.
+Rows are keyed by ``(event, ts)`` which lets windowed queries return exact
+answers instead of filtering ``metrics.tail(N)``.
+"""
+
+from __future__ import annotations
+
+import calendar
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from runtime import metrics
+
+INDEX_SCHEMA_VERSION = "2"
+SYNC_BATCH_SIZE = 5000
+
+
+def index_enabled() -> bool:
+    return os.getenv("ADAAD_METRICS_INDEX", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def default_index_path(metrics_path: Path) -> Path:
+    return metrics_path.with_suffix(".index.sqlite")
+
+
+def _file_id(path: Path) -> str:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return ""
+    return f"{stat.st_dev}:{stat.st_ino}"
+
+
+def _parse_timestamp(value: Any) -> Optional[float]:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return float(calendar.timegm(time.strptime(value, "%Y-%m-%dT%H:%M:%SZ")))
+    except ValueError:
+        return None
+
+
+class MetricsIndex:
+    """SQLite index over metrics JSONL with ``(event, ts)`` window queries."""
+
+    def __init__(self, metrics_path: Path | None = None, *, index_path: Path | None = None) -> None:
+        self._metrics_path = metrics_path
+        self._index_path = index_path
+
+    @property
+    def metrics_path(self) -> Path:
+        # Resolve lazily so callers that repoint metrics.METRICS_PATH stay in sync.
+        return self._metrics_path or metrics.METRICS_PATH
+
+    @property
+    def index_path(self) -> Path:
+        return self._index_path or default_index_path(self.metrics_path)
+
+    def _connect(self) -> sqlite3.Connection:
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.index_path, timeout=30.0, isolation_level=None)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS metrics_events (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                segment INTEGER NOT NULL,
+                offset INTEGER NOT NULL,
+                event TEXT NOT NULL,
+                ts REAL,
+                record_json TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS metrics_events_event_ts ON metrics_events(event, ts)")
+        conn.execute("CREATE INDEX IF NOT EXISTS metrics_events_ts ON metrics_events(ts)")
+        conn.execute("CREATE TABLE IF NOT EXISTS metrics_cursor (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        return conn
+
+    @staticmethod
+    def _read_cursor(conn: sqlite3.Connection) -> Dict[str, str]:
+        return {key: value for key, value in conn.execute("SELECT key, value FROM metrics_cursor")}
+
+    @staticmethod
+    def _write_cursor(conn: sqlite3.Connection, **values: str) -> None:
+        conn.executemany(
+            "INSERT OR REPLACE INTO metrics_cursor(key, value) VALUES (?, ?)",
+            sorted(values.items()),
+        )
+
+    @staticmethod
+    def _insert_rows(conn: sqlite3.Connection, rows: List[tuple[Any, ...]]) -> int:
+        conn.executemany(
+            "INSERT INTO metrics_events(segment, offset, event, ts, record_json) VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        return len(rows)
+
+    def sync(self) -> int:
+        """Ingest records appended since the stored cursor; returns rows added."""
+        path = self.metrics_path
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            stored = self._read_cursor(conn)
+            cursor: Dict[str, int] | None = None
+            if stored.get("schema_version") == INDEX_SCHEMA_VERSION and "cursor" in stored:
+                cursor = json.loads(stored["cursor"])
+            else:
+                conn.execute("DELETE FROM metrics_events")
+            manifest = metrics.load_segment_manifest(path)
+            if cursor is not None and cursor["segment"] == manifest["active_segment"]:
+                size = path.stat().st_size if path.exists() else 0
+                replaced = "file_id" in stored and stored["file_id"] != _file_id(path)
+                if replaced or cursor["offset"] > size:
+                    # Active file was truncated or replaced outside rotation.
+                    conn.execute("DELETE FROM metrics_events WHERE segment >= ?", (cursor["segment"],))
+                    cursor = {"segment": cursor["segment"], "offset": 0}
+            added = 0
+            batch: List[tuple[Any, ...]] = []
+            for record, next_cursor in metrics.iter_since(cursor, path=path):
+                batch.append(
+                    (
+                        next_cursor["segment"],
+                        next_cursor["offset"],
+                        str(record.get("event") or ""),
+                        _parse_timestamp(record.get("timestamp")),
+                        json.dumps(record, ensure_ascii=False),
+                    )
+                )
+                cursor = next_cursor
+                if len(batch) >= SYNC_BATCH_SIZE:
+                    added += self._insert_rows(conn, batch)
+                    batch = []
+            added += self._insert_rows(conn, batch)
+            self._write_cursor(
+                conn,
+                cursor=json.dumps(cursor, sort_keys=True),
+                file_id=_file_id(path),
+                schema_version=INDEX_SCHEMA_VERSION,
+            )
+            conn.execute("COMMIT")
+            return added
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _window_clause(
+        event_types: Iterable[str] | None,
+        since: float | None,
+        until: float | None,
+    ) -> tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if event_types is not None:
+            events = sorted(set(event_types))
+            if not events:
+                return "WHERE 0", []
+            clauses.append(f"event IN ({', '.join('?' for _ in events)})")
+            params.extend(events)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(float(since))
+        if until is not None:
+            clauses.append("ts <= ?")
+            params.append(float(until))
+        return ("WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def count(self, event_types: Iterable[str] | None = None, since: float | None = None, until: float | None = None) -> int:
+        """Count events of ``event_types`` with ``since <= ts <= until`` (bounds optional)."""
+        self.sync()
+        where, params = self._window_clause(event_types, since, until)
+        conn = self._connect()
+        try:
+            (total,) = conn.execute(f"SELECT COUNT(*) FROM metrics_events {where}", params).fetchone()
+        finally:
+            conn.close()
+        return int(total)
+
+    def iter_events(
+        self,
+        event_types: Iterable[str] | None = None,
+        since: float | None = None,
+        until: float | None = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield matching metrics records in append order."""
+        self.sync()
+        where, params = self._window_clause(event_types, since, until)
+        conn = self._connect()
+        try:
+            for (record_json,) in conn.execute(f"SELECT record_json FROM metrics_events {where} ORDER BY seq ASC", params):
+                yield json.loads(record_json)
+        finally:
+            conn.close()
+
+    def latest(self, event_types: Iterable[str] | None = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Return the most recent ``limit`` matching records, oldest first."""
+        self.sync()
+        where, params = self._window_clause(event_types, None, None)
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f"SELECT record_json FROM metrics_events {where} ORDER BY seq DESC LIMIT ?",
+                [*params, max(0, int(limit))],
+            ).fetchall()
+        finally:
+            conn.close()
+        return [json.loads(record_json) for (record_json,) in reversed(rows)]
+
+
+def count(event_types: Iterable[str] | None = None, since: float | None = None, until: float | None = None) -> int:
+    return MetricsIndex().count(event_types, since=since, until=until)
+
+
+def iter_events(
+    event_types: Iterable[str] | None = None,
+    since: float | None = None,
+    until: float | None = None,
+) -> Iterator[Dict[str, Any]]:
+    return MetricsIndex().iter_events(event_types, since=since, until=until)
+
+
+def latest(event_types: Iterable[str] | None = None, limit: int = 100) -> List[Dict[str, Any]]:
+    return MetricsIndex().latest(event_types, limit=limit)
+
+
+__all__ = [
+    "INDEX_SCHEMA_VERSION",
+    "MetricsIndex",
+    "count",
+    "default_index_path",
+    "index_enabled",
+    "iter_events",
+    "latest",
+]
@@ -10,7 +10,6 @@ Validations are intentionally minimal and deterministic:
 
 from __future__ import annotations
 
-import ast
 import hashlib
 import importlib.util
 import json
@@ -22,11 +21,13 @@ from typing import Any, Dict, Mapping, Optional, Sequence, Set
 from app.agents.discovery import agent_path_from_id
 from app.agents.mutation_request import MutationRequest
 
+from adaad.core import ast_cache
 from adaad.core.agent_contract import DEFAULT_AGENT_SCOPES, validate_agent_contracts
 from adaad.core.tool_contract import DEFAULT_DISCOVERY_SCOPES, validate_tool_contracts
 
 from runtime import ROOT_DIR
 from runtime.governance.foundation import default_provider
+from runtime.governance.schema_engine import PREFLIGHT, load_schema
 
 
 _FILE_KEYS = ("file", "filepath", "target")
@@ -131,53 +132,9 @@ def validate_boot_runtime_profile(*, replay_mode: str = "off", recovery_tier: st
     return {"ok": True, "reason": "ok", "checks": checks}
 
 
-def _is_schema_type(value: Any, expected: str) -> bool:
-    if expected == "object":
-        return isinstance(value, dict)
-    if expected == "array":
-        return isinstance(value, list)
-    if expected == "string":
-        return isinstance(value, str)
-    if expected == "number":
-        return isinstance(value, (int, float)) and not isinstance(value, bool)
-    if expected == "integer":
-        return isinstance(value, int) and not isinstance(value, bool)
-    if expected == "boolean":
-        return isinstance(value, bool)
-    return True
-
-
-def _validate_against_schema(schema: Dict[str, Any], payload: Any, path: str = "$") -> list[str]:
-    errors: list[str] = []
-    expected_type = schema.get("type")
-    if isinstance(expected_type, str) and not _is_schema_type(payload, expected_type):
-        return [f"{path}:expected_{expected_type}"]
-
-    if isinstance(payload, dict):
-        required = schema.get("required") if isinstance(schema.get("required"), list) else []
-        for key in required:
-            if isinstance(key, str) and key not in payload:
-                errors.append(f"{path}.{key}:missing_required")
-
-        properties = schema.get("properties") if isinstance(schema.get("properties"), dict) else {}
-        for key, value in payload.items():
-            if key in properties and isinstance(properties[key], dict):
-                errors.extend(_validate_against_schema(properties[key], value, f"{path}.{key}"))
-            elif schema.get("additionalProperties") is False:
-                errors.append(f"{path}.{key}:additional_property")
-
-    if isinstance(payload, list) and isinstance(schema.get("items"), dict):
-        item_schema = schema["items"]
-        for index, item in enumerate(payload):
-            errors.extend(_validate_against_schema(item_schema, item, f"{path}[{index}]"))
-
-    return errors
-
-
 def validate_mutation_proposal_schema(proposal: Mapping[str, Any]) -> Dict[str, Any]:
-    schema = json.loads(_MUTATION_PROPOSAL_SCHEMA_PATH.read_text(encoding="utf-8"))
     payload = dict(proposal)
-    errors = _validate_against_schema(schema, payload)
+    errors = load_schema(_MUTATION_PROPOSAL_SCHEMA_PATH, PREFLIGHT).validate(payload)
     if errors:
         return {"ok": False, "reason": "invalid_mutation_proposal_schema", "errors": errors}
     return {"ok": True, "reason": "ok", "errors": []}
@@ -283,7 +240,7 @@ def _ast_check(target: Path, source: Optional[str]) -> Dict[str, Any]:
             return {"ok": False, "reason": "missing_target"}
         source = target.read_text(encoding="utf-8")
     try:
-        ast.parse(source, filename=str(target))
+        ast_cache.parse_source(source, filename=str(target))
     except SyntaxError as exc:
         return {"ok": False, "reason": f"syntax_error:{exc.msg}"}
     return {"ok": True}
@@ -300,24 +257,10 @@ def _import_smoke_check(target: Path, source: Optional[str]) -> Dict[str, Any]:
 
         # Baseline: AST parse validates syntax and import statement shape without execution.
         try:
-            tree = ast.parse(source, filename=str(target))
+            imported_roots = ast_cache.import_roots(source, filename=str(target))
         except SyntaxError as exc:
             return {"ok": False, "reason": f"syntax_error:{exc.msg}"}
 
-        imported_roots: Set[str] = set()
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    root = alias.name.split(".", 1)[0]
-                    if root:
-                        imported_roots.add(root)
-            elif isinstance(node, ast.ImportFrom):
-                if node.level > 0 or not node.module:
-                    continue
-                root = node.module.split(".", 1)[0]
-                if root:
-                    imported_roots.add(root)
-
         stdlib_modules = getattr(sys, "stdlib_module_names", set())
         for module_name in sorted(imported_roots):
             if module_name in stdlib_modules:
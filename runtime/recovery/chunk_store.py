@@ -0,0 +1,195 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Content-addressed chunk store backing ledger snapshots.
+
+Files are split into fixed-size chunks stored once under
+``<root>/<digest[:2]>/<digest>``. A :class:`FileManifest` records the chunk
+digests, the byte length and the SHA-256 of the whole file at snapshot time.
+The ledgers are append-only, so two snapshots of the same ledger share every
+chunk but the last partial one; fixed offsets dedupe that case as well as a
+rolling hash would, without the boundary search. Every chunk read is checked
+against its digest, so a damaged store is reported rather than restored, and
+an existing chunk only satisfies a write once its digest is confirmed; a
+damaged one is rewritten from the source. Confirmed digests are remembered by
+stat stamp, so snapshots of an unchanged store only stat the shared chunks.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from runtime.governance.deterministic_filesystem import stamp_is_settled, stat_stamp
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class ChunkStoreError(RuntimeError):
+    """Raised when a chunk is missing or its content no longer matches its digest."""
+
+
+@dataclass(frozen=True)
+class FileManifest:
+    length: int
+    sha256: str
+    chunk_size: int
+    chunks: tuple[str, ...]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"length": self.length, "sha256": self.sha256, "chunk_size": self.chunk_size, "chunks": list(self.chunks)}
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> "FileManifest":
+        return cls(
+            length=int(raw["length"]),
+            sha256=str(raw["sha256"]),
+            chunk_size=int(raw["chunk_size"]),
+            chunks=tuple(str(item) for item in raw["chunks"]),
+        )
+
+    def chunk_length(self, index: int) -> int:
+        return min(self.chunk_size, self.length - index * self.chunk_size)
+
+
+class ChunkStore:
+    """Deduplicating ``sha256 -> bytes`` store with streaming put and verified, prefix-capable reads."""
+
+    def __init__(self, root: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self.root = root
+        self.chunk_size = max(1, int(chunk_size))
+        # digest -> (stat stamp, stamped at ns) of a chunk file whose content was hashed and matched.
+        self._verified: dict[str, tuple[tuple[int, int, int], int]] = {}
+
+    def chunk_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def _read_verified(self, digest: str) -> bytes | None:
+        """Chunk bytes, or ``None`` when the stored content no longer hashes to ``digest``."""
+        with self.chunk_path(digest).open("rb") as handle:
+            stat = os.fstat(handle.fileno())
+            stamped_ns = time.time_ns()
+            data = handle.read()
+        if hashlib.sha256(data).hexdigest() != digest:
+            self._verified.pop(digest, None)
+            return None
+        self._verified[digest] = (stat_stamp(stat), stamped_ns)
+        return data
+
+    def has(self, digest: str, length: int) -> bool:
+        """True when the stored chunk is ``length`` bytes long and still hashes to ``digest``.
+
+        The content is re-hashed only when the chunk file changed since it was
+        last confirmed, or was confirmed inside the racy window of its mtime.
+        """
+        try:
+            stat = self.chunk_path(digest).stat()
+            if stat.st_size != length:
+                return False
+            cached = self._verified.get(digest)
+            if cached is not None and cached[0] == stat_stamp(stat) and stamp_is_settled(cached[1], stat.st_mtime_ns):
+                return True
+            return self._read_verified(digest) is not None
+        except OSError:
+            return False
+
+    def _write_chunk(self, digest: str, data: bytes) -> bool:
+        # A damaged chunk with the right size is rewritten, not deduplicated against.
+        if self.has(digest, len(data)):
+            return False
+        path = self.chunk_path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{digest}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        self._verified[digest] = (stat_stamp(path.stat()), time.time_ns())
+        return True
+
+    def put_file(self, source: Path) -> tuple[FileManifest, int]:
+        """Chunk ``source`` into the store; return its manifest and the number of bytes newly written."""
+        file_hasher = hashlib.sha256()
+        chunks: list[str] = []
+        length = 0
+        written = 0
+        with source.open("rb") as handle:
+            for data in iter(lambda: handle.read(self.chunk_size), b""):
+                file_hasher.update(data)
+                digest = hashlib.sha256(data).hexdigest()
+                if self._write_chunk(digest, data):
+                    written += len(data)
+                chunks.append(digest)
+                length += len(data)
+        return FileManifest(length, file_hasher.hexdigest(), self.chunk_size, tuple(chunks)), written
+
+    def read_chunk(self, digest: str) -> bytes:
+        try:
+            data = self._read_verified(digest)
+        except OSError as exc:
+            raise ChunkStoreError(f"chunk_missing:{digest}") from exc
+        if data is None:
+            raise ChunkStoreError(f"chunk_corrupted:{digest}")
+        return data
+
+    def iter_bytes(self, manifest: FileManifest, length: int | None = None) -> Iterator[bytes]:
+        """Yield the first ``length`` bytes (default: all) of the file ``manifest`` describes."""
+        remaining = manifest.length if length is None else max(0, min(int(length), manifest.length))
+        for index, digest in enumerate(manifest.chunks):
+            if remaining <= 0:
+                return
+            data = self.read_chunk(digest)
+            if len(data) != manifest.chunk_length(index):
+                raise ChunkStoreError(f"chunk_length_mismatch:{digest}")
+            yield data[:remaining]
+            remaining -= min(len(data), remaining)
+
+    def verify(self, manifest: FileManifest) -> None:
+        """Stream every chunk of ``manifest`` and check it and the whole-file digest; raise :class:`ChunkStoreError`."""
+        file_hasher = hashlib.sha256()
+        for data in self.iter_bytes(manifest):
+            file_hasher.update(data)
+        if file_hasher.hexdigest() != manifest.sha256:
+            raise ChunkStoreError(f"file_digest_mismatch:{manifest.sha256}")
+
+    def materialize(self, manifest: FileManifest, target: Path, *, length: int | None = None) -> int:
+        """Atomically rebuild ``target`` from the store (a prefix when ``length`` is given); return bytes written."""
+        full = length is None or int(length) >= manifest.length
+        file_hasher = hashlib.sha256()
+        written = 0
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".tmp", dir=target.parent)
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                for data in self.iter_bytes(manifest, length):
+                    file_hasher.update(data)
+                    handle.write(data)
+                    written += len(data)
+            if full and file_hasher.hexdigest() != manifest.sha256:
+                raise ChunkStoreError(f"file_digest_mismatch:{manifest.sha256}")
+            os.replace(tmp_name, target)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return written
+
+    def collect_garbage(self, live: Iterable[str]) -> int:
+        """Delete chunks not referenced by ``live``; return how many were removed."""
+        keep = set(live)
+        removed = 0
+        if not self.root.is_dir():
+            return 0
+        for bucket in self.root.iterdir():
+            if not bucket.is_dir():
+                continue
+            for path in bucket.iterdir():
+                if path.name in keep:
+                    continue
+                path.unlink(missing_ok=True)
+                self._verified.pop(path.name, None)
+                removed += 1
+        return removed
+
+
+__all__ = ["ChunkStore", "ChunkStoreError", "DEFAULT_CHUNK_SIZE", "FileManifest"]
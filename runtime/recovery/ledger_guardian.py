@@ -1,20 +1,34 @@
 # SPDX-License-Identifier: Apache-2.0
-"""Ledger guardian: automatic recovery and snapshot management."""
+"""Ledger guardian: automatic recovery and snapshot management.
+
+Snapshot contents live in a shared content-addressed chunk store
+(``<snapshot_dir>/chunks``); each ``snapshot-*`` directory holds only a
+``manifest.json`` naming the chunks and byte length of every file at snapshot
+time, so a snapshot of a grown append-only ledger writes just its new tail.
+Directories from before the chunk store hold full file copies and are still
+restored and validated as such.
+"""
 
 from __future__ import annotations
 
-import hashlib
 import json
 import shutil
+import tempfile
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable
 
 from runtime import metrics
 from runtime.evolution.lineage_v2 import LineageIntegrityError, LineageLedgerV2, LineageRecoveryHook
+from runtime.governance.deterministic_filesystem import stamp_is_settled, stat_stamp
 from runtime.governance.foundation import RuntimeDeterminismProvider, default_provider, require_replay_safe_provider
+from runtime.recovery.chunk_store import DEFAULT_CHUNK_SIZE, ChunkStore, ChunkStoreError, FileManifest
 from security.ledger.journal import JournalIntegrityError, JournalRecoveryHook, verify_journal_integrity
 
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
 
 @dataclass(frozen=True)
 class SnapshotMetadata:
@@ -49,6 +63,7 @@ class SnapshotManager:
         *,
         replay_mode: str = "off",
         recovery_tier: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
     ):
         self.snapshot_dir = snapshot_dir
         self.max_snapshots = max_snapshots
@@ -57,8 +72,12 @@ class SnapshotManager:
         self.recovery_tier = recovery_tier
         self.snapshot_dir.mkdir(parents=True, exist_ok=True)
         self.metadata_path = self.snapshot_dir / "snapshots.json"
+        self.chunks = ChunkStore(self.snapshot_dir / "chunks", chunk_size)
+        self.staging_dir = self.snapshot_dir / ".staging"
         self._metadata: dict[str, SnapshotMetadata] = {}
         self._next_creation_sequence = 1
+        # source path -> (stat stamp, stamped at ns, manifest): unchanged ledgers are not re-read.
+        self._source_manifests: dict[Path, tuple[tuple[int, int, int], int, FileManifest]] = {}
         self._load_metadata()
 
     def _load_metadata(self) -> None:
@@ -118,10 +137,12 @@ class SnapshotManager:
         Supported signatures:
         - create_snapshot(source_path)
         - create_snapshot(lineage_path, journal_path, epoch_id)
+
+        Both return the snapshot directory, which holds the chunk manifest.
         """
         if len(args) == 1 and isinstance(args[0], Path):
             metadata = self.create_snapshot_set([args[0]])
-            return self.snapshot_dir / metadata.snapshot_id / args[0].name
+            return self.snapshot_dir / metadata.snapshot_id
         if len(args) == 3 and isinstance(args[0], Path) and isinstance(args[1], Path) and isinstance(args[2], str):
             metadata = self.create_snapshot_set([args[0], args[1]], epoch_id=args[2])
             return self.snapshot_dir / metadata.snapshot_id
@@ -132,15 +153,20 @@ class SnapshotManager:
         snapshot_id, snapshot_path = self._reserve_snapshot_dir()
 
         file_hashes: dict[str, str] = {}
+        manifests: dict[str, dict[str, Any]] = {}
         total_bytes = 0
+        stored_bytes = 0
         for source in sources:
             source.parent.mkdir(parents=True, exist_ok=True)
             if not source.exists():
                 source.touch()
-            target = snapshot_path / source.name
-            shutil.copy2(source, target)
-            file_hashes[source.name] = self._hash_file(target)
-            total_bytes += target.stat().st_size
+            manifest, written = self._chunk_source(source)
+            manifests[source.name] = manifest.to_dict()
+            file_hashes[source.name] = manifest.sha256
+            total_bytes += manifest.length
+            stored_bytes += written
+        manifest_payload = {"version": MANIFEST_VERSION, "files": manifests}
+        (snapshot_path / MANIFEST_NAME).write_text(json.dumps(manifest_payload, sort_keys=True), encoding="utf-8")
 
         creation_sequence = self._next_creation_sequence
         self._next_creation_sequence += 1
@@ -157,9 +183,36 @@ class SnapshotManager:
         self._save_metadata()
         self._prune_old_snapshots()
 
-        metrics.log(event_type="snapshot_created", payload=metadata.to_dict(), level="INFO")
+        metrics.log(event_type="snapshot_created", payload={**metadata.to_dict(), "stored_bytes": stored_bytes}, level="INFO")
         return metadata
 
+    def _chunk_source(self, source: Path) -> tuple[FileManifest, int]:
+        key = source.resolve()
+        stat = source.stat()
+        stamp = stat_stamp(stat)
+        cached = self._source_manifests.get(key)
+        if cached is not None and cached[0] == stamp and stamp_is_settled(cached[1], stat.st_mtime_ns):
+            manifest = cached[2]
+            if manifest.chunk_size == self.chunks.chunk_size and all(
+                self.chunks.has(digest, manifest.chunk_length(index)) for index, digest in enumerate(manifest.chunks)
+            ):
+                return manifest, 0
+        stamped_ns = time.time_ns()
+        manifest, written = self.chunks.put_file(source)
+        self._source_manifests[key] = (stamp, stamped_ns, manifest)
+        return manifest, written
+
+    def _read_manifests(self, snapshot_id: str) -> dict[str, FileManifest] | None:
+        """Chunk manifests of ``snapshot_id``, or ``None`` for a pre-chunk-store snapshot of full copies."""
+        manifest_path = self.snapshot_dir / snapshot_id / MANIFEST_NAME
+        if not manifest_path.exists():
+            return None
+        try:
+            raw = json.loads(manifest_path.read_text(encoding="utf-8"))
+            return {name: FileManifest.from_dict(item) for name, item in dict(raw.get("files") or {}).items()}
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return {}
+
     def list_snapshots(self) -> list[SnapshotMetadata]:
         return sorted(self._metadata.values(), key=lambda m: m.creation_sequence, reverse=True)
 
@@ -179,11 +232,8 @@ class SnapshotManager:
             return False
 
         restored_any = False
-        for file_name, target_path in ((lineage_path.name, lineage_path), (cryovant_path.name, cryovant_path)):
-            source = snapshot_dir / file_name
-            if source.exists():
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(source, target_path)
+        for target_path in (lineage_path, cryovant_path):
+            if self.restore_file(snapshot_id, target_path.name, target_path):
                 restored_any = True
 
         metrics.log(
@@ -193,12 +243,54 @@ class SnapshotManager:
         )
         return restored_any
 
+    def restore_file(self, snapshot_id: str, file_name: str, target_path: Path, *, length: int | None = None) -> bool:
+        """Rebuild ``file_name`` from ``snapshot_id`` into ``target_path``; ``length`` restores only that byte prefix."""
+        manifests = self._read_manifests(snapshot_id)
+        if manifests is None:
+            source = self.snapshot_dir / snapshot_id / file_name
+            if not source.exists():
+                return False
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            if length is None:
+                shutil.copy2(source, target_path)
+            else:
+                with source.open("rb") as handle:
+                    target_path.write_bytes(handle.read(max(0, int(length))))
+            return True
+        manifest = manifests.get(file_name)
+        if manifest is None:
+            return False
+        try:
+            self.chunks.materialize(manifest, target_path, length=length)
+        except ChunkStoreError as exc:
+            metrics.log(
+                event_type="snapshot_restore_failed",
+                payload={"snapshot_id": snapshot_id, "file": file_name, "reason": str(exc)},
+                level="ERROR",
+            )
+            return False
+        return True
+
     def _prune_old_snapshots(self) -> None:
         snapshots = sorted(self._metadata.values(), key=lambda m: m.creation_sequence, reverse=True)
-        for old in snapshots[self.max_snapshots :]:
+        pruned = snapshots[self.max_snapshots :]
+        for old in pruned:
             shutil.rmtree(self.snapshot_dir / old.snapshot_id, ignore_errors=True)
             self._metadata.pop(old.snapshot_id, None)
         self._save_metadata()
+        if pruned:
+            self._collect_chunks()
+
+    def _collect_chunks(self) -> None:
+        # Chunks stay alive while any snapshot directory on disk references them, tracked in metadata or not.
+        live: set[str] = set()
+        for snapshot_path in self.snapshot_dir.glob("snapshot-*"):
+            manifests = self._read_manifests(snapshot_path.name)
+            if manifests == {} and (snapshot_path / MANIFEST_NAME).exists():
+                return
+            for manifest in (manifests or {}).values():
+                live.update(manifest.chunks)
+        self.chunks.collect_garbage(live)
 
     def _reserve_snapshot_dir(self) -> tuple[str, Path]:
         for _ in range(32):
@@ -219,30 +311,57 @@ class SnapshotManager:
         return f"snapshot-{timestamp}-{suffix:04x}"
 
     def get_latest_valid_snapshot(self, source_name: str, validator: Callable[[Path], None]) -> Path | None:
-        snapshots = sorted(
-            [d for d in self.snapshot_dir.glob("snapshot-*") if d.is_dir()],
+        """Newest snapshot copy of ``source_name`` that passes ``validator``.
+
+        Chunked snapshots are first checked by streaming their chunk digests,
+        so a damaged one is skipped without writing anything. The validator
+        needs a file, so an intact candidate is then rebuilt once into a fresh
+        directory under ``<snapshot_dir>/.staging``; a returned path is never
+        overwritten by a later call, and :class:`AutoRecoveryHook` moves it
+        into place rather than copying it again. The caller may remove its
+        parent once done. Content already rejected for an older or newer
+        snapshot is not checked again.
+        """
+        tracked = [meta.snapshot_id for meta in self.list_snapshots()]
+        untracked = sorted(
+            [d for d in self.snapshot_dir.glob("snapshot-*") if d.is_dir() and d.name not in self._metadata],
             key=lambda p: p.stat().st_mtime,
             reverse=True,
         )
-        for snapshot_dir in snapshots:
-            snapshot = snapshot_dir / source_name
-            if not snapshot.exists():
-                continue
+        rejected: set[str] = set()
+        for snapshot_id in [*tracked, *(d.name for d in untracked)]:
+            manifests = self._read_manifests(snapshot_id)
+            if manifests is None:
+                snapshot = self.snapshot_dir / snapshot_id / source_name
+                if not snapshot.exists():
+                    continue
+            else:
+                manifest = manifests.get(source_name)
+                if manifest is None or manifest.sha256 in rejected:
+                    continue
+                try:
+                    self.chunks.verify(manifest)
+                except ChunkStoreError:
+                    rejected.add(manifest.sha256)
+                    continue
+                self.staging_dir.mkdir(parents=True, exist_ok=True)
+                snapshot = Path(tempfile.mkdtemp(prefix=f"{snapshot_id}.", dir=self.staging_dir)) / source_name
+                try:
+                    self.chunks.materialize(manifest, snapshot)
+                except ChunkStoreError:
+                    rejected.add(manifest.sha256)
+                    shutil.rmtree(snapshot.parent, ignore_errors=True)
+                    continue
             try:
                 validator(snapshot)
                 return snapshot
             except Exception:
+                if manifests is not None:
+                    rejected.add(manifest.sha256)
+                    shutil.rmtree(snapshot.parent, ignore_errors=True)
                 continue
         return None
 
-    @staticmethod
-    def _hash_file(path: Path) -> str:
-        hasher = hashlib.sha256()
-        with path.open("rb") as handle:
-            for chunk in iter(lambda: handle.read(4096), b""):
-                hasher.update(chunk)
-        return hasher.hexdigest()
-
 
 class AutoRecoveryHook(LineageRecoveryHook, JournalRecoveryHook):
     """Attempts ledger/journal recovery from latest valid snapshot."""
@@ -287,7 +406,12 @@ class AutoRecoveryHook(LineageRecoveryHook, JournalRecoveryHook):
         corrupted_backup = target_path.with_suffix(target_path.suffix + ".corrupted")
         if target_path.exists():
             shutil.move(target_path, corrupted_backup)
-        shutil.copy2(snapshot_path, target_path)
+        if snapshot_path.parent.parent == self.snapshot_manager.staging_dir:
+            # A staged copy was rebuilt for this call only; move it instead of copying it again.
+            shutil.move(snapshot_path, target_path)
+            shutil.rmtree(snapshot_path.parent, ignore_errors=True)
+        else:
+            shutil.copy2(snapshot_path, target_path)
 
         event = {
             "timestamp": self.provider.iso_now(),
@@ -4,10 +4,16 @@
 from runtime.sandbox.evidence import SandboxEvidenceLedger, build_sandbox_evidence
 from runtime.sandbox.executor import HardenedSandboxExecutor
 from runtime.sandbox.fs_rules import enforce_write_path_allowlist
-from runtime.sandbox.isolation import ContainerIsolationBackend, ProcessIsolationBackend
+from runtime.sandbox.isolation import (
+    ContainerIsolationBackend,
+    ProcessIsolationBackend,
+    WarmPoolIsolationBackend,
+    select_isolation_backend,
+)
 from runtime.sandbox.manifest import SandboxManifest, manifest_from_mapping, validate_manifest
 from runtime.sandbox.network_rules import enforce_network_egress_allowlist
 from runtime.sandbox.preflight import analyze_execution_plan
+from runtime.sandbox.pytest_pool import PytestWorkerPool
 from runtime.sandbox.policy import SandboxPolicy, default_sandbox_policy, policy_from_mapping, validate_policy
 from runtime.sandbox.replay import replay_sandbox_execution
 from runtime.sandbox.resources import enforce_resource_quotas
@@ -26,6 +32,9 @@ __all__ = [
     "enforce_resource_quotas",
     "ProcessIsolationBackend",
     "ContainerIsolationBackend",
+    "WarmPoolIsolationBackend",
+    "select_isolation_backend",
+    "PytestWorkerPool",
     "analyze_execution_plan",
     "manifest_from_mapping",
     "validate_manifest",
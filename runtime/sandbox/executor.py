@@ -9,7 +9,7 @@ from typing import Any, Sequence
 from runtime.governance.foundation import RuntimeDeterminismProvider, default_provider
 from runtime.sandbox.evidence import SandboxEvidenceLedger, build_sandbox_evidence
 from runtime.sandbox.fs_rules import enforce_write_path_allowlist
-from runtime.sandbox.isolation import IsolationBackend, ProcessIsolationBackend
+from runtime.sandbox.isolation import IsolationBackend, select_isolation_backend
 from runtime.sandbox.manifest import SandboxManifest, validate_manifest
 from runtime.sandbox.network_rules import enforce_network_egress_allowlist
 from runtime.sandbox.policy import SandboxPolicy, default_sandbox_policy, validate_policy
@@ -31,7 +31,7 @@ class HardenedSandboxExecutor:
         self.test_sandbox = test_sandbox
         self.policy = policy or default_sandbox_policy()
         self.provider = provider or default_provider()
-        self.isolation_backend = isolation_backend or ProcessIsolationBackend()
+        self.isolation_backend = isolation_backend or select_isolation_backend()
         self.evidence_ledger = SandboxEvidenceLedger()
         self.last_evidence_hash = ""
         self.last_evidence_payload: dict[str, object] = {}
@@ -3,11 +3,13 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from typing import Protocol, Sequence
 
 from runtime.sandbox.manifest import SandboxManifest
 from runtime.sandbox.policy import SandboxPolicy
+from runtime.sandbox.pytest_pool import PytestWorkerPool, shared_pool, warm_pool_supported
 from runtime.test_sandbox import TestSandbox, TestSandboxResult
 
 
@@ -89,6 +91,24 @@ class ProcessIsolationBackend:
         return test_sandbox.run_tests_with_retry(args=args, retries=retries)
 
 
+@dataclass(frozen=True)
+class WarmPoolIsolationBackend(ProcessIsolationBackend):
+    """Process backend that runs pytest on a warm fork-server pool instead of cold subprocesses."""
+
+    pool: PytestWorkerPool | None = None
+
+    def prepare(self, *, manifest: SandboxManifest, policy: SandboxPolicy) -> IsolationPreparation:
+        preparation = super().prepare(manifest=manifest, policy=policy)
+        if self.pool is None:
+            raise RuntimeError("sandbox_backend_unavailable:warm_pool")
+        return IsolationPreparation(mode="warm_pool", controls=preparation.controls)
+
+    def run(self, *, test_sandbox: TestSandbox, args: Sequence[str] | None, retries: int) -> TestSandboxResult:
+        if self.pool is None:
+            raise RuntimeError("sandbox_backend_unavailable:warm_pool")
+        return test_sandbox.run_tests_with_retry(args=args, retries=retries, runner=self.pool)
+
+
 @dataclass(frozen=True)
 class ContainerIsolationBackend:
     """Container isolation backend placeholder used for fail-closed gating."""
@@ -106,10 +126,24 @@ class ContainerIsolationBackend:
         raise RuntimeError("sandbox_backend_unavailable:container")
 
 
+def select_isolation_backend() -> IsolationBackend:
+    """Backend named by ``ADAAD_SANDBOX_ISOLATION_BACKEND``: ``process`` (default) or ``warm_pool``."""
+    name = os.getenv("ADAAD_SANDBOX_ISOLATION_BACKEND", "").strip().lower() or "process"
+    if name == "process":
+        return ProcessIsolationBackend()
+    if name == "warm_pool":
+        if not warm_pool_supported():
+            raise RuntimeError("sandbox_backend_unavailable:warm_pool")
+        return WarmPoolIsolationBackend(pool=shared_pool())
+    raise RuntimeError(f"sandbox_backend_unknown:{name}")
+
+
 __all__ = [
     "ContainerIsolationBackend",
     "EnforcedControl",
     "IsolationBackend",
     "IsolationPreparation",
     "ProcessIsolationBackend",
+    "WarmPoolIsolationBackend",
+    "select_isolation_backend",
 ]
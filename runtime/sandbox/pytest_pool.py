@@ -0,0 +1,323 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Warm pool of pre-imported pytest fork-servers for sandboxed test runs.
+
+Each worker is a long-lived ``runtime/sandbox/pytest_worker.py`` process that
+has already paid interpreter start-up and the pytest import. Every run forks a
+fresh child from it with the run's own cwd, environment and tempdir, so runs
+stay isolated while skipping the cold start. Workers are recycled after
+``max_runs_per_worker`` runs and immediately on any isolation doubt: a timeout,
+a child killed by a signal, a pytest internal error or a protocol failure.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import queue
+import select
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Mapping, Sequence
+
+from runtime import metrics
+from runtime.sandbox.pytest_worker import PRELOADERS
+
+ELEMENT_ID = "Fire"
+WORKER_SCRIPT = Path(__file__).with_name("pytest_worker.py")
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_RUNS_PER_WORKER = 50
+DEFAULT_STARTUP_TIMEOUT_S = 30.0
+DEFAULT_PRELOAD: tuple[str, ...] = ("pytest",)
+# pytest exit code 3 is an internal error: the run may have left the child in an unknown state.
+_DOUBTFUL_RETURNCODES = {3}
+
+
+class WorkerPoolError(RuntimeError):
+    """Raised when a warm worker cannot be started or answers out of protocol."""
+
+
+def warm_pool_supported() -> bool:
+    return hasattr(os, "fork") and hasattr(os, "waitstatus_to_exitcode")
+
+
+class _Worker:
+    def __init__(self, *, preload: Sequence[str], startup_timeout_s: float) -> None:
+        self.runs = 0
+        self._pending = b""
+        self.process = subprocess.Popen(
+            [sys.executable, str(WORKER_SCRIPT), *preload],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        ready = self.read_message(startup_timeout_s)
+        if not ready or not ready.get("ready"):
+            self.kill()
+            raise WorkerPoolError("pytest_worker_start_failed")
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    def read_message(self, timeout_s: float) -> Dict[str, Any] | None:
+        # Read the raw fd against one deadline: a worker that writes half a line
+        # and hangs must not block a buffered readline() past ``timeout_s``.
+        stdout = self.process.stdout
+        assert stdout is not None
+        deadline = time.monotonic() + max(0.0, timeout_s)
+        while b"\n" not in self._pending:
+            readable, _, _ = select.select([stdout], [], [], max(0.0, deadline - time.monotonic()))
+            if not readable:
+                return None
+            chunk = os.read(stdout.fileno(), 65536)
+            if not chunk:
+                return None
+            self._pending += chunk
+        line, _, self._pending = self._pending.partition(b"\n")
+        try:
+            payload = json.loads(line)
+        except ValueError:
+            return None
+        return payload if isinstance(payload, dict) else None
+
+    def send(self, payload: Mapping[str, Any]) -> None:
+        stdin = self.process.stdin
+        assert stdin is not None
+        stdin.write((json.dumps(payload) + "\n").encode("utf-8"))
+        stdin.flush()
+
+    def kill(self) -> None:
+        # Workers lead their own session, so the group also covers a running test child.
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:  # pragma: no cover
+            pass
+        for stream in (self.process.stdin, self.process.stdout):
+            if stream is not None:
+                try:
+                    stream.close()
+                except OSError:
+                    pass
+
+
+class PytestWorkerPool:
+    """Implements :class:`runtime.test_sandbox.PytestRunner` on top of warm fork-servers."""
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        *,
+        max_runs_per_worker: int = DEFAULT_MAX_RUNS_PER_WORKER,
+        preload: Sequence[str] = DEFAULT_PRELOAD,
+        startup_timeout_s: float = DEFAULT_STARTUP_TIMEOUT_S,
+    ) -> None:
+        if not warm_pool_supported():
+            raise WorkerPoolError("pytest_worker_pool_unsupported_platform")
+        self.size = max(1, int(size))
+        self.max_runs_per_worker = max(1, int(max_runs_per_worker))
+        self.preload = tuple(preload)
+        for module_name in self.preload:
+            if module_name not in PRELOADERS:
+                raise WorkerPoolError(f"pytest_worker_unsupported_preload:{module_name}")
+        self.startup_timeout_s = float(startup_timeout_s)
+        self._idle: "queue.LifoQueue[_Worker]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._live = 0
+        self._closed = False
+        self._stats = {"started": 0, "recycled": 0, "runs": 0}
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "live": self._live, "idle": self._idle.qsize()}
+
+    def _acquire(self) -> _Worker:
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise WorkerPoolError("pytest_worker_pool_closed")
+                try:
+                    return self._idle.get_nowait()
+                except queue.Empty:
+                    pass
+                spawn = self._live < self.size
+                if spawn:
+                    self._live += 1
+            if spawn:
+                try:
+                    worker = _Worker(preload=self.preload, startup_timeout_s=self.startup_timeout_s)
+                except BaseException:
+                    with self._lock:
+                        self._live -= 1
+                    raise
+                with self._lock:
+                    self._stats["started"] += 1
+                metrics.log(
+                    event_type="pytest_worker_started",
+                    payload={"pid": worker.pid, "preload": list(self.preload)},
+                    level="INFO",
+                    element_id=ELEMENT_ID,
+                )
+                return worker
+            try:
+                return self._idle.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+    def _retire(self, worker: _Worker, reason: str) -> None:
+        worker.kill()
+        with self._lock:
+            self._live -= 1
+            self._stats["recycled"] += 1
+        metrics.log(
+            event_type="pytest_worker_recycled",
+            payload={"pid": worker.pid, "runs": worker.runs, "reason": reason},
+            level="INFO" if reason == "max_runs" else "WARNING",
+            element_id=ELEMENT_ID,
+        )
+
+    def _release(self, worker: _Worker) -> None:
+        with self._lock:
+            closed = self._closed
+        if closed:
+            self._retire(worker, "pool_closed")
+        elif worker.runs >= self.max_runs_per_worker:
+            self._retire(worker, "max_runs")
+        else:
+            self._idle.put(worker)
+
+    def run(
+        self,
+        args: Sequence[str],
+        *,
+        cwd: Path,
+        env: Mapping[str, str],
+        timeout_s: int,
+    ) -> subprocess.CompletedProcess[str]:
+        command = [sys.executable, "-m", "pytest", *args]
+        worker = self._acquire()
+        # Set once the worker has been retired or released; anything else hands it back as a protocol error.
+        disposed = False
+
+        def _dispose(reason: str | None) -> None:
+            nonlocal disposed
+            disposed = True
+            if reason is None:
+                self._release(worker)
+            else:
+                self._retire(worker, reason)
+
+        stdout_path = stderr_path = None
+        started = time.monotonic()
+        try:
+            output_dir = Path(env.get("TMPDIR") or tempfile.gettempdir())
+            stdout_fd, stdout_name = tempfile.mkstemp(prefix="pytest-worker-", suffix=".out", dir=output_dir)
+            os.close(stdout_fd)
+            stdout_path = Path(stdout_name)
+            stderr_fd, stderr_name = tempfile.mkstemp(prefix="pytest-worker-", suffix=".err", dir=output_dir)
+            os.close(stderr_fd)
+            stderr_path = Path(stderr_name)
+
+            def _captured() -> tuple[str, str]:
+                return (
+                    stdout_path.read_text(encoding="utf-8", errors="replace"),
+                    stderr_path.read_text(encoding="utf-8", errors="replace"),
+                )
+
+            worker.runs += 1
+            with self._lock:
+                self._stats["runs"] += 1
+            try:
+                worker.send(
+                    {
+                        "args": list(args),
+                        "cwd": str(cwd),
+                        "env": dict(env),
+                        "stdout_path": str(stdout_path),
+                        "stderr_path": str(stderr_path),
+                    }
+                )
+            except OSError as exc:
+                _dispose("protocol_error")
+                raise WorkerPoolError(f"pytest_worker_send_failed:{exc}") from exc
+            response = worker.read_message(timeout_s - (time.monotonic() - started))
+            if response is None:
+                alive = worker.process.poll() is None
+                _dispose("timeout" if alive else "worker_died")
+                stdout, stderr = _captured()
+                if alive:
+                    raise subprocess.TimeoutExpired(command, timeout_s, output=stdout, stderr=stderr)
+                raise WorkerPoolError("pytest_worker_died")
+            if "returncode" not in response:
+                _dispose("protocol_error")
+                raise WorkerPoolError(f"pytest_worker_error:{response.get('error', 'unknown')}")
+            returncode = int(response["returncode"])
+            if returncode < 0 or returncode in _DOUBTFUL_RETURNCODES:
+                _dispose(f"isolation_doubt:returncode_{returncode}")
+            else:
+                _dispose(None)
+            stdout, stderr = _captured()
+            return subprocess.CompletedProcess(command, returncode, stdout, stderr)
+        except BaseException:
+            if not disposed:
+                _dispose("protocol_error")
+            raise
+        finally:
+            for path in (stdout_path, stderr_path):
+                if path is not None:
+                    path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._retire(worker, "pool_closed")
+
+    def __enter__(self) -> "PytestWorkerPool":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+
+_SHARED_POOL: PytestWorkerPool | None = None
+_SHARED_POOL_LOCK = threading.Lock()
+
+
+def shared_pool() -> PytestWorkerPool:
+    """Process-wide pool sized by ``ADAAD_SANDBOX_WARM_POOL_SIZE``; workers start on first use and stop at exit."""
+    global _SHARED_POOL
+    with _SHARED_POOL_LOCK:
+        if _SHARED_POOL is None:
+            raw = os.getenv("ADAAD_SANDBOX_WARM_POOL_SIZE", "").strip()
+            try:
+                size = int(raw) if raw else DEFAULT_POOL_SIZE
+            except ValueError:
+                size = DEFAULT_POOL_SIZE
+            _SHARED_POOL = PytestWorkerPool(size=size)
+            atexit.register(_SHARED_POOL.close)
+        return _SHARED_POOL
+
+
+__all__ = [
+    "DEFAULT_MAX_RUNS_PER_WORKER",
+    "DEFAULT_POOL_SIZE",
+    "PytestWorkerPool",
+    "WorkerPoolError",
+    "shared_pool",
+    "warm_pool_supported",
+]
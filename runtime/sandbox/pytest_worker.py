@@ -0,0 +1,102 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Fork-server process backing :class:`runtime.sandbox.pytest_pool.PytestWorkerPool`.
+
+The pool launches this file by path (not ``-m``) so no project package is
+imported into the long-lived server. The server pre-imports pytest once, then
+forks a fresh child per request; the child applies the request's cwd, env and
+output files, runs ``pytest.main`` and exits, so nothing a test run imports or
+mutates survives into the next run.
+
+Protocol: one JSON object per line on stdin/stdout. The server writes
+``{"ready": true}`` after preloading and answers every request with
+``{"returncode": int}`` or ``{"error": str}``. Only modules listed in
+:data:`PRELOADERS` can be preloaded.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+from typing import Any, Callable, Dict, List
+
+
+def _preload_pytest() -> None:
+    import pytest  # noqa: F401
+
+
+# Modules the server may pre-import. Static imports keep the preload visible to the determinism lint.
+PRELOADERS: Dict[str, Callable[[], None]] = {"pytest": _preload_pytest}
+
+
+def _run_child(request: Dict[str, Any]) -> int:
+    null_fd = os.open(os.devnull, os.O_RDONLY)
+    stdout_fd = os.open(request["stdout_path"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    stderr_fd = os.open(request["stderr_path"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.dup2(null_fd, 0)
+    os.dup2(stdout_fd, 1)
+    os.dup2(stderr_fd, 2)
+    for fd in (null_fd, stdout_fd, stderr_fd):
+        os.close(fd)
+
+    os.environ.clear()
+    os.environ.update(request["env"])
+    os.chdir(request["cwd"])
+    # Match ``python -m pytest``: the working directory heads sys.path.
+    sys.path[0] = request["cwd"]
+    sys.dont_write_bytecode = bool(os.environ.get("PYTHONDONTWRITEBYTECODE"))
+    tempfile.tempdir = None
+
+    import pytest
+
+    return int(pytest.main(list(request["args"])))
+
+
+def _serve(request: Dict[str, Any]) -> Dict[str, Any]:
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:
+        code = 3
+        try:
+            code = _run_child(request)
+        except BaseException:  # pragma: no cover - child process
+            import traceback
+
+            traceback.print_exc()
+        finally:
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+            finally:
+                os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    return {"returncode": os.waitstatus_to_exitcode(status)}
+
+
+def main(preload: List[str]) -> int:
+    out = sys.stdout
+    unsupported = [name for name in preload if name not in PRELOADERS]
+    if unsupported:
+        out.write(json.dumps({"error": f"unsupported_preload:{','.join(unsupported)}"}) + "\n")
+        out.flush()
+        return 2
+    for module_name in preload:
+        PRELOADERS[module_name]()
+    out.write(json.dumps({"ready": True}) + "\n")
+    out.flush()
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            response = _serve(json.loads(line))
+        except Exception as exc:
+            response = {"error": f"{type(exc).__name__}:{exc}"}
+        out.write(json.dumps(response) + "\n")
+        out.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
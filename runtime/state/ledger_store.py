@@ -14,9 +14,9 @@ from __future__ import annotations
 import json
 import sqlite3
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
-from runtime.governance.deterministic_filesystem import read_file_deterministic
+from runtime.governance.deterministic_filesystem import iter_lines_deterministic
 from runtime.governance.foundation import canonical_json, sha256_prefixed_digest
 
 _ZERO_HASH = "sha256:" + ("0" * 64)
@@ -48,36 +48,39 @@ class ScoringLedgerStore:
                 """
             )
 
-    def _iter_json_records(self) -> list[dict[str, Any]]:
-        rows: list[dict[str, Any]] = []
-        for line in read_file_deterministic(self.path).splitlines():
+    def _iter_json_records(self) -> Iterator[dict[str, Any]]:
+        for line in iter_lines_deterministic(self.path):
             stripped = line.strip()
             if not stripped:
                 continue
             payload = json.loads(stripped)
             if isinstance(payload, dict):
-                rows.append(payload)
-        return rows
+                yield payload
 
-    def iter_records(self) -> list[dict[str, Any]]:
-        if self.backend == "sqlite":
-            with sqlite3.connect(self.sqlite_path) as conn:
-                rows = conn.execute(
-                    "SELECT scoring_result_json, prev_hash, record_hash FROM scoring_ledger ORDER BY seq ASC"
-                ).fetchall()
-            return [
-                {
+    def _iter_sqlite_records(self) -> Iterator[dict[str, Any]]:
+        with sqlite3.connect(self.sqlite_path) as conn:
+            cursor = conn.execute(
+                "SELECT scoring_result_json, prev_hash, record_hash FROM scoring_ledger ORDER BY seq ASC"
+            )
+            for scoring_result_json, prev_hash, record_hash in cursor:
+                yield {
                     "scoring_result": json.loads(scoring_result_json),
                     "prev_hash": prev_hash,
                     "record_hash": record_hash,
                 }
-                for scoring_result_json, prev_hash, record_hash in rows
-            ]
+
+    def iter_entries(self) -> Iterator[dict[str, Any]]:
+        """Stream ledger records in append order without materializing the ledger."""
+        if self.backend == "sqlite":
+            return self._iter_sqlite_records()
         return self._iter_json_records()
 
+    def iter_records(self) -> list[dict[str, Any]]:
+        return list(self.iter_entries())
+
     def last_hash(self) -> str:
         last = _ZERO_HASH
-        for record in self.iter_records():
+        for record in self.iter_entries():
             candidate = record.get("record_hash")
             if isinstance(candidate, str):
                 last = candidate
@@ -106,8 +109,8 @@ class ScoringLedgerStore:
 
     def verify_chain(self) -> dict[str, Any]:
         expected_prev = _ZERO_HASH
-        records = self.iter_records()
-        for index, record in enumerate(records):
+        count = 0
+        for index, record in enumerate(self.iter_entries()):
             observed_prev = record.get("prev_hash")
             if observed_prev != expected_prev:
                 return {"ok": False, "count": index, "error": "prev_hash_mismatch", "index": index}
@@ -119,4 +122,5 @@ class ScoringLedgerStore:
             if record.get("record_hash") != expected_hash:
                 return {"ok": False, "count": index, "error": "record_hash_mismatch", "index": index}
             expected_prev = expected_hash
-        return {"ok": True, "count": len(records), "tip_hash": expected_prev}
+            count = index + 1
+        return {"ok": True, "count": count, "tip_hash": expected_prev}
@@ -14,7 +14,7 @@ from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Sequence
+from typing import Callable, Mapping, Protocol, Sequence
 
 from runtime import ROOT_DIR
 from runtime import metrics
@@ -57,6 +57,41 @@ class TestSandboxResult:
     attempted_network_hosts: tuple[str, ...] = ()
 
 
+class PytestRunner(Protocol):
+    """Executes one pytest invocation; raises ``subprocess.TimeoutExpired`` on timeout."""
+
+    def run(
+        self,
+        args: Sequence[str],
+        *,
+        cwd: Path,
+        env: Mapping[str, str],
+        timeout_s: int,
+    ) -> subprocess.CompletedProcess[str]: ...
+
+
+class ColdPytestRunner:
+    """Default runner: a fresh ``python -m pytest`` subprocess per invocation."""
+
+    def run(
+        self,
+        args: Sequence[str],
+        *,
+        cwd: Path,
+        env: Mapping[str, str],
+        timeout_s: int,
+    ) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [sys.executable, "-m", "pytest", *args],
+            capture_output=True,
+            text=True,
+            timeout=timeout_s,
+            cwd=str(cwd),
+            env=dict(env),
+            check=False,
+        )
+
+
 class TestSandbox:
     """Run pytest in a temporary execution sandbox."""
 
@@ -70,6 +105,7 @@ class TestSandbox:
         post_hook: Callable[[TestSandboxResult], None] | None = None,
         verbose: bool = False,
         retain_failed_artifacts: bool = False,
+        runner: PytestRunner | None = None,
     ) -> None:
         self.root_dir = root_dir or ROOT_DIR
         self.timeout_s = timeout_s
@@ -77,6 +113,7 @@ class TestSandbox:
         self.post_hook = post_hook
         self.verbose = verbose
         self.retain_failed_artifacts = retain_failed_artifacts
+        self.runner = runner or ColdPytestRunner()
 
     @staticmethod
     def _with_updates(result: TestSandboxResult, **updates: object) -> TestSandboxResult:
@@ -131,9 +168,16 @@ class TestSandbox:
             )
             return None
 
-    def run_tests(self, args: Sequence[str] | None = None, keep_sandbox: bool = False) -> TestSandboxResult:
+    def run_tests(
+        self,
+        args: Sequence[str] | None = None,
+        keep_sandbox: bool = False,
+        *,
+        runner: PytestRunner | None = None,
+    ) -> TestSandboxResult:
         """Execute pytest with timeout and tempdir isolation for each invocation."""
         self._run_pre_hook()
+        runner = runner or self.runner
 
         test_args = list(args or ["-x", "--tb=short"])
         started = time.monotonic()
@@ -155,14 +199,11 @@ class TestSandbox:
         env["PYTHONDONTWRITEBYTECODE"] = "1"
 
         try:
-            completed = subprocess.run(
-                [sys.executable, "-m", "pytest", *test_args, f"--basetemp={sandbox_path / 'pytest-temp'}"],
-                capture_output=True,
-                text=True,
-                timeout=self.timeout_s,
-                cwd=str(self.root_dir),
+            completed = runner.run(
+                [*test_args, f"--basetemp={sandbox_path / 'pytest-temp'}"],
+                cwd=self.root_dir,
                 env=env,
-                check=False,
+                timeout_s=self.timeout_s,
             )
             duration_s = time.monotonic() - started
             ok = completed.returncode in {0, 5}
@@ -282,10 +323,12 @@ class TestSandbox:
         args: Sequence[str] | None = None,
         retries: int = 2,
         keep_sandbox: bool = False,
+        *,
+        runner: PytestRunner | None = None,
     ) -> TestSandboxResult:
         """Retry sandbox test execution on failure."""
         attempts = 0
-        final = self.run_tests(args=args, keep_sandbox=keep_sandbox)
+        final = self.run_tests(args=args, keep_sandbox=keep_sandbox, runner=runner)
         while attempts < retries and not final.ok:
             attempts += 1
             metrics.log(
@@ -300,7 +343,7 @@ class TestSandbox:
                 level="WARNING",
                 element_id=ELEMENT_ID,
             )
-            final = self.run_tests(args=args, keep_sandbox=keep_sandbox)
+            final = self.run_tests(args=args, keep_sandbox=keep_sandbox, runner=runner)
         return self._with_updates(final, retries=attempts)
 
     def run_tests_parallel(self, test_args_list: list[Sequence[str]]) -> list[TestSandboxResult]:
@@ -326,4 +369,4 @@ class TestSandbox:
             return list(executor.map(worker, test_args_list))
 
 
-__all__ = ["TestSandbox", "TestSandboxResult", "TestSandboxStatus"]
+__all__ = ["ColdPytestRunner", "PytestRunner", "TestSandbox", "TestSandboxResult", "TestSandboxStatus"]
@@ -1,14 +1,26 @@
 # SPDX-License-Identifier: Apache-2.0
 """
 Gatekeeper protocol stub for Phase-2 drift detection.
+
+The ``app/`` tree is fingerprinted through a persisted per-file manifest keyed
+by ``(path, size, mtime_ns, inode)``: only files whose stat changed since the
+previous boot are re-hashed, and so is any file whose recorded hash is not yet
+settled (``runtime.governance.deterministic_filesystem.stamp_is_settled``).
+Directory hashes form a Merkle tree over the manifest, so a drift report names
+the files and subtrees that changed. The flat ``hash`` is the same digest
+earlier releases stored in ``gate_hash.txt``.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
+import os
+import time
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, Tuple
+
+from runtime.governance.deterministic_filesystem import stamp_is_settled
 
 REQUIRED_DIRS = [
     Path("app"),
@@ -18,6 +30,111 @@ REQUIRED_DIRS = [
     Path("security/keys"),
 ]
 
+MANIFEST_VERSION = 1
+
+
+def _excluded(name: str) -> bool:
+    # Exclude dotfiles and .gitkeep placeholders to avoid false positives from
+    # local/editor metadata and empty-directory sentinels.
+    return name.startswith(".") or name.endswith(".gitkeep")
+
+
+def _walk(app_root: Path) -> Dict[str, os.stat_result]:
+    """Stat every fingerprinted file under ``app_root`` without reading it."""
+    found: Dict[str, os.stat_result] = {}
+    base = app_root.parent
+    pending = [app_root]
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            path = Path(entry.path)
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    pending.append(path)
+                continue
+            if _excluded(entry.name):
+                continue
+            found[path.relative_to(base).as_posix()] = entry.stat()
+    return found
+
+
+def _load_manifest(manifest_path: Path) -> Dict[str, Any]:
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest
+
+
+def build_file_manifest(app_root: Path, previous: Dict[str, Dict[str, Any]]) -> Tuple[Dict[str, Dict[str, Any]], int]:
+    """Return ``(path -> stat key + sha256, files re-hashed)`` reusing unchanged entries from ``previous``."""
+    now_ns = time.time_ns()
+    base = app_root.parent
+    files: Dict[str, Dict[str, Any]] = {}
+    rehashed = 0
+    for rel_path, stat in sorted(_walk(app_root).items()):
+        key = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "ino": stat.st_ino}
+        cached = previous.get(rel_path)
+        if (
+            isinstance(cached, dict)
+            and all(cached.get(field) == value for field, value in key.items())
+            and stamp_is_settled(int(cached.get("hashed_ns", 0)), stat.st_mtime_ns)
+        ):
+            files[rel_path] = cached
+            continue
+        sha256 = hashlib.sha256((base / rel_path).read_bytes()).hexdigest()
+        rehashed += 1
+        files[rel_path] = {**key, "sha256": sha256, "hashed_ns": now_ns}
+    return files, rehashed
+
+
+def flat_digest(files: Dict[str, Dict[str, Any]]) -> str:
+    manifest = [{"path": path, "sha256": entry["sha256"]} for path, entry in sorted(files.items())]
+    manifest_payload = json.dumps(manifest, sort_keys=True)
+    return hashlib.sha256(manifest_payload.encode("utf-8")).hexdigest()
+
+
+def merkle_tree(files: Dict[str, Dict[str, Any]], root: str = "app") -> Dict[str, str]:
+    """Directory path -> hash over its sorted ``(name, kind, hash)`` children."""
+    children: Dict[str, Dict[str, Tuple[str, str]]] = {root: {}}
+    for path, entry in files.items():
+        parent, _, name = path.rpartition("/")
+        children.setdefault(parent, {})[name] = ("file", entry["sha256"])
+        while parent != root and "/" in parent:
+            grandparent, _, dirname = parent.rpartition("/")
+            children.setdefault(grandparent, {}).setdefault(dirname, ("dir", ""))
+            parent = grandparent
+    tree: Dict[str, str] = {}
+    for directory in sorted(children, key=lambda item: item.count("/"), reverse=True):
+        digest = hashlib.sha256()
+        for name, (kind, value) in sorted(children[directory].items()):
+            value = tree[f"{directory}/{name}"] if kind == "dir" else value
+            digest.update(f"{name}\0{kind}\0{value}\n".encode("utf-8"))
+        tree[directory] = digest.hexdigest()
+    return tree
+
+
+def diff_manifests(
+    previous_files: Dict[str, Dict[str, Any]],
+    previous_tree: Dict[str, str],
+    files: Dict[str, Dict[str, Any]],
+    tree: Dict[str, str],
+) -> Dict[str, List[str]]:
+    return {
+        "added": sorted(set(files) - set(previous_files)),
+        "removed": sorted(set(previous_files) - set(files)),
+        "modified": sorted(
+            path for path in set(files) & set(previous_files) if files[path]["sha256"] != previous_files[path].get("sha256")
+        ),
+        "subtrees": sorted(path for path in set(tree) | set(previous_tree) if tree.get(path) != previous_tree.get(path)),
+    }
+
 
 def run_gatekeeper() -> Dict[str, object]:
     missing: List[str] = []
@@ -25,21 +142,13 @@ def run_gatekeeper() -> Dict[str, object]:
         if not path.exists():
             missing.append(str(path))
 
-    manifest: List[Dict[str, str]] = []
     app_root = Path("app")
-    for p in sorted(app_root.rglob("*")):
-        if p.is_dir():
-            continue
-        # Exclude dotfiles and .gitkeep placeholders to avoid false positives from
-        # local/editor metadata and empty-directory sentinels.
-        if p.name.startswith(".") or p.name.endswith(".gitkeep"):
-            continue
-        rel_path = p.relative_to(app_root.parent).as_posix()
-        file_hash = hashlib.sha256(p.read_bytes()).hexdigest()
-        manifest.append({"path": rel_path, "sha256": file_hash})
-
-    manifest_payload = json.dumps(sorted(manifest, key=lambda item: item["path"]), sort_keys=True)
-    digest = hashlib.sha256(manifest_payload.encode("utf-8")).hexdigest()
+    manifest_path = Path("security/ledger/gate_manifest.json")
+    previous = _load_manifest(manifest_path)
+    previous_files = previous.get("files") if isinstance(previous.get("files"), dict) else {}
+    files, rehashed = build_file_manifest(app_root, previous_files)
+    digest = flat_digest(files)
+    tree = merkle_tree(files)
     ledger_hash_file = Path("security/ledger/gate_hash.txt")
     prev = ledger_hash_file.read_text(encoding="utf-8").strip() if ledger_hash_file.exists() else None
     drift = prev is not None and prev != digest
@@ -48,6 +157,10 @@ def run_gatekeeper() -> Dict[str, object]:
     try:
         ledger_hash_file.parent.mkdir(parents=True, exist_ok=True)
         ledger_hash_file.write_text(digest, encoding="utf-8")
+        manifest_path.write_text(
+            json.dumps({"version": MANIFEST_VERSION, "hash": digest, "files": files, "tree": tree}, sort_keys=True),
+            encoding="utf-8",
+        )
     except Exception as exc:
         persistence_error = f"{type(exc).__name__}: {exc}"
 
@@ -64,12 +177,17 @@ def run_gatekeeper() -> Dict[str, object]:
         "ok": ok,
         "missing": missing,
         "hash": digest,
+        "merkle_root": tree.get("app", ""),
+        "rehashed": rehashed,
         "persistence_error": persistence_error,
         "reasons": reasons,
     }
     if drift:
         payload["drift"] = True
+        if previous.get("hash") == prev:
+            previous_tree = previous.get("tree") if isinstance(previous.get("tree"), dict) else {}
+            payload["drift_report"] = diff_manifests(previous_files, previous_tree, files, tree)
     return payload
 
 
-__all__ = ["run_gatekeeper"]
+__all__ = ["build_file_manifest", "diff_manifests", "flat_digest", "merkle_tree", "run_gatekeeper"]
@@ -20,12 +20,13 @@ import time
 import hashlib
 import os
 import threading
+from collections import deque
 from pathlib import Path
 from contextlib import contextmanager
-from typing import Dict, List, Optional, Protocol
+from typing import Dict, Iterator, List, Optional, Protocol
 
 from runtime import metrics
-from security.ledger import LEDGER_ROOT
+from security.ledger import LEDGER_ROOT, rate_index
 
 ELEMENT_ID = "Water"
 
@@ -82,14 +83,29 @@ def write_entry(agent_id: str, action: str, payload: Dict[str, str] | None = Non
     }
     with LEDGER_FILE.open("a", encoding="utf-8") as handle:
         handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+    rate_index.index_for(LEDGER_FILE).sync()
     metrics.log(event_type="ledger_write", payload=record, level="INFO", element_id=ELEMENT_ID)
 
 
+def iter_entries() -> Iterator[Dict[str, str]]:
+    """
+    Stream parsed lineage ledger entries in append order, skipping malformed lines.
+    """
+    ensure_ledger()
+    with LEDGER_FILE.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
 def read_entries(limit: int = 50) -> List[Dict[str, str]]:
     ensure_ledger()
-    lines = LEDGER_FILE.read_text(encoding="utf-8").splitlines()
+    with LEDGER_FILE.open("r", encoding="utf-8") as handle:
+        lines = deque(handle, maxlen=limit) if limit > 0 else list(handle)
     entries: List[Dict[str, str]] = []
-    for line in lines[-limit:]:
+    for line in lines:
         try:
             entries.append(json.loads(line))
         except json.JSONDecodeError:
@@ -122,24 +138,28 @@ def _raise_integrity_error(
     raise error
 
 
-def _scan_chain(
+def _iter_chain(
     *,
     path: Path,
     recovery_hook: JournalRecoveryHook | None,
     start_offset: int,
     expected_prev_hash: str,
-) -> tuple[str, int]:
+) -> Iterator[tuple[Dict[str, object] | None, int]]:
+    """Yield ``(entry, end_offset)`` per line, verifying the chain as it streams (blank lines yield ``None``)."""
     prev_hash = expected_prev_hash
-    with path.open("r", encoding="utf-8") as handle:
+    offset = start_offset
+    with path.open("rb") as handle:
         if start_offset:
             handle.seek(start_offset)
         for line_no, line in enumerate(handle, start=1):
+            offset += len(line)
             entry_text = line.strip()
             if not entry_text:
+                yield None, offset
                 continue
             try:
-                entry = json.loads(entry_text)
-            except json.JSONDecodeError as exc:
+                entry = json.loads(entry_text.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError) as exc:
                 _raise_integrity_error(
                     f"journal_invalid_json:line{line_no}:{exc}",
                     path=path,
@@ -169,7 +189,27 @@ def _scan_chain(
                     recovery_hook=recovery_hook,
                 )
             prev_hash = entry_hash
-        return prev_hash, handle.tell()
+            yield entry, offset
+
+
+def _scan_chain(
+    *,
+    path: Path,
+    recovery_hook: JournalRecoveryHook | None,
+    start_offset: int,
+    expected_prev_hash: str,
+) -> tuple[str, int]:
+    prev_hash = expected_prev_hash
+    offset = start_offset
+    for entry, offset in _iter_chain(
+        path=path,
+        recovery_hook=recovery_hook,
+        start_offset=start_offset,
+        expected_prev_hash=expected_prev_hash,
+    ):
+        if entry is not None:
+            prev_hash = str(entry.get("hash") or "")
+    return prev_hash, offset
 
 
 def _read_tail_state(path: Path) -> tuple[str, int] | None:
@@ -281,6 +321,26 @@ def verify_journal_integrity(
     _validated_last_hash(recovery_hook=recovery_hook, journal_path=journal_path)
 
 
+def iter_journal_entries(
+    recovery_hook: JournalRecoveryHook | None = None,
+    *,
+    journal_path: Path | None = None,
+) -> Iterator[Dict[str, object]]:
+    """
+    Stream Cryovant journal entries from genesis, verifying the hash chain line by line.
+    """
+    if journal_path is None:
+        path = ensure_journal()
+    else:
+        path = journal_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if not path.exists():
+            path.touch()
+    for entry, _ in _iter_chain(path=path, recovery_hook=recovery_hook, start_offset=0, expected_prev_hash="0" * 64):
+        if entry is not None:
+            yield entry
+
+
 def append_tx(tx_type: str, payload: Dict[str, object], tx_id: Optional[str] = None) -> Dict[str, object]:
     JOURNAL_PATH.parent.mkdir(parents=True, exist_ok=True)
     with _journal_append_lock(JOURNAL_PATH):
@@ -330,6 +390,8 @@ def record_rotation_failure(action: str, payload: Dict[str, object]) -> None:
 __all__ = [
     "write_entry",
     "read_entries",
+    "iter_entries",
+    "iter_journal_entries",
     "append_tx",
     "ensure_ledger",
     "ensure_journal",
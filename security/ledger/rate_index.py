@@ -0,0 +1,261 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Sliding-window mutation counters over the lineage ledger (``lineage.jsonl``).
+
+The index keeps, per epoch and per action, a count of entries for each distinct
+timestamp (the ledger writes whole seconds), plus the same series aggregated
+over all epochs. A window query bisects to the window start and sums the
+buckets inside it, so rate checks cost O(buckets in window) instead of a parse
+of the whole ledger.
+
+The index is persisted next to the ledger (``lineage.rate_index.json``) with the
+byte offset it covers and a SHA-256 anchor over the bytes just before that
+offset. :meth:`MutationRateIndex.sync` ingests only lines appended after the
+offset; if the anchor no longer matches (the ledger was rewritten or truncated)
+the index is rebuilt from the start. Persisting is throttled because a stale
+file only costs a catch-up read from its recorded offset.
+"""
+
+from __future__ import annotations
+
+import bisect
+import calendar
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from runtime.governance.deterministic_filesystem import stamp_is_settled, stat_stamp
+
+INDEX_VERSION = 1
+ANCHOR_BYTES = 4096
+PERSIST_INTERVAL_S = 1.0
+
+MUTATION_RATE_ACTIONS = frozenset(
+    {
+        "mutation_approved_constitutional",
+        "mutation_rejected_constitutional",
+        "mutation_planned",
+        "mutation_executed",
+        "mutation_failed",
+        "mutation_noop",
+    }
+)
+
+# Series key for counts aggregated over every epoch (``""`` is the real scope of entries without one).
+ALL_EPOCHS: Optional[str] = None
+
+
+def parse_ledger_ts(value: str | None) -> int | None:
+    if not value:
+        return None
+    try:
+        if value.endswith("Z"):
+            parsed = time.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
+        else:
+            parsed = time.strptime(value, "%Y-%m-%dT%H:%M:%S")
+    except (TypeError, ValueError):
+        return None
+    return calendar.timegm(parsed)
+
+
+@dataclass
+class _Series:
+    keys: List[int] = field(default_factory=list)
+    counts: Dict[int, int] = field(default_factory=dict)
+    untimed: int = 0
+
+    def add(self, ts: int | None, count: int = 1) -> None:
+        if ts is None:
+            self.untimed += count
+            return
+        if ts not in self.counts:
+            if not self.keys or ts > self.keys[-1]:
+                self.keys.append(ts)
+            else:
+                bisect.insort(self.keys, ts)
+            self.counts[ts] = 0
+        self.counts[ts] += count
+
+    @property
+    def total(self) -> int:
+        return self.untimed + sum(self.counts.values())
+
+    def count_since(self, start: float) -> int:
+        return sum(self.counts[ts] for ts in self.keys[bisect.bisect_left(self.keys, start):])
+
+
+class MutationRateIndex:
+    """Incrementally maintained ``(epoch, action) -> timestamp buckets`` index for one ledger file."""
+
+    def __init__(self, ledger_path: Path, *, index_path: Path | None = None) -> None:
+        self.ledger_path = ledger_path
+        self.index_path = index_path or ledger_path.with_suffix(".rate_index.json")
+        self._lock = threading.RLock()
+        self._reset()
+        self._stamp: Tuple[int, int, int] | None = None
+        self._synced_ns = 0
+        self._persisted_at = 0.0
+        self._dirty = False
+        self._load()
+
+    def _reset(self) -> None:
+        self._offset = 0
+        self._anchor_hex = hashlib.sha256(b"").hexdigest()
+        self._entries = 0
+        self._series: Dict[Tuple[Optional[str], str], _Series] = {}
+
+    def _add(self, epoch: str, action: str, ts: int | None, count: int = 1) -> None:
+        for scope in (epoch, ALL_EPOCHS):
+            series = self._series.get((scope, action))
+            if series is None:
+                series = self._series[(scope, action)] = _Series()
+            series.add(ts, count)
+
+    def _anchor(self, handle, offset: int) -> str:
+        start = max(0, offset - ANCHOR_BYTES)
+        handle.seek(start)
+        return hashlib.sha256(handle.read(offset - start)).hexdigest()
+
+    def _load(self) -> None:
+        try:
+            payload = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, dict) or payload.get("version") != INDEX_VERSION:
+            return
+        try:
+            offset = int(payload["offset"])
+            entries = int(payload["entries"])
+            anchor = str(payload["anchor"])
+            series = payload["series"]
+            with self.ledger_path.open("rb") as handle:
+                if os.fstat(handle.fileno()).st_size < offset or self._anchor(handle, offset) != anchor:
+                    return
+            for epoch, actions in series.items():
+                for action, data in actions.items():
+                    if int(data.get("untimed", 0)):
+                        self._add(epoch, action, None, int(data["untimed"]))
+                    for ts, count in data.get("buckets", []):
+                        self._add(epoch, action, int(ts), int(count))
+        except (OSError, KeyError, TypeError, ValueError, AttributeError):
+            self._reset()
+            return
+        self._offset = offset
+        self._anchor_hex = anchor
+        self._entries = entries
+
+    def _persist(self) -> None:
+        series: Dict[str, Dict[str, Any]] = {}
+        for (epoch, action), data in self._series.items():
+            if epoch is ALL_EPOCHS:
+                continue
+            series.setdefault(epoch, {})[action] = {
+                "untimed": data.untimed,
+                "buckets": [[ts, data.counts[ts]] for ts in data.keys],
+            }
+        payload = {"version": INDEX_VERSION, "offset": self._offset, "anchor": self._anchor_hex, "entries": self._entries, "series": series}
+        try:
+            tmp_path = self.index_path.with_name(f"{self.index_path.name}.tmp")
+            tmp_path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            return
+        self._dirty = False
+        self._persisted_at = time.monotonic()
+
+    def _ingest(self, handle) -> None:
+        handle.seek(self._offset)
+        for line in handle:
+            if not line.endswith(b"\n"):
+                break
+            self._offset += len(line)
+            text = line.strip()
+            if not text:
+                continue
+            try:
+                entry = json.loads(text.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                continue
+            if not isinstance(entry, dict):
+                continue
+            self._entries += 1
+            self._dirty = True
+            payload = entry.get("payload")
+            epoch = str((payload if isinstance(payload, dict) else {}).get("epoch_id") or "").strip()
+            self._add(epoch, str(entry.get("action") or ""), parse_ledger_ts(str(entry.get("timestamp") or "")))
+
+    def sync(self) -> None:
+        """Ingest lines appended since the recorded offset, rebuilding if the ledger no longer matches it."""
+        with self._lock:
+            try:
+                stat = self.ledger_path.stat()
+            except OSError:
+                self._reset()
+                self._stamp = None
+                return
+            stamp = stat_stamp(stat)
+            if stamp == self._stamp and stamp_is_settled(self._synced_ns, stat.st_mtime_ns):
+                return
+            synced_ns = time.time_ns()
+            with self.ledger_path.open("rb") as handle:
+                if stat.st_size < self._offset or self._anchor(handle, self._offset) != self._anchor_hex:
+                    # Rewritten or truncated below the indexed offset: rebuild from the start.
+                    self._reset()
+                    self._dirty = True
+                self._ingest(handle)
+                self._anchor_hex = self._anchor(handle, self._offset)
+            self._stamp = stamp
+            self._synced_ns = synced_ns
+            if self._dirty and time.monotonic() - self._persisted_at >= PERSIST_INTERVAL_S:
+                self._persist()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._dirty:
+                self._persist()
+
+    def snapshot(self, window_sec: int, epoch_id: str = "", event_types: Iterable[str] | None = None) -> Dict[str, Any]:
+        """Mutation count in the ``window_sec`` window ending at the newest scoped entry."""
+        actions = frozenset(event_types) if event_types is not None else MUTATION_RATE_ACTIONS
+        scope = epoch_id or ALL_EPOCHS
+        self.sync()
+        with self._lock:
+            series = [self._series[(scope, action)] for action in sorted(actions) if (scope, action) in self._series]
+            latest_event_ts = max((item.keys[-1] for item in series if item.keys), default=0)
+            window_end_ts = float(latest_event_ts) if latest_event_ts > 0 else 0.0
+            window_start_ts = window_end_ts - window_sec
+            count = sum(item.count_since(window_start_ts) for item in series)
+            return {
+                "window_sec": window_sec,
+                "window_start_ts": window_start_ts,
+                "window_end_ts": window_end_ts,
+                "count": count,
+                "rate_per_hour": (count * 3600.0 / window_sec) if window_sec > 0 else float(count),
+                "event_types": sorted(actions),
+                "entries_considered": self._entries,
+                "entries_scoped": sum(item.total for item in series),
+                "scope": {"epoch_id": epoch_id or "*"},
+                "source": "security.ledger.lineage",
+            }
+
+
+_INDEXES: Dict[Path, MutationRateIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def index_for(ledger_path: Path) -> MutationRateIndex:
+    """Shared index for ``ledger_path`` (callers pass ``journal.LEDGER_FILE``, which tests may repoint)."""
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(ledger_path)
+        if index is None:
+            index = MutationRateIndex(ledger_path)
+            _INDEXES[ledger_path] = index
+        return index
+
+
+__all__ = ["MUTATION_RATE_ACTIONS", "MutationRateIndex", "index_for", "parse_ledger_ts"]
@@ -9,9 +9,10 @@ from pathlib import Path
 from typing import Any, Literal
 
 from fastapi import Depends, FastAPI, Header, HTTPException, Query
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 
 from runtime import metrics
+from runtime.event_stream import SOURCES as STREAM_SOURCES, StreamCursor, StreamCursorError, aiter_sse, hub_for
 from runtime.evolution.evidence_bundle import EvidenceBundleBuilder, FORENSIC_EXPORT_DIR
 from runtime.evolution.lineage_v2 import LineageLedgerV2
 from runtime.evolution.replay_attestation import REPLAY_PROOFS_DIR, load_replay_proof, verify_replay_proof_bundle
@@ -285,6 +286,45 @@ def api_audit_bundle(
     return _audit_envelope(data=payload, auth_ctx=auth_ctx, redaction=redaction)
 
 
+STREAM_MAX_SECONDS = 300.0
+STREAM_RETRY_MS = 1000
+
+
+@app.get("/stream")
+def stream_events(
+    sources: str = Query(default=",".join(STREAM_SOURCES)),
+    event_type: list[str] = Query(default=[]),
+    epoch_id: str = Query(default=""),
+    cursor: str = Query(default=""),
+    redaction: Literal["none", "sensitive", "strict"] = Query(default="sensitive"),
+    last_event_id: str | None = Header(default=None),
+    auth_ctx: dict[str, Any] = Depends(_authenticate_audit_request),
+) -> StreamingResponse:
+    # Lineage frames carry the same entries as /api/audit/epochs/{epoch_id}/lineage, so they get the same gate;
+    # both sources are redacted alike.
+    _require_scope(auth_ctx, AUDIT_READ_SCOPE)
+    selected = [item for item in sources.split(",") if item] or list(STREAM_SOURCES)
+    if set(selected) - set(STREAM_SOURCES):
+        raise HTTPException(status_code=400, detail="unknown_stream_source")
+    hub = hub_for()
+    token = cursor.strip() or (last_event_id or "").strip()
+    try:
+        start = StreamCursor.parse(token) if token else hub.head()
+    except StreamCursorError as exc:
+        raise HTTPException(status_code=400, detail="invalid_stream_cursor") from exc
+    frames = aiter_sse(
+        hub,
+        start,
+        sources=selected,
+        event_types=[item for raw in event_type for item in raw.split(",") if item],
+        epoch_id=epoch_id.strip(),
+        max_duration_s=STREAM_MAX_SECONDS,
+        retry_ms=STREAM_RETRY_MS,
+        transform=lambda _source, record: _apply_redaction(record, redaction),
+    )
+    return StreamingResponse(frames, media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
 MOCK_ENDPOINTS = ["status", "agents", "tree", "kpis", "changes", "suggestions"]
 
 for endpoint_name in MOCK_ENDPOINTS:
@@ -7,10 +7,13 @@ from runtime.evolution.replay_attestation import load_replay_proof
 from runtime.evolution.simulation_runner import _load_candidate
 from runtime.governance.deterministic_envelope import ENTROPY_COSTS, EntropySource, deterministic_envelope
 from runtime.governance.deterministic_filesystem import (
+    RACY_WINDOW_NS,
     find_files_deterministic,
     glob_deterministic,
     listdir_deterministic,
     read_file_deterministic,
+    stamp_is_settled,
+    stat_stamp,
     walk_deterministic,
 )
 from runtime.governance.gate_certifier import GateCertifier
@@ -65,3 +68,13 @@ def test_migrated_callsites_charge_filesystem_entropy(tmp_path: Path) -> None:
         assert validate_governance_schemas([Path("schemas/replay_attestation.v1.json")]) == {}
 
     assert ledger.consumed >= ENTROPY_COSTS[EntropySource.FILESYSTEM] * 4
+
+
+def test_stat_stamp_is_trusted_only_outside_the_racy_window(tmp_path: Path) -> None:
+    path = tmp_path / "a.txt"
+    path.write_text("a", encoding="utf-8")
+    stat = path.stat()
+
+    assert stat_stamp(stat) == (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    assert not stamp_is_settled(stat.st_mtime_ns + RACY_WINDOW_NS - 1, stat.st_mtime_ns)
+    assert stamp_is_settled(stat.st_mtime_ns + RACY_WINDOW_NS, stat.st_mtime_ns)
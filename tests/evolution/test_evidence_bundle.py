@@ -151,3 +151,79 @@ def test_export_bundle_rejects_immutable_overwrite(tmp_path: Path) -> None:
         assert False, "expected immutable_export_mismatch"
     except EvidenceBundleError as exc:
         assert "immutable_export_mismatch" in str(exc)
+
+
+def _interleaved_builder(tmp_path: Path) -> EvidenceBundleBuilder:
+    ledger = LineageLedgerV2(ledger_path=tmp_path / "lineage_v2.jsonl")
+    epochs = ["epoch-1", "epoch-2", "epoch-3"]
+    for epoch_id in epochs:
+        ledger.append_event("EpochStartEvent", {"epoch_id": epoch_id, "state": {"seed": epoch_id}})
+    for index in range(12):
+        epoch_id = epochs[index % len(epochs)]
+        ledger.append_bundle_with_digest(
+            epoch_id,
+            {
+                "bundle_id": f"bundle-{11 - index:02d}",
+                "impact": 0.1,
+                "risk_tier": ("low", "high", "critical")[index % 3],
+                "certificate": {"bundle_id": f"bundle-{11 - index:02d}"},
+                "strategy_set": ["safe"],
+            },
+        )
+    for epoch_id in epochs:
+        ledger.append_event("EpochEndEvent", {"epoch_id": epoch_id, "state": {"done": True}})
+
+    sandbox_path = tmp_path / "sandbox_evidence.jsonl"
+    _write_jsonl(
+        sandbox_path,
+        [
+            {
+                "payload": {
+                    "evidence_hash": f"sha256:evidence{index}",
+                    "manifest_hash": f"sha256:manifest{index}",
+                    "policy_hash": "sha256:policy",
+                    "manifest": {"epoch_id": epochs[index % 4] if index % 4 < 3 else "epoch-other", "bundle_id": f"bundle-{index % 5:02d}"},
+                },
+                "prev_hash": "sha256:0",
+                "hash": f"sha256:entry{9 - index}",
+            }
+            for index in range(10)
+        ],
+    )
+    return EvidenceBundleBuilder(
+        ledger=ledger,
+        sandbox_evidence_path=sandbox_path,
+        export_dir=tmp_path / "exports",
+        schema_path=Path("schemas/evidence_bundle.v1.json"),
+    )
+
+
+def test_streamed_export_matches_in_memory_bundle(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr("runtime.evolution.evidence_bundle.STREAM_SPOOL_RUN_ROWS", 2)
+    builder = _interleaved_builder(tmp_path)
+    bundle = builder.build_bundle(epoch_start="epoch-1", epoch_end="epoch-3", persist=False)
+
+    summary = builder.export_bundle(epoch_start="epoch-3", epoch_end="epoch-1")
+
+    assert summary["bundle_id"] == bundle["bundle_id"]
+    assert summary["export_metadata"] == bundle["export_metadata"]
+    assert summary["risk_summaries"] == {"bundle_count": 12, "sandbox_evidence_count": 8, "replay_proof_count": 3, "high_risk_bundle_count": 8}
+    export_path = tmp_path / "exports" / f"{bundle['bundle_id']}.json"
+    assert export_path.read_text(encoding="utf-8") == canonical_json(bundle)
+    assert sorted(path.name for path in (tmp_path / "exports").iterdir()) == [export_path.name]
+
+    # A second export is an idempotent no-op; build_bundle accepts the streamed file as its own.
+    assert builder.export_bundle(epoch_start="epoch-1", epoch_end="epoch-3")["bundle_id"] == bundle["bundle_id"]
+    assert builder.build_bundle(epoch_start="epoch-1", epoch_end="epoch-3", persist=True) == bundle
+
+
+def test_streamed_export_rejects_immutable_overwrite(tmp_path: Path) -> None:
+    builder = _interleaved_builder(tmp_path)
+    summary = builder.export_bundle(epoch_start="epoch-2")
+    (tmp_path / "exports" / f"{summary['bundle_id']}.json").write_text("{}", encoding="utf-8")
+
+    try:
+        builder.export_bundle(epoch_start="epoch-2")
+        assert False, "expected immutable_export_mismatch"
+    except EvidenceBundleError as exc:
+        assert "immutable_export_mismatch" in str(exc)
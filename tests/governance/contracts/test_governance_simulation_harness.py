@@ -1,7 +1,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from runtime import constitution
-from tools.simulate_governance_harness import run_simulation
+from tools import simulate_governance_harness as harness
+from tools.simulate_governance_harness import RequestMix, mixed_request, run_batch, run_simulation
 
 
 def test_governance_simulation_harness_smoke() -> None:
@@ -9,3 +10,53 @@ def test_governance_simulation_harness_smoke() -> None:
     assert summary.total_requests == 10
     assert summary.passed >= 0
     assert summary.unique_envelope_digests >= 1
+
+
+def test_governance_simulation_batch_report() -> None:
+    mix = RequestMix(op_sizes=(1, 4), tiers=("SANDBOX", "STABLE"), epochs=2, code_fraction=0.5)
+    report = run_batch(count=8, mix=mix, workers=1, warmup=2, seed=7)
+
+    assert report["schema_version"] == "governance_load_report.v1"
+    assert report["summary"]["total_requests"] == 8
+    assert report["summary"]["passed"] + report["summary"]["blocked"] == 8
+    assert sum(report["targets"].values()) == 8
+    assert report["throughput"]["evaluations_per_second"] > 0
+    assert report["latency"]["p50_ms"] <= report["latency"]["p95_ms"] <= report["latency"]["p99_ms"]
+    lineage = report["rules"]["lineage_continuity"]
+    assert lineage["validator_name"] == "_validate_lineage"
+    assert lineage["evaluations"] == 8
+    assert sum(bucket["count"] for bucket in lineage["histogram"]) == 8
+
+
+def test_rule_timings_stay_out_of_verdicts() -> None:
+    request, tier, _kind = mixed_request(3, RequestMix(code_fraction=1.0), seed=1)
+    with constitution.record_rule_timings() as timings:
+        timed = constitution.evaluate_mutation(request, tier)
+
+    assert all(set(row) == {"rule", "severity", "passed", "applicable", "provenance", "details"} for row in timed["verdicts"])
+    assert {row["rule"] for row in timings} == {row["rule"] for row in timed["verdicts"] if row["applicable"]}
+    assert mixed_request(3, RequestMix(code_fraction=1.0), seed=1)[0] == request
+
+
+def test_batch_warmup_draws_from_indices_outside_the_measured_range(monkeypatch) -> None:
+    seen: list[tuple[int, int]] = []
+    evaluate = harness._evaluate_batch
+
+    def _spy(task):
+        seen.append((task[0], task[1]))
+        return evaluate(task)
+
+    monkeypatch.setattr(harness, "_evaluate_batch", _spy)
+    report = run_batch(count=6, workers=1, warmup=3, seed=2)
+
+    assert seen[0] == (6, 9)
+    assert sorted(index for start, stop in seen[1:] for index in range(start, stop)) == list(range(6))
+    assert report["summary"]["total_requests"] == 6
+
+
+def test_batch_report_with_worker_processes() -> None:
+    report = run_batch(count=6, workers=2, warmup=2, seed=2)
+
+    assert report["config"]["workers"] == 2
+    assert report["summary"]["passed"] + report["summary"]["blocked"] == 6
+    assert report["rules"]["lineage_continuity"]["evaluations"] == 6
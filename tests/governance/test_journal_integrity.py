@@ -78,3 +78,19 @@ def test_append_tx_blocked_after_corruption(tmp_path: Path) -> None:
             journal.append_tx("test", {"i": 2}, tx_id="TX-2")
     finally:
         _restore_journal(original_path, original_genesis, original_tail, original_lock)
+
+
+def test_iter_journal_entries_streams_verified_entries(tmp_path: Path) -> None:
+    original_path, original_genesis, original_tail, original_lock, temp_journal, _ = _with_temp_journal(tmp_path)
+    try:
+        journal.append_tx("test", {"i": 1}, tx_id="TX-1")
+        journal.append_tx("test", {"i": 2}, tx_id="TX-2")
+        with temp_journal.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps({"tx": "TX-3", "prev_hash": "f" * 64, "hash": "e" * 64}) + "\n")
+
+        stream = journal.iter_journal_entries()
+        assert [next(stream)["tx"], next(stream)["tx"]] == ["TX-1", "TX-2"]
+        with pytest.raises(journal.JournalIntegrityError, match="journal_prev_hash_mismatch:line3"):
+            next(stream)
+    finally:
+        _restore_journal(original_path, original_genesis, original_tail, original_lock)
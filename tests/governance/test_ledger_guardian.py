@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Callable
 
 import pytest
 
 from runtime.evolution.lineage_v2 import LineageIntegrityError, LineageLedgerV2
+from runtime.recovery import chunk_store
 from runtime.recovery.ledger_guardian import AutoRecoveryHook, SnapshotManager
 from security.ledger.journal import JournalIntegrityError, append_tx, verify_journal_integrity
 
@@ -106,3 +108,134 @@ def test_snapshot_manager_prunes_deterministically_with_rapid_calls(tmp_path: Pa
     expected_ids = [item.snapshot_id for item in created[-5:]][::-1]
     assert [item.snapshot_id for item in remaining] == expected_ids
     assert [item.creation_sequence for item in remaining] == [12, 11, 10, 9, 8]
+
+
+def test_snapshot_chunks_are_shared_and_prefix_restorable(tmp_path: Path) -> None:
+    source = tmp_path / "lineage_v2.jsonl"
+    source.write_bytes(b"a" * 40)
+
+    snapshots = SnapshotManager(tmp_path / "snaps", max_snapshots=2, chunk_size=16)
+    first = snapshots.create_snapshot_set([source])
+    with source.open("ab") as handle:
+        handle.write(b"b" * 20)
+    second = snapshots.create_snapshot_set([source])
+
+    chunk_files = [path for path in (tmp_path / "snaps" / "chunks").rglob("*") if path.is_file()]
+    # "a"*16 is stored once; the tails "a"*8 and "a"*8+"b"*8, "b"*12 are new.
+    assert len(chunk_files) == 4
+    assert not (tmp_path / "snaps" / second.snapshot_id / source.name).exists()
+    assert second.total_bytes == 60
+
+    target = tmp_path / "restored.jsonl"
+    assert snapshots.restore_file(second.snapshot_id, source.name, target, length=44)
+    assert target.read_bytes() == b"a" * 40 + b"b" * 4
+    assert snapshots.restore_file(first.snapshot_id, source.name, target)
+    assert target.read_bytes() == b"a" * 40
+
+    snapshots.create_snapshot_set([source])
+    snapshots.create_snapshot_set([source])
+    remaining = {path.name for path in (tmp_path / "snaps" / "chunks").rglob("*") if path.is_file()}
+    assert len(remaining) == 3
+    assert SnapshotManager(tmp_path / "snaps", chunk_size=16).restore_file(snapshots.get_latest_snapshot().snapshot_id, source.name, target)
+    assert target.read_bytes() == source.read_bytes()
+
+
+def test_latest_valid_snapshot_skips_corrupted_chunks_and_legacy_copies_still_work(tmp_path: Path) -> None:
+    source = tmp_path / "lineage_v2.jsonl"
+    source.write_text('{"n": 1}\n', encoding="utf-8")
+    snapshots = SnapshotManager(tmp_path / "snaps", chunk_size=4)
+    snapshots.create_snapshot_set([source])
+    source.write_text('{"n": 2}\n', encoding="utf-8")
+    latest = snapshots.create_snapshot_set([source])
+
+    manifest = json.loads((tmp_path / "snaps" / latest.snapshot_id / "manifest.json").read_text(encoding="utf-8"))
+    # ': 2}' is the only chunk the older snapshot does not share.
+    snapshots.chunks.chunk_path(manifest["files"][source.name]["chunks"][1]).write_bytes(b"junk")
+
+    validated: list[str] = []
+    found = snapshots.get_latest_valid_snapshot(source.name, lambda p: validated.append(p.read_text(encoding="utf-8")))
+    assert found is not None
+    assert validated == ['{"n": 1}\n']
+
+    def _require_zero(path: Path) -> None:
+        if json.loads(path.read_text(encoding="utf-8"))["n"] != 0:
+            raise ValueError("not zero")
+
+    legacy = tmp_path / "snaps" / "snapshot-00000000T000000.000000Z-0000"
+    legacy.mkdir()
+    (legacy / source.name).write_text('{"n": 0}\n', encoding="utf-8")
+    assert snapshots.get_latest_valid_snapshot(source.name, _require_zero) == legacy / source.name
+
+
+def test_snapshot_rewrites_same_size_corrupted_chunk(tmp_path: Path) -> None:
+    source = tmp_path / "lineage_v2.jsonl"
+    source.write_bytes(b"a" * 16 + b"b" * 16)
+    snapshots = SnapshotManager(tmp_path / "snaps", chunk_size=16)
+    first = snapshots.create_snapshot_set([source])
+    manifest = json.loads((tmp_path / "snaps" / first.snapshot_id / "manifest.json").read_text(encoding="utf-8"))
+    damaged = snapshots.chunks.chunk_path(manifest["files"][source.name]["chunks"][0])
+    damaged.write_bytes(b"x" * 16)
+
+    second = snapshots.create_snapshot_set([source])
+
+    assert damaged.read_bytes() == b"a" * 16
+    target = tmp_path / "restored.jsonl"
+    assert snapshots.restore_file(second.snapshot_id, source.name, target)
+    assert target.read_bytes() == source.read_bytes()
+
+
+def test_latest_valid_snapshot_paths_are_not_shared_between_calls(tmp_path: Path) -> None:
+    source = tmp_path / "lineage_v2.jsonl"
+    source.write_text('{"n": 1}\n', encoding="utf-8")
+    snapshots = SnapshotManager(tmp_path / "snaps", chunk_size=4)
+    snapshots.create_snapshot_set([source])
+    source.write_text('{"n": 2}\n', encoding="utf-8")
+    snapshots.create_snapshot_set([source])
+
+    def _require(n: int) -> Callable[[Path], None]:
+        def _check(path: Path) -> None:
+            if json.loads(path.read_text(encoding="utf-8"))["n"] != n:
+                raise ValueError("unexpected")
+
+        return _check
+
+    older = snapshots.get_latest_valid_snapshot(source.name, _require(1))
+    newer = snapshots.get_latest_valid_snapshot(source.name, _require(2))
+
+    assert older is not None and newer is not None and older != newer
+    assert json.loads(older.read_text(encoding="utf-8"))["n"] == 1
+    assert json.loads(newer.read_text(encoding="utf-8"))["n"] == 2
+    assert len(list(snapshots.staging_dir.iterdir())) == 2
+
+
+def test_snapshot_dedupe_only_stats_settled_chunks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    source = tmp_path / "lineage_v2.jsonl"
+    source.write_bytes(b"a" * 16 + b"b" * 16)
+    snapshots = SnapshotManager(tmp_path / "snaps", chunk_size=16)
+    snapshots.create_snapshot_set([source])
+    monkeypatch.setattr(chunk_store, "stamp_is_settled", lambda recorded_ns, mtime_ns: True)
+    reads: list[str] = []
+    original = snapshots.chunks._read_verified
+    monkeypatch.setattr(snapshots.chunks, "_read_verified", lambda digest: reads.append(digest) or original(digest))
+
+    with source.open("ab") as handle:
+        handle.write(b"c" * 16)
+    snapshots.create_snapshot_set([source])
+
+    assert reads == []
+    target = tmp_path / "restored.jsonl"
+    assert snapshots.restore_file(snapshots.get_latest_snapshot().snapshot_id, source.name, target)
+    assert target.read_bytes() == source.read_bytes()
+    assert len(reads) == 3  # restores still verify every chunk
+
+
+def test_latest_valid_snapshot_skips_damaged_chunks_without_staging(tmp_path: Path) -> None:
+    source = tmp_path / "lineage_v2.jsonl"
+    source.write_text('{"n": 1}\n', encoding="utf-8")
+    snapshots = SnapshotManager(tmp_path / "snaps", chunk_size=4)
+    latest = snapshots.create_snapshot_set([source])
+    manifest = json.loads((tmp_path / "snaps" / latest.snapshot_id / "manifest.json").read_text(encoding="utf-8"))
+    snapshots.chunks.chunk_path(manifest["files"][source.name]["chunks"][0]).write_bytes(b"junk")
+
+    assert snapshots.get_latest_valid_snapshot(source.name, lambda p: None) is None
+    assert not snapshots.staging_dir.exists()
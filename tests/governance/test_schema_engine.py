@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from runtime.governance import schema_engine
+from runtime.governance.deterministic_envelope import ENTROPY_COSTS, EntropySource, deterministic_envelope
+
+_SCHEMA = {
+    "type": "object",
+    "required": ["id", "items"],
+    "additionalProperties": False,
+    "properties": {
+        "id": {"type": "string", "minLength": 3, "pattern": "^[a-z]+$"},
+        "kind": {"type": "string", "enum": ["a", "b"]},
+        "items": {"type": "array", "minItems": 1, "items": {"type": "integer", "minimum": 0}},
+    },
+}
+
+
+def test_dialects_keep_their_error_strings() -> None:
+    payload = {"id": "A1", "kind": "c", "items": [-1, "x"], "zz": 1, "extra": 2}
+
+    assert schema_engine.compile_schema(_SCHEMA, schema_engine.RESPONSE).validate(payload) == [
+        "$.kind:enum_mismatch",
+        "$.items[1]:expected_integer",
+        "$.zz:additional_property",
+        "$.extra:additional_property",
+    ]
+    assert schema_engine.compile_schema(_SCHEMA, schema_engine.FEDERATION).validate(payload) == [
+        "$.id:min_length",
+        "$.id:pattern_mismatch",
+        "$.kind:enum_mismatch",
+        "$.items[0]:minimum",
+        "$.items[1]:expected_integer",
+        "$.zz:additional_property",
+        "$.extra:additional_property",
+    ]
+    assert schema_engine.compile_schema(_SCHEMA, schema_engine.REPLAY_ATTESTATION).validate(payload) == [
+        "$.id:min_length_violation",
+        "$.id:pattern_violation",
+        "$.items[0]:expected_integer:got_number",
+        "$.items[1]:expected_integer:got_string",
+        "$.extra:additional_property",
+        "$.zz:additional_property",
+    ]
+    assert schema_engine.compile_schema(_SCHEMA, schema_engine.PREFLIGHT).validate({"items": []}) == ["$.id:missing_required"]
+
+
+def test_load_schema_caches_by_stamp_and_digest(tmp_path: Path) -> None:
+    cache = schema_engine.SchemaCache()
+    first_path = tmp_path / "first.json"
+    second_path = tmp_path / "second.json"
+    first_path.write_text(json.dumps(_SCHEMA), encoding="utf-8")
+    second_path.write_text(json.dumps(_SCHEMA), encoding="utf-8")
+
+    compiled = cache.load(first_path, schema_engine.FEDERATION)
+    assert cache.load(second_path, schema_engine.FEDERATION) is compiled
+    assert cache.load(first_path, schema_engine.RESPONSE) is not compiled
+
+    first_path.write_text(json.dumps({"type": "object", "required": ["other"]}), encoding="utf-8")
+    assert cache.load(first_path, schema_engine.FEDERATION).validate({}) == ["$.other:missing_required"]
+    assert cache.stats()["entries"] == 3
+
+
+def test_deterministic_loads_charge_entropy_on_every_call(tmp_path: Path) -> None:
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text(json.dumps(_SCHEMA), encoding="utf-8")
+    cache = schema_engine.SchemaCache()
+
+    with deterministic_envelope("schema-load", budget=100) as ledger:
+        cache.load(schema_path, schema_engine.EVIDENCE_BUNDLE, deterministic=True)
+        cache.load(schema_path, schema_engine.EVIDENCE_BUNDLE, deterministic=True)
+
+    assert ledger.consumed == ENTROPY_COSTS[EntropySource.FILESYSTEM] * 2
@@ -0,0 +1,158 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from runtime import metrics
+from runtime.sandbox.isolation import ProcessIsolationBackend, WarmPoolIsolationBackend, select_isolation_backend
+from runtime.sandbox.manifest import SandboxManifest
+from runtime.sandbox.policy import default_sandbox_policy
+from runtime.sandbox.pytest_pool import PytestWorkerPool, WorkerPoolError, _Worker, shared_pool, warm_pool_supported
+from runtime.test_sandbox import TestSandbox, TestSandboxStatus
+
+pytestmark = pytest.mark.skipif(not warm_pool_supported(), reason="fork-server pool requires os.fork")
+
+
+@pytest.fixture()
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(metrics, "METRICS_PATH", tmp_path / "metrics.jsonl")
+    root = tmp_path / "project"
+    root.mkdir()
+    (root / "test_probe.py").write_text(
+        "import os\n"
+        "import sys\n"
+        "import time\n\n"
+        "def test_env():\n"
+        "    assert os.environ['PROBE'] == '1'\n"
+        "    assert 'probe_marker' not in sys.modules\n"
+        "    sys.modules['probe_marker'] = sys\n\n"
+        "def test_sleep():\n"
+        "    time.sleep(float(os.environ.get('PROBE_SLEEP', '0')))\n",
+        encoding="utf-8",
+    )
+    return root
+
+
+def _env(tmp_path: Path, **extra: str) -> dict[str, str]:
+    return {**os.environ, "PROBE": "1", "TMPDIR": str(tmp_path), **extra}
+
+
+def test_runs_reuse_worker_with_fresh_child_state(project: Path, tmp_path: Path) -> None:
+    with PytestWorkerPool(size=1) as pool:
+        for _ in range(2):
+            completed = pool.run(["-q", "-p", "no:cacheprovider"], cwd=project, env=_env(tmp_path), timeout_s=60)
+            assert completed.returncode == 0, completed.stdout + completed.stderr
+            assert "2 passed" in completed.stdout
+        failed = pool.run(["-q", "-p", "no:cacheprovider"], cwd=project, env=_env(tmp_path, PROBE="0"), timeout_s=60)
+        assert failed.returncode == 1
+        assert pool.stats()["started"] == 1
+        assert pool.stats()["runs"] == 3
+
+
+def test_workers_recycle_after_max_runs(project: Path, tmp_path: Path) -> None:
+    with PytestWorkerPool(size=1, max_runs_per_worker=1) as pool:
+        for _ in range(2):
+            assert pool.run(["-q", "-p", "no:cacheprovider"], cwd=project, env=_env(tmp_path), timeout_s=60).returncode == 0
+        stats = pool.stats()
+    assert stats["started"] == 2
+    assert stats["recycled"] == 2
+
+
+def test_timeout_kills_and_recycles_worker(project: Path, tmp_path: Path) -> None:
+    with PytestWorkerPool(size=1) as pool:
+        with pytest.raises(subprocess.TimeoutExpired):
+            pool.run(["-q", "-p", "no:cacheprovider"], cwd=project, env=_env(tmp_path, PROBE_SLEEP="30"), timeout_s=2)
+        assert pool.stats()["recycled"] == 1
+        assert pool.run(["-q", "-p", "no:cacheprovider"], cwd=project, env=_env(tmp_path), timeout_s=60).returncode == 0
+
+
+def test_warm_backend_runs_test_sandbox(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    policy = default_sandbox_policy()
+    manifest = SandboxManifest(
+        mutation_id="m1",
+        epoch_id="e1",
+        replay_seed="0000000000000001",
+        command=("-q",),
+        env=(("PYTHONDONTWRITEBYTECODE", "1"),),
+        mounts=(),
+        allowed_write_paths=policy.write_path_allowlist,
+        allowed_network_hosts=policy.network_egress_allowlist,
+        cpu_seconds=policy.cpu_seconds,
+        memory_mb=policy.memory_mb,
+        disk_mb=policy.disk_mb,
+        timeout_s=policy.timeout_s,
+        deterministic_clock=True,
+        deterministic_random=True,
+    )
+    monkeypatch.setenv("PROBE", "1")
+    with PytestWorkerPool(size=1) as pool:
+        backend = WarmPoolIsolationBackend(pool=pool)
+        assert backend.prepare(manifest=manifest, policy=policy).mode == "warm_pool"
+        result = backend.run(test_sandbox=TestSandbox(root_dir=project, timeout_s=60), args=["-q", "-p", "no:cacheprovider"], retries=0)
+    assert result.ok
+    assert result.status == TestSandboxStatus.OK
+
+
+def test_isolation_backend_selected_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("ADAAD_SANDBOX_ISOLATION_BACKEND", raising=False)
+    assert isinstance(select_isolation_backend(), ProcessIsolationBackend)
+    assert not isinstance(select_isolation_backend(), WarmPoolIsolationBackend)
+
+    monkeypatch.setenv("ADAAD_SANDBOX_ISOLATION_BACKEND", "warm_pool")
+    backend = select_isolation_backend()
+    assert isinstance(backend, WarmPoolIsolationBackend)
+    assert backend.pool is shared_pool()
+
+    monkeypatch.setenv("ADAAD_SANDBOX_ISOLATION_BACKEND", "bogus")
+    with pytest.raises(RuntimeError, match="sandbox_backend_unknown:bogus"):
+        select_isolation_backend()
+
+
+def test_pool_rejects_unlisted_preload() -> None:
+    with pytest.raises(WorkerPoolError, match="pytest_worker_unsupported_preload:os"):
+        PytestWorkerPool(size=1, preload=("pytest", "os"))
+
+
+def test_failed_acquire_leaves_no_output_files(project: Path, tmp_path: Path) -> None:
+    pool = PytestWorkerPool(size=1)
+    pool.close()
+    with pytest.raises(WorkerPoolError, match="pytest_worker_pool_closed"):
+        pool.run(["-q"], cwd=project, env=_env(tmp_path), timeout_s=60)
+    assert not list(tmp_path.glob("pytest-worker-*"))
+
+
+def test_unexpected_error_retires_worker_instead_of_leaking_it(project: Path, tmp_path: Path) -> None:
+    with PytestWorkerPool(size=1) as pool:
+        assert pool.run(["-q", "-p", "no:cacheprovider"], cwd=project, env=_env(tmp_path), timeout_s=60).returncode == 0
+        worker = pool._idle.queue[0]
+        worker.read_message = lambda timeout_s: {"returncode": "not-a-number"}
+        with pytest.raises(ValueError):
+            pool.run(["-q"], cwd=project, env=_env(tmp_path), timeout_s=60)
+        stats = pool.stats()
+        assert stats["live"] == 0
+        assert stats["recycled"] == 1
+        assert worker.process.poll() is not None
+        assert pool.run(["-q", "-p", "no:cacheprovider"], cwd=project, env=_env(tmp_path), timeout_s=60).returncode == 0
+
+
+def test_partial_line_does_not_block_past_timeout() -> None:
+    worker = _Worker.__new__(_Worker)
+    worker.runs = 0
+    worker._pending = b""
+    worker.process = subprocess.Popen(
+        [sys.executable, "-c", "import sys, time; sys.stdout.write('{\"ready\"'); sys.stdout.flush(); time.sleep(30)"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        start_new_session=True,
+    )
+    try:
+        started = time.monotonic()
+        assert worker.read_message(0.5) is None
+        assert time.monotonic() - started < 5
+    finally:
+        worker.kill()
@@ -43,3 +43,15 @@ def test_ledger_store_json_sqlite_parity(tmp_path) -> None:
 
     assert json_ledger.iter_records() == sqlite_ledger.iter_records()
     assert sqlite_ledger.verify_chain()["ok"] is True
+
+
+def test_ledger_store_iter_entries_is_lazy_and_matches_records(tmp_path) -> None:
+    for backend in ("json", "sqlite"):
+        ledger = ScoringLedgerStore(path=tmp_path / f"{backend}.jsonl", backend=backend)
+        ledger.append({"mutation": "a", "score": 0.9})
+        ledger.append({"mutation": "b", "score": 0.95})
+
+        stream = ledger.iter_entries()
+
+        assert not isinstance(stream, list)
+        assert list(stream) == ledger.iter_records()
@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from app.agents.discovery import scan_agent_dirs
+from app.agents.inventory import AgentInventory
+
+
+def _write_agent(agent_dir: Path, *, dream_scope: object = None) -> Path:
+    agent_dir.mkdir(parents=True, exist_ok=True)
+    meta = {"name": agent_dir.name}
+    if dream_scope is not None:
+        meta["dream_scope"] = dream_scope
+    (agent_dir / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+    (agent_dir / "dna.json").write_text("{}", encoding="utf-8")
+    (agent_dir / "certificate.json").write_text("{}", encoding="utf-8")
+    return agent_dir
+
+
+def _age_tree(root: Path, seconds: int = 60) -> None:
+    """Backdate every path so the inventory treats recorded stamps as settled."""
+    delta = seconds * 1_000_000_000
+    for path in sorted(root.rglob("*"), key=lambda p: len(p.parts), reverse=True) + [root]:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - delta))
+
+
+class AgentInventoryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name) / "agents"
+        (self.root / "lineage").mkdir(parents=True)
+        _write_agent(self.root / "alpha", dream_scope={"allow": ["mutation"]})
+        _write_agent(self.root / "bucket" / "beta")
+        (self.root / "bucket" / "not_an_agent").mkdir()
+        _write_agent(self.root / "agent_template")
+        _write_agent(self.root / "__pycache__" / "gamma")
+
+    def test_matches_uncached_scan_through_changes(self) -> None:
+        inventory = AgentInventory(self.root)
+        self.assertEqual(inventory.agent_dirs(), list(scan_agent_dirs(self.root)))
+        self.assertEqual([record.agent_id for record in inventory.refresh()], ["alpha", "bucket:beta"])
+
+        _write_agent(self.root / "bucket" / "delta")
+        shutil.rmtree(self.root / "alpha")
+        self.assertEqual(inventory.agent_dirs(), list(scan_agent_dirs(self.root)))
+        self.assertEqual([record.agent_id for record in inventory.refresh()], ["bucket:beta", "bucket:delta"])
+
+    def test_settled_tree_is_not_relisted_or_reread(self) -> None:
+        inventory = AgentInventory(self.root)
+        _age_tree(self.root)
+        first = inventory.refresh()
+        with mock.patch("app.agents.inventory._list_dirs", side_effect=AssertionError("relisted")), mock.patch(
+            "app.agents.inventory._read_json", side_effect=AssertionError("reread")
+        ):
+            self.assertEqual(inventory.refresh(), first)
+            # A fresh process starts from the persisted index.
+            self.assertEqual(AgentInventory(self.root).refresh(), first)
+
+    def test_meta_edit_updates_digest_and_scope(self) -> None:
+        inventory = AgentInventory(self.root)
+        _age_tree(self.root)
+        before = {record.agent_id: record for record in inventory.refresh()}
+        self.assertIsNone(before["bucket:beta"].dream_scope)
+        meta_path = self.root / "bucket" / "beta" / "meta.json"
+        meta_path.write_text(json.dumps({"dream_scope": {"allow": "mutation"}}), encoding="utf-8")
+        after = {record.agent_id: record for record in inventory.refresh()}
+        self.assertEqual(after["bucket:beta"].dream_scope, {"allow": "mutation"})
+        self.assertNotEqual(after["bucket:beta"].meta_digest, before["bucket:beta"].meta_digest)
+        self.assertEqual(after["alpha"], before["alpha"])
+
+    def test_latest_staged_prefers_newest_matching_candidate(self) -> None:
+        staging = self.root / "lineage" / "_staging"
+        for name, parent, age in (("old", "alpha", 30), ("new", "alpha", 10), ("other", "bucket:beta", 0)):
+            candidate = staging / name
+            candidate.mkdir(parents=True)
+            (candidate / "mutation.json").write_text(json.dumps({"parent": parent, "name": name}), encoding="utf-8")
+            stat = candidate.stat()
+            os.utime(candidate, ns=(stat.st_atime_ns, stat.st_mtime_ns - age * 1_000_000_000))
+        (staging / "broken").mkdir()
+        (staging / "broken" / "mutation.json").write_text("{", encoding="utf-8")
+        inventory = AgentInventory(self.root)
+
+        path, payload = inventory.latest_staged(staging, "alpha")
+        self.assertEqual((path, payload["name"]), (staging / "new", "new"))
+        shutil.rmtree(staging / "new")
+        path, payload = inventory.latest_staged(staging, "alpha")
+        self.assertEqual((path, payload["name"]), (staging / "old", "old"))
+        self.assertEqual(inventory.latest_staged(staging, "missing"), (None, None))
+        self.assertEqual(inventory.latest_staged(self.root / "nowhere", "alpha"), (None, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
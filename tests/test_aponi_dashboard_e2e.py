@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import json
+from http.client import HTTPConnection
+from http.server import ThreadingHTTPServer
 from pathlib import Path
 from urllib.request import urlopen
 
 from runtime.evolution.evidence_bundle import EvidenceBundleBuilder
 from runtime.evolution.lineage_v2 import LineageLedgerV2
+from security.ledger import journal
 from ui import aponi_dashboard
 
 
@@ -106,3 +109,141 @@ def test_replay_diff_http_endpoint_persists_export_bundle(tmp_path, monkeypatch)
     assert export_path.exists()
     persisted = json.loads(export_path.read_text(encoding="utf-8"))
     assert persisted["bundle_id"] == payload["bundle_id"]
+
+
+def test_threaded_dashboard_serves_cached_panels_with_etag(tmp_path, monkeypatch) -> None:
+    ledger = LineageLedgerV2(tmp_path / "lineage_v2.jsonl")
+    ledger.append_event("EpochStartEvent", {"epoch_id": "epoch-3", "state": {"x": 1}})
+    reads: list[int] = []
+    original_read_all = ledger.read_all
+
+    def _counting_read_all():
+        reads.append(1)
+        return original_read_all()
+
+    monkeypatch.setattr(ledger, "read_all", _counting_read_all)
+    monkeypatch.setattr(aponi_dashboard, "LineageLedgerV2", lambda: ledger)
+    monkeypatch.setattr(aponi_dashboard, "EvidenceBundleBuilder", _StaticBundleBuilder)
+
+    def _get(port: int, headers: dict[str, str] | None = None):
+        connection = HTTPConnection("127.0.0.1", port, timeout=5)
+        try:
+            connection.request("GET", "/evolution/live", headers=headers or {})
+            response = connection.getresponse()
+            return response.status, response.getheader("ETag"), response.read()
+        finally:
+            connection.close()
+
+    dashboard = aponi_dashboard.AponiDashboard(host="127.0.0.1", port=0, threaded=True, max_workers=2)
+    dashboard.start({"status": "ok"})
+    try:
+        assert isinstance(dashboard._server, ThreadingHTTPServer)
+        port = dashboard._server.server_port
+        status, etag, body = _get(port)
+        assert status == 200
+        assert etag
+        assert [entry["type"] for entry in json.loads(body)] == ["EpochStartEvent"]
+
+        status, revalidated_etag, body = _get(port, {"If-None-Match": etag})
+        assert (status, revalidated_etag, body) == (304, etag, b"")
+        assert len(reads) == 1
+
+        ledger.append_event("EpochEndEvent", {"epoch_id": "epoch-3", "state": {"x": 2}})
+        status, new_etag, body = _get(port, {"If-None-Match": etag})
+        assert status == 200
+        assert new_etag != etag
+        assert len(json.loads(body)) == 2
+        assert len(reads) == 2
+    finally:
+        dashboard.stop()
+
+
+def test_cached_lineage_panel_revalidates_after_journal_write(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(journal, "LEDGER_FILE", tmp_path / "lineage.jsonl")
+    monkeypatch.setattr(aponi_dashboard, "LineageLedgerV2", lambda: LineageLedgerV2(tmp_path / "lineage_v2.jsonl"))
+    monkeypatch.setattr(aponi_dashboard, "EvidenceBundleBuilder", _StaticBundleBuilder)
+    journal.write_entry("agent-a", "first")
+
+    def _get(port: int, headers: dict[str, str] | None = None):
+        connection = HTTPConnection("127.0.0.1", port, timeout=5)
+        try:
+            connection.request("GET", "/lineage", headers=headers or {})
+            response = connection.getresponse()
+            return response.status, response.getheader("ETag"), response.read()
+        finally:
+            connection.close()
+
+    dashboard = aponi_dashboard.AponiDashboard(host="127.0.0.1", port=0, threaded=True, max_workers=2)
+    dashboard.start({"status": "ok"})
+    try:
+        assert dashboard._server is not None
+        port = dashboard._server.server_port
+        status, etag, body = _get(port)
+        assert status == 200
+        assert [entry["action"] for entry in json.loads(body)] == ["first"]
+        assert _get(port, {"If-None-Match": etag})[0] == 304
+
+        journal.write_entry("agent-a", "second")
+        status, new_etag, body = _get(port, {"If-None-Match": etag})
+        assert status == 200
+        assert new_etag != etag
+        assert [entry["action"] for entry in json.loads(body)] == ["first", "second"]
+    finally:
+        dashboard.stop()
+
+
+def test_stream_endpoint_resumes_from_cursor_with_filters(tmp_path, monkeypatch) -> None:
+    ledger = LineageLedgerV2(tmp_path / "lineage_v2.jsonl")
+    ledger.append_event("EpochStartEvent", {"epoch_id": "epoch-4", "state": {}})
+    ledger.append_event("EpochStartEvent", {"epoch_id": "epoch-5", "state": {}})
+    ledger.append_event("EpochEndEvent", {"epoch_id": "epoch-5", "state": {}})
+    monkeypatch.setattr(aponi_dashboard, "LineageLedgerV2", lambda: ledger)
+    monkeypatch.setattr(aponi_dashboard, "EvidenceBundleBuilder", _StaticBundleBuilder)
+
+    dashboard = aponi_dashboard.AponiDashboard(host="127.0.0.1", port=0, threaded=False)
+    dashboard.start({"status": "ok"})
+    try:
+        assert dashboard._server is not None
+        port = dashboard._server.server_port
+        url = f"http://127.0.0.1:{port}/stream?sources=lineage&epoch_id=epoch-5&cursor=0.1.0"
+        with urlopen(url, timeout=5) as response:
+            content_type = response.headers["Content-Type"]
+            body = response.read().decode("utf-8")
+    finally:
+        dashboard.stop()
+
+    assert content_type.startswith("text/event-stream")
+    frames = [frame for frame in body.split("\n\n") if frame.startswith("id: ")]
+    records = [json.loads(frame.split("data: ", 1)[1])["record"] for frame in frames]
+    assert [record["type"] for record in records] == ["EpochStartEvent", "EpochEndEvent"]
+    assert all(record["payload"]["epoch_id"] == "epoch-5" for record in records)
+
+
+def test_streams_past_the_slot_cap_poll_and_close(tmp_path, monkeypatch) -> None:
+    ledger = LineageLedgerV2(tmp_path / "lineage_v2.jsonl")
+    ledger.append_event("EpochStartEvent", {"epoch_id": "epoch-6", "state": {}})
+    monkeypatch.setattr(aponi_dashboard, "LineageLedgerV2", lambda: ledger)
+    monkeypatch.setattr(aponi_dashboard, "EvidenceBundleBuilder", _StaticBundleBuilder)
+    monkeypatch.setattr(aponi_dashboard, "STREAM_MAX_SECONDS", 3.0)
+
+    dashboard = aponi_dashboard.AponiDashboard(host="127.0.0.1", port=0, threaded=True, max_workers=2)
+    dashboard.start({"status": "ok"})
+    held = None
+    try:
+        assert dashboard._server is not None
+        port = dashboard._server.server_port
+        url = f"http://127.0.0.1:{port}/stream?sources=lineage&cursor=0.0.0"
+        # Two workers leave one stream slot: the first stream is held open ...
+        held = urlopen(url, timeout=10)
+        while b"EpochStartEvent" not in held.readline():
+            pass
+        # ... the second gets the pending events and closes, and panels stay responsive.
+        with urlopen(url, timeout=2) as response:
+            body = response.read().decode("utf-8")
+        assert "EpochStartEvent" in body
+        with urlopen(f"http://127.0.0.1:{port}/state", timeout=2) as response:
+            assert response.status == 200
+    finally:
+        if held is not None:
+            held.close()
+        dashboard.stop()
@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import ast
+
+import pytest
+
+from adaad.core.ast_cache import AstCache
+from runtime.evolution.change_classifier import is_doc_change, is_functional_change
+
+
+def test_same_source_is_parsed_once_and_facts_are_memoized() -> None:
+    cache = AstCache()
+    source = "import os\nfrom json import dumps\nfrom . import sibling\n\nif os:\n    pass\n"
+
+    first = cache.parse(source, filename="a.py")
+    assert cache.parse(source, filename="b.py") is first
+    assert cache.import_roots(source) == frozenset({"os", "json"})
+    assert cache.cyclomatic_complexity(source) == 2
+    assert cache.stats() == {"entries": 1, "hits": 3, "misses": 1}
+
+
+def test_lru_evicts_oldest_source() -> None:
+    cache = AstCache(max_entries=2)
+    for idx in range(3):
+        cache.parse(f"value = {idx}\n")
+    assert cache.stats()["entries"] == 2
+    cache.parse("value = 0\n")
+    assert cache.stats()["misses"] == 4
+
+
+def test_syntax_errors_are_cached_and_report_caller_filename() -> None:
+    cache = AstCache()
+    with pytest.raises(SyntaxError) as first:
+        cache.parse("def broken(:\n", filename="one.py")
+    with pytest.raises(SyntaxError) as second:
+        cache.parse("def broken(:\n", filename="two.py")
+    assert first.value.filename == "one.py"
+    assert second.value.filename == "two.py"
+
+
+def test_stripped_dump_does_not_mutate_shared_tree() -> None:
+    cache = AstCache()
+    source = 'def f():\n    """doc"""\n    return 1\n'
+    tree = cache.parse(source)
+    before = ast.dump(tree)
+    assert cache.stripped_dump(source) == cache.stripped_dump('def f():\n    return 1\n')
+    assert ast.dump(tree) == before
+
+
+def test_change_classifier_leaves_cached_trees_intact() -> None:
+    old = ast.parse('def f():\n    """doc"""\n    return 1\n')
+    new = ast.parse('def f():\n    """doc"""\n    return 2\n')
+    assert is_functional_change(old, new) is True
+    assert isinstance(old.body[0].body[0], ast.Expr)
+    assert is_doc_change('def f():\n    """a"""\n    return 1\n', 'def f():\n    """b"""\n    return 1\n') is True
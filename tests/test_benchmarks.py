@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+
+from benchmarks import generators, harness, suite
+from benchmarks.__main__ import main
+from runtime.evolution.lineage_v2 import LineageLedgerV2
+from runtime.evolution.replay import ReplayEngine
+from security.ledger import journal
+
+
+def test_generated_ledgers_verify_and_replay(tmp_path) -> None:
+    ledger_path = tmp_path / "lineage_v2.jsonl"
+    epochs = generators.write_lineage_ledger(ledger_path, 25, epoch_size=10)
+    ledger = LineageLedgerV2(ledger_path)
+    ledger.verify_integrity()
+
+    assert epochs == ledger.list_epoch_ids() == ["bench-epoch-000000", "bench-epoch-000001", "bench-epoch-000002"]
+    for epoch_id in epochs:
+        assert ReplayEngine(ledger).replay_epoch(epoch_id)["digest"] == (ledger.get_expected_epoch_digest(epoch_id) or "sha256:0")
+
+    journal_path = tmp_path / "journal.jsonl"
+    generators.write_journal(journal_path, 12)
+    journal.verify_journal_integrity(journal_path=journal_path)
+
+
+def _document(**medians: float) -> dict:
+    return {
+        "schema_version": harness.RESULTS_SCHEMA_VERSION,
+        "results": [{"id": case_id, "median_s": value} for case_id, value in medians.items()],
+    }
+
+
+def test_compare_flags_regressions_against_thresholds() -> None:
+    baseline = _document(fast=1.0, slow=1.0, gone=1.0, noisy=1.0)
+    current = _document(fast=0.5, slow=1.3, new=1.0, noisy=1.4)
+
+    rows = {row.case_id: row.status for row in harness.compare(baseline, current, threshold=0.25, overrides={"noi*": 0.5})}
+
+    assert rows == {"fast": "improved", "slow": "regressed", "gone": "missing", "new": "new", "noisy": "ok"}
+
+
+def test_compare_command_exit_codes(tmp_path, capsys) -> None:
+    baseline_path = tmp_path / "baseline.json"
+    current_path = tmp_path / "current.json"
+    harness.write_results(_document(case=1.0), baseline_path)
+    harness.write_results(_document(case=1.2), current_path)
+
+    assert main(["compare", str(baseline_path), str(current_path)]) == 0
+    capsys.readouterr()
+    assert main(["compare", str(baseline_path), str(current_path), "--threshold", "0.1", "--format", "json"]) == 1
+    assert json.loads(capsys.readouterr().out)["regressions"] == ["case"]
+
+
+def test_quick_cases_run_isolated(tmp_path) -> None:
+    original_journal = journal.JOURNAL_PATH
+    selected = harness.select(suite.cases("quick"), ["journal.*", "lineage.append_event*"])
+    document = harness.run_cases(selected, profile="quick", scratch=tmp_path)
+
+    assert [row["id"] for row in document["results"]] == ["lineage.append_event[entries=1000]", "journal.append_tx[entries=1000]"]
+    assert all(row["samples"] == 20 and row["median_s"] > 0 for row in document["results"])
+    assert journal.JOURNAL_PATH == original_journal
+    assert list(tmp_path.iterdir()) == []
@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
+import os
 from pathlib import Path
+from typing import List
 
 import pytest
 
@@ -648,3 +650,172 @@ def test_resource_bounds_logs_warning_when_policy_document_empty(monkeypatch: py
     assert result["ok"] is True
     warning = next(item for item in events if item["event_type"] == "resource_bounds_policy_unavailable")
     assert warning["level"] == "WARNING"
+
+
+def _cache_request() -> MutationRequest:
+    return MutationRequest(
+        agent_id="test_subject",
+        generation_ts="now",
+        intent="test",
+        ops=[{"op": "replace"}],
+        signature="cryovant-static-test",
+        nonce="n",
+    )
+
+
+def test_verdict_cache_reuses_passing_verdicts(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ADAAD_CONSTITUTION_VERDICT_CACHE", "1")
+    constitution.clear_verdict_cache()
+    request = _cache_request()
+
+    first = constitution.evaluate_mutation(request, constitution.Tier.SANDBOX)
+    assert constitution.verdict_cache_stats()["hits"] == 0
+    second = constitution.evaluate_mutation(request, constitution.Tier.SANDBOX)
+
+    stats = constitution.verdict_cache_stats()
+    assert stats["hits"] >= 2
+    stable = {"single_file_scope", "signature_required", "entropy_budget_limit"}
+    first_rows = {row["rule"]: row for row in first["verdicts"] if row["rule"] in stable}
+    second_rows = {row["rule"]: row for row in second["verdicts"] if row["rule"] in stable}
+    assert first_rows == second_rows
+    assert first["passed"] == second["passed"]
+    constitution.clear_verdict_cache()
+
+
+def test_verdict_cache_invalidates_on_declared_input_change(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ADAAD_CONSTITUTION_VERDICT_CACHE", "1")
+    constitution.clear_verdict_cache()
+    request = _cache_request()
+
+    constitution.evaluate_mutation(request, constitution.Tier.SANDBOX)
+    monkeypatch.setenv("ADAAD_MAX_MUTATION_ENTROPY_BITS", "1")
+    verdict = constitution.evaluate_mutation(request, constitution.Tier.SANDBOX)
+
+    entropy = next(row for row in verdict["verdicts"] if row["rule"] == "entropy_budget_limit")
+    assert entropy["passed"] is False
+    assert entropy["details"]["details"]["max_mutation_entropy_bits"] == 1
+
+    monkeypatch.delenv("ADAAD_MAX_MUTATION_ENTROPY_BITS")
+    verdict = constitution.evaluate_mutation(request, constitution.Tier.SANDBOX)
+    entropy = next(row for row in verdict["verdicts"] if row["rule"] == "entropy_budget_limit")
+    assert entropy["passed"] is True
+    constitution.clear_verdict_cache()
+
+
+def test_file_stamps_inside_racy_window_are_not_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    target = tmp_path / "target.py"
+    target.write_text("x = 1\n", encoding="utf-8")
+    with pytest.raises(constitution._UnsettledFileStamp):
+        constitution._file_stamp(target)
+    monkeypatch.setattr(constitution, "RULE_APPLICABILITY_PATH", target)
+    monkeypatch.setattr(constitution, "_DOMAIN_CLASSIFICATION_CACHE", {})
+    monkeypatch.setattr(constitution, "_load_domain_classification_config", lambda: {})
+    constitution._extract_domain_classification_config()
+    assert constitution._DOMAIN_CLASSIFICATION_CACHE == {}
+
+    monkeypatch.setattr(constitution, "stamp_is_settled", lambda recorded_ns, mtime_ns: True)
+    stamp = constitution._file_stamp(target)
+    replacement = tmp_path / "replacement.py"
+    replacement.write_text("x = 2\n", encoding="utf-8")
+    os.utime(replacement, ns=(target.stat().st_atime_ns, target.stat().st_mtime_ns))
+    replacement.replace(target)
+    # Same size and mtime, but a different inode.
+    assert constitution._file_stamp(target) != stamp
+
+
+def test_verdict_cache_disabled_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("ADAAD_CONSTITUTION_VERDICT_CACHE", raising=False)
+    constitution.clear_verdict_cache()
+    constitution.evaluate_mutation(_cache_request(), constitution.Tier.SANDBOX)
+    assert constitution.verdict_cache_stats() == {"hits": 0, "misses": 0, "entries": 0}
+
+
+def test_parallel_validators_match_sequential_evaluation(monkeypatch: pytest.MonkeyPatch) -> None:
+    request = _cache_request()
+    monkeypatch.setenv("ADAAD_CONSTITUTION_MAX_WORKERS", "1")
+    sequential = constitution.evaluate_mutation(request, constitution.Tier.STABLE)
+    monkeypatch.setenv("ADAAD_CONSTITUTION_MAX_WORKERS", "4")
+    parallel = constitution.evaluate_mutation(request, constitution.Tier.STABLE)
+
+    assert [row["rule"] for row in parallel["verdicts"]] == [row["rule"] for row in sequential["verdicts"]]
+    assert parallel["blocking_failures"] == sequential["blocking_failures"]
+    # Ledger-reading rules see the entries the first evaluation appended, so compare outcomes.
+    def outcome(rows):
+        return [(row["rule"], row["severity"], row["passed"]) for row in rows]
+
+    assert outcome(parallel["governance_envelope"]["rules"]) == outcome(sequential["governance_envelope"]["rules"])
+
+
+def test_parallel_scheduler_honors_dependencies_and_envelope_context() -> None:
+    import threading
+
+    rules = [rule for rule in constitution.RULES if rule.name in {"lineage_continuity", "max_mutation_rate", "signature_required"}]
+    finished: List[str] = []
+    lock = threading.Lock()
+
+    def _evaluate(rule):
+        state = constitution.get_deterministic_envelope_state()
+        with lock:
+            if rule.name == "max_mutation_rate":
+                assert "lineage_continuity" in finished
+            finished.append(rule.name)
+        return {"ok": True, "tier": state.get("tier")}
+
+    with constitution.deterministic_envelope_scope({"tier": "STABLE"}):
+        results = constitution._run_validators(list(reversed(rules)), _evaluate, max_workers=3)
+
+    assert set(results) == {rule.name for rule in rules}
+    assert all(result["tier"] == "STABLE" for result in results.values())
+
+
+def test_parallel_validators_charge_the_active_entropy_envelope() -> None:
+    from runtime.governance.deterministic_envelope import (
+        ENTROPY_COSTS,
+        EntropySource,
+        charge_entropy,
+        deterministic_envelope,
+        get_current_ledger,
+    )
+
+    rules = [rule for rule in constitution.RULES if rule.name in {"lineage_continuity", "max_mutation_rate", "signature_required"}]
+
+    def _evaluate(rule):
+        charge_entropy(EntropySource.FILESYSTEM, f"validator:{rule.name}")
+        return {"ok": True, "ledger": get_current_ledger()}
+
+    with deterministic_envelope("epoch-parallel", budget=100) as ledger:
+        results = constitution._run_validators(rules, _evaluate, max_workers=3)
+
+    assert all(result["ledger"] is ledger for result in results.values())
+    assert ledger.consumed == len(rules) * ENTROPY_COSTS[EntropySource.FILESYSTEM]
+    assert [event.context for event in ledger.events] == [f"validator:{rule.name}" for rule in rules]
+
+
+def test_parallel_validator_side_effects_follow_rule_order(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import json
+    import threading
+
+    from runtime import metrics
+    from runtime.governance.deterministic_envelope import EntropySource, charge_entropy, deterministic_envelope
+
+    monkeypatch.setattr(metrics, "METRICS_PATH", tmp_path / "metrics.jsonl")
+    rules = [rule for rule in constitution.RULES if rule.name in {"single_file_scope", "ast_validity", "signature_required"}]
+    assert len(rules) == 3
+    last_done = threading.Event()
+
+    def _evaluate(rule):
+        # The first rule finishes last, so completion order is the reverse of rule order.
+        if rule is rules[0]:
+            assert last_done.wait(timeout=5)
+        charge_entropy(EntropySource.FILESYSTEM, f"validator:{rule.name}")
+        metrics.log(event_type="validator_probe", payload={"rule": rule.name})
+        if rule is rules[-1]:
+            last_done.set()
+        return {"ok": True}
+
+    with deterministic_envelope("epoch-parallel", budget=100) as ledger:
+        constitution._run_validators(rules, _evaluate, max_workers=3)
+
+    logged = [json.loads(line)["payload"]["rule"] for line in metrics.METRICS_PATH.read_text(encoding="utf-8").splitlines()]
+    assert logged == [rule.name for rule in rules]
+    assert [event.context for event in ledger.events] == [f"validator:{rule.name}" for rule in rules]
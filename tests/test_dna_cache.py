@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from app.agents import dna_cache
+from app.agents.dna_cache import DnaCache
+from app.agents.mutation_strategies import DEFAULT_REGISTRY
+from app.architect_agent import ArchitectAgent
+from runtime.tools.mutation_fs import file_hash
+
+
+def _write_agent(root: Path, name: str, dna: dict) -> Path:
+    agent_dir = root / name
+    agent_dir.mkdir(parents=True, exist_ok=True)
+    (agent_dir / "meta.json").write_text(json.dumps({"name": name}), encoding="utf-8")
+    (agent_dir / "certificate.json").write_text(json.dumps({"agent": name}), encoding="utf-8")
+    (agent_dir / "dna.json").write_text(json.dumps(dna), encoding="utf-8")
+    return agent_dir
+
+
+def _age(agent_dir: Path, seconds: int = 60) -> None:
+    """Backdate files so snapshots are outside the racy window."""
+    for name in ("meta.json", "certificate.json", "dna.json"):
+        path = agent_dir / name
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1_000_000_000))
+
+
+class DnaCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name)
+
+    def test_unchanged_agent_is_served_from_stat(self) -> None:
+        agent_dir = _write_agent(self.root, "alpha", {"traits": ["a"]})
+        _age(agent_dir)
+        cache = DnaCache()
+        first = cache.snapshot(agent_dir)
+        with mock.patch("app.agents.dna_cache._read", side_effect=AssertionError("unexpected read")):
+            second = cache.snapshot(agent_dir)
+        self.assertIs(first, second)
+        self.assertEqual(first.dna_hash, file_hash(agent_dir / "dna.json"))
+        self.assertEqual(cache.stats(), {"entries": 1, "hits": 1, "misses": 1})
+
+    def test_racy_snapshot_rehashes_and_sees_same_size_rewrite(self) -> None:
+        agent_dir = _write_agent(self.root, "alpha", {"version": 1})
+        cache = DnaCache()
+        self.assertEqual(cache.snapshot(agent_dir).dna, {"version": 1})
+        stat = (agent_dir / "dna.json").stat()
+        (agent_dir / "dna.json").write_text(json.dumps({"version": 2}), encoding="utf-8")
+        os.utime(agent_dir / "dna.json", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(cache.snapshot(agent_dir).dna, {"version": 2})
+
+    def test_touch_without_content_change_keeps_memoized_facts(self) -> None:
+        agent_dir = _write_agent(self.root, "alpha", {"traits": []})
+        _age(agent_dir)
+        cache = DnaCache()
+        calls = []
+        cache.memo(cache.snapshot(agent_dir), "fact", lambda dna: calls.append(dna) or len(calls))
+        _age(agent_dir, seconds=30)
+        value = cache.memo(cache.snapshot(agent_dir), "fact", lambda dna: calls.append(dna) or len(calls))
+        self.assertEqual(value, 1)
+        self.assertEqual(len(calls), 1)
+
+
+class ArchitectProposalTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.addCleanup(dna_cache.default_cache().clear)
+
+    def test_parallel_proposals_match_serial_order(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for index in range(12):
+                _write_agent(root, f"agent_{index:02d}", {"capabilities": ["versioning"] * (index % 2), "version": index})
+            architect = ArchitectAgent(root)
+            # Keep to strategies whose ops depend only on DNA (no clock, no provider).
+            deterministic = {name: DEFAULT_REGISTRY.get(name) for name in ("add_capability", "increment_version")}
+            with mock.patch("app.architect_agent.metrics.log"), mock.patch.dict(
+                DEFAULT_REGISTRY._strategies, deterministic, clear=True
+            ):
+                with mock.patch.dict(os.environ, {"ADAAD_ARCHITECT_WORKERS": "1"}):
+                    serial = architect.propose_mutations()
+                with mock.patch.dict(os.environ, {"ADAAD_ARCHITECT_WORKERS": "4"}):
+                    parallel = architect.propose_mutations()
+
+        self.assertEqual([p.agent_id for p in parallel], [f"agent_{index:02d}" for index in range(12)])
+        self.assertEqual([(p.agent_id, p.intent, p.ops) for p in parallel], [(p.agent_id, p.intent, p.ops) for p in serial])
+        self.assertEqual({p.intent for p in parallel}, {"add_capability", "increment_version"})
+        self.assertTrue(all(p.targets[0].hash_preimage for p in parallel))
+
+
+if __name__ == "__main__":
+    unittest.main()
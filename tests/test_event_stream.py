@@ -0,0 +1,159 @@
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from runtime.event_stream import EventStreamHub, StreamCursor, StreamCursorError, aiter_sse, format_sse, iter_sse
+from runtime.evolution.lineage_v2 import LineageLedgerV2
+
+
+def _append_metric(path: Path, event: str, epoch_id: str = "") -> None:
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"event": event, "payload": {"epoch_id": epoch_id}}) + "\n")
+
+
+@pytest.fixture()
+def sources(tmp_path: Path):
+    ledger = LineageLedgerV2(tmp_path / "lineage_v2.jsonl")
+    metrics_path = tmp_path / "metrics.jsonl"
+    metrics_path.touch()
+    ledger.append_event("EpochStartEvent", {"epoch_id": "epoch-0"})
+    return ledger, metrics_path
+
+
+def test_head_cursor_streams_only_new_events(sources) -> None:
+    ledger, metrics_path = sources
+    hub = EventStreamHub(ledger.ledger_path, metrics_path)
+    head = hub.head()
+
+    ledger.append_event("EpochStartEvent", {"epoch_id": "epoch-1"})
+    _append_metric(metrics_path, "fitness_scored", "epoch-1")
+    events, cursor = hub.read(head)
+
+    assert [(event.source, event.record.get("type") or event.record.get("event")) for event in events] == [
+        ("lineage", "EpochStartEvent"),
+        ("metrics", "fitness_scored"),
+    ]
+    assert events[-1].cursor == cursor
+    assert hub.read(cursor) == ([], cursor)
+
+
+def test_observers_share_one_read_per_append(sources) -> None:
+    ledger, metrics_path = sources
+    hub = EventStreamHub(ledger.ledger_path, metrics_path)
+    cursors = [hub.head() for _ in range(5)]
+
+    ledger.append_event("MutationBundleEvent", {"epoch_id": "epoch-0"})
+    results = [hub.read(cursor, sources=["lineage"]) for cursor in cursors]
+    results += [hub.read(cursor, sources=["lineage"]) for cursor in cursors]
+
+    assert all(len(events) == 1 for events, _ in results[:5])
+    assert hub.stats()["lineage_reads"] == 1
+
+
+def test_filters_advance_cursor_past_skipped_records(sources) -> None:
+    ledger, metrics_path = sources
+    hub = EventStreamHub(ledger.ledger_path, metrics_path)
+    head = hub.head()
+    ledger.append_event("EpochStartEvent", {"epoch_id": "epoch-1"})
+    ledger.append_event("EpochEndEvent", {"epoch_id": "epoch-1"})
+    ledger.append_event("EpochStartEvent", {"epoch_id": "epoch-2"})
+    _append_metric(metrics_path, "fitness_scored", "epoch-2")
+
+    events, cursor = hub.read(head, event_types=["EpochStartEvent", "fitness_scored"], epoch_id="epoch-2")
+
+    assert [event.record.get("type") or event.record.get("event") for event in events] == ["EpochStartEvent", "fitness_scored"]
+    assert cursor == hub.head()
+
+
+def test_resume_from_cursor_before_buffer_reads_history(sources) -> None:
+    ledger, metrics_path = sources
+    ledger.append_event("EpochEndEvent", {"epoch_id": "epoch-0"})
+    hub = EventStreamHub(ledger.ledger_path, metrics_path)
+    hub.head()
+
+    events, cursor = hub.read(StreamCursor.parse("0.1.0"), sources=["lineage"])
+
+    assert [event.record["type"] for event in events] == ["EpochStartEvent", "EpochEndEvent"]
+    assert cursor.lineage == hub.head().lineage
+    frame = format_sse(events[0])
+    assert frame.startswith(f"id: {events[0].cursor.token()}\nevent: lineage\ndata: ")
+    assert StreamCursor.parse(events[0].cursor.token()) == events[0].cursor
+
+
+def test_iter_sse_single_batch_and_invalid_cursor(sources) -> None:
+    ledger, metrics_path = sources
+    hub = EventStreamHub(ledger.ledger_path, metrics_path)
+    head = hub.head()
+    _append_metric(metrics_path, "governance_review_quality")
+
+    frames = list(iter_sse(hub, head, max_duration_s=0.0, retry_ms=500))
+
+    assert frames[0] == "retry: 500\n\n"
+    assert len(frames) == 2 and "event: metrics" in frames[1]
+    with pytest.raises(StreamCursorError):
+        StreamCursor.parse("not-a-cursor")
+
+
+def test_iter_sse_transform_rewrites_records_before_framing(sources) -> None:
+    ledger, metrics_path = sources
+    hub = EventStreamHub(ledger.ledger_path, metrics_path)
+    head = hub.head()
+    ledger.append_event("MutationBundleEvent", {"epoch_id": "epoch-1", "certificate": {"signature": "secret"}})
+    _append_metric(metrics_path, "governance_review_quality")
+
+    def _strip_certificate(source, record):
+        if source != "lineage":
+            return record
+        return {**record, "payload": {key: value for key, value in record["payload"].items() if key != "certificate"}}
+
+    frames = list(iter_sse(hub, head, max_duration_s=0.0, transform=_strip_certificate))
+
+    assert len(frames) == 2
+    assert "event: lineage" in frames[0] and "secret" not in frames[0]
+    assert "event: metrics" in frames[1]
+
+
+def test_aiter_sse_yields_same_frames_as_iter_sse(sources) -> None:
+    ledger, metrics_path = sources
+    hub = EventStreamHub(ledger.ledger_path, metrics_path)
+    head = hub.head()
+    ledger.append_event("EpochEndEvent", {"epoch_id": "epoch-0"})
+    _append_metric(metrics_path, "governance_review_quality")
+
+    async def _collect() -> list[str]:
+        return [frame async for frame in aiter_sse(hub, head, max_duration_s=0.0, retry_ms=500)]
+
+    assert asyncio.run(_collect()) == list(iter_sse(hub, head, max_duration_s=0.0, retry_ms=500))
+
+
+def test_aiter_sse_reads_off_the_event_loop_thread(sources, monkeypatch: pytest.MonkeyPatch) -> None:
+    import threading
+
+    ledger, metrics_path = sources
+    hub = EventStreamHub(ledger.ledger_path, metrics_path)
+    head = hub.head()
+    ledger.append_event("EpochEndEvent", {"epoch_id": "epoch-0"})
+    reader_threads: list[int] = []
+    original_read = hub.read
+
+    def _recording_read(*args, **kwargs):
+        reader_threads.append(threading.get_ident())
+        return original_read(*args, **kwargs)
+
+    monkeypatch.setattr(hub, "read", _recording_read)
+
+    async def _collect() -> tuple[int, list[str]]:
+        frames = [frame async for frame in aiter_sse(hub, head, poll_interval_s=0.01, max_duration_s=0.05)]
+        return threading.get_ident(), frames
+
+    loop_thread, frames = asyncio.run(_collect())
+
+    assert any("EpochEndEvent" in frame for frame in frames)
+    assert len(reader_threads) >= 2
+    assert loop_thread not in reader_threads
@@ -1,17 +1,21 @@
 # SPDX-License-Identifier: Apache-2.0
 
+import json
 import tempfile
 import unittest
 from pathlib import Path
 from unittest import mock
 
 from app.agents.mutation_request import MutationRequest, MutationTarget
+from runtime.evolution import replay as replay_module
+from runtime.evolution.checkpoint_registry import CheckpointRegistry
 from runtime.evolution.epoch import EpochManager
 from runtime.evolution.governor import EvolutionGovernor
 from runtime.evolution.lineage_v2 import LineageLedgerV2
 from runtime.evolution.replay import ReplayEngine
 from runtime.evolution.replay_verifier import ReplayVerifier
 from runtime.evolution.runtime import EvolutionRuntime
+from runtime.governance.foundation import SeededDeterminismProvider
 
 
 class EvolutionRuntimeComponentsTest(unittest.TestCase):
@@ -68,7 +72,7 @@ class EvolutionRuntimeComponentsTest(unittest.TestCase):
 
     def test_replay_preflight_reports_explicit_divergence_fields(self) -> None:
         runtime = EvolutionRuntime()
-        runtime.verify_epoch = mock.Mock(return_value={
+        runtime.verify_epochs = mock.Mock(return_value=[{
             "epoch_id": "epoch-1",
             "baseline_epoch": "epoch-1",
             "baseline_source": "lineage_epoch_digest",
@@ -78,7 +82,7 @@ class EvolutionRuntimeComponentsTest(unittest.TestCase):
             "decision": "diverge",
             "replay_score": 0.4,
             "cause_buckets": {"digest_mismatch": True},
-        })
+        }])
         runtime.ledger.list_epoch_ids = mock.Mock(return_value=["epoch-1"])
         runtime.governor.enter_fail_closed = mock.Mock()
 
@@ -95,5 +99,83 @@ class EvolutionRuntimeComponentsTest(unittest.TestCase):
         self.assertTrue(detail["cause_buckets"]["digest_mismatch"])
 
 
+class BatchReplayVerificationTest(unittest.TestCase):
+    EPOCHS = ("epoch-a", "epoch-b", "epoch-c")
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _ledger(self, name: str) -> LineageLedgerV2:
+        ledger = LineageLedgerV2(Path(self.tmp.name) / name / "lineage_v2.jsonl")
+        # Interleave epochs so partitioning cannot rely on contiguous spans.
+        for epoch_id in self.EPOCHS:
+            ledger.append_event("EpochStartEvent", {"epoch_id": epoch_id})
+        for index in range(4):
+            for epoch_id in self.EPOCHS:
+                ledger.append_bundle_with_digest(
+                    epoch_id,
+                    {"bundle_id": f"{epoch_id}-{index}", "impact": 0.1 * index, "certificate": {"bundle_id": f"{epoch_id}-{index}"}},
+                )
+        for epoch_id in self.EPOCHS:
+            ledger.append_event("EpochEndEvent", {"epoch_id": epoch_id})
+        return ledger
+
+    def _runtime(self, ledger: LineageLedgerV2) -> EvolutionRuntime:
+        runtime = EvolutionRuntime()
+        runtime.ledger = ledger
+        runtime.governor = EvolutionGovernor(ledger=ledger, provider=SeededDeterminismProvider(seed="batch-replay"))
+        runtime.replay_engine = ReplayEngine(ledger)
+        runtime.checkpoint_registry = CheckpointRegistry(ledger, provider=runtime.governor.provider)
+        runtime.baseline_store.find_for_epoch = lambda _epoch_id: None
+        return runtime
+
+    def test_verify_epochs_matches_sequential_verification(self) -> None:
+        sequential_ledger = self._ledger("sequential")
+        batch_ledger = self._ledger("batch")
+        sequential = [self._runtime(sequential_ledger).verify_epoch(epoch_id) for epoch_id in self.EPOCHS]
+        with mock.patch.object(LineageLedgerV2, "read_epoch", side_effect=AssertionError("batch must not re-read epochs")):
+            batch = self._runtime(batch_ledger).verify_epochs()
+
+        self.assertEqual(batch, sequential)
+        self.assertTrue(all(result["checkpoint_verification"]["passed"] for result in batch))
+        self.assertEqual(batch_ledger.ledger_path.read_bytes(), sequential_ledger.ledger_path.read_bytes())
+        batch_ledger.verify_integrity()
+
+    def test_process_pool_replay_matches_in_process_replay(self) -> None:
+        ledger = self._ledger("pool")
+        engine = ReplayEngine(ledger)
+        expected = {epoch_id: engine.replay_epoch(epoch_id) for epoch_id in self.EPOCHS}
+        with mock.patch.object(replay_module, "REPLAY_PARALLEL_MIN_EVENTS", 0):
+            pooled = engine.replay_epochs(max_workers=2)
+        self.assertEqual(list(pooled), list(self.EPOCHS))
+        self.assertEqual(pooled, expected)
+
+    def test_verify_epochs_fails_closed_on_integrity_error(self) -> None:
+        ledger = self._ledger("tampered")
+        lines = ledger.ledger_path.read_text(encoding="utf-8").splitlines()
+        lines[6] = lines[6].replace('"impact": 0.1', '"impact": 0.9')
+        ledger.ledger_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        runtime = self._runtime(ledger)
+        runtime._enter_fail_closed_replay = mock.Mock()
+
+        results = runtime.verify_epochs(list(self.EPOCHS))
+
+        self.assertEqual([result["decision"] for result in results], ["fail_closed"] * 3)
+        self.assertEqual(runtime._enter_fail_closed_replay.call_count, 3)
+
+
+    def test_verify_epochs_fails_closed_on_edited_epoch_index(self) -> None:
+        ledger = self._ledger("edited-index")
+        index = json.loads(ledger.epoch_index_path.read_text(encoding="utf-8"))
+        del index["epochs"]["epoch-c"]
+        ledger.epoch_index_path.write_text(json.dumps(index), encoding="utf-8")
+        runtime = self._runtime(LineageLedgerV2(ledger.ledger_path))
+        runtime._enter_fail_closed_replay = mock.Mock()
+
+        self.assertFalse(runtime.verify_all_epochs())
+        runtime._enter_fail_closed_replay.assert_called_once()
+
+
 if __name__ == "__main__":
     unittest.main()
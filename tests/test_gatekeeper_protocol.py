@@ -103,6 +103,40 @@ class GatekeeperProtocolTest(unittest.TestCase):
             self.assertIn("hash_persist_failed", payload["reasons"])
             self.assertIsNotNone(payload["persistence_error"])
 
+    def test_unchanged_stat_skips_rehash(self) -> None:
+        with _in_temp_repo():
+            for name in ("app/alpha.txt", "app/nested/beta.txt"):
+                Path(name).parent.mkdir(parents=True, exist_ok=True)
+                Path(name).write_text(name, encoding="utf-8")
+                os.utime(name, ns=(1_000_000_000, 1_000_000_000))
+
+            first = run_gatekeeper()
+            second = run_gatekeeper()
+
+            self.assertEqual(first["rehashed"], 2)
+            self.assertEqual(second["rehashed"], 0)
+            self.assertEqual(first["hash"], second["hash"])
+            self.assertEqual(first["merkle_root"], second["merkle_root"])
+
+    def test_drift_report_lists_changed_files_and_subtrees(self) -> None:
+        with _in_temp_repo():
+            for name in ("app/alpha.txt", "app/nested/beta.txt", "app/other/gamma.txt"):
+                Path(name).parent.mkdir(parents=True, exist_ok=True)
+                Path(name).write_text(name, encoding="utf-8")
+            run_gatekeeper()
+
+            Path("app/nested/beta.txt").write_text("changed", encoding="utf-8")
+            Path("app/nested/deeper").mkdir()
+            Path("app/nested/deeper/delta.txt").write_text("new", encoding="utf-8")
+            payload = run_gatekeeper()
+
+            self.assertIn("drift_detected", payload["reasons"])
+            report = payload["drift_report"]
+            self.assertEqual(report["added"], ["app/nested/deeper/delta.txt"])
+            self.assertEqual(report["removed"], [])
+            self.assertEqual(report["modified"], ["app/nested/beta.txt"])
+            self.assertEqual(report["subtrees"], ["app", "app/nested", "app/nested/deeper"])
+
 
 if __name__ == "__main__":
     unittest.main()
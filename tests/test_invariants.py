@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
+import os
 from pathlib import Path
 
 from runtime import invariants
@@ -36,3 +37,30 @@ def test_scan_banned_imports_ignores_virtualenv_dirs(tmp_path: Path, monkeypatch
     ok, failures = invariants.scan_banned_imports()
     assert ok is True
     assert failures == []
+
+
+def test_source_scanner_rescans_only_modified_files(tmp_path: Path, monkeypatch) -> None:
+    (tmp_path / "app").mkdir(parents=True)
+    (tmp_path / "archives" / "old").mkdir(parents=True)
+    (tmp_path / "archives" / "old" / "legacy.py").write_text("import core\n", encoding="utf-8")
+    for index in range(3):
+        source = tmp_path / "app" / f"module_{index}.py"
+        source.write_text(f"VALUE = {index}\n", encoding="utf-8")
+        os.utime(source, ns=(1_000_000_000, 1_000_000_000))
+
+    monkeypatch.setattr(invariants, "ROOT_DIR", tmp_path)
+    scanner = invariants.source_scanner()
+    scanner.clear()
+
+    assert invariants.scan_banned_imports() == (True, [])
+    assert scanner.stats() == {"files": 3, "rescanned": 3}
+    assert invariants.scan_absolute_paths() == (True, [])
+    assert scanner.stats()["rescanned"] == 0
+
+    bad_path = "/ho" + "me/user/data"
+    (tmp_path / "app" / "module_1.py").write_text(f'PATH = "{bad_path}"\nimport /abs\n', encoding="utf-8")
+    ok, failures = invariants.scan_absolute_paths()
+    assert scanner.stats()["rescanned"] == 1
+    assert ok is False
+    assert failures == [f"{tmp_path / 'app' / 'module_1.py'}:1:PATH = \"{bad_path}\""]
+    assert invariants.scan_banned_imports() == (False, [f"{tmp_path / 'app' / 'module_1.py'}:2:import /abs"])
@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from runtime.evolution.lineage_v2 import LineageIntegrityError, LineageLedgerV2
+
+
+def _seed(ledger: LineageLedgerV2) -> None:
+    ledger.append_event("EpochStartEvent", {"epoch_id": "ep-1"})
+    ledger.append_event("EpochStartEvent", {"epoch_id": "ep-2"})
+    ledger.append_bundle_with_digest("ep-1", {"epoch_id": "ep-1", "bundle_id": "b1", "impact": 0.1, "certificate": {"bundle_id": "b1"}})
+    ledger.append_event("GovernanceDecisionEvent", {"decision": "accept"})
+    ledger.append_bundle_with_digest("ep-2", {"epoch_id": "ep-2", "bundle_id": "b2", "impact": 0.2, "certificate": {"bundle_id": "b2"}})
+    ledger.append_event("EpochCheckpointEvent", {"epoch_id": "ep-1", "checkpoint_hash": "sha256:" + "c" * 64})
+    ledger.append_event("EpochEndEvent", {"epoch_id": "ep-1"})
+
+
+def test_read_epoch_matches_full_scan_filter(tmp_path: Path) -> None:
+    ledger = LineageLedgerV2(tmp_path / "lineage_v2.jsonl")
+    _seed(ledger)
+
+    for epoch_id in ("ep-1", "ep-2"):
+        expected = [entry for entry in ledger.read_all() if entry.get("payload", {}).get("epoch_id") == epoch_id]
+        assert ledger.read_epoch(epoch_id) == expected
+    assert ledger.read_epoch("ep-missing") == []
+    assert ledger.list_epoch_ids() == ["ep-1", "ep-2"]
+
+
+def test_iter_epochs_yields_each_epoch_once_completed(tmp_path: Path) -> None:
+    ledger = LineageLedgerV2(tmp_path / "lineage_v2.jsonl")
+    _seed(ledger)
+
+    streamed = list(ledger.iter_epochs(["ep-2", "ep-1", "ep-missing", "ep-2"]))
+
+    assert [epoch_id for epoch_id, _ in streamed] == ["ep-2", "ep-1"]
+    assert dict(streamed) == {"ep-1": ledger.read_epoch("ep-1"), "ep-2": ledger.read_epoch("ep-2")}
+    assert list(ledger.iter_epochs(["ep-missing"])) == []
+
+
+def _forge_bundle(path: Path, bundle_id: str) -> None:
+    """Rewrite one bundle line at the same length with a recomputed self-hash."""
+    lines = path.read_bytes().splitlines(keepends=True)
+    for number, line in enumerate(lines):
+        entry = json.loads(line)
+        if entry["payload"].get("bundle_id") == bundle_id:
+            entry["payload"]["impact"] = 0.9
+            body = {key: value for key, value in entry.items() if key != "hash"}
+            entry["hash"] = LineageLedgerV2._compute_hash(entry["prev_hash"], body)
+            forged = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+            assert len(forged) == len(line)
+            lines[number] = forged
+    path.write_bytes(b"".join(lines))
+
+
+@pytest.mark.parametrize("bundle_id, epoch_id", [("b1", "ep-1"), ("b2", "ep-2")])
+def test_read_epoch_rejects_forged_self_hash(tmp_path: Path, bundle_id: str, epoch_id: str) -> None:
+    path = tmp_path / "lineage_v2.jsonl"
+    ledger = LineageLedgerV2(path)
+    _seed(ledger)
+    ledger.list_epoch_ids()
+    _forge_bundle(path, bundle_id)
+
+    with pytest.raises(LineageIntegrityError, match="lineage_prev_hash_mismatch"):
+        ledger.read_epoch(epoch_id)
+    with pytest.raises(LineageIntegrityError, match="lineage_prev_hash_mismatch"):
+        list(ledger.iter_epochs([epoch_id]))
+
+
+def test_epoch_summary_tracks_counts_and_latest_digests(tmp_path: Path) -> None:
+    ledger = LineageLedgerV2(tmp_path / "lineage_v2.jsonl")
+    _seed(ledger)
+
+    summary = ledger.get_epoch_summary("ep-1")
+    assert summary is not None
+    assert summary["event_count"] == 4
+    assert summary["event_counts"] == {
+        "EpochStartEvent": 1,
+        "MutationBundleEvent": 1,
+        "EpochCheckpointEvent": 1,
+        "EpochEndEvent": 1,
+    }
+    assert summary["checkpoint_hash"] == "sha256:" + "c" * 64
+    assert summary["epoch_digest"] == ledger.compute_incremental_epoch_digest("ep-1")
+
+
+def test_epoch_index_rebuilds_when_missing_or_stale(tmp_path: Path) -> None:
+    path = tmp_path / "lineage_v2.jsonl"
+    ledger = LineageLedgerV2(path)
+    _seed(ledger)
+    expected = ledger.read_epoch("ep-2")
+
+    ledger.epoch_index_path.unlink()
+    fresh = LineageLedgerV2(path)
+    assert fresh.read_epoch("ep-2") == expected
+    assert json.loads(fresh.epoch_index_path.read_text(encoding="utf-8"))["offset"] == path.stat().st_size
+
+    other = LineageLedgerV2(path)
+    other.epoch_index_path.write_text(json.dumps({"epochs": {}}), encoding="utf-8")
+    other.append_event("MutationBundleEvent", {"epoch_id": "ep-3", "bundle_id": "b3"})
+    assert ledger.list_epoch_ids() == ["ep-1", "ep-2", "ep-3"]
+    assert [entry["payload"]["bundle_id"] for entry in ledger.read_epoch("ep-3")] == ["b3"]
+
+
+def test_reindexed_scan_fails_closed_on_edited_sidecar(tmp_path: Path) -> None:
+    ledger = LineageLedgerV2(tmp_path / "lineage_v2.jsonl")
+    _seed(ledger)
+    index = json.loads(ledger.epoch_index_path.read_text(encoding="utf-8"))
+    del index["epochs"]["ep-2"]
+    ledger.epoch_index_path.write_text(json.dumps(index), encoding="utf-8")
+
+    reader = LineageLedgerV2(ledger.ledger_path)
+    assert reader.list_epoch_ids() == ["ep-1"]  # tail anchor still matches
+    with pytest.raises(LineageIntegrityError, match="lineage_epoch_index_mismatch"):
+        list(reader.iter_entries_reindexed())
+
+    # The rebuilt index replaced the edited sidecar.
+    assert LineageLedgerV2(ledger.ledger_path).list_epoch_ids() == ["ep-1", "ep-2"]
+    assert list(reader.iter_entries_reindexed()) == ledger.read_all()
@@ -150,3 +150,69 @@ def test_lineage_append_blocked_after_corruption(tmp_path: Path) -> None:
 
     with pytest.raises(LineageIntegrityError, match="lineage_prev_hash_mismatch"):
         ledger.append_event("EpochEndEvent", {"epoch_id": "ep-1"})
+
+
+def test_lineage_append_persists_tail_state(tmp_path: Path) -> None:
+    path = tmp_path / "lineage_v2.jsonl"
+    ledger = LineageLedgerV2(path)
+    ledger.append_event("EpochStartEvent", {"epoch_id": "ep-1"})
+    second = ledger.append_event("EpochEndEvent", {"epoch_id": "ep-1"})
+
+    state = json.loads(ledger.tail_state_path.read_text(encoding="utf-8"))
+    assert state["last_hash"] == second["hash"]
+    assert state["offset"] == path.stat().st_size
+    assert path.read_bytes()[state["entry_offset"] :].startswith(b'{"type": "EpochEndEvent"')
+
+
+def test_lineage_append_verifies_external_appends_incrementally(tmp_path: Path) -> None:
+    path = tmp_path / "lineage_v2.jsonl"
+    writer = LineageLedgerV2(path)
+    writer.append_event("EpochStartEvent", {"epoch_id": "ep-1"})
+
+    other = LineageLedgerV2(path)
+    other.tail_state_path.unlink()
+    other.append_event("MutationBundleEvent", {"epoch_id": "ep-1", "bundle_id": "b1"})
+
+    entry = writer.append_event("EpochEndEvent", {"epoch_id": "ep-1"})
+    writer.verify_integrity()
+    assert entry["prev_hash"] == json.loads(path.read_text(encoding="utf-8").splitlines()[1])["hash"]
+
+
+def test_lineage_append_rescans_after_truncation(tmp_path: Path) -> None:
+    path = tmp_path / "lineage_v2.jsonl"
+    ledger = LineageLedgerV2(path)
+    first = ledger.append_event("EpochStartEvent", {"epoch_id": "ep-1"})
+    ledger.append_event("EpochEndEvent", {"epoch_id": "ep-1"})
+
+    path.write_text(path.read_text(encoding="utf-8").splitlines(keepends=True)[0], encoding="utf-8")
+
+    entry = ledger.append_event("EpochEndEvent", {"epoch_id": "ep-1"})
+    assert entry["prev_hash"] == first["hash"]
+    ledger.verify_integrity()
+
+
+def test_lineage_append_blocked_after_tampering_new_bytes(tmp_path: Path) -> None:
+    path = tmp_path / "lineage_v2.jsonl"
+    ledger = LineageLedgerV2(path)
+    ledger.append_event("EpochStartEvent", {"epoch_id": "ep-1"})
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"type": "Forged", "payload": {}, "prev_hash": "b" * 64, "hash": "c" * 64}) + "\n")
+
+    with pytest.raises(LineageIntegrityError, match="lineage_prev_hash_mismatch:line2"):
+        ledger.append_event("EpochEndEvent", {"epoch_id": "ep-1"})
+
+
+def test_lineage_iter_entries_verifies_while_streaming(tmp_path: Path) -> None:
+    path = tmp_path / "lineage_v2.jsonl"
+    ledger = LineageLedgerV2(path)
+    ledger.append_event("EpochStartEvent", {"epoch_id": "ep-1"})
+    ledger.append_event("EpochEndEvent", {"epoch_id": "ep-1"})
+    lines = path.read_text(encoding="utf-8").splitlines()
+    tampered = json.loads(lines[1])
+    tampered["payload"]["epoch_id"] = "ep-forged"
+    path.write_text(lines[0] + "\n" + json.dumps(tampered, ensure_ascii=False) + "\n", encoding="utf-8")
+
+    stream = ledger.iter_entries()
+    assert next(stream)["type"] == "EpochStartEvent"
+    with pytest.raises(LineageIntegrityError, match="lineage_hash_mismatch:line2"):
+        next(stream)
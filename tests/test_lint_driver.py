@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+from pathlib import Path
+
+from tools import lint_determinism, lint_driver, lint_import_paths
+
+
+def _tree(root: Path) -> None:
+    files = {
+        "runtime/governance/bad.py": "def run(x):\n    return eval(x)\n",
+        "runtime/governance/clean.py": "VALUE = 1\n",
+        "runtime/evolution/broken.py": "def run(:\n",
+        "app/main.py": "import governance.core\n",
+    }
+    for relative, content in files.items():
+        (root / relative).parent.mkdir(parents=True, exist_ok=True)
+        (root / relative).write_text(content, encoding="utf-8")
+
+
+def test_lint_driver_single_parse_matches_linters_and_reuses_cache(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(lint_import_paths, "REPO_ROOT", tmp_path)
+    monkeypatch.setattr(lint_determinism, "REPO_ROOT", tmp_path)
+    _tree(tmp_path)
+    cache_path = tmp_path / ".lint_cache" / "lint_results.json"
+    roots = [tmp_path / "runtime", tmp_path / "app"]
+
+    issues, stats = lint_driver.run(roots, jobs=1, cache_path=cache_path)
+    assert stats == {"files": 4, "cached": 0, "linted": 4}
+    assert [(issue.linter, issue.path, issue.line, issue.message) for issue in issues] == [
+        ("import_paths", "app/main.py", 1, lint_import_paths.VIOLATION_MESSAGE),
+        ("determinism", "runtime/evolution/broken.py", 1, "syntax_error:invalid syntax"),
+        ("import_paths", "runtime/evolution/broken.py", 1, "syntax_error"),
+        ("determinism", "runtime/governance/bad.py", 2, "forbidden_dynamic_execution"),
+    ]
+    for path in (tmp_path / "runtime" / "governance" / "bad.py", tmp_path / "app" / "main.py"):
+        expected = sorted((i.line, i.column, i.message) for i in lint_determinism._lint_file(path))
+        assert sorted((i.line, i.column, i.message) for i in issues if i.linter == "determinism" and i.path == lint_driver._rel(path)) == expected
+
+    assert lint_driver.run(roots, jobs=1, cache_path=cache_path) == (issues, {"files": 4, "cached": 4, "linted": 0})
+
+    (tmp_path / "runtime" / "governance" / "bad.py").write_text("VALUE = 2\n", encoding="utf-8")
+    warm, stats = lint_driver.run(roots, jobs=1, cache_path=cache_path)
+    assert stats == {"files": 4, "cached": 3, "linted": 1}
+    assert [issue.path for issue in warm] == ["app/main.py", "runtime/evolution/broken.py", "runtime/evolution/broken.py"]
+
+    payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    payload["ruleset"] = "stale"
+    cache_path.write_text(json.dumps(payload), encoding="utf-8")
+    assert lint_driver.run(roots, jobs=1, cache_path=cache_path)[1]["linted"] == 4
+
+
+def test_lint_driver_parallel_output_matches_serial(tmp_path: Path, monkeypatch, capsys) -> None:
+    monkeypatch.setattr(lint_import_paths, "REPO_ROOT", tmp_path)
+    monkeypatch.setattr(lint_determinism, "REPO_ROOT", tmp_path)
+    monkeypatch.setattr(lint_driver, "MIN_PARALLEL_FILES", 1)
+    _tree(tmp_path)
+
+    assert lint_driver.main(["runtime", "app", "--no-cache", "-j", "1"]) == 1
+    serial = capsys.readouterr().out
+    assert lint_driver.main(["runtime", "app", "--no-cache", "-j", "2"]) == 1
+    assert capsys.readouterr().out == serial
+    assert serial.splitlines()[-2:] == ["determinism lint failed: 2 issue(s)", "import path lint failed: 2 issue(s)"]
@@ -0,0 +1,80 @@
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from runtime import metrics
+from runtime.metrics_analysis import mutation_rate_snapshot, summarize_preflight_rejections
+from runtime.metrics_index import MetricsIndex
+
+
+def _write_records(path: Path, records: list[dict]) -> None:
+    with path.open("a", encoding="utf-8") as handle:
+        for record in records:
+            handle.write(json.dumps(record) + "\n")
+
+
+def test_index_answers_exact_windows_beyond_tail_limit(tmp_path: Path, monkeypatch) -> None:
+    metrics_path = tmp_path / "metrics.jsonl"
+    monkeypatch.setattr(metrics, "METRICS_PATH", metrics_path)
+    records = []
+    for idx in range(3000):
+        records.append({"timestamp": f"2026-01-01T00:{idx // 60 % 60:02d}:{idx % 60:02d}Z", "event": "mutation_executed", "payload": {"idx": idx}})
+        records.append({"timestamp": "2026-01-01T00:00:00Z", "event": "noise", "payload": {}})
+    _write_records(metrics_path, records)
+
+    index = MetricsIndex()
+    assert index.count(["mutation_executed"]) == 3000
+    since = 1767225600.0 + 30 * 60
+    assert index.count(["mutation_executed"], since=since) == sum(
+        1 for idx in range(3000) if (idx // 60 % 60) * 60 + idx % 60 >= 30 * 60
+    )
+    assert [entry["payload"]["idx"] for entry in index.latest(["mutation_executed"], limit=3)] == [2997, 2998, 2999]
+    assert next(index.iter_events(["mutation_executed"]))["payload"]["idx"] == 0
+
+
+def test_index_tails_incrementally_and_resets_after_truncation(tmp_path: Path, monkeypatch) -> None:
+    metrics_path = tmp_path / "metrics.jsonl"
+    monkeypatch.setattr(metrics, "METRICS_PATH", metrics_path)
+    index = MetricsIndex()
+
+    metrics.log("probe", {"n": 1})
+    assert index.sync() == 1
+    with metrics_path.open("a", encoding="utf-8") as handle:
+        handle.write('{"event": "probe", "payload": {"n": 2}}\n{"event": "pro')
+    assert index.sync() == 1
+    assert index.count(["probe"]) == 2
+
+    metrics_path.write_text('{"event": "probe", "payload": {"n": 3}}\n', encoding="utf-8")
+    assert [entry["payload"]["n"] for entry in index.iter_events(["probe"])] == [3]
+
+
+def test_index_resets_when_active_file_is_replaced_without_shrinking(tmp_path: Path, monkeypatch) -> None:
+    metrics_path = tmp_path / "metrics.jsonl"
+    monkeypatch.setattr(metrics, "METRICS_PATH", metrics_path)
+    index = MetricsIndex()
+
+    _write_records(metrics_path, [{"event": "probe", "payload": {"n": 1}}])
+    assert index.sync() == 1
+
+    replacement = tmp_path / "metrics.replacement.jsonl"
+    _write_records(replacement, [{"event": "probe", "payload": {"n": 2}}, {"event": "probe", "payload": {"n": 3}}])
+    replacement.replace(metrics_path)
+
+    assert [entry["payload"]["n"] for entry in index.iter_events(["probe"])] == [2, 3]
+
+
+def test_metrics_analysis_uses_index_when_enabled(tmp_path: Path, monkeypatch) -> None:
+    metrics_path = tmp_path / "metrics.jsonl"
+    monkeypatch.setattr(metrics, "METRICS_PATH", metrics_path)
+    monkeypatch.setenv("ADAAD_METRICS_INDEX", "1")
+    for _ in range(5):
+        metrics.log("mutation_rejected_preflight", {"reason": "ast"})
+    for _ in range(20):
+        metrics.log("mutation_executed", {})
+
+    snapshot = mutation_rate_snapshot(window_sec=3600, max_entries=3, source="metrics")
+    assert snapshot["count"] == 20
+    assert summarize_preflight_rejections(limit=10)["reasons"] == {"ast": 5}
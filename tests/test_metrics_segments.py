@@ -0,0 +1,86 @@
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from app.agents.mutation_engine import MutationEngine
+from runtime import metrics
+from runtime.metrics_index import MetricsIndex
+
+
+@pytest.fixture()
+def metrics_path(tmp_path: Path, monkeypatch) -> Path:
+    path = tmp_path / "metrics.jsonl"
+    monkeypatch.setattr(metrics, "METRICS_PATH", path)
+    yield path
+    metrics.configure_rotation()
+
+
+def test_size_rotation_writes_gzip_segments_and_manifest(metrics_path: Path) -> None:
+    metrics.configure_rotation(max_bytes=400)
+    for idx in range(20):
+        metrics.log("probe", {"idx": idx})
+
+    manifest = metrics.load_segment_manifest()
+    assert manifest["segments"]
+    assert manifest["active_segment"] == manifest["segments"][-1]["segment"] + 1
+    first = manifest["segments"][0]
+    assert first["file"] == "metrics.000001.jsonl.gz"
+    with gzip.open(metrics_path.with_name(first["file"]), "rb") as handle:
+        assert len(handle.read().splitlines()) == first["lines"]
+    archived_lines = sum(entry["lines"] for entry in manifest["segments"])
+    active_lines = len(metrics_path.read_text(encoding="utf-8").splitlines()) if metrics_path.exists() else 0
+    assert archived_lines + active_lines == 20
+    assert [record["payload"]["idx"] for record in metrics.iter_records()] == list(range(20))
+
+
+def test_tail_and_cursor_reads_span_rotation_without_reprocessing(metrics_path: Path) -> None:
+    for idx in range(5):
+        metrics.log("probe", {"idx": idx})
+    records, cursor = metrics.read_since(None)
+    assert [record["payload"]["idx"] for record in records] == [0, 1, 2, 3, 4]
+
+    metrics.rotate()
+    for idx in range(5, 8):
+        metrics.log("probe", {"idx": idx})
+    metrics.rotate()
+    metrics.log("probe", {"idx": 8})
+
+    records, cursor = metrics.read_since(cursor)
+    assert [record["payload"]["idx"] for record in records] == [5, 6, 7, 8]
+    assert cursor["segment"] == metrics.load_segment_manifest()["active_segment"]
+    assert metrics.read_since(cursor)[0] == []
+    assert [entry["payload"]["idx"] for entry in metrics.tail(limit=6)] == [3, 4, 5, 6, 7, 8]
+
+
+def test_retention_drops_oldest_segments(metrics_path: Path) -> None:
+    metrics.configure_rotation(retain=2)
+    for idx in range(4):
+        metrics.log("probe", {"idx": idx})
+        metrics.rotate()
+
+    manifest = metrics.load_segment_manifest()
+    assert [entry["segment"] for entry in manifest["segments"]] == [3, 4]
+    assert not metrics_path.with_name("metrics.000001.jsonl.gz").exists()
+    assert [record["payload"]["idx"] for record in metrics.iter_records()] == [2, 3]
+
+
+def test_consumers_keep_state_across_rotation(metrics_path: Path, tmp_path: Path) -> None:
+    engine = MutationEngine(metrics_path, state_path=tmp_path / "engine_state.json")
+    index = MetricsIndex()
+    metrics.log("mutation_score", {"strategy_id": "s1", "score": 0.9})
+    engine.refresh_state_from_metrics()
+    assert index.count(["mutation_score"]) == 1
+
+    metrics.rotate()
+    metrics.log("mutation_score", {"strategy_id": "s1", "score": 0.5})
+    engine.refresh_state_from_metrics()
+
+    state = json.loads((tmp_path / "engine_state.json").read_text(encoding="utf-8"))
+    assert state["stats"]["s1"]["n"] == 2.0
+    assert index.count(["mutation_score"]) == 2
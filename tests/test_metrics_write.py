@@ -15,8 +15,10 @@ import json
 import multiprocessing
 import tempfile
 import threading
+import time
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from runtime import metrics
 
@@ -27,6 +29,11 @@ def _process_worker(metrics_path: str, worker_id: int, count: int) -> None:
         metrics.log(event_type="proc_probe", payload={"worker": worker_id, "idx": idx, "text": "こんにちは"}, level="INFO")
 
 
+def _forked_worker(count: int) -> None:
+    for idx in range(count):
+        metrics.log(event_type="fork_probe", payload={"idx": idx}, level="INFO")
+
+
 class MetricsWriteTest(unittest.TestCase):
     def setUp(self) -> None:
         self.tmp = tempfile.TemporaryDirectory()
@@ -77,6 +84,151 @@ class MetricsWriteTest(unittest.TestCase):
         self.assertEqual(len(parsed), expected)
         self.assertTrue(all("event" in rec and "payload" in rec for rec in parsed))
 
+    def test_deferred_lines_are_written_only_when_handed_back(self) -> None:
+        with metrics.deferred() as lines:
+            metrics.log(event_type="held_a")
+            metrics.log(event_type="held_b")
+        self.assertFalse(metrics.METRICS_PATH.exists() and metrics.METRICS_PATH.read_text(encoding="utf-8"))
+
+        metrics.log(event_type="direct")
+        metrics.write_lines(lines)
+
+        events = [json.loads(line)["event"] for line in metrics.METRICS_PATH.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual(events, ["direct", "held_a", "held_b"])
+
+    def test_buffered_writes_group_commit_in_order(self) -> None:
+        metrics.enable_buffered_writes(max_batch=1000, max_latency_s=60.0)
+        self.addCleanup(metrics.disable_buffered_writes)
+
+        def thread_worker(worker_id: int) -> None:
+            for idx in range(50):
+                metrics.log(event_type="buffered_probe", payload={"worker": worker_id, "idx": idx}, level="INFO")
+
+        threads = [threading.Thread(target=thread_worker, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertFalse(metrics.METRICS_PATH.exists() and metrics.METRICS_PATH.read_text(encoding="utf-8"))
+        metrics.flush()
+
+        parsed = [json.loads(line) for line in metrics.METRICS_PATH.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual(len(parsed), 200)
+        for worker_id in range(4):
+            indexes = [rec["payload"]["idx"] for rec in parsed if rec["payload"]["worker"] == worker_id]
+            self.assertEqual(indexes, list(range(50)))
+
+    def test_buffered_writes_flush_on_batch_size_tail_and_disable(self) -> None:
+        metrics.enable_buffered_writes(max_batch=2, max_latency_s=60.0)
+        self.addCleanup(metrics.disable_buffered_writes)
+
+        metrics.log(event_type="batch_a")
+        metrics.log(event_type="batch_b")
+        deadline = time.monotonic() + 5
+        lines: list[str] = []
+        while time.monotonic() < deadline and len(lines) < 2:
+            time.sleep(0.01)
+            lines = metrics.METRICS_PATH.read_text(encoding="utf-8").splitlines() if metrics.METRICS_PATH.exists() else []
+        self.assertEqual(len(lines), 2)
+
+        metrics.log(event_type="tail_visible")
+        self.assertEqual(metrics.tail(limit=1)[0]["event"], "tail_visible")
+
+        metrics.log(event_type="flushed_on_disable")
+        metrics.disable_buffered_writes()
+        self.assertFalse(metrics.buffered_writes_enabled())
+        self.assertEqual(metrics.tail(limit=1)[0]["event"], "flushed_on_disable")
+
+    def _wait_for_lines(self, count: int) -> list[str]:
+        deadline = time.monotonic() + 5
+        lines: list[str] = []
+        while time.monotonic() < deadline and len(lines) < count:
+            time.sleep(0.01)
+            lines = metrics.METRICS_PATH.read_text(encoding="utf-8").splitlines() if metrics.METRICS_PATH.exists() else []
+        return lines
+
+    def test_buffered_writes_zero_latency_flushes_immediately(self) -> None:
+        metrics.enable_buffered_writes(max_batch=1000, max_latency_s=0)
+        self.addCleanup(metrics.disable_buffered_writes)
+
+        metrics.log(event_type="immediate")
+
+        lines = self._wait_for_lines(1)
+        self.assertEqual([json.loads(line)["event"] for line in lines], ["immediate"])
+
+    def test_buffered_flusher_survives_write_errors_without_losing_lines(self) -> None:
+        metrics.enable_buffered_writes(max_batch=1, max_latency_s=60.0)
+        self.addCleanup(metrics.disable_buffered_writes)
+        original_append = metrics._append_bytes
+        failures = iter([OSError("disk full")])
+
+        def flaky_append(path: Path, data: bytes) -> None:
+            failure = next(failures, None)
+            if failure is not None:
+                raise failure
+            original_append(path, data)
+
+        with mock.patch.object(metrics, "_append_bytes", side_effect=flaky_append), mock.patch.object(metrics, "_FLUSH_RETRY_S", 0.01):
+            with self.assertLogs("runtime.metrics", level="ERROR"):
+                metrics.log(event_type="first")
+                lines = self._wait_for_lines(1)
+            metrics.log(event_type="second")
+            lines = self._wait_for_lines(2)
+
+        self.assertEqual([json.loads(line)["event"] for line in lines], ["first", "second"])
+
+    def test_buffered_queue_is_bounded_by_synchronous_flush(self) -> None:
+        metrics.enable_buffered_writes(max_batch=2, max_latency_s=60.0, max_pending=2)
+        self.addCleanup(metrics.disable_buffered_writes)
+        writer = metrics._BUFFERED_WRITER
+        assert writer is not None
+        seen: list[int] = []
+        original_flush = writer.flush
+
+        def recording_flush() -> None:
+            with writer._condition:
+                seen.append(len(writer._pending))
+            original_flush()
+
+        with mock.patch.object(writer, "flush", side_effect=recording_flush):
+            for idx in range(20):
+                metrics.log(event_type="bounded", payload={"idx": idx})
+                with writer._condition:
+                    self.assertLessEqual(len(writer._pending), writer.max_pending)
+        metrics.flush()
+
+        parsed = [json.loads(line) for line in metrics.METRICS_PATH.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual([rec["payload"]["idx"] for rec in parsed], list(range(20)))
+        self.assertTrue(all(size <= writer.max_pending for size in seen))
+
+    def test_fork_reset_replaces_write_locks(self) -> None:
+        metrics.enable_buffered_writes(max_batch=4, max_latency_s=60.0, max_pending=8)
+        self.addCleanup(metrics.disable_buffered_writes)
+        parent_writer = metrics._BUFFERED_WRITER
+        parent_lock = metrics._THREAD_LOCK
+        self.addCleanup(setattr, metrics, "_THREAD_LOCK", parent_lock)
+
+        metrics._reset_writer_after_fork()
+        self.addCleanup(parent_writer.close)
+
+        self.assertIsNot(metrics._THREAD_LOCK, parent_lock)
+        self.assertFalse(metrics.buffered_writes_enabled())
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "fork start method unavailable")
+    def test_forked_worker_events_reach_metrics_file(self) -> None:
+        metrics.enable_buffered_writes(max_batch=256, max_latency_s=60.0)
+        self.addCleanup(metrics.disable_buffered_writes)
+
+        # Fork workers leave through os._exit, so nothing may stay queued in the child.
+        proc = multiprocessing.get_context("fork").Process(target=_forked_worker, args=(5,))
+        proc.start()
+        proc.join(timeout=20)
+        self.assertEqual(proc.exitcode, 0)
+
+        raw_lines = metrics.METRICS_PATH.read_text(encoding="utf-8").splitlines()
+        self.assertEqual([json.loads(line)["payload"]["idx"] for line in raw_lines], list(range(5)))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,110 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+
+import pytest
+
+from runtime import constitution, metrics, metrics_analysis
+from security.ledger import journal, rate_index
+
+
+def _entry(action: str, timestamp: str, epoch_id: str = "") -> str:
+    payload = {"epoch_id": epoch_id} if epoch_id else {}
+    return json.dumps({"timestamp": timestamp, "agent_id": "a", "action": action, "payload": payload})
+
+
+def _reference_count(lines, window_sec: int, epoch_id: str):
+    scoped = []
+    for line in lines:
+        entry = json.loads(line)
+        if entry["action"] not in rate_index.MUTATION_RATE_ACTIONS:
+            continue
+        entry_epoch = entry["payload"].get("epoch_id", "")
+        if epoch_id and entry_epoch != epoch_id:
+            continue
+        scoped.append(rate_index.parse_ledger_ts(entry["timestamp"]))
+    end = max((ts or 0 for ts in scoped), default=0)
+    return sum(1 for ts in scoped if ts is not None and ts >= end - window_sec), len(scoped)
+
+
+def test_rate_index_matches_full_scan_and_ingests_appends(tmp_path) -> None:
+    ledger_path = tmp_path / "lineage.jsonl"
+    lines = [
+        _entry("mutation_executed", "2026-01-01T00:00:00Z", "epoch-1"),
+        _entry("mutation_planned", "2026-01-01T00:30:00Z", "epoch-1"),
+        _entry("ledger_note", "2026-01-01T00:40:00Z", "epoch-1"),
+        _entry("mutation_failed", "2026-01-01T01:10:00Z", "epoch-2"),
+        _entry("mutation_noop", "not-a-timestamp", "epoch-2"),
+        _entry("mutation_executed", "2026-01-01T00:05:00Z"),
+    ]
+    ledger_path.write_text("\n".join(lines[:4]) + "\n", encoding="utf-8")
+    index = rate_index.MutationRateIndex(ledger_path)
+
+    for epoch_id in ("", "epoch-1", "epoch-2", "missing"):
+        snapshot = index.snapshot(3600, epoch_id)
+        assert (snapshot["count"], snapshot["entries_scoped"]) == _reference_count(lines[:4], 3600, epoch_id)
+
+    with ledger_path.open("a", encoding="utf-8") as handle:
+        handle.write("\n".join(lines[4:]) + "\n" + _entry("mutation_executed", "2026-01-01T02:00:00Z")[:20])
+    index.flush()
+    for epoch_id in ("", "epoch-1", "epoch-2"):
+        snapshot = index.snapshot(3600, epoch_id)
+        assert (snapshot["count"], snapshot["entries_scoped"]) == _reference_count(lines, 3600, epoch_id)
+    assert index.snapshot(3600)["entries_considered"] == len(lines)
+
+    reloaded = rate_index.MutationRateIndex(ledger_path)
+    assert reloaded.snapshot(600, "epoch-2") == index.snapshot(600, "epoch-2")
+
+
+def test_rate_index_rebuilds_when_ledger_is_rewritten(tmp_path) -> None:
+    ledger_path = tmp_path / "lineage.jsonl"
+    ledger_path.write_text(_entry("mutation_executed", "2026-01-01T00:00:00Z") + "\n", encoding="utf-8")
+    index = rate_index.MutationRateIndex(ledger_path)
+    assert index.snapshot(3600)["count"] == 1
+    index.flush()
+
+    ledger_path.write_text(_entry("mutation_noop", "2026-01-02T00:00:00Z") + "\n", encoding="utf-8")
+    snapshot = rate_index.MutationRateIndex(ledger_path).snapshot(3600)
+    assert (snapshot["count"], snapshot["entries_considered"]) == (1, 1)
+    assert index.snapshot(3600)["event_types"] == sorted(rate_index.MUTATION_RATE_ACTIONS)
+    assert index.snapshot(3600)["window_end_ts"] == snapshot["window_end_ts"]
+
+
+def test_write_entry_updates_shared_index_and_consumers_agree(monkeypatch, tmp_path) -> None:
+    ledger_path = tmp_path / "lineage.jsonl"
+    monkeypatch.setattr(journal, "LEDGER_FILE", ledger_path)
+    for _ in range(3):
+        journal.write_entry("agent", "mutation_executed", {"epoch_id": "epoch-1"})
+    journal.write_entry("agent", "mutation_planned", {})
+
+    shared = rate_index.index_for(ledger_path)
+    assert shared.snapshot(3600, "epoch-1")["count"] == 3
+    assert constitution._deterministic_mutation_count(3600, "") == metrics_analysis.mutation_rate_snapshot(3600)
+    assert constitution._deterministic_mutation_count(3600, "epoch-1") == metrics_analysis.mutation_rate_snapshot(3600, epoch_id="epoch-1")
+    assert metrics_analysis.mutation_rate_snapshot(3600)["count"] == 4
+
+
+def test_ledger_snapshot_rejects_metrics_only_arguments(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(journal, "LEDGER_FILE", tmp_path / "lineage.jsonl")
+    with pytest.raises(ValueError):
+        metrics_analysis.mutation_rate_snapshot(3600, max_entries=10)
+    with pytest.raises(ValueError):
+        metrics_analysis.mutation_rate_snapshot(3600, now=0.0)
+
+
+def test_metrics_snapshot_honors_max_entries_and_now(monkeypatch, tmp_path) -> None:
+    metrics_path = tmp_path / "metrics.jsonl"
+    records = [
+        {"timestamp": "2026-01-01T00:00:00Z", "event": "mutation_executed", "payload": {}},
+        {"timestamp": "2026-01-01T00:30:00Z", "event": "mutation_executed", "payload": {}},
+        {"timestamp": "2026-01-01T00:59:00Z", "event": "mutation_executed", "payload": {}},
+    ]
+    metrics_path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+    monkeypatch.setattr(metrics, "METRICS_PATH", metrics_path)
+    monkeypatch.delenv("ADAAD_METRICS_INDEX", raising=False)
+    now = rate_index.parse_ledger_ts("2026-01-01T01:00:00Z")
+
+    snapshot = metrics_analysis.mutation_rate_snapshot(3600, now=now, source="metrics")
+    assert (snapshot["count"], snapshot["window_end_ts"]) == (3, now)
+    assert metrics_analysis.mutation_rate_snapshot(3600, max_entries=2, now=now, source="metrics")["count"] == 2
+    assert metrics_analysis.mutation_rate_snapshot(900, now=now, source="metrics")["count"] == 1
@@ -7,7 +7,7 @@ import unittest
 from pathlib import Path
 from unittest import mock
 
-from app.agents.mutation_strategies import DEFAULT_REGISTRY, ai_propose_strategy
+from app.agents.mutation_strategies import DEFAULT_REGISTRY, ai_propose_strategy, load_skill_weights
 from runtime.intelligence.llm_provider import LLMProviderResult
 
 
@@ -77,5 +77,17 @@ class AiProposeStrategyTest(unittest.TestCase):
         self.assertGreater(strategy.skill_weight, 0.0)
 
 
+class SkillWeightsCacheTest(unittest.TestCase):
+    def test_same_size_rewrite_inside_racy_window_is_reread(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            state_path = Path(tmp) / "state.json"
+            state_path.write_text(json.dumps({"stats": {"a": {"skill_weight": 0.1}}}), encoding="utf-8")
+            self.assertEqual(load_skill_weights(state_path), {"a": 0.1})
+            stat = state_path.stat()
+            state_path.write_text(json.dumps({"stats": {"a": {"skill_weight": 0.9}}}), encoding="utf-8")
+            os.utime(state_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            self.assertEqual(load_skill_weights(state_path), {"a": 0.9})
+
+
 if __name__ == "__main__":
     unittest.main()
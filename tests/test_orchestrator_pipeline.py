@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+
+from app.agents.mutation_request import MutationRequest
+from app.main import Orchestrator, _run_pipeline_stage
+
+
+def _request(agent_id: str, intent: str) -> MutationRequest:
+    return MutationRequest(
+        agent_id=agent_id,
+        generation_ts="2026-01-01T00:00:00Z",
+        intent=intent,
+        ops=[{"op": "set", "path": "/version", "value": 2}],
+        signature="cryovant-dev-test",
+        nonce=f"n-{agent_id}",
+    )
+
+
+class PipelineStageTest(unittest.TestCase):
+    def test_stage_keeps_task_order_and_reports_depth(self) -> None:
+        barrier = threading.Barrier(3, timeout=5)
+
+        def task(value: int):
+            def run() -> int:
+                barrier.wait()
+                time.sleep(0.01 * (3 - value))
+                return value
+
+            return run
+
+        stats: dict = {}
+        results = _run_pipeline_stage("evaluate", [task(0), task(1), task(2)], workers=3, stats=stats)
+
+        self.assertEqual(results, [0, 1, 2])
+        self.assertEqual(stats["evaluate"]["queue_depth"], 3)
+        self.assertEqual(stats["evaluate"]["workers"], 3)
+        self.assertGreater(stats["evaluate"]["max_latency_seconds"], 0.0)
+
+    def test_empty_stage_is_recorded(self) -> None:
+        stats: dict = {}
+        self.assertEqual(_run_pipeline_stage("commit", [], workers=4, stats=stats), [])
+        self.assertEqual(stats["commit"]["queue_depth"], 0)
+
+
+class PipelinedMutationCycleTest(unittest.TestCase):
+    def test_winners_commit_in_rank_order_and_rejections_are_journaled(self) -> None:
+        orchestrator = Orchestrator()
+        proposals = [_request("alpha", "a"), _request("beta", "b"), _request("gamma", "c"), _request("delta", "d")]
+        ranked = [proposals[2], proposals[0], proposals[3], proposals[1]]
+        orchestrator.architect.propose_mutations = mock.Mock(return_value=proposals)
+        orchestrator.mutation_engine.refresh_state_from_metrics = mock.Mock()
+        orchestrator.mutation_engine.rank = mock.Mock(return_value=(ranked, {"a": 0.5}))
+        orchestrator.evolution_runtime.before_mutation_cycle = mock.Mock(return_value={"epoch_id": "epoch-pipe"})
+        orchestrator._resolve_tier = mock.Mock(return_value=mock.Mock(name="tier"))
+        orchestrator._evaluate_constitution = mock.Mock(
+            side_effect=lambda request, _tier, _epoch: {"passed": request.agent_id != "alpha"}
+        )
+        orchestrator.executor.execute = mock.Mock(return_value={"status": "executed"})
+        logged = []
+
+        with mock.patch.dict(os.environ, {"ADAAD_MUTATION_PIPELINE_TOP_K": "3"}), mock.patch(
+            "app.main.journal.write_entry"
+        ) as write_entry, mock.patch("app.main.metrics.log", side_effect=lambda **kw: logged.append(kw)):
+            orchestrator._run_mutation_cycle()
+
+        # Three pre-commit evaluations plus delta's re-evaluation after gamma commits.
+        self.assertEqual(orchestrator._evaluate_constitution.call_count, 4)
+        executed = [call.args[0].agent_id for call in orchestrator.executor.execute.call_args_list]
+        self.assertEqual(executed, ["gamma", "delta"])
+        actions = [call.kwargs["action"] for call in write_entry.call_args_list]
+        self.assertEqual(actions, ["mutation_rejected_constitutional", "mutation_cycle", "mutation_cycle"])
+        summary = next(entry["payload"] for entry in logged if entry["event_type"] == "mutation_pipeline_cycle")
+        self.assertEqual(summary["committed"], ["gamma", "delta"])
+        self.assertEqual(summary["stages"]["constitution"]["queue_depth"], 3)
+        self.assertNotIn("screen", summary["stages"])
+        self.assertEqual(summary["stages"]["commit"]["workers"], 1)
+
+    def test_commits_past_the_rate_budget_are_rejected_on_re_evaluation(self) -> None:
+        orchestrator = Orchestrator()
+        proposals = [_request("alpha", "a"), _request("beta", "b"), _request("alpha", "a2"), _request("gamma", "c")]
+        orchestrator.architect.propose_mutations = mock.Mock(return_value=proposals)
+        orchestrator.mutation_engine.refresh_state_from_metrics = mock.Mock()
+        orchestrator.mutation_engine.rank = mock.Mock(return_value=(proposals, {}))
+        orchestrator.evolution_runtime.before_mutation_cycle = mock.Mock(return_value={"epoch_id": "epoch-rate"})
+        orchestrator._resolve_tier = mock.Mock(return_value=mock.Mock(name="tier"))
+        executed = []
+        orchestrator.executor.execute = mock.Mock(side_effect=lambda request, *_a, **_k: executed.append(request.agent_id) or {"status": "executed"})
+        # One mutation left in the rate budget: evaluations only fail once something has committed.
+        orchestrator._evaluate_constitution = mock.Mock(
+            side_effect=lambda _request, _tier, _epoch: {"passed": not executed, "blocking_failures": ["max_mutation_rate"] if executed else []}
+        )
+        logged = []
+
+        with mock.patch.dict(os.environ, {"ADAAD_MUTATION_PIPELINE_TOP_K": "4"}), mock.patch(
+            "app.main.journal.write_entry"
+        ) as write_entry, mock.patch("app.main.metrics.log", side_effect=lambda **kw: logged.append(kw)):
+            orchestrator._run_mutation_cycle()
+
+        evaluated = [call.args[0].intent for call in orchestrator._evaluate_constitution.call_args_list]
+        self.assertEqual(evaluated[:3], ["a", "b", "c"])  # alpha's second proposal is deduplicated
+        self.assertEqual(executed, ["alpha"])
+        actions = [call.kwargs["action"] for call in write_entry.call_args_list]
+        self.assertEqual(actions, ["mutation_cycle", "mutation_rejected_constitutional", "mutation_rejected_constitutional"])
+        summary = next(entry["payload"] for entry in logged if entry["event_type"] == "mutation_pipeline_cycle")
+        self.assertEqual(summary["candidates"], 3)
+        self.assertEqual(summary["committed"], ["alpha"])
+
+    def test_executions_that_do_not_land_are_not_reported_as_committed(self) -> None:
+        orchestrator = Orchestrator()
+        proposals = [_request("alpha", "a"), _request("beta", "b")]
+        orchestrator.architect.propose_mutations = mock.Mock(return_value=proposals)
+        orchestrator.mutation_engine.refresh_state_from_metrics = mock.Mock()
+        orchestrator.mutation_engine.rank = mock.Mock(return_value=(proposals, {}))
+        orchestrator.evolution_runtime.before_mutation_cycle = mock.Mock(return_value={"epoch_id": "epoch-reject"})
+        orchestrator._resolve_tier = mock.Mock(return_value=mock.Mock(name="tier"))
+        orchestrator._evaluate_constitution = mock.Mock(return_value={"passed": True})
+        orchestrator.executor.execute = mock.Mock(
+            side_effect=lambda request: {"status": "rejected", "reason": "governor"} if request.agent_id == "alpha" else {"status": "executed"}
+        )
+        logged = []
+
+        with mock.patch.dict(os.environ, {"ADAAD_MUTATION_PIPELINE_TOP_K": "2"}), mock.patch("app.main.journal.write_entry"), mock.patch(
+            "app.main.metrics.log", side_effect=lambda **kw: logged.append(kw)
+        ):
+            orchestrator._run_mutation_cycle()
+
+        # alpha never landed, so beta is not re-evaluated as if state had changed.
+        self.assertEqual(orchestrator._evaluate_constitution.call_count, 2)
+        summary = next(entry["payload"] for entry in logged if entry["event_type"] == "mutation_pipeline_cycle")
+        self.assertEqual(summary["committed"], ["beta"])
+        self.assertEqual(summary["not_committed"], [{"agent_id": "alpha", "status": "rejected", "reason": "governor"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
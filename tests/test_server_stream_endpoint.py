@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import server
+from runtime.event_stream import EventStreamHub
+from runtime.evolution.lineage_v2 import LineageLedgerV2
+
+
+@pytest.fixture(autouse=True)
+def _audit_tokens(monkeypatch) -> None:
+    monkeypatch.setenv("ADAAD_AUDIT_TOKENS", json.dumps({"audit-token": ["audit:read"], "metrics-token": ["metrics:read"]}))
+
+
+def _auth_header(token: str = "audit-token") -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_stream_requires_audit_authentication() -> None:
+    with TestClient(server.app) as client:
+        missing = client.get("/stream")
+        wrong_scope = client.get("/stream", headers=_auth_header("metrics-token"))
+
+    assert missing.status_code == 401
+    assert missing.json() == {"detail": "missing_authentication"}
+    assert wrong_scope.status_code == 403
+    assert wrong_scope.json() == {"detail": "insufficient_scope"}
+
+
+def test_stream_rejects_invalid_cursor() -> None:
+    with TestClient(server.app) as client:
+        response = client.get("/stream", params={"cursor": "not-a-cursor"}, headers=_auth_header())
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "invalid_stream_cursor"}
+
+
+def test_stream_rejects_unknown_source() -> None:
+    with TestClient(server.app) as client:
+        response = client.get("/stream", params={"sources": "lineage,journal"}, headers=_auth_header())
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "unknown_stream_source"}
+
+
+def test_stream_redacts_metrics_frames(tmp_path, monkeypatch) -> None:
+    ledger = LineageLedgerV2(tmp_path / "lineage_v2.jsonl")
+    metrics_path = tmp_path / "metrics.jsonl"
+    metrics_path.touch()
+    hub = EventStreamHub(ledger.ledger_path, metrics_path)
+    head = hub.head()
+    with metrics_path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"event": "bundle_signed", "payload": {"signature": "secret", "bundle_id": "b1"}}) + "\n")
+    monkeypatch.setattr(server, "hub_for", lambda: hub)
+    monkeypatch.setattr(server, "STREAM_MAX_SECONDS", 0.0)
+
+    with TestClient(server.app) as client:
+        response = client.get("/stream", params={"sources": "metrics", "cursor": head.token()}, headers=_auth_header())
+
+    assert response.status_code == 200
+    assert "bundle_signed" in response.text
+    assert "secret" not in response.text
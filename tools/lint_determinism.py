@@ -328,6 +328,10 @@ def _iter_print_policy_issues(path: Path, tree: ast.AST) -> Iterable[LintIssue]:
             yield LintIssue(path, getattr(node, "lineno", 1), getattr(node, "col_offset", 0), "forbidden_direct_print")
 
 
+def _syntax_issue(path: Path, exc: SyntaxError) -> LintIssue:
+    return LintIssue(path, exc.lineno or 1, exc.offset or 0, f"syntax_error:{exc.msg}")
+
+
 def _lint_file(path: Path) -> list[LintIssue]:
     try:
         content = path.read_text(encoding="utf-8")
@@ -337,10 +341,12 @@ def _lint_file(path: Path) -> list[LintIssue]:
     try:
         tree = ast.parse(content, filename=str(path))
     except SyntaxError as exc:
-        line = exc.lineno or 1
-        col = exc.offset or 0
-        return [LintIssue(path, line, col, f"syntax_error:{exc.msg}")]
+        return [_syntax_issue(path, exc)]
+    return _lint_tree(path, tree)
+
 
+def _lint_tree(path: Path, tree: ast.AST) -> list[LintIssue]:
+    """Run every determinism rule over an already parsed module."""
     module_aliases, import_module_aliases = _collect_aliases(tree)
 
     issues: list[LintIssue] = []
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+"""Combined, parallel and incremental driver for the determinism and import-path lints.
+
+Every file is read and parsed once and all selected linters run over the same
+tree. Parsing fans out over a process pool. Results are cached in
+``.lint_cache/lint_results.json`` keyed by repo-relative path and content
+SHA-256, under a rule-set version derived from the linter sources and the
+Python minor version; editing a linter or switching interpreters invalidates
+everything. A file whose ``(mtime_ns, size, inode)`` stamp is unchanged (and
+settled) is not even re-read. Output is sorted,
+so warm, cold, serial and parallel runs print the same thing.
+
+    python tools/lint_driver.py                      # both linters, default targets
+    python tools/lint_driver.py runtime/ security/ app/main.py --linters determinism
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.governance.deterministic_filesystem import stamp_is_settled, stat_stamp
+from tools import lint_determinism, lint_import_paths
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_PATH = REPO_ROOT / ".lint_cache" / "lint_results.json"
+# Below this many files to lint, pool start-up costs more than it saves.
+MIN_PARALLEL_FILES = 16
+
+LINTERS = {"determinism": lint_determinism, "import_paths": lint_import_paths}
+PASS_MESSAGES = {"determinism": "determinism lint passed", "import_paths": "import path lint passed"}
+FAIL_MESSAGES = {"determinism": "determinism lint failed", "import_paths": "import path lint failed"}
+
+_Issue = Tuple[int, int, str]
+
+
+@dataclass(frozen=True)
+class DriverIssue:
+    linter: str
+    path: str
+    line: int
+    column: int
+    message: str
+
+    def rule(self) -> str:
+        if self.linter == "import_paths":
+            return lint_import_paths._classify_rule(self.message)
+        return self.message.split(":", 1)[0]
+
+
+def ruleset_version() -> str:
+    digest = hashlib.sha256(f"{CACHE_VERSION}:{sys.version_info.major}.{sys.version_info.minor}".encode("utf-8"))
+    for name in sorted(LINTERS):
+        digest.update(b"\0" + name.encode("utf-8") + b"\0" + Path(LINTERS[name].__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def _rel(path: Path) -> str:
+    root = lint_import_paths.REPO_ROOT
+    return path.relative_to(root).as_posix() if path.is_relative_to(root) else path.as_posix()
+
+
+def _select_files(roots: Sequence[Path], linters: Sequence[str]) -> Dict[Path, Tuple[str, ...]]:
+    """``file -> linters that apply to it``, in linter default scope when no roots are given."""
+    root = lint_import_paths.REPO_ROOT
+    selected: Dict[Path, List[str]] = {}
+    for name in linters:
+        if roots:
+            scope = list(roots)
+        elif name == "determinism":
+            scope = [root / relative for relative in lint_determinism.TARGET_DIRS]
+        else:
+            scope = [root / target for target in lint_import_paths.DEFAULT_TARGETS]
+        for file_path in LINTERS[name]._iter_python_files(scope):
+            if name == "import_paths" and (not file_path.is_relative_to(root) or lint_import_paths._is_excluded(file_path)):
+                continue
+            selected.setdefault(file_path, []).append(name)
+    return {path: tuple(names) for path, names in selected.items()}
+
+
+def _lint_source(path_text: str, source: bytes, linters: Tuple[str, ...]) -> Dict[str, List[_Issue]]:
+    """Parse ``source`` once and run each linter over the tree (also the process-pool task)."""
+    path = Path(path_text)
+    try:
+        tree = ast.parse(source.decode("utf-8"), filename=path_text)
+    except SyntaxError as exc:
+        issues = {name: [LINTERS[name]._syntax_issue(path, exc)] for name in linters}
+    except UnicodeDecodeError as exc:
+        issues = {name: [lint_determinism.LintIssue(path, 1, 0, f"read_error:{exc}")] for name in linters}
+    else:
+        issues = {name: LINTERS[name]._lint_tree(path, tree) for name in linters}
+    return {name: [(issue.line, issue.column, issue.message) for issue in found] for name, found in issues.items()}
+
+
+def _init_worker(repo_root: str) -> None:
+    lint_determinism.REPO_ROOT = lint_import_paths.REPO_ROOT = Path(repo_root)
+
+
+def _lint_task(task: Tuple[str, bytes, Tuple[str, ...]]) -> Dict[str, List[_Issue]]:
+    return _lint_source(*task)
+
+
+class LintCache:
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self.ruleset = ruleset_version()
+        self.files: Dict[str, Dict[str, Any]] = {}
+        if path is None:
+            return
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(payload, dict) and payload.get("version") == CACHE_VERSION and payload.get("ruleset") == self.ruleset:
+            self.files = dict(payload.get("files") or {})
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        payload = {"version": CACHE_VERSION, "ruleset": self.ruleset, "files": {key: self.files[key] for key in sorted(self.files)}}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+            tmp_path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError:
+            return
+
+
+def run(
+    roots: Sequence[Path] = (),
+    *,
+    linters: Sequence[str] = tuple(LINTERS),
+    jobs: int | None = None,
+    cache_path: Path | None = DEFAULT_CACHE_PATH,
+) -> Tuple[List[DriverIssue], Dict[str, int]]:
+    """Lint ``roots`` (or each linter's default targets); return sorted issues and cache statistics."""
+    cache = LintCache(cache_path)
+    selected = _select_files(roots, linters)
+    results: Dict[Path, Dict[str, List[_Issue]]] = {}
+    pending: List[Tuple[Path, str, bytes, Dict[str, Any]]] = []
+    stats = {"files": len(selected), "cached": 0, "linted": 0}
+
+    for path, names in sorted(selected.items()):
+        rel = _rel(path)
+        entry = cache.files.get(rel) or {}
+        cached_results = entry.get("results") or {}
+        fresh = all(name in cached_results for name in names)
+        try:
+            stat = path.stat()
+        except OSError as exc:
+            results[path] = {name: [(1, 0, f"read_error:{exc}")] for name in names}
+            cache.files.pop(rel, None)
+            continue
+        stamp = list(stat_stamp(stat))
+        if fresh and entry.get("stamp") == stamp and stamp_is_settled(entry.get("hashed_ns", 0), stat.st_mtime_ns):
+            results[path] = {name: [tuple(item) for item in cached_results[name]] for name in names}
+            stats["cached"] += 1
+            continue
+        hashed_ns = time.time_ns()
+        source = path.read_bytes()
+        digest = hashlib.sha256(source).hexdigest()
+        if fresh and entry.get("sha256") == digest:
+            entry.update({"stamp": stamp, "hashed_ns": hashed_ns})
+            results[path] = {name: [tuple(item) for item in cached_results[name]] for name in names}
+            stats["cached"] += 1
+            continue
+        if entry.get("sha256") != digest:
+            entry = {"results": {}}
+        entry.update({"stamp": stamp, "hashed_ns": hashed_ns, "sha256": digest})
+        cache.files[rel] = entry
+        pending.append((path, rel, source, entry))
+
+    tasks = [(str(path), source, selected[path]) for path, _, source, _ in pending]
+    workers = max(1, jobs if jobs is not None else (os.cpu_count() or 1))
+    if workers > 1 and len(tasks) >= MIN_PARALLEL_FILES:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(str(lint_import_paths.REPO_ROOT),)) as pool:
+            outputs = list(pool.map(_lint_task, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+    else:
+        outputs = [_lint_task(task) for task in tasks]
+    for (path, rel, _, entry), output in zip(pending, outputs):
+        entry["results"].update({name: [list(item) for item in found] for name, found in output.items()})
+        results[path] = output
+        stats["linted"] += 1
+
+    cache.save()
+    issues = [
+        DriverIssue(name, _rel(path), line, column, message)
+        for path, per_linter in results.items()
+        for name, found in per_linter.items()
+        for line, column, message in found
+    ]
+    issues.sort(key=lambda item: (item.path, item.line, item.column, item.linter, item.message))
+    return issues, stats
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", help="files or directories (relative to the repo root); default: each linter's targets")
+    parser.add_argument("--linters", default=",".join(LINTERS), help="comma-separated subset of: " + ", ".join(LINTERS))
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--cache", type=Path, default=DEFAULT_CACHE_PATH, help="result cache file")
+    parser.add_argument("--no-cache", action="store_true", help="neither read nor write the result cache")
+    parser.add_argument("--format", choices=("text", "json"), default="text")
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    linters = [name.strip() for name in args.linters.split(",") if name.strip()]
+    unknown = sorted(set(linters) - set(LINTERS))
+    if unknown:
+        parser.error(f"unknown linter(s): {', '.join(unknown)}")
+    roots = [path if path.is_absolute() else lint_import_paths.REPO_ROOT / path for path in map(Path, args.paths)]
+    issues, stats = run(roots, linters=linters, jobs=args.jobs, cache_path=None if args.no_cache else args.cache)
+
+    if args.format == "json":
+        print(
+            json.dumps(
+                {
+                    "passed": not issues,
+                    "issue_count": len(issues),
+                    "issues": [
+                        {
+                            "linter": issue.linter,
+                            "path": issue.path,
+                            "line": issue.line,
+                            "column": issue.column,
+                            "message": issue.message,
+                            "rule": issue.rule(),
+                        }
+                        for issue in issues
+                    ],
+                },
+                indent=2,
+            )
+        )
+    else:
+        for issue in issues:
+            print(f"{issue.path}:{issue.line}:{issue.column}: {issue.message}")
+        for name in linters:
+            count = sum(1 for issue in issues if issue.linter == name)
+            print(f"{FAIL_MESSAGES[name]}: {count} issue(s)" if count else PASS_MESSAGES[name])
+    print(f"lint driver: {stats['linted']} linted, {stats['cached']} cached of {stats['files']} file(s)", file=sys.stderr)
+    return 1 if issues else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
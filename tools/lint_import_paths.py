@@ -227,6 +227,19 @@ def _iter_layer_boundary_issues(path: Path, tree: ast.AST) -> Iterable[LintIssue
                 yield LintIssue(path, node.lineno, node.col_offset, LAYER_BOUNDARY_VIOLATION_MESSAGE)
 
 
+def _syntax_issue(path: Path, exc: SyntaxError) -> LintIssue:
+    return LintIssue(path, exc.lineno or 1, exc.offset or 0, "syntax_error")
+
+
+def _lint_tree(path: Path, tree: ast.AST) -> list[LintIssue]:
+    """Run every import-path rule over an already parsed module."""
+    return [
+        *_iter_issues(path, tree),
+        *_iter_governance_impl_issues(path, tree),
+        *_iter_layer_boundary_issues(path, tree),
+    ]
+
+
 def main(argv: Sequence[str] | None = None) -> int:
     args = list(argv or sys.argv[1:])
     output_format = "text"
@@ -245,11 +258,9 @@ def main(argv: Sequence[str] | None = None) -> int:
         try:
             tree = ast.parse(source, filename=str(file_path))
         except SyntaxError as exc:
-            issues.append(LintIssue(file_path, exc.lineno or 1, exc.offset or 0, "syntax_error"))
+            issues.append(_syntax_issue(file_path, exc))
             continue
-        issues.extend(_iter_issues(file_path, tree))
-        issues.extend(_iter_governance_impl_issues(file_path, tree))
-        issues.extend(_iter_layer_boundary_issues(file_path, tree))
+        issues.extend(_lint_tree(file_path, tree))
 
     sorted_issues = sorted(issues, key=lambda item: (str(item.path), item.line, item.column, item.message))
 
@@ -1,16 +1,38 @@
 # SPDX-License-Identifier: Apache-2.0
-"""Deterministic governance simulation harness for constitutional rule evaluation."""
+"""Deterministic governance simulation harness for constitutional rule evaluation.
+
+``--batch`` switches to a load-test mode: a seeded mix of requests (op sizes,
+tiers, epochs, code vs DNA targets) is evaluated by a pool of worker processes
+after a per-worker warmup, and a JSON report with evaluations/sec, request
+latency percentiles and per-rule latency histograms is emitted. Rules are
+identified by the validator provenance carried in each verdict; their timings
+come from ``constitution.record_rule_timings`` because verdicts themselves are
+hashed into the governance envelope and must stay free of wall-clock data.
+"""
 
 from __future__ import annotations
 
 import argparse
 import json
+import math
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from app.agents.mutation_request import MutationRequest
+from app.agents.mutation_request import MutationRequest, MutationTarget
 from runtime import constitution
 
+# Repo-relative so directory-scoped rules apply to the generated targets.
+_AGENT_DIR = "app/agents/test_subject"
+LOAD_REPORT_SCHEMA_VERSION = "governance_load_report.v1"
+# Histogram bucket upper bounds in microseconds; the last bucket is open-ended.
+LATENCY_BUCKETS_US = (10, 25, 50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000, 25_000, 50_000, 100_000)
+
 
 @dataclass(frozen=True)
 class SimulationSummary:
@@ -57,15 +79,278 @@ def run_simulation(*, count: int, tier: constitution.Tier) -> SimulationSummary:
     )
 
 
+@dataclass(frozen=True)
+class RequestMix:
+    """Shape of a batch workload; every request draws from these independently."""
+
+    op_sizes: Tuple[int, ...] = (1, 8, 32)
+    tiers: Tuple[str, ...] = ("SANDBOX",)
+    epochs: int = 4
+    code_fraction: float = 0.5
+
+    def __post_init__(self) -> None:
+        if not self.op_sizes or any(size < 1 for size in self.op_sizes):
+            raise ValueError("op_sizes must be a non-empty list of positive integers")
+        unknown = sorted(set(self.tiers) - {tier.name for tier in constitution.Tier})
+        if not self.tiers or unknown:
+            raise ValueError(f"tiers must name constitution tiers (unknown: {', '.join(unknown) or 'none given'})")
+        if self.epochs < 1:
+            raise ValueError("epochs must be at least 1")
+        if not 0.0 <= self.code_fraction <= 1.0:
+            raise ValueError("code_fraction must be within [0, 1]")
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any]) -> "RequestMix":
+        defaults = cls()
+        return cls(
+            op_sizes=tuple(int(item) for item in raw.get("op_sizes", defaults.op_sizes)),
+            tiers=tuple(str(item) for item in raw.get("tiers", defaults.tiers)),
+            epochs=int(raw.get("epochs", defaults.epochs)),
+            code_fraction=float(raw.get("code_fraction", defaults.code_fraction)),
+        )
+
+
+def mixed_request(index: int, mix: RequestMix, seed: int) -> Tuple[MutationRequest, constitution.Tier, str]:
+    """Request ``index`` of the workload; seeded per index so any worker split yields the same requests.
+
+    Op size is the number of DNA replace ops, or the number of functions in the
+    generated module for a code target.
+    """
+    rng = random.Random(f"{seed}:{index}")
+    op_size = rng.choice(mix.op_sizes)
+    tier = constitution.Tier[rng.choice(mix.tiers)]
+    if rng.random() < mix.code_fraction:
+        kind = "code"
+        source = "".join(f"def sim_{index}_{n}(value):\n    return value + {n}\n\n" for n in range(op_size))
+        path = f"{_AGENT_DIR}/sim_{index}.py"
+        ops = [{"op": "replace", "path": path, "content": source}]
+        target = MutationTarget(agent_id="test_subject", path=path, target_type="code", ops=ops)
+    else:
+        kind = "dna"
+        ops = [{"op": "replace", "path": f"/traits/sim_{n}", "value": index + n} for n in range(op_size)]
+        target = MutationTarget(agent_id="test_subject", path=f"{_AGENT_DIR}/dna.json", target_type="dna", ops=ops)
+    request = MutationRequest(
+        agent_id="test_subject",
+        generation_ts="2026-01-01T00:00:00Z",
+        intent=f"simulate-{kind}-{index}",
+        ops=ops,
+        signature="cryovant-dev-test",
+        nonce=f"nonce-{index:05d}",
+        targets=[target],
+        epoch_id=f"sim-epoch-{index % mix.epochs}",
+    )
+    return request, tier, kind
+
+
+def _empty_outcome() -> Dict[str, Any]:
+    return {
+        "latencies_ns": [],
+        "rule_latencies_ns": {},
+        "rule_cached": {},
+        "provenance": {},
+        "passed": 0,
+        "blocked": 0,
+        "warnings": 0,
+        "targets": {},
+        "digests": set(),
+    }
+
+
+def _evaluate_batch(task: Tuple[int, int, RequestMix, int]) -> Dict[str, Any]:
+    """Evaluate requests ``[start, stop)`` and return raw timings (also the process-pool task)."""
+    start, stop, mix, seed = task
+    outcome = _empty_outcome()
+    for index in range(start, stop):
+        request, tier, kind = mixed_request(index, mix, seed)
+        with constitution.record_rule_timings() as timings:
+            started = time.perf_counter_ns()
+            verdict = constitution.evaluate_mutation(request, tier)
+            outcome["latencies_ns"].append(time.perf_counter_ns() - started)
+        for row in verdict.get("verdicts", []):
+            outcome["provenance"].setdefault(str(row.get("rule", "")), dict(row.get("provenance") or {}))
+        for timing in timings:
+            outcome["rule_latencies_ns"].setdefault(timing["rule"], []).append(timing["elapsed_ns"])
+            outcome["rule_cached"][timing["rule"]] = outcome["rule_cached"].get(timing["rule"], 0) + int(timing["cached"])
+        outcome["passed" if verdict.get("passed") else "blocked"] += 1
+        outcome["warnings"] += len(verdict.get("warnings", []))
+        outcome["targets"][kind] = outcome["targets"].get(kind, 0) + 1
+        outcome["digests"].add(str(verdict.get("governance_envelope", {}).get("digest", "")))
+    return outcome
+
+
+def _merge_outcomes(outcomes: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    merged = _empty_outcome()
+    for outcome in outcomes:
+        merged["latencies_ns"].extend(outcome["latencies_ns"])
+        for rule, values in outcome["rule_latencies_ns"].items():
+            merged["rule_latencies_ns"].setdefault(rule, []).extend(values)
+        for rule, count in outcome["rule_cached"].items():
+            merged["rule_cached"][rule] = merged["rule_cached"].get(rule, 0) + count
+        for rule, provenance in outcome["provenance"].items():
+            merged["provenance"].setdefault(rule, provenance)
+        for kind, count in outcome["targets"].items():
+            merged["targets"][kind] = merged["targets"].get(kind, 0) + count
+        for key in ("passed", "blocked", "warnings"):
+            merged[key] += outcome[key]
+        merged["digests"] |= outcome["digests"]
+    return merged
+
+
+def percentile(ordered: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence (``0`` when empty)."""
+    if not ordered:
+        return 0
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))]
+
+
+def _latency_summary(values_ns: Sequence[int]) -> Dict[str, float]:
+    ordered = sorted(values_ns)
+    to_ms = lambda value: round(value / 1_000_000, 6)  # noqa: E731
+    return {
+        "p50_ms": to_ms(percentile(ordered, 0.50)),
+        "p95_ms": to_ms(percentile(ordered, 0.95)),
+        "p99_ms": to_ms(percentile(ordered, 0.99)),
+        "max_ms": to_ms(ordered[-1] if ordered else 0),
+        "mean_ms": to_ms(sum(ordered) / len(ordered) if ordered else 0),
+    }
+
+
+def _histogram(values_ns: Sequence[int]) -> List[Dict[str, Any]]:
+    counts = [0] * (len(LATENCY_BUCKETS_US) + 1)
+    for value in values_ns:
+        bucket = next((slot for slot, bound in enumerate(LATENCY_BUCKETS_US) if value <= bound * 1_000), len(LATENCY_BUCKETS_US))
+        counts[bucket] += 1
+    bounds: List[int | None] = [*LATENCY_BUCKETS_US, None]
+    return [{"le_us": bound, "count": count} for bound, count in zip(bounds, counts)]
+
+
+_WORKER_READY: Optional[Any] = None
+
+
+def _warm_worker(warmup_task: Tuple[int, int, RequestMix, int], ready: Any) -> None:
+    """Pool initializer: run the unmeasured warmup once in each worker process."""
+    global _WORKER_READY
+    _WORKER_READY = ready
+    _evaluate_batch(warmup_task)
+
+
+def _await_workers() -> None:
+    # Blocks until every worker holds one of these tasks, i.e. every worker
+    # has finished its initializer warmup.
+    if _WORKER_READY is not None:
+        _WORKER_READY.wait()
+
+
+def _chunks(count: int, workers: int) -> List[Tuple[int, int]]:
+    size = max(1, count // (workers * 4))
+    return [(start, min(count, start + size)) for start in range(0, count, size)]
+
+
+def run_batch(
+    *,
+    count: int,
+    mix: RequestMix | None = None,
+    workers: int = 1,
+    warmup: int = 0,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Run a load test and return the machine-readable report.
+
+    ``workers <= 1`` evaluates in-process. Each worker first evaluates ``warmup``
+    requests, drawn from indices past the measured ``[0, count)`` range, that
+    are excluded from every statistic; the clock for evaluations/sec starts
+    once every worker has finished its warmup.
+    """
+    mix = mix or RequestMix()
+    count = max(1, count)
+    workers = max(1, workers)
+    tasks = [(start, stop, mix, seed) for start, stop in _chunks(count, workers)]
+    warmup_task = (count, count + max(0, warmup), mix, seed)
+
+    if workers > 1:
+        ready = multiprocessing.Barrier(workers)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker, initargs=(warmup_task, ready)) as pool:
+            for future in [pool.submit(_await_workers) for _ in range(workers)]:
+                future.result()
+            started = time.perf_counter()
+            outcomes = list(pool.map(_evaluate_batch, tasks))
+            wall_seconds = time.perf_counter() - started
+    else:
+        _evaluate_batch(warmup_task)
+        started = time.perf_counter()
+        outcomes = [_evaluate_batch(task) for task in tasks]
+        wall_seconds = time.perf_counter() - started
+
+    merged = _merge_outcomes(outcomes)
+    rules: Dict[str, Any] = {}
+    for rule in sorted(merged["rule_latencies_ns"]):
+        values = merged["rule_latencies_ns"][rule]
+        provenance = merged["provenance"].get(rule, {})
+        rules[rule] = {
+            "validator_name": provenance.get("validator_name", ""),
+            "validator_version": provenance.get("validator_version", ""),
+            "evaluations": len(values),
+            "cached": merged["rule_cached"].get(rule, 0),
+            "latency": _latency_summary(values),
+            "histogram": _histogram(values),
+        }
+    return {
+        "schema_version": LOAD_REPORT_SCHEMA_VERSION,
+        "constitution_version": constitution.CONSTITUTION_VERSION,
+        "policy_hash": constitution.POLICY_HASH,
+        "config": {"count": count, "workers": workers, "warmup": max(0, warmup), "seed": seed, "mix": asdict(mix)},
+        "summary": asdict(
+            SimulationSummary(
+                total_requests=count,
+                passed=merged["passed"],
+                blocked=merged["blocked"],
+                warnings=merged["warnings"],
+                unique_envelope_digests=len(merged["digests"]),
+            )
+        ),
+        "targets": dict(sorted(merged["targets"].items())),
+        "throughput": {
+            "wall_seconds": round(wall_seconds, 6),
+            "evaluations_per_second": round(count / wall_seconds, 3) if wall_seconds > 0 else 0.0,
+        },
+        "latency": _latency_summary(merged["latencies_ns"]),
+        "rules": rules,
+    }
+
+
+def _csv(text: str) -> List[str]:
+    return [item.strip() for item in text.split(",") if item.strip()]
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Run deterministic governance simulation harness.")
     parser.add_argument("--count", type=int, default=1000)
     parser.add_argument("--tier", choices=[tier.name for tier in constitution.Tier], default="SANDBOX")
     parser.add_argument("--output", default="", help="Optional JSON output file path.")
+    batch = parser.add_argument_group("batch mode")
+    batch.add_argument("--batch", action="store_true", help="Run the load test and emit the latency/throughput report.")
+    batch.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (default: CPU count).")
+    batch.add_argument("--warmup", type=int, default=20, help="Unmeasured evaluations per worker before timing starts.")
+    batch.add_argument("--seed", type=int, default=0)
+    batch.add_argument("--op-sizes", default="1,8,32", help="Comma-separated op sizes to draw from.")
+    batch.add_argument("--tiers", default="", help="Comma-separated tiers to draw from (default: --tier).")
+    batch.add_argument("--epochs", type=int, default=4, help="Number of distinct epochs requests are spread over.")
+    batch.add_argument("--code-fraction", type=float, default=0.5, help="Share of requests with a code (vs DNA) target.")
     args = parser.parse_args(argv)
 
-    summary = run_simulation(count=max(1, args.count), tier=constitution.Tier[args.tier])
-    payload = asdict(summary)
+    if args.batch:
+        try:
+            mix = RequestMix(
+                op_sizes=tuple(int(item) for item in _csv(args.op_sizes)),
+                tiers=tuple(_csv(args.tiers) or [args.tier]),
+                epochs=args.epochs,
+                code_fraction=args.code_fraction,
+            )
+        except ValueError as exc:
+            parser.error(str(exc))
+        payload = run_batch(count=args.count, mix=mix, workers=args.workers, warmup=args.warmup, seed=args.seed)
+    else:
+        payload = asdict(run_simulation(count=max(1, args.count), tier=constitution.Tier[args.tier]))
     if args.output:
         path = Path(args.output)
         path.parent.mkdir(parents=True, exist_ok=True)
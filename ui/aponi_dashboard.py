@@ -22,14 +22,17 @@ import os
 import re
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import sha256
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import HTTPServer, SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Tuple
 from urllib.parse import parse_qs, urlparse
 
 from app import APP_ROOT
 from runtime import metrics
+from runtime.event_stream import SOURCES as STREAM_SOURCES, StreamCursor, StreamCursorError, hub_for, iter_sse
+from runtime.metrics_index import MetricsIndex, index_enabled
 from runtime.governance.event_taxonomy import (
     EVENT_TYPE_CONSTITUTION_ESCALATION,
     EVENT_TYPE_OPERATOR_OVERRIDE,
@@ -71,6 +74,31 @@ CONTROL_AGENT_ID_RE = re.compile(r"^[a-z0-9_\-]{3,64}$")
 CONTROL_COMMAND_ID_RE = re.compile(r"^cmd-[0-9]{6}-[0-9a-f]{12}$")
 CONTROL_GOVERNANCE_PROFILES = {"strict", "high-assurance"}
 CONTROL_EXECUTION_ACTIONS = {"cancel", "fork"}
+DEFAULT_MAX_WORKERS = 8
+RESPONSE_CACHE_MAX_ENTRIES = 256
+# GET endpoints derived only from the files stamped by ``_response_validator`` (plus orchestrator state).
+CACHED_GET_PREFIXES: tuple[str, ...] = (
+    "/state",
+    "/metrics",
+    "/fitness",
+    "/system/intelligence",
+    "/risk/summary",
+    "/risk/instability",
+    "/replay/divergence",
+    "/alerts/evaluate",
+    "/lineage",
+    "/evolution/live",
+    "/evolution/active",
+    "/evolution/timeline",
+)
+# Panels read only from the lineage ledger, journal and epoch files; every other cached panel also reads
+# metrics, which rendering itself appends to (entropy accounting), and the sliding mutation-rate window.
+LEDGER_PANEL_PREFIXES: tuple[str, ...] = ("/lineage", "/evolution/")
+TIME_BUCKET_SECONDS = 5
+# A held-open ``/stream`` occupies a pool worker; it is closed after this long and the EventSource reconnects.
+# At most half the workers hold streams open; past that a stream sends what is new and closes at once.
+STREAM_MAX_SECONDS = 300.0
+STREAM_RETRY_MS = 1000
 CONTROL_QUEUE_PATH = Path(os.environ.get("APONI_COMMAND_QUEUE_PATH", str(APP_ROOT.parent / "data" / "aponi_command_queue.jsonl")))
 FREE_CAPABILITY_SOURCES_PATH = Path(os.environ.get("APONI_FREE_SOURCES_PATH", str(APP_ROOT.parent / "data" / "free_capability_sources.json")))
 SKILL_PROFILES_PATH = Path(os.environ.get("APONI_SKILL_PROFILES_PATH", str(APP_ROOT.parent / "data" / "governed_skill_profiles.json")))
@@ -513,25 +541,132 @@ def _cancel_control_command(command_id: str) -> Dict[str, object]:
     return {"ok": True, "backend_supported": True, "command_id": command_id, "cancellation_entry": cancellation_entry}
 
 
+def _file_stamp(path: Path) -> Tuple[int, int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+
+def _response_validator(ledger_path: Path, *, include_metrics: bool) -> Tuple[object, ...]:
+    """Size/mtime stamps of the files a cached panel reads; ledgers are append-only, so appends move size."""
+    paths = [ledger_path, journal.LEDGER_FILE, journal.JOURNAL_PATH, CURRENT_EPOCH_PATH]
+    if not include_metrics:
+        return tuple(_file_stamp(path) for path in paths)
+    paths += [metrics.METRICS_PATH, REPLAY_PROOFS_DIR]
+    return (*(_file_stamp(path) for path in paths), int(time.time()) // TIME_BUCKET_SECONDS)
+
+
+def _etag(body: bytes) -> str:
+    return f'"{sha256(body).hexdigest()[:32]}"'
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    candidates = {item.strip() for item in header.split(",")}
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+class _ResponseCache:
+    """Per-request-target cache of rendered JSON bodies, valid while the validator is unchanged."""
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._entries: Dict[str, Tuple[object, str, bytes]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: str, validator: object) -> Tuple[str, bytes] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != validator:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return entry[1], entry[2]
+
+    def put(self, key: str, validator: object, etag: str, body: bytes) -> None:
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (validator, etag, body)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self._hits, "misses": self._misses}
+
+
+class _PooledHTTPServer(ThreadingHTTPServer):
+    """``ThreadingHTTPServer`` that serves requests on a bounded worker pool instead of a thread each."""
+
+    def __init__(self, server_address, handler, *, max_workers: int) -> None:
+        # Created first: ``TCPServer`` calls ``server_close`` itself when binding fails.
+        self._pool = ThreadPoolExecutor(max_workers=max(1, int(max_workers)), thread_name_prefix="aponi-http")
+        super().__init__(server_address, handler)
+
+    def process_request(self, request, client_address) -> None:
+        self._pool.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._pool.shutdown(wait=True)
+
+
+def _threaded_default() -> bool:
+    return os.getenv("APONI_THREADED", "0").strip() == "1"
+
+
+def _max_workers_default() -> int:
+    try:
+        return max(1, int(os.getenv("APONI_MAX_WORKERS", str(DEFAULT_MAX_WORKERS))))
+    except ValueError:
+        return DEFAULT_MAX_WORKERS
+
+
 class AponiDashboard:
     """
     Lightweight dashboard exposing orchestrator state and logs.
+
+    ``threaded`` (env: ``APONI_THREADED=1``) serves requests on a pool of
+    ``max_workers`` threads (env: ``APONI_MAX_WORKERS``) so one slow panel does
+    not block other clients; at most ``max_workers // 2`` ``/stream`` clients
+    are held open at once, and the rest are answered with the events pending
+    now and reconnect after ``STREAM_RETRY_MS``. Read-only panels are cached per request target and
+    carry an ``ETag``; a matching ``If-None-Match`` gets ``304`` without
+    recomputation until the files they read change; panels that read metrics
+    also expire every ``TIME_BUCKET_SECONDS`` because they include the sliding
+    mutation-rate window.
     """
 
-    def __init__(self, host: str = "0.0.0.0", port: int = 8080) -> None:
+    def __init__(self, host: str = "0.0.0.0", port: int = 8080, *, threaded: bool | None = None, max_workers: int | None = None) -> None:
         self.host = host
         self.port = port
+        self.threaded = _threaded_default() if threaded is None else bool(threaded)
+        self.max_workers = _max_workers_default() if max_workers is None else max(1, int(max_workers))
         self._server: HTTPServer | None = None
         self._thread: threading.Thread | None = None
         self._state: Dict[str, str] = {}
+        self._response_cache = _ResponseCache()
+        self._stream_slots = threading.BoundedSemaphore(self.max_workers // 2) if self.threaded and self.max_workers > 1 else None
 
     def start(self, orchestrator_state: Dict[str, str]) -> None:
         self._state = orchestrator_state
         handler = self._build_handler()
-        self._server = HTTPServer((self.host, self.port), handler)
+        if self.threaded:
+            self._server = _PooledHTTPServer((self.host, self.port), handler, max_workers=self.max_workers)
+        else:
+            self._server = HTTPServer((self.host, self.port), handler)
         self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
         self._thread.start()
-        metrics.log(event_type="aponi_dashboard_started", payload={"host": self.host, "port": self.port}, level="INFO", element_id=ELEMENT_ID)
+        metrics.log(
+            event_type="aponi_dashboard_started",
+            payload={"host": self.host, "port": self.port, "threaded": self.threaded, "max_workers": self.max_workers if self.threaded else 1},
+            level="INFO",
+            element_id=ELEMENT_ID,
+        )
 
     def _build_handler(self):
         state_ref = self._state
@@ -541,12 +676,21 @@ class AponiDashboard:
         lineage_v2 = LineageLedgerV2()
         replay = ReplayEngine(lineage_v2)
         bundle_builder = EvidenceBundleBuilder(ledger=lineage_v2, replay_engine=replay)
+        response_cache = self._response_cache
+        stream_slots = self._stream_slots
 
         class Handler(SimpleHTTPRequestHandler):
             _replay_engine = replay
             _bundle_builder = bundle_builder
+            _response_cache = response_cache
+            # Set while rendering a cacheable GET: ``_send_json`` records ``(status, body)`` here instead of writing.
+            _capture: List[Tuple[int, bytes]] | None = None
+
             def _send_json(self, payload, *, status_code: int = 200) -> None:
                 body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                if self._capture is not None:
+                    self._capture.append((status_code, body))
+                    return
                 self.send_response(status_code)
                 self.send_header("Content-Type", "application/json")
                 self.send_header("Cache-Control", "no-store")
@@ -602,8 +746,108 @@ class AponiDashboard:
                 self.end_headers()
                 self.wfile.write(body)
 
+            def _send_cached(self, render: Callable[[], None]) -> None:
+                key = self.path
+                path = urlparse(self.path).path
+                include_metrics = not path.startswith(LEDGER_PANEL_PREFIXES)
+                state_key = json.dumps(dict(state_ref), sort_keys=True, default=str) if path.startswith("/state") else ""
+                validator = (_response_validator(lineage_v2.ledger_path, include_metrics=include_metrics), state_key)
+                cached = self._response_cache.get(key, validator)
+                if cached is None:
+                    self._capture = []
+                    try:
+                        render()
+                        captured = self._capture
+                    finally:
+                        self._capture = None
+                    if not captured:
+                        return
+                    status_code, body = captured[-1]
+                    if status_code != 200:
+                        self._write_body(status_code, body, etag=None)
+                        return
+                    etag = _etag(body)
+                    if include_metrics:
+                        # Re-stamp so the panel's own metrics appends do not invalidate it; a concurrent
+                        # append missed this way is picked up by the next append or time bucket.
+                        validator = (_response_validator(lineage_v2.ledger_path, include_metrics=True), state_key)
+                    self._response_cache.put(key, validator, etag, body)
+                else:
+                    etag, body = cached
+                if _etag_matches(self.headers.get("If-None-Match"), etag):
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Cache-Control", "no-cache")
+                    self.end_headers()
+                    return
+                self._write_body(200, body, etag=etag)
+
+            def _write_body(self, status_code: int, body: bytes, *, etag: str | None) -> None:
+                self.send_response(status_code)
+                self.send_header("Content-Type", "application/json")
+                if etag is None:
+                    self.send_header("Cache-Control", "no-store")
+                else:
+                    # ``no-cache`` (not ``no-store``) lets clients keep the body and revalidate with If-None-Match.
+                    self.send_header("Cache-Control", "no-cache")
+                    self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _send_stream(self, query: Dict[str, List[str]]) -> None:
+                hub = hub_for(lineage_v2.ledger_path)
+                sources = [item for raw in query.get("sources", []) for item in raw.split(",") if item] or list(STREAM_SOURCES)
+                unknown = sorted(set(sources) - set(STREAM_SOURCES))
+                if unknown:
+                    self._send_json({"ok": False, "error": "unknown_stream_source", "sources": unknown}, status_code=400)
+                    return
+                event_types = [item for raw in query.get("event_type", []) for item in raw.split(",") if item]
+                epoch_id = query.get("epoch_id", [""])[0].strip()
+                token = (query.get("cursor") or [""])[0].strip() or (self.headers.get("Last-Event-ID") or "").strip()
+                try:
+                    cursor = StreamCursor.parse(token) if token else hub.head()
+                except StreamCursorError as exc:
+                    self._send_json({"ok": False, "error": "invalid_stream_cursor", "detail": str(exc)}, status_code=400)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("X-Accel-Buffering", "no")
+                self.end_headers()
+                # Without a free stream slot (always, single-threaded) a stream cannot be held open without
+                # starving other panels: send what is new and let the client reconnect.
+                held = stream_slots is not None and stream_slots.acquire(blocking=False)
+                frames = iter_sse(
+                    hub,
+                    cursor,
+                    sources=sources,
+                    event_types=event_types,
+                    epoch_id=epoch_id,
+                    max_duration_s=STREAM_MAX_SECONDS if held else 0.0,
+                    retry_ms=STREAM_RETRY_MS,
+                )
+                try:
+                    for frame in frames:
+                        self.wfile.write(frame.encode("utf-8"))
+                        self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    return
+                finally:
+                    if held:
+                        stream_slots.release()
+
             def do_GET(self):  # noqa: N802 - required by base class
                 parsed = urlparse(self.path)
+                if parsed.path == "/stream":
+                    self._send_stream(parse_qs(parsed.query))
+                    return
+                if parsed.path.startswith(CACHED_GET_PREFIXES):
+                    self._send_cached(lambda: self._handle_get(parsed))
+                    return
+                self._handle_get(parsed)
+
+            def _handle_get(self, parsed) -> None:
                 path = parsed.path
                 query = parse_qs(parsed.query)
 
@@ -630,11 +874,14 @@ class AponiDashboard:
                         sla_seconds = max(1, int(sla_raw))
                     except (TypeError, ValueError):
                         sla_seconds = 86_400
-                    events = [
-                        entry
-                        for entry in metrics.tail(limit=limit)
-                        if isinstance(entry, dict) and str(entry.get("event", "")) == "governance_review_quality"
-                    ]
+                    if index_enabled():
+                        events = MetricsIndex().latest(["governance_review_quality"], limit=limit)
+                    else:
+                        events = [
+                            entry
+                            for entry in metrics.tail(limit=limit)
+                            if isinstance(entry, dict) and str(entry.get("event", "")) == "governance_review_quality"
+                        ]
                     payload = compute_review_quality_payload(events, sla_seconds=sla_seconds, window_limit=limit)
                     self._send_validated_response("/metrics/review-quality", "review_quality.schema.json", payload)
                     return
@@ -1007,6 +1254,8 @@ class AponiDashboard:
 
             @staticmethod
             def _fitness_events() -> List[Dict]:
+                if index_enabled():
+                    return MetricsIndex().latest(["fitness_scored", "beast_fitness_scored"], limit=50)
                 entries = metrics.tail(limit=200)
                 fitness_events = [
                     entry
@@ -2131,6 +2380,7 @@ setInterval(refreshControlQueue, EXECUTION_POLL_MS);
     def stop(self) -> None:
         if self._server:
             self._server.shutdown()
+            self._server.server_close()
         if self._thread:
             self._thread.join(timeout=1)
 
@@ -2144,13 +2394,15 @@ def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Run Aponi dashboard in standalone mode.")
     parser.add_argument("--host", default=os.environ.get("APONI_HOST", "0.0.0.0"), help="Host interface to bind (env: APONI_HOST)")
     parser.add_argument("--port", type=int, default=int(os.environ.get("APONI_PORT", "8080")), help="Port to bind (env: APONI_PORT)")
+    parser.add_argument("--threaded", action="store_true", default=_threaded_default(), help="Serve requests on a bounded worker pool (env: APONI_THREADED=1)")
+    parser.add_argument("--max-workers", type=int, default=_max_workers_default(), help="Worker pool size in threaded mode (env: APONI_MAX_WORKERS)")
     args = parser.parse_args(argv)
 
-    dashboard = AponiDashboard(host=args.host, port=args.port)
+    dashboard = AponiDashboard(host=args.host, port=args.port, threaded=args.threaded, max_workers=args.max_workers)
     dashboard.start({"status": "dashboard_only"})
     print(f"[APONI] dashboard running on http://{dashboard.host}:{dashboard.port}")
     print(
-        "[APONI] endpoints: / /state /metrics /fitness /system/intelligence /risk/summary /risk/instability /policy/simulate /alerts/evaluate /replay/divergence /replay/diff?epoch_id=... "
+        "[APONI] endpoints: / /state /stream /metrics /fitness /system/intelligence /risk/summary /risk/instability /policy/simulate /alerts/evaluate /replay/divergence /replay/diff?epoch_id=... "
         "/capabilities /lineage /mutations /staging /evolution/epoch?epoch_id=... /evolution/live /evolution/active /evolution/timeline /control/free-sources /control/skill-profiles /control/capability-matrix /control/policy-summary /control/templates /control/environment-health /control/queue /control/queue/verify /control/execution"
     )
     try: